@@ -1523,12 +1523,12 @@ static const char *__pyx_filename;
 
 static const char *__pyx_f[] = {
   "blacksheep/baseapp.pyx",
-  ".venv/lib64/python3.12/site-packages/Cython/Includes/cpython/datetime.pxd",
+  "datetime.pxd",
   "blacksheep/baseapp.pxd",
   "<stringsource>",
   "blacksheep/exceptions.pxd",
   "blacksheep/contents.pxd",
-  ".venv/lib64/python3.12/site-packages/Cython/Includes/cpython/type.pxd",
+  "type.pxd",
   "blacksheep/cookies.pxd",
   "blacksheep/url.pxd",
   "blacksheep/messages.pxd",
@@ -1942,11 +1942,12 @@ struct __pyx_obj_10blacksheep_8messages_Request {
   PyObject *_raw_query;
   PyObject *route_values;
   PyObject *scope;
+  PyObject *_session;
   PyObject *__dict__;
 };
 
 
-/* "messages.pxd":59
+/* "messages.pxd":61
  * 
  * 
  * cdef class Response(Message):             # <<<<<<<<<<<<<<
@@ -2253,11 +2254,12 @@ static struct __pyx_vtabstruct_10blacksheep_8messages_Message *__pyx_vtabptr_10b
 struct __pyx_vtabstruct_10blacksheep_8messages_Request {
   struct __pyx_vtabstruct_10blacksheep_8messages_Message __pyx_base;
   int (*expect_100_continue)(struct __pyx_obj_10blacksheep_8messages_Request *, int __pyx_skip_dispatch);
+  void (*release)(struct __pyx_obj_10blacksheep_8messages_Request *, int __pyx_skip_dispatch);
 };
 static struct __pyx_vtabstruct_10blacksheep_8messages_Request *__pyx_vtabptr_10blacksheep_8messages_Request;
 
 
-/* "messages.pxd":59
+/* "messages.pxd":61
  * 
  * 
  * cdef class Response(Message):             # <<<<<<<<<<<<<<
@@ -16353,8 +16355,8 @@ static int __Pyx_modinit_type_import_code(void) {
   __pyx_vtabptr_10blacksheep_8messages_Message = (struct __pyx_vtabstruct_10blacksheep_8messages_Message*)__Pyx_GetVtable(__pyx_ptype_10blacksheep_8messages_Message); if (unlikely(!__pyx_vtabptr_10blacksheep_8messages_Message)) __PYX_ERR(9, 18, __pyx_L1_error)
   __pyx_ptype_10blacksheep_8messages_Request = __Pyx_ImportType_3_0_11(__pyx_t_1, "blacksheep.messages", "Request", sizeof(struct __pyx_obj_10blacksheep_8messages_Request), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(struct __pyx_obj_10blacksheep_8messages_Request),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_10blacksheep_8messages_Request) __PYX_ERR(9, 46, __pyx_L1_error)
   __pyx_vtabptr_10blacksheep_8messages_Request = (struct __pyx_vtabstruct_10blacksheep_8messages_Request*)__Pyx_GetVtable(__pyx_ptype_10blacksheep_8messages_Request); if (unlikely(!__pyx_vtabptr_10blacksheep_8messages_Request)) __PYX_ERR(9, 46, __pyx_L1_error)
-  __pyx_ptype_10blacksheep_8messages_Response = __Pyx_ImportType_3_0_11(__pyx_t_1, "blacksheep.messages", "Response", sizeof(struct __pyx_obj_10blacksheep_8messages_Response), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(struct __pyx_obj_10blacksheep_8messages_Response),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_10blacksheep_8messages_Response) __PYX_ERR(9, 59, __pyx_L1_error)
-  __pyx_vtabptr_10blacksheep_8messages_Response = (struct __pyx_vtabstruct_10blacksheep_8messages_Response*)__Pyx_GetVtable(__pyx_ptype_10blacksheep_8messages_Response); if (unlikely(!__pyx_vtabptr_10blacksheep_8messages_Response)) __PYX_ERR(9, 59, __pyx_L1_error)
+  __pyx_ptype_10blacksheep_8messages_Response = __Pyx_ImportType_3_0_11(__pyx_t_1, "blacksheep.messages", "Response", sizeof(struct __pyx_obj_10blacksheep_8messages_Response), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(struct __pyx_obj_10blacksheep_8messages_Response),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_10blacksheep_8messages_Response) __PYX_ERR(9, 61, __pyx_L1_error)
+  __pyx_vtabptr_10blacksheep_8messages_Response = (struct __pyx_vtabstruct_10blacksheep_8messages_Response*)__Pyx_GetVtable(__pyx_ptype_10blacksheep_8messages_Response); if (unlikely(!__pyx_vtabptr_10blacksheep_8messages_Response)) __PYX_ERR(9, 61, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -1523,11 +1523,11 @@ static const char *__pyx_filename;
 
 static const char *__pyx_f[] = {
   "blacksheep/messages.pyx",
-  ".venv/lib64/python3.12/site-packages/Cython/Includes/cpython/datetime.pxd",
+  "datetime.pxd",
   "blacksheep/messages.pxd",
   "<stringsource>",
   "blacksheep/contents.pxd",
-  ".venv/lib64/python3.12/site-packages/Cython/Includes/cpython/type.pxd",
+  "type.pxd",
   "blacksheep/cookies.pxd",
   "blacksheep/exceptions.pxd",
   "blacksheep/url.pxd",
@@ -1969,11 +1969,12 @@ struct __pyx_obj_10blacksheep_8messages_Request {
   PyObject *_raw_query;
   PyObject *route_values;
   PyObject *scope;
+  PyObject *_session;
   PyObject *__dict__;
 };
 
 
-/* "blacksheep/messages.pxd":59
+/* "blacksheep/messages.pxd":61
  * 
  * 
  * cdef class Response(Message):             # <<<<<<<<<<<<<<
@@ -2111,8 +2112,8 @@ struct __pyx_obj_10blacksheep_8messages___pyx_scope_struct_7_files {
 };
 
 
-/* "blacksheep/messages.pyx":506
- *         return False
+/* "blacksheep/messages.pyx":517
+ *             (<ASGIContent>self.content).dispose()
  * 
  *     async def is_disconnected(self):             # <<<<<<<<<<<<<<
  *         if not isinstance(self.content, ASGIContent):
@@ -2241,11 +2242,12 @@ static struct __pyx_vtabstruct_10blacksheep_8messages_Message *__pyx_vtabptr_10b
 struct __pyx_vtabstruct_10blacksheep_8messages_Request {
   struct __pyx_vtabstruct_10blacksheep_8messages_Message __pyx_base;
   int (*expect_100_continue)(struct __pyx_obj_10blacksheep_8messages_Request *, int __pyx_skip_dispatch);
+  void (*release)(struct __pyx_obj_10blacksheep_8messages_Request *, int __pyx_skip_dispatch);
 };
 static struct __pyx_vtabstruct_10blacksheep_8messages_Request *__pyx_vtabptr_10blacksheep_8messages_Request;
 
 
-/* "blacksheep/messages.pyx":526
+/* "blacksheep/messages.pyx":537
  * 
  * 
  * cdef class Response(Message):             # <<<<<<<<<<<<<<
@@ -2925,15 +2927,6 @@ static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
 /* GetAttr3.proto */
 static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *, PyObject *, PyObject *);
 
-/* PyObjectSetAttrStr.proto */
-#if CYTHON_USE_TYPE_SLOTS
-#define __Pyx_PyObject_DelAttrStr(o,n) __Pyx_PyObject_SetAttrStr(o, n, NULL)
-static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value);
-#else
-#define __Pyx_PyObject_DelAttrStr(o,n)   PyObject_DelAttr(o,n)
-#define __Pyx_PyObject_SetAttrStr(o,n,v) PyObject_SetAttr(o,n,v)
-#endif
-
 /* dict_getitem_default.proto */
 static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value);
 
@@ -2999,6 +2992,15 @@ static CYTHON_INLINE int __Pyx_PyDict_ContainsTF(PyObject* item, PyObject* dict,
     return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
 }
 
+/* PyObjectSetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+#define __Pyx_PyObject_DelAttrStr(o,n) __Pyx_PyObject_SetAttrStr(o, n, NULL)
+static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value);
+#else
+#define __Pyx_PyObject_DelAttrStr(o,n)   PyObject_DelAttr(o,n)
+#define __Pyx_PyObject_SetAttrStr(o,n,v) PyObject_SetAttr(o,n,v)
+#endif
+
 /* PyUnicode_Unicode.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyUnicode_Unicode(PyObject *obj);
 
@@ -3399,6 +3401,7 @@ static int __pyx_f_10blacksheep_8messages_7Message_declares_json(struct __pyx_ob
 static int __pyx_f_10blacksheep_8messages_7Message_declares_xml(struct __pyx_obj_10blacksheep_8messages_Message *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
 static int __pyx_f_10blacksheep_8messages_7Message_has_body(struct __pyx_obj_10blacksheep_8messages_Message *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
 static int __pyx_f_10blacksheep_8messages_7Request_expect_100_continue(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static void __pyx_f_10blacksheep_8messages_7Request_release(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
 static int __pyx_f_10blacksheep_8messages_8Response_is_redirect(struct __pyx_obj_10blacksheep_8messages_Response *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
 
 /* Module declarations from "blacksheep.contents" */
@@ -3562,8 +3565,8 @@ static const char __pyx_k_cookies[] = "cookies";
 static const char __pyx_k_disable[] = "disable";
 static const char __pyx_k_headers[] = "headers";
 static const char __pyx_k_inspect[] = "inspect";
+static const char __pyx_k_release[] = "release";
 static const char __pyx_k_request[] = "request";
-static const char __pyx_k_session[] = "_session";
 static const char __pyx_k_unquote[] = "unquote";
 static const char __pyx_k_KeyError[] = "KeyError";
 static const char __pyx_k_Response[] = "<Response ";
@@ -3644,6 +3647,7 @@ static const char __pyx_k_CancelledError[] = "CancelledError";
 static const char __pyx_k_Message_stream[] = "Message.stream";
 static const char __pyx_k_content_type_2[] = "content-type";
 static const char __pyx_k_get_event_loop[] = "get_event_loop";
+static const char __pyx_k_Request_release[] = "Request.release";
 static const char __pyx_k_existing_cookie[] = "existing_cookie";
 static const char __pyx_k_is_cors_request[] = "is_cors_request";
 static const char __pyx_k_is_disconnected[] = "is_disconnected";
@@ -3718,7 +3722,7 @@ static const char __pyx_k_Invalid_value_type_expected_byte[] = "Invalid value ty
 static const char __pyx_k_This_method_is_only_supported_wh[] = "This method is only supported when a request is bound to an instance of ASGIContent and to an ASGI request/response cycle.";
 static const char __pyx_k_Time_zones_are_not_available_fro[] = "Time zones are not available from the C-API.";
 static const char __pyx_k_application_x_www_form_urlencode[] = "application/x-www-form-urlencoded";
-static const char __pyx_k_Incompatible_checksums_0x_x_vs_0_2[] = "Incompatible checksums (0x%x vs (0x80165aa, 0xc07cd1e, 0xc6d580b) = (_path, _raw_headers, _raw_query, _url, content, method, route_values, scope))";
+static const char __pyx_k_Incompatible_checksums_0x_x_vs_0_2[] = "Incompatible checksums (0x%x vs (0xba91f9e, 0xa59023d, 0xc52fccb) = (_path, _raw_headers, _raw_query, _session, _url, content, method, route_values, scope))";
 static const char __pyx_k_Incompatible_checksums_0x_x_vs_0_3[] = "Incompatible checksums (0x%x vs (0x4a470c7, 0x422d404, 0xc31488a) = (_raw_headers, content, status))";
 /* #### Code section: decls ### */
 static PyObject *__pyx_pf_10blacksheep_8messages_parse_charset(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_value); /* proto */
@@ -3781,7 +3785,8 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_8set_cookie(struct __p
 static PyObject *__pyx_pf_10blacksheep_8messages_7Request_4etag___get__(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_10blacksheep_8messages_7Request_13if_none_match___get__(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_10blacksheep_8messages_7Request_10expect_100_continue(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_10blacksheep_8messages_7Request_12is_disconnected(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_10blacksheep_8messages_7Request_12release(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_10blacksheep_8messages_7Request_14is_disconnected(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_10blacksheep_8messages_7Request_6method___get__(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self); /* proto */
 static int __pyx_pf_10blacksheep_8messages_7Request_6method_2__set__(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
 static int __pyx_pf_10blacksheep_8messages_7Request_6method_4__del__(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self); /* proto */
@@ -3800,8 +3805,8 @@ static int __pyx_pf_10blacksheep_8messages_7Request_12route_values_4__del__(stru
 static PyObject *__pyx_pf_10blacksheep_8messages_7Request_5scope___get__(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self); /* proto */
 static int __pyx_pf_10blacksheep_8messages_7Request_5scope_2__set__(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
 static int __pyx_pf_10blacksheep_8messages_7Request_5scope_4__del__(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_10blacksheep_8messages_7Request_15__reduce_cython__(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_10blacksheep_8messages_7Request_17__setstate_cython__(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_10blacksheep_8messages_7Request_17__reduce_cython__(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_10blacksheep_8messages_7Request_19__setstate_cython__(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
 static int __pyx_pf_10blacksheep_8messages_8Response___init__(struct __pyx_obj_10blacksheep_8messages_Response *__pyx_v_self, int __pyx_v_status, PyObject *__pyx_v_headers, struct __pyx_obj_10blacksheep_8contents_Content *__pyx_v_content); /* proto */
 static PyObject *__pyx_pf_10blacksheep_8messages_8Response_2__repr__(struct __pyx_obj_10blacksheep_8messages_Response *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_10blacksheep_8messages_8Response_7cookies___get__(struct __pyx_obj_10blacksheep_8messages_Response *__pyx_v_self); /* proto */
@@ -4000,6 +4005,7 @@ typedef struct {
   PyObject *__pyx_n_s_Request_get_cookie;
   PyObject *__pyx_n_s_Request_incoming;
   PyObject *__pyx_n_s_Request_is_disconnected;
+  PyObject *__pyx_n_s_Request_release;
   PyObject *__pyx_n_s_Request_set_cookie;
   PyObject *__pyx_kp_u_Response;
   PyObject *__pyx_n_s_Response_2;
@@ -4168,6 +4174,7 @@ typedef struct {
   PyObject *__pyx_n_s_reduce;
   PyObject *__pyx_n_s_reduce_cython;
   PyObject *__pyx_n_s_reduce_ex;
+  PyObject *__pyx_n_s_release;
   PyObject *__pyx_n_s_remove;
   PyObject *__pyx_n_s_remove_cookie;
   PyObject *__pyx_n_s_remove_header;
@@ -4178,7 +4185,6 @@ typedef struct {
   PyObject *__pyx_n_u_scheme;
   PyObject *__pyx_n_s_self;
   PyObject *__pyx_n_s_send;
-  PyObject *__pyx_n_s_session;
   PyObject *__pyx_kp_b_set_cookie;
   PyObject *__pyx_n_s_set_cookie_2;
   PyObject *__pyx_n_s_set_cookies;
@@ -4218,12 +4224,12 @@ typedef struct {
   PyObject *__pyx_int_365;
   PyObject *__pyx_int_69391364;
   PyObject *__pyx_int_77885639;
-  PyObject *__pyx_int_134309290;
   PyObject *__pyx_int_156416356;
   PyObject *__pyx_int_160707978;
-  PyObject *__pyx_int_201837854;
+  PyObject *__pyx_int_173605437;
+  PyObject *__pyx_int_195633054;
   PyObject *__pyx_int_204556426;
-  PyObject *__pyx_int_208492555;
+  PyObject *__pyx_int_206765259;
   PyObject *__pyx_int_243617669;
   PyObject *__pyx_tuple_;
   PyObject *__pyx_tuple__4;
@@ -4259,14 +4265,14 @@ typedef struct {
   PyObject *__pyx_tuple__68;
   PyObject *__pyx_tuple__70;
   PyObject *__pyx_tuple__72;
-  PyObject *__pyx_tuple__77;
-  PyObject *__pyx_tuple__79;
-  PyObject *__pyx_tuple__81;
-  PyObject *__pyx_tuple__83;
-  PyObject *__pyx_tuple__86;
-  PyObject *__pyx_tuple__91;
-  PyObject *__pyx_tuple__95;
-  PyObject *__pyx_tuple__97;
+  PyObject *__pyx_tuple__78;
+  PyObject *__pyx_tuple__80;
+  PyObject *__pyx_tuple__82;
+  PyObject *__pyx_tuple__84;
+  PyObject *__pyx_tuple__87;
+  PyObject *__pyx_tuple__92;
+  PyObject *__pyx_tuple__96;
+  PyObject *__pyx_tuple__98;
   PyObject *__pyx_codeobj__2;
   PyObject *__pyx_codeobj__3;
   PyObject *__pyx_codeobj__6;
@@ -4299,22 +4305,23 @@ typedef struct {
   PyObject *__pyx_codeobj__74;
   PyObject *__pyx_codeobj__75;
   PyObject *__pyx_codeobj__76;
-  PyObject *__pyx_codeobj__78;
-  PyObject *__pyx_codeobj__80;
-  PyObject *__pyx_codeobj__82;
-  PyObject *__pyx_codeobj__84;
+  PyObject *__pyx_codeobj__77;
+  PyObject *__pyx_codeobj__79;
+  PyObject *__pyx_codeobj__81;
+  PyObject *__pyx_codeobj__83;
   PyObject *__pyx_codeobj__85;
-  PyObject *__pyx_codeobj__87;
+  PyObject *__pyx_codeobj__86;
   PyObject *__pyx_codeobj__88;
   PyObject *__pyx_codeobj__89;
   PyObject *__pyx_codeobj__90;
-  PyObject *__pyx_codeobj__92;
+  PyObject *__pyx_codeobj__91;
   PyObject *__pyx_codeobj__93;
   PyObject *__pyx_codeobj__94;
-  PyObject *__pyx_codeobj__96;
-  PyObject *__pyx_codeobj__98;
+  PyObject *__pyx_codeobj__95;
+  PyObject *__pyx_codeobj__97;
   PyObject *__pyx_codeobj__99;
   PyObject *__pyx_codeobj__100;
+  PyObject *__pyx_codeobj__101;
 } __pyx_mstate;
 
 #if CYTHON_USE_MODULE_STATE
@@ -4461,6 +4468,7 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_Request_get_cookie);
   Py_CLEAR(clear_module_state->__pyx_n_s_Request_incoming);
   Py_CLEAR(clear_module_state->__pyx_n_s_Request_is_disconnected);
+  Py_CLEAR(clear_module_state->__pyx_n_s_Request_release);
   Py_CLEAR(clear_module_state->__pyx_n_s_Request_set_cookie);
   Py_CLEAR(clear_module_state->__pyx_kp_u_Response);
   Py_CLEAR(clear_module_state->__pyx_n_s_Response_2);
@@ -4629,6 +4637,7 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_reduce);
   Py_CLEAR(clear_module_state->__pyx_n_s_reduce_cython);
   Py_CLEAR(clear_module_state->__pyx_n_s_reduce_ex);
+  Py_CLEAR(clear_module_state->__pyx_n_s_release);
   Py_CLEAR(clear_module_state->__pyx_n_s_remove);
   Py_CLEAR(clear_module_state->__pyx_n_s_remove_cookie);
   Py_CLEAR(clear_module_state->__pyx_n_s_remove_header);
@@ -4639,7 +4648,6 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_u_scheme);
   Py_CLEAR(clear_module_state->__pyx_n_s_self);
   Py_CLEAR(clear_module_state->__pyx_n_s_send);
-  Py_CLEAR(clear_module_state->__pyx_n_s_session);
   Py_CLEAR(clear_module_state->__pyx_kp_b_set_cookie);
   Py_CLEAR(clear_module_state->__pyx_n_s_set_cookie_2);
   Py_CLEAR(clear_module_state->__pyx_n_s_set_cookies);
@@ -4679,12 +4687,12 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_int_365);
   Py_CLEAR(clear_module_state->__pyx_int_69391364);
   Py_CLEAR(clear_module_state->__pyx_int_77885639);
-  Py_CLEAR(clear_module_state->__pyx_int_134309290);
   Py_CLEAR(clear_module_state->__pyx_int_156416356);
   Py_CLEAR(clear_module_state->__pyx_int_160707978);
-  Py_CLEAR(clear_module_state->__pyx_int_201837854);
+  Py_CLEAR(clear_module_state->__pyx_int_173605437);
+  Py_CLEAR(clear_module_state->__pyx_int_195633054);
   Py_CLEAR(clear_module_state->__pyx_int_204556426);
-  Py_CLEAR(clear_module_state->__pyx_int_208492555);
+  Py_CLEAR(clear_module_state->__pyx_int_206765259);
   Py_CLEAR(clear_module_state->__pyx_int_243617669);
   Py_CLEAR(clear_module_state->__pyx_tuple_);
   Py_CLEAR(clear_module_state->__pyx_tuple__4);
@@ -4720,14 +4728,14 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_tuple__68);
   Py_CLEAR(clear_module_state->__pyx_tuple__70);
   Py_CLEAR(clear_module_state->__pyx_tuple__72);
-  Py_CLEAR(clear_module_state->__pyx_tuple__77);
-  Py_CLEAR(clear_module_state->__pyx_tuple__79);
-  Py_CLEAR(clear_module_state->__pyx_tuple__81);
-  Py_CLEAR(clear_module_state->__pyx_tuple__83);
-  Py_CLEAR(clear_module_state->__pyx_tuple__86);
-  Py_CLEAR(clear_module_state->__pyx_tuple__91);
-  Py_CLEAR(clear_module_state->__pyx_tuple__95);
-  Py_CLEAR(clear_module_state->__pyx_tuple__97);
+  Py_CLEAR(clear_module_state->__pyx_tuple__78);
+  Py_CLEAR(clear_module_state->__pyx_tuple__80);
+  Py_CLEAR(clear_module_state->__pyx_tuple__82);
+  Py_CLEAR(clear_module_state->__pyx_tuple__84);
+  Py_CLEAR(clear_module_state->__pyx_tuple__87);
+  Py_CLEAR(clear_module_state->__pyx_tuple__92);
+  Py_CLEAR(clear_module_state->__pyx_tuple__96);
+  Py_CLEAR(clear_module_state->__pyx_tuple__98);
   Py_CLEAR(clear_module_state->__pyx_codeobj__2);
   Py_CLEAR(clear_module_state->__pyx_codeobj__3);
   Py_CLEAR(clear_module_state->__pyx_codeobj__6);
@@ -4760,22 +4768,23 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_codeobj__74);
   Py_CLEAR(clear_module_state->__pyx_codeobj__75);
   Py_CLEAR(clear_module_state->__pyx_codeobj__76);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__78);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__80);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__82);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__84);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__77);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__79);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__81);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__83);
   Py_CLEAR(clear_module_state->__pyx_codeobj__85);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__87);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__86);
   Py_CLEAR(clear_module_state->__pyx_codeobj__88);
   Py_CLEAR(clear_module_state->__pyx_codeobj__89);
   Py_CLEAR(clear_module_state->__pyx_codeobj__90);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__92);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__91);
   Py_CLEAR(clear_module_state->__pyx_codeobj__93);
   Py_CLEAR(clear_module_state->__pyx_codeobj__94);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__96);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__98);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__95);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__97);
   Py_CLEAR(clear_module_state->__pyx_codeobj__99);
   Py_CLEAR(clear_module_state->__pyx_codeobj__100);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__101);
   return 0;
 }
 #endif
@@ -4900,6 +4909,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_Request_get_cookie);
   Py_VISIT(traverse_module_state->__pyx_n_s_Request_incoming);
   Py_VISIT(traverse_module_state->__pyx_n_s_Request_is_disconnected);
+  Py_VISIT(traverse_module_state->__pyx_n_s_Request_release);
   Py_VISIT(traverse_module_state->__pyx_n_s_Request_set_cookie);
   Py_VISIT(traverse_module_state->__pyx_kp_u_Response);
   Py_VISIT(traverse_module_state->__pyx_n_s_Response_2);
@@ -5068,6 +5078,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_reduce);
   Py_VISIT(traverse_module_state->__pyx_n_s_reduce_cython);
   Py_VISIT(traverse_module_state->__pyx_n_s_reduce_ex);
+  Py_VISIT(traverse_module_state->__pyx_n_s_release);
   Py_VISIT(traverse_module_state->__pyx_n_s_remove);
   Py_VISIT(traverse_module_state->__pyx_n_s_remove_cookie);
   Py_VISIT(traverse_module_state->__pyx_n_s_remove_header);
@@ -5078,7 +5089,6 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_u_scheme);
   Py_VISIT(traverse_module_state->__pyx_n_s_self);
   Py_VISIT(traverse_module_state->__pyx_n_s_send);
-  Py_VISIT(traverse_module_state->__pyx_n_s_session);
   Py_VISIT(traverse_module_state->__pyx_kp_b_set_cookie);
   Py_VISIT(traverse_module_state->__pyx_n_s_set_cookie_2);
   Py_VISIT(traverse_module_state->__pyx_n_s_set_cookies);
@@ -5118,12 +5128,12 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_int_365);
   Py_VISIT(traverse_module_state->__pyx_int_69391364);
   Py_VISIT(traverse_module_state->__pyx_int_77885639);
-  Py_VISIT(traverse_module_state->__pyx_int_134309290);
   Py_VISIT(traverse_module_state->__pyx_int_156416356);
   Py_VISIT(traverse_module_state->__pyx_int_160707978);
-  Py_VISIT(traverse_module_state->__pyx_int_201837854);
+  Py_VISIT(traverse_module_state->__pyx_int_173605437);
+  Py_VISIT(traverse_module_state->__pyx_int_195633054);
   Py_VISIT(traverse_module_state->__pyx_int_204556426);
-  Py_VISIT(traverse_module_state->__pyx_int_208492555);
+  Py_VISIT(traverse_module_state->__pyx_int_206765259);
   Py_VISIT(traverse_module_state->__pyx_int_243617669);
   Py_VISIT(traverse_module_state->__pyx_tuple_);
   Py_VISIT(traverse_module_state->__pyx_tuple__4);
@@ -5159,14 +5169,14 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_tuple__68);
   Py_VISIT(traverse_module_state->__pyx_tuple__70);
   Py_VISIT(traverse_module_state->__pyx_tuple__72);
-  Py_VISIT(traverse_module_state->__pyx_tuple__77);
-  Py_VISIT(traverse_module_state->__pyx_tuple__79);
-  Py_VISIT(traverse_module_state->__pyx_tuple__81);
-  Py_VISIT(traverse_module_state->__pyx_tuple__83);
-  Py_VISIT(traverse_module_state->__pyx_tuple__86);
-  Py_VISIT(traverse_module_state->__pyx_tuple__91);
-  Py_VISIT(traverse_module_state->__pyx_tuple__95);
-  Py_VISIT(traverse_module_state->__pyx_tuple__97);
+  Py_VISIT(traverse_module_state->__pyx_tuple__78);
+  Py_VISIT(traverse_module_state->__pyx_tuple__80);
+  Py_VISIT(traverse_module_state->__pyx_tuple__82);
+  Py_VISIT(traverse_module_state->__pyx_tuple__84);
+  Py_VISIT(traverse_module_state->__pyx_tuple__87);
+  Py_VISIT(traverse_module_state->__pyx_tuple__92);
+  Py_VISIT(traverse_module_state->__pyx_tuple__96);
+  Py_VISIT(traverse_module_state->__pyx_tuple__98);
   Py_VISIT(traverse_module_state->__pyx_codeobj__2);
   Py_VISIT(traverse_module_state->__pyx_codeobj__3);
   Py_VISIT(traverse_module_state->__pyx_codeobj__6);
@@ -5199,22 +5209,23 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_codeobj__74);
   Py_VISIT(traverse_module_state->__pyx_codeobj__75);
   Py_VISIT(traverse_module_state->__pyx_codeobj__76);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__78);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__80);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__82);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__84);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__77);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__79);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__81);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__83);
   Py_VISIT(traverse_module_state->__pyx_codeobj__85);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__87);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__86);
   Py_VISIT(traverse_module_state->__pyx_codeobj__88);
   Py_VISIT(traverse_module_state->__pyx_codeobj__89);
   Py_VISIT(traverse_module_state->__pyx_codeobj__90);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__92);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__91);
   Py_VISIT(traverse_module_state->__pyx_codeobj__93);
   Py_VISIT(traverse_module_state->__pyx_codeobj__94);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__96);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__98);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__95);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__97);
   Py_VISIT(traverse_module_state->__pyx_codeobj__99);
   Py_VISIT(traverse_module_state->__pyx_codeobj__100);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__101);
   return 0;
 }
 #endif
@@ -5377,6 +5388,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_Request_get_cookie __pyx_mstate_global->__pyx_n_s_Request_get_cookie
 #define __pyx_n_s_Request_incoming __pyx_mstate_global->__pyx_n_s_Request_incoming
 #define __pyx_n_s_Request_is_disconnected __pyx_mstate_global->__pyx_n_s_Request_is_disconnected
+#define __pyx_n_s_Request_release __pyx_mstate_global->__pyx_n_s_Request_release
 #define __pyx_n_s_Request_set_cookie __pyx_mstate_global->__pyx_n_s_Request_set_cookie
 #define __pyx_kp_u_Response __pyx_mstate_global->__pyx_kp_u_Response
 #define __pyx_n_s_Response_2 __pyx_mstate_global->__pyx_n_s_Response_2
@@ -5545,6 +5557,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_reduce __pyx_mstate_global->__pyx_n_s_reduce
 #define __pyx_n_s_reduce_cython __pyx_mstate_global->__pyx_n_s_reduce_cython
 #define __pyx_n_s_reduce_ex __pyx_mstate_global->__pyx_n_s_reduce_ex
+#define __pyx_n_s_release __pyx_mstate_global->__pyx_n_s_release
 #define __pyx_n_s_remove __pyx_mstate_global->__pyx_n_s_remove
 #define __pyx_n_s_remove_cookie __pyx_mstate_global->__pyx_n_s_remove_cookie
 #define __pyx_n_s_remove_header __pyx_mstate_global->__pyx_n_s_remove_header
@@ -5555,7 +5568,6 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_u_scheme __pyx_mstate_global->__pyx_n_u_scheme
 #define __pyx_n_s_self __pyx_mstate_global->__pyx_n_s_self
 #define __pyx_n_s_send __pyx_mstate_global->__pyx_n_s_send
-#define __pyx_n_s_session __pyx_mstate_global->__pyx_n_s_session
 #define __pyx_kp_b_set_cookie __pyx_mstate_global->__pyx_kp_b_set_cookie
 #define __pyx_n_s_set_cookie_2 __pyx_mstate_global->__pyx_n_s_set_cookie_2
 #define __pyx_n_s_set_cookies __pyx_mstate_global->__pyx_n_s_set_cookies
@@ -5595,12 +5607,12 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_int_365 __pyx_mstate_global->__pyx_int_365
 #define __pyx_int_69391364 __pyx_mstate_global->__pyx_int_69391364
 #define __pyx_int_77885639 __pyx_mstate_global->__pyx_int_77885639
-#define __pyx_int_134309290 __pyx_mstate_global->__pyx_int_134309290
 #define __pyx_int_156416356 __pyx_mstate_global->__pyx_int_156416356
 #define __pyx_int_160707978 __pyx_mstate_global->__pyx_int_160707978
-#define __pyx_int_201837854 __pyx_mstate_global->__pyx_int_201837854
+#define __pyx_int_173605437 __pyx_mstate_global->__pyx_int_173605437
+#define __pyx_int_195633054 __pyx_mstate_global->__pyx_int_195633054
 #define __pyx_int_204556426 __pyx_mstate_global->__pyx_int_204556426
-#define __pyx_int_208492555 __pyx_mstate_global->__pyx_int_208492555
+#define __pyx_int_206765259 __pyx_mstate_global->__pyx_int_206765259
 #define __pyx_int_243617669 __pyx_mstate_global->__pyx_int_243617669
 #define __pyx_tuple_ __pyx_mstate_global->__pyx_tuple_
 #define __pyx_tuple__4 __pyx_mstate_global->__pyx_tuple__4
@@ -5636,14 +5648,14 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_tuple__68 __pyx_mstate_global->__pyx_tuple__68
 #define __pyx_tuple__70 __pyx_mstate_global->__pyx_tuple__70
 #define __pyx_tuple__72 __pyx_mstate_global->__pyx_tuple__72
-#define __pyx_tuple__77 __pyx_mstate_global->__pyx_tuple__77
-#define __pyx_tuple__79 __pyx_mstate_global->__pyx_tuple__79
-#define __pyx_tuple__81 __pyx_mstate_global->__pyx_tuple__81
-#define __pyx_tuple__83 __pyx_mstate_global->__pyx_tuple__83
-#define __pyx_tuple__86 __pyx_mstate_global->__pyx_tuple__86
-#define __pyx_tuple__91 __pyx_mstate_global->__pyx_tuple__91
-#define __pyx_tuple__95 __pyx_mstate_global->__pyx_tuple__95
-#define __pyx_tuple__97 __pyx_mstate_global->__pyx_tuple__97
+#define __pyx_tuple__78 __pyx_mstate_global->__pyx_tuple__78
+#define __pyx_tuple__80 __pyx_mstate_global->__pyx_tuple__80
+#define __pyx_tuple__82 __pyx_mstate_global->__pyx_tuple__82
+#define __pyx_tuple__84 __pyx_mstate_global->__pyx_tuple__84
+#define __pyx_tuple__87 __pyx_mstate_global->__pyx_tuple__87
+#define __pyx_tuple__92 __pyx_mstate_global->__pyx_tuple__92
+#define __pyx_tuple__96 __pyx_mstate_global->__pyx_tuple__96
+#define __pyx_tuple__98 __pyx_mstate_global->__pyx_tuple__98
 #define __pyx_codeobj__2 __pyx_mstate_global->__pyx_codeobj__2
 #define __pyx_codeobj__3 __pyx_mstate_global->__pyx_codeobj__3
 #define __pyx_codeobj__6 __pyx_mstate_global->__pyx_codeobj__6
@@ -5676,22 +5688,23 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_codeobj__74 __pyx_mstate_global->__pyx_codeobj__74
 #define __pyx_codeobj__75 __pyx_mstate_global->__pyx_codeobj__75
 #define __pyx_codeobj__76 __pyx_mstate_global->__pyx_codeobj__76
-#define __pyx_codeobj__78 __pyx_mstate_global->__pyx_codeobj__78
-#define __pyx_codeobj__80 __pyx_mstate_global->__pyx_codeobj__80
-#define __pyx_codeobj__82 __pyx_mstate_global->__pyx_codeobj__82
-#define __pyx_codeobj__84 __pyx_mstate_global->__pyx_codeobj__84
+#define __pyx_codeobj__77 __pyx_mstate_global->__pyx_codeobj__77
+#define __pyx_codeobj__79 __pyx_mstate_global->__pyx_codeobj__79
+#define __pyx_codeobj__81 __pyx_mstate_global->__pyx_codeobj__81
+#define __pyx_codeobj__83 __pyx_mstate_global->__pyx_codeobj__83
 #define __pyx_codeobj__85 __pyx_mstate_global->__pyx_codeobj__85
-#define __pyx_codeobj__87 __pyx_mstate_global->__pyx_codeobj__87
+#define __pyx_codeobj__86 __pyx_mstate_global->__pyx_codeobj__86
 #define __pyx_codeobj__88 __pyx_mstate_global->__pyx_codeobj__88
 #define __pyx_codeobj__89 __pyx_mstate_global->__pyx_codeobj__89
 #define __pyx_codeobj__90 __pyx_mstate_global->__pyx_codeobj__90
-#define __pyx_codeobj__92 __pyx_mstate_global->__pyx_codeobj__92
+#define __pyx_codeobj__91 __pyx_mstate_global->__pyx_codeobj__91
 #define __pyx_codeobj__93 __pyx_mstate_global->__pyx_codeobj__93
 #define __pyx_codeobj__94 __pyx_mstate_global->__pyx_codeobj__94
-#define __pyx_codeobj__96 __pyx_mstate_global->__pyx_codeobj__96
-#define __pyx_codeobj__98 __pyx_mstate_global->__pyx_codeobj__98
+#define __pyx_codeobj__95 __pyx_mstate_global->__pyx_codeobj__95
+#define __pyx_codeobj__97 __pyx_mstate_global->__pyx_codeobj__97
 #define __pyx_codeobj__99 __pyx_mstate_global->__pyx_codeobj__99
 #define __pyx_codeobj__100 __pyx_mstate_global->__pyx_codeobj__100
+#define __pyx_codeobj__101 __pyx_mstate_global->__pyx_codeobj__101
 /* #### Code section: module_code ### */
 
 /* "cpython/datetime.pxd":72
@@ -16990,7 +17003,11 @@ static int __pyx_pf_10blacksheep_8messages_7Request___init__(struct __pyx_obj_10
  *         if _url:
  *             self._path = _url.path
  */
-  if (__Pyx_PyObject_SetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_session, Py_None) < 0) __PYX_ERR(0, 286, __pyx_L1_error)
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->_session);
+  __Pyx_DECREF(__pyx_v_self->_session);
+  __pyx_v_self->_session = Py_None;
 
   /* "blacksheep/messages.pyx":287
  *         self._url = _url
@@ -18547,8 +18564,8 @@ static PyObject *__pyx_pw_10blacksheep_8messages_7Request_7session_1__get__(PyOb
 static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7session___get__(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -18561,11 +18578,8 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7session___get__(struc
  *             raise TypeError(
  *                 "A session is not configured for this request, activate "
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_session); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 376, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = (__pyx_t_1 == Py_None);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (unlikely(__pyx_t_2)) {
+  __pyx_t_1 = (__pyx_v_self->_session == Py_None);
+  if (unlikely(__pyx_t_1)) {
 
     /* "blacksheep/messages.pyx":377
  *     def session(self):
@@ -18574,10 +18588,10 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7session___get__(struc
  *                 "A session is not configured for this request, activate "
  *                 "sessions using `app.use_sessions` method."
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__18, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 377, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__18, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 377, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __PYX_ERR(0, 377, __pyx_L1_error)
 
     /* "blacksheep/messages.pyx":376
@@ -18597,10 +18611,8 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7session___get__(struc
  *     @session.setter
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_session); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 381, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __Pyx_INCREF(__pyx_v_self->_session);
+  __pyx_r = __pyx_v_self->_session;
   goto __pyx_L0;
 
   /* "blacksheep/messages.pyx":374
@@ -18613,7 +18625,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7session___get__(struc
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_AddTraceback("blacksheep.messages.Request.session.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -18647,9 +18659,8 @@ static int __pyx_pw_10blacksheep_8messages_7Request_7session_3__set__(PyObject *
 
 static int __pyx_pf_10blacksheep_8messages_7Request_7session_2__set__(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self, PyObject *__pyx_v_value) {
   int __pyx_r;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__", 1);
 
   /* "blacksheep/messages.pyx":385
  *     @session.setter
@@ -18658,7 +18669,11 @@ static int __pyx_pf_10blacksheep_8messages_7Request_7session_2__set__(struct __p
  * 
  *     @classmethod
  */
-  if (__Pyx_PyObject_SetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_session, __pyx_v_value) < 0) __PYX_ERR(0, 385, __pyx_L1_error)
+  __Pyx_INCREF(__pyx_v_value);
+  __Pyx_GIVEREF(__pyx_v_value);
+  __Pyx_GOTREF(__pyx_v_self->_session);
+  __Pyx_DECREF(__pyx_v_self->_session);
+  __pyx_v_self->_session = __pyx_v_value;
 
   /* "blacksheep/messages.pyx":383
  *         return self._session
@@ -18670,11 +18685,7 @@ static int __pyx_pf_10blacksheep_8messages_7Request_7session_2__set__(struct __p
 
   /* function exit code */
   __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_AddTraceback("blacksheep.messages.Request.session.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
-  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
@@ -18682,8 +18693,8 @@ static int __pyx_pf_10blacksheep_8messages_7Request_7session_2__set__(struct __p
  *         self._session = value
  * 
  *     @classmethod             # <<<<<<<<<<<<<<
- *     def incoming(cls, str method, bytes path, bytes query, list headers):
- *         request = cls(method, None, headers)
+ *     def incoming(cls, str method, bytes path, bytes query, object headers):
+ *         # ASGI servers pass headers as lists in most cases: these are used as-is, to
  */
 
 /* Python wrapper */
@@ -18796,7 +18807,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
     __pyx_v_method = ((PyObject*)values[0]);
     __pyx_v_path = ((PyObject*)values[1]);
     __pyx_v_query = ((PyObject*)values[2]);
-    __pyx_v_headers = ((PyObject*)values[3]);
+    __pyx_v_headers = values[3];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
@@ -18817,7 +18828,6 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_method), (&PyUnicode_Type), 1, "method", 1))) __PYX_ERR(0, 388, __pyx_L1_error)
   if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_path), (&PyBytes_Type), 1, "path", 1))) __PYX_ERR(0, 388, __pyx_L1_error)
   if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_query), (&PyBytes_Type), 1, "query", 1))) __PYX_ERR(0, 388, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_headers), (&PyList_Type), 1, "headers", 1))) __PYX_ERR(0, 388, __pyx_L1_error)
   __pyx_r = __pyx_pf_10blacksheep_8messages_7Request_2incoming(((PyTypeObject*)__pyx_v_cls), __pyx_v_method, __pyx_v_path, __pyx_v_query, __pyx_v_headers);
 
   /* function exit code */
@@ -18840,55 +18850,74 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_2incoming(PyTypeObject
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("incoming", 1);
 
-  /* "blacksheep/messages.pyx":389
- *     @classmethod
- *     def incoming(cls, str method, bytes path, bytes query, list headers):
- *         request = cls(method, None, headers)             # <<<<<<<<<<<<<<
+  /* "blacksheep/messages.pyx":392
+ *         # not copy them for each request
+ *         request = cls(
+ *             method, None, headers if type(headers) is list else list(headers)             # <<<<<<<<<<<<<<
+ *         )
  *         request._path = path
- *         request._raw_query = query
  */
-  __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 389, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (((PyObject *)Py_TYPE(__pyx_v_headers)) == ((PyObject *)(&PyList_Type)));
+  if (__pyx_t_2) {
+    __Pyx_INCREF(__pyx_v_headers);
+    __pyx_t_1 = __pyx_v_headers;
+  } else {
+    __pyx_t_3 = PySequence_List(__pyx_v_headers); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 392, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = __pyx_t_3;
+    __pyx_t_3 = 0;
+  }
+
+  /* "blacksheep/messages.pyx":391
+ *         # ASGI servers pass headers as lists in most cases: these are used as-is, to
+ *         # not copy them for each request
+ *         request = cls(             # <<<<<<<<<<<<<<
+ *             method, None, headers if type(headers) is list else list(headers)
+ *         )
+ */
+  __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 391, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
   __Pyx_INCREF(__pyx_v_method);
   __Pyx_GIVEREF(__pyx_v_method);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_method)) __PYX_ERR(0, 389, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_method)) __PYX_ERR(0, 391, __pyx_L1_error);
   __Pyx_INCREF(Py_None);
   __Pyx_GIVEREF(Py_None);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 1, Py_None)) __PYX_ERR(0, 389, __pyx_L1_error);
-  __Pyx_INCREF(__pyx_v_headers);
-  __Pyx_GIVEREF(__pyx_v_headers);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_headers)) __PYX_ERR(0, 389, __pyx_L1_error);
-  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_v_cls), __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 389, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_request = __pyx_t_2;
-  __pyx_t_2 = 0;
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 1, Py_None)) __PYX_ERR(0, 391, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_1);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_t_1)) __PYX_ERR(0, 391, __pyx_L1_error);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_v_cls), __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 391, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_request = __pyx_t_1;
+  __pyx_t_1 = 0;
 
-  /* "blacksheep/messages.pyx":390
- *     def incoming(cls, str method, bytes path, bytes query, list headers):
- *         request = cls(method, None, headers)
+  /* "blacksheep/messages.pyx":394
+ *             method, None, headers if type(headers) is list else list(headers)
+ *         )
  *         request._path = path             # <<<<<<<<<<<<<<
  *         request._raw_query = query
  *         return request
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_request, __pyx_n_s_path_2, __pyx_v_path) < 0) __PYX_ERR(0, 390, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_request, __pyx_n_s_path_2, __pyx_v_path) < 0) __PYX_ERR(0, 394, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":391
- *         request = cls(method, None, headers)
+  /* "blacksheep/messages.pyx":395
+ *         )
  *         request._path = path
  *         request._raw_query = query             # <<<<<<<<<<<<<<
  *         return request
  * 
  */
-  if (__Pyx_PyObject_SetAttrStr(__pyx_v_request, __pyx_n_s_raw_query, __pyx_v_query) < 0) __PYX_ERR(0, 391, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_request, __pyx_n_s_raw_query, __pyx_v_query) < 0) __PYX_ERR(0, 395, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":392
+  /* "blacksheep/messages.pyx":396
  *         request._path = path
  *         request._raw_query = query
  *         return request             # <<<<<<<<<<<<<<
@@ -18904,14 +18933,14 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_2incoming(PyTypeObject
  *         self._session = value
  * 
  *     @classmethod             # <<<<<<<<<<<<<<
- *     def incoming(cls, str method, bytes path, bytes query, list headers):
- *         request = cls(method, None, headers)
+ *     def incoming(cls, str method, bytes path, bytes query, object headers):
+ *         # ASGI servers pass headers as lists in most cases: these are used as-is, to
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
   __Pyx_AddTraceback("blacksheep.messages.Request.incoming", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -18921,7 +18950,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_2incoming(PyTypeObject
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":394
+/* "blacksheep/messages.pyx":398
  *         return request
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -18958,7 +18987,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_5query___get__(struct
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 1);
 
-  /* "blacksheep/messages.pyx":396
+  /* "blacksheep/messages.pyx":400
  *     @property
  *     def query(self):
  *         if self._raw_query:             # <<<<<<<<<<<<<<
@@ -18968,7 +18997,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_5query___get__(struct
   __pyx_t_1 = (__pyx_v_self->_raw_query != Py_None)&&(PyBytes_GET_SIZE(__pyx_v_self->_raw_query) != 0);
   if (__pyx_t_1) {
 
-    /* "blacksheep/messages.pyx":397
+    /* "blacksheep/messages.pyx":401
  *     def query(self):
  *         if self._raw_query:
  *             return parse_qs(self._raw_query.decode("utf8"))             # <<<<<<<<<<<<<<
@@ -18976,13 +19005,13 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_5query___get__(struct
  * 
  */
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_parse_qs); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 397, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_parse_qs); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 401, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     if (unlikely(__pyx_v_self->_raw_query == Py_None)) {
       PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "decode");
-      __PYX_ERR(0, 397, __pyx_L1_error)
+      __PYX_ERR(0, 401, __pyx_L1_error)
     }
-    __pyx_t_4 = __Pyx_decode_bytes(__pyx_v_self->_raw_query, 0, PY_SSIZE_T_MAX, NULL, NULL, PyUnicode_DecodeUTF8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 397, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_decode_bytes(__pyx_v_self->_raw_query, 0, PY_SSIZE_T_MAX, NULL, NULL, PyUnicode_DecodeUTF8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 401, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_5 = NULL;
     __pyx_t_6 = 0;
@@ -19003,7 +19032,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_5query___get__(struct
       __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_6, 1+__pyx_t_6);
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 397, __pyx_L1_error)
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 401, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     }
@@ -19011,7 +19040,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_5query___get__(struct
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "blacksheep/messages.pyx":396
+    /* "blacksheep/messages.pyx":400
  *     @property
  *     def query(self):
  *         if self._raw_query:             # <<<<<<<<<<<<<<
@@ -19020,7 +19049,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_5query___get__(struct
  */
   }
 
-  /* "blacksheep/messages.pyx":398
+  /* "blacksheep/messages.pyx":402
  *         if self._raw_query:
  *             return parse_qs(self._raw_query.decode("utf8"))
  *         return {}             # <<<<<<<<<<<<<<
@@ -19028,13 +19057,13 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_5query___get__(struct
  *     @query.setter
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 398, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 402, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "blacksheep/messages.pyx":394
+  /* "blacksheep/messages.pyx":398
  *         return request
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -19056,7 +19085,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_5query___get__(struct
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":400
+/* "blacksheep/messages.pyx":404
  *         return {}
  * 
  *     @query.setter             # <<<<<<<<<<<<<<
@@ -19093,14 +19122,14 @@ static int __pyx_pf_10blacksheep_8messages_7Request_5query_2__set__(struct __pyx
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 1);
 
-  /* "blacksheep/messages.pyx":403
+  /* "blacksheep/messages.pyx":407
  *     def query(self, value):
  *         cdef bytes raw_query
  *         raw_query = urlencode(value, True).encode("utf8")             # <<<<<<<<<<<<<<
  *         self._raw_query = raw_query
  *         self.url = self.url.with_query(raw_query)
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_urlencode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 403, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_urlencode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 407, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_4 = NULL;
   __pyx_t_5 = 0;
@@ -19120,11 +19149,11 @@ static int __pyx_pf_10blacksheep_8messages_7Request_5query_2__set__(struct __pyx
     PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_v_value, Py_True};
     __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 2+__pyx_t_5);
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 403, __pyx_L1_error)
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 407, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   }
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_encode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 403, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_encode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 407, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_t_2 = NULL;
@@ -19145,15 +19174,15 @@ static int __pyx_pf_10blacksheep_8messages_7Request_5query_2__set__(struct __pyx
     PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_n_u_utf8};
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 403, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 407, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   }
-  if (!(likely(PyBytes_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_1))) __PYX_ERR(0, 403, __pyx_L1_error)
+  if (!(likely(PyBytes_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_1))) __PYX_ERR(0, 407, __pyx_L1_error)
   __pyx_v_raw_query = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "blacksheep/messages.pyx":404
+  /* "blacksheep/messages.pyx":408
  *         cdef bytes raw_query
  *         raw_query = urlencode(value, True).encode("utf8")
  *         self._raw_query = raw_query             # <<<<<<<<<<<<<<
@@ -19166,16 +19195,16 @@ static int __pyx_pf_10blacksheep_8messages_7Request_5query_2__set__(struct __pyx
   __Pyx_DECREF(__pyx_v_self->_raw_query);
   __pyx_v_self->_raw_query = __pyx_v_raw_query;
 
-  /* "blacksheep/messages.pyx":405
+  /* "blacksheep/messages.pyx":409
  *         raw_query = urlencode(value, True).encode("utf8")
  *         self._raw_query = raw_query
  *         self.url = self.url.with_query(raw_query)             # <<<<<<<<<<<<<<
  * 
  *     @property
  */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_url); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 405, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_url); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 409, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_with_query); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 405, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_with_query); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 409, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_t_3 = NULL;
@@ -19196,14 +19225,14 @@ static int __pyx_pf_10blacksheep_8messages_7Request_5query_2__set__(struct __pyx
     PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_raw_query};
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 405, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 409, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   }
-  if (__Pyx_PyObject_SetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_url, __pyx_t_1) < 0) __PYX_ERR(0, 405, __pyx_L1_error)
+  if (__Pyx_PyObject_SetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_url, __pyx_t_1) < 0) __PYX_ERR(0, 409, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "blacksheep/messages.pyx":400
+  /* "blacksheep/messages.pyx":404
  *         return {}
  * 
  *     @query.setter             # <<<<<<<<<<<<<<
@@ -19227,7 +19256,7 @@ static int __pyx_pf_10blacksheep_8messages_7Request_5query_2__set__(struct __pyx
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":407
+/* "blacksheep/messages.pyx":411
  *         self.url = self.url.with_query(raw_query)
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -19261,17 +19290,17 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_3url___get__(struct __
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 1);
 
-  /* "blacksheep/messages.pyx":409
+  /* "blacksheep/messages.pyx":413
  *     @property
  *     def url(self):
  *         if self._url:             # <<<<<<<<<<<<<<
  *             return self._url
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(((PyObject *)__pyx_v_self->_url)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 409, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(((PyObject *)__pyx_v_self->_url)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 413, __pyx_L1_error)
   if (__pyx_t_1) {
 
-    /* "blacksheep/messages.pyx":410
+    /* "blacksheep/messages.pyx":414
  *     def url(self):
  *         if self._url:
  *             return self._url             # <<<<<<<<<<<<<<
@@ -19283,7 +19312,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_3url___get__(struct __
     __pyx_r = ((PyObject *)__pyx_v_self->_url);
     goto __pyx_L0;
 
-    /* "blacksheep/messages.pyx":409
+    /* "blacksheep/messages.pyx":413
  *     @property
  *     def url(self):
  *         if self._url:             # <<<<<<<<<<<<<<
@@ -19292,7 +19321,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_3url___get__(struct __
  */
   }
 
-  /* "blacksheep/messages.pyx":412
+  /* "blacksheep/messages.pyx":416
  *             return self._url
  * 
  *         if self._raw_query:             # <<<<<<<<<<<<<<
@@ -19302,19 +19331,19 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_3url___get__(struct __
   __pyx_t_1 = (__pyx_v_self->_raw_query != Py_None)&&(PyBytes_GET_SIZE(__pyx_v_self->_raw_query) != 0);
   if (__pyx_t_1) {
 
-    /* "blacksheep/messages.pyx":413
+    /* "blacksheep/messages.pyx":417
  * 
  *         if self._raw_query:
  *             self._url = URL(self._path + b'?' + self._raw_query)             # <<<<<<<<<<<<<<
  *         else:
  *             self._url = URL(self._path)
  */
-    __pyx_t_2 = PyNumber_Add(__pyx_v_self->_path, __pyx_kp_b__19); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 413, __pyx_L1_error)
+    __pyx_t_2 = PyNumber_Add(__pyx_v_self->_path, __pyx_kp_b__19); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 417, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyNumber_Add(__pyx_t_2, __pyx_v_self->_raw_query); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 413, __pyx_L1_error)
+    __pyx_t_3 = PyNumber_Add(__pyx_t_2, __pyx_v_self->_raw_query); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 417, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = __Pyx_PyObject_CallOneArg(((PyObject *)__pyx_ptype_10blacksheep_3url_URL), __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 413, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg(((PyObject *)__pyx_ptype_10blacksheep_3url_URL), __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 417, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_GIVEREF(__pyx_t_2);
@@ -19323,7 +19352,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_3url___get__(struct __
     __pyx_v_self->_url = ((struct __pyx_obj_10blacksheep_3url_URL *)__pyx_t_2);
     __pyx_t_2 = 0;
 
-    /* "blacksheep/messages.pyx":412
+    /* "blacksheep/messages.pyx":416
  *             return self._url
  * 
  *         if self._raw_query:             # <<<<<<<<<<<<<<
@@ -19333,7 +19362,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_3url___get__(struct __
     goto __pyx_L4;
   }
 
-  /* "blacksheep/messages.pyx":415
+  /* "blacksheep/messages.pyx":419
  *             self._url = URL(self._path + b'?' + self._raw_query)
  *         else:
  *             self._url = URL(self._path)             # <<<<<<<<<<<<<<
@@ -19341,7 +19370,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_3url___get__(struct __
  * 
  */
   /*else*/ {
-    __pyx_t_2 = __Pyx_PyObject_CallOneArg(((PyObject *)__pyx_ptype_10blacksheep_3url_URL), __pyx_v_self->_path); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 415, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg(((PyObject *)__pyx_ptype_10blacksheep_3url_URL), __pyx_v_self->_path); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 419, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_GIVEREF(__pyx_t_2);
     __Pyx_GOTREF((PyObject *)__pyx_v_self->_url);
@@ -19351,7 +19380,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_3url___get__(struct __
   }
   __pyx_L4:;
 
-  /* "blacksheep/messages.pyx":416
+  /* "blacksheep/messages.pyx":420
  *         else:
  *             self._url = URL(self._path)
  *         return self._url             # <<<<<<<<<<<<<<
@@ -19363,7 +19392,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_3url___get__(struct __
   __pyx_r = ((PyObject *)__pyx_v_self->_url);
   goto __pyx_L0;
 
-  /* "blacksheep/messages.pyx":407
+  /* "blacksheep/messages.pyx":411
  *         self.url = self.url.with_query(raw_query)
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -19383,7 +19412,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_3url___get__(struct __
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":418
+/* "blacksheep/messages.pyx":422
  *         return self._url
  * 
  *     @url.setter             # <<<<<<<<<<<<<<
@@ -19420,17 +19449,17 @@ static int __pyx_pf_10blacksheep_8messages_7Request_3url_2__set__(struct __pyx_o
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 1);
 
-  /* "blacksheep/messages.pyx":422
+  /* "blacksheep/messages.pyx":426
  *         cdef URL _url
  * 
  *         if value:             # <<<<<<<<<<<<<<
  *             if isinstance(value, bytes):
  *                 _url = URL(value)
  */
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 422, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 426, __pyx_L1_error)
   if (__pyx_t_1) {
 
-    /* "blacksheep/messages.pyx":423
+    /* "blacksheep/messages.pyx":427
  * 
  *         if value:
  *             if isinstance(value, bytes):             # <<<<<<<<<<<<<<
@@ -19440,19 +19469,19 @@ static int __pyx_pf_10blacksheep_8messages_7Request_3url_2__set__(struct __pyx_o
     __pyx_t_1 = PyBytes_Check(__pyx_v_value); 
     if (__pyx_t_1) {
 
-      /* "blacksheep/messages.pyx":424
+      /* "blacksheep/messages.pyx":428
  *         if value:
  *             if isinstance(value, bytes):
  *                 _url = URL(value)             # <<<<<<<<<<<<<<
  *             elif isinstance(value, str):
  *                 _url = URL(value.encode('utf8'))
  */
-      __pyx_t_2 = __Pyx_PyObject_CallOneArg(((PyObject *)__pyx_ptype_10blacksheep_3url_URL), __pyx_v_value); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 424, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(((PyObject *)__pyx_ptype_10blacksheep_3url_URL), __pyx_v_value); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 428, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __pyx_v__url = ((struct __pyx_obj_10blacksheep_3url_URL *)__pyx_t_2);
       __pyx_t_2 = 0;
 
-      /* "blacksheep/messages.pyx":423
+      /* "blacksheep/messages.pyx":427
  * 
  *         if value:
  *             if isinstance(value, bytes):             # <<<<<<<<<<<<<<
@@ -19462,7 +19491,7 @@ static int __pyx_pf_10blacksheep_8messages_7Request_3url_2__set__(struct __pyx_o
       goto __pyx_L4;
     }
 
-    /* "blacksheep/messages.pyx":425
+    /* "blacksheep/messages.pyx":429
  *             if isinstance(value, bytes):
  *                 _url = URL(value)
  *             elif isinstance(value, str):             # <<<<<<<<<<<<<<
@@ -19472,14 +19501,14 @@ static int __pyx_pf_10blacksheep_8messages_7Request_3url_2__set__(struct __pyx_o
     __pyx_t_1 = PyUnicode_Check(__pyx_v_value); 
     if (__pyx_t_1) {
 
-      /* "blacksheep/messages.pyx":426
+      /* "blacksheep/messages.pyx":430
  *                 _url = URL(value)
  *             elif isinstance(value, str):
  *                 _url = URL(value.encode('utf8'))             # <<<<<<<<<<<<<<
  *             elif isinstance(value, URL):
  *                 _url = value
  */
-      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_value, __pyx_n_s_encode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 426, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_value, __pyx_n_s_encode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 430, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __pyx_t_4 = NULL;
       __pyx_t_5 = 0;
@@ -19499,17 +19528,17 @@ static int __pyx_pf_10blacksheep_8messages_7Request_3url_2__set__(struct __pyx_o
         PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_n_u_utf8};
         __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
         __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 426, __pyx_L1_error)
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 430, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       }
-      __pyx_t_3 = __Pyx_PyObject_CallOneArg(((PyObject *)__pyx_ptype_10blacksheep_3url_URL), __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 426, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_CallOneArg(((PyObject *)__pyx_ptype_10blacksheep_3url_URL), __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 430, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __pyx_v__url = ((struct __pyx_obj_10blacksheep_3url_URL *)__pyx_t_3);
       __pyx_t_3 = 0;
 
-      /* "blacksheep/messages.pyx":425
+      /* "blacksheep/messages.pyx":429
  *             if isinstance(value, bytes):
  *                 _url = URL(value)
  *             elif isinstance(value, str):             # <<<<<<<<<<<<<<
@@ -19519,7 +19548,7 @@ static int __pyx_pf_10blacksheep_8messages_7Request_3url_2__set__(struct __pyx_o
       goto __pyx_L4;
     }
 
-    /* "blacksheep/messages.pyx":427
+    /* "blacksheep/messages.pyx":431
  *             elif isinstance(value, str):
  *                 _url = URL(value.encode('utf8'))
  *             elif isinstance(value, URL):             # <<<<<<<<<<<<<<
@@ -19529,20 +19558,20 @@ static int __pyx_pf_10blacksheep_8messages_7Request_3url_2__set__(struct __pyx_o
     __pyx_t_1 = __Pyx_TypeCheck(__pyx_v_value, __pyx_ptype_10blacksheep_3url_URL); 
     if (likely(__pyx_t_1)) {
 
-      /* "blacksheep/messages.pyx":428
+      /* "blacksheep/messages.pyx":432
  *                 _url = URL(value.encode('utf8'))
  *             elif isinstance(value, URL):
  *                 _url = value             # <<<<<<<<<<<<<<
  *             else:
  *                 raise TypeError('Invalid value type, expected bytes, str, or URL')
  */
-      if (!(likely(((__pyx_v_value) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_value, __pyx_ptype_10blacksheep_3url_URL))))) __PYX_ERR(0, 428, __pyx_L1_error)
+      if (!(likely(((__pyx_v_value) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_value, __pyx_ptype_10blacksheep_3url_URL))))) __PYX_ERR(0, 432, __pyx_L1_error)
       __pyx_t_3 = __pyx_v_value;
       __Pyx_INCREF(__pyx_t_3);
       __pyx_v__url = ((struct __pyx_obj_10blacksheep_3url_URL *)__pyx_t_3);
       __pyx_t_3 = 0;
 
-      /* "blacksheep/messages.pyx":427
+      /* "blacksheep/messages.pyx":431
  *             elif isinstance(value, str):
  *                 _url = URL(value.encode('utf8'))
  *             elif isinstance(value, URL):             # <<<<<<<<<<<<<<
@@ -19552,7 +19581,7 @@ static int __pyx_pf_10blacksheep_8messages_7Request_3url_2__set__(struct __pyx_o
       goto __pyx_L4;
     }
 
-    /* "blacksheep/messages.pyx":430
+    /* "blacksheep/messages.pyx":434
  *                 _url = value
  *             else:
  *                 raise TypeError('Invalid value type, expected bytes, str, or URL')             # <<<<<<<<<<<<<<
@@ -19560,15 +19589,15 @@ static int __pyx_pf_10blacksheep_8messages_7Request_3url_2__set__(struct __pyx_o
  *             _url = None
  */
     /*else*/ {
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__20, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 430, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__20, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 434, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __PYX_ERR(0, 430, __pyx_L1_error)
+      __PYX_ERR(0, 434, __pyx_L1_error)
     }
     __pyx_L4:;
 
-    /* "blacksheep/messages.pyx":422
+    /* "blacksheep/messages.pyx":426
  *         cdef URL _url
  * 
  *         if value:             # <<<<<<<<<<<<<<
@@ -19578,7 +19607,7 @@ static int __pyx_pf_10blacksheep_8messages_7Request_3url_2__set__(struct __pyx_o
     goto __pyx_L3;
   }
 
-  /* "blacksheep/messages.pyx":432
+  /* "blacksheep/messages.pyx":436
  *                 raise TypeError('Invalid value type, expected bytes, str, or URL')
  *         else:
  *             _url = None             # <<<<<<<<<<<<<<
@@ -19591,17 +19620,17 @@ static int __pyx_pf_10blacksheep_8messages_7Request_3url_2__set__(struct __pyx_o
   }
   __pyx_L3:;
 
-  /* "blacksheep/messages.pyx":434
+  /* "blacksheep/messages.pyx":438
  *             _url = None
  * 
  *         if _url:             # <<<<<<<<<<<<<<
  *             self._path = _url.path
  *             self._raw_query = _url.query
  */
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(((PyObject *)__pyx_v__url)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 434, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(((PyObject *)__pyx_v__url)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 438, __pyx_L1_error)
   if (__pyx_t_1) {
 
-    /* "blacksheep/messages.pyx":435
+    /* "blacksheep/messages.pyx":439
  * 
  *         if _url:
  *             self._path = _url.path             # <<<<<<<<<<<<<<
@@ -19616,7 +19645,7 @@ static int __pyx_pf_10blacksheep_8messages_7Request_3url_2__set__(struct __pyx_o
     __pyx_v_self->_path = ((PyObject*)__pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "blacksheep/messages.pyx":436
+    /* "blacksheep/messages.pyx":440
  *         if _url:
  *             self._path = _url.path
  *             self._raw_query = _url.query             # <<<<<<<<<<<<<<
@@ -19631,7 +19660,7 @@ static int __pyx_pf_10blacksheep_8messages_7Request_3url_2__set__(struct __pyx_o
     __pyx_v_self->_raw_query = ((PyObject*)__pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "blacksheep/messages.pyx":434
+    /* "blacksheep/messages.pyx":438
  *             _url = None
  * 
  *         if _url:             # <<<<<<<<<<<<<<
@@ -19641,7 +19670,7 @@ static int __pyx_pf_10blacksheep_8messages_7Request_3url_2__set__(struct __pyx_o
     goto __pyx_L5;
   }
 
-  /* "blacksheep/messages.pyx":438
+  /* "blacksheep/messages.pyx":442
  *             self._raw_query = _url.query
  *         else:
  *             self._path = None             # <<<<<<<<<<<<<<
@@ -19655,7 +19684,7 @@ static int __pyx_pf_10blacksheep_8messages_7Request_3url_2__set__(struct __pyx_o
     __Pyx_DECREF(__pyx_v_self->_path);
     __pyx_v_self->_path = ((PyObject*)Py_None);
 
-    /* "blacksheep/messages.pyx":439
+    /* "blacksheep/messages.pyx":443
  *         else:
  *             self._path = None
  *             self._raw_query = None             # <<<<<<<<<<<<<<
@@ -19670,7 +19699,7 @@ static int __pyx_pf_10blacksheep_8messages_7Request_3url_2__set__(struct __pyx_o
   }
   __pyx_L5:;
 
-  /* "blacksheep/messages.pyx":440
+  /* "blacksheep/messages.pyx":444
  *             self._path = None
  *             self._raw_query = None
  *         self._url = _url             # <<<<<<<<<<<<<<
@@ -19683,7 +19712,7 @@ static int __pyx_pf_10blacksheep_8messages_7Request_3url_2__set__(struct __pyx_o
   __Pyx_DECREF((PyObject *)__pyx_v_self->_url);
   __pyx_v_self->_url = __pyx_v__url;
 
-  /* "blacksheep/messages.pyx":442
+  /* "blacksheep/messages.pyx":446
  *         self._url = _url
  *         # unset the cached host
  *         self.__dict__["host"] = None             # <<<<<<<<<<<<<<
@@ -19692,20 +19721,20 @@ static int __pyx_pf_10blacksheep_8messages_7Request_3url_2__set__(struct __pyx_o
  */
   if (unlikely(__pyx_v_self->__dict__ == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-    __PYX_ERR(0, 442, __pyx_L1_error)
+    __PYX_ERR(0, 446, __pyx_L1_error)
   }
-  if (unlikely((PyDict_SetItem(__pyx_v_self->__dict__, __pyx_n_u_host, Py_None) < 0))) __PYX_ERR(0, 442, __pyx_L1_error)
+  if (unlikely((PyDict_SetItem(__pyx_v_self->__dict__, __pyx_n_u_host, Py_None) < 0))) __PYX_ERR(0, 446, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":443
+  /* "blacksheep/messages.pyx":447
  *         # unset the cached host
  *         self.__dict__["host"] = None
  *         self.remove_header(b"host")             # <<<<<<<<<<<<<<
  * 
  *     def __repr__(self):
  */
-  ((struct __pyx_vtabstruct_10blacksheep_8messages_Request *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.remove_header(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_self), __pyx_n_b_host, 0); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 443, __pyx_L1_error)
+  ((struct __pyx_vtabstruct_10blacksheep_8messages_Request *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.remove_header(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_self), __pyx_n_b_host, 0); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 447, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":418
+  /* "blacksheep/messages.pyx":422
  *         return self._url
  * 
  *     @url.setter             # <<<<<<<<<<<<<<
@@ -19728,7 +19757,7 @@ static int __pyx_pf_10blacksheep_8messages_7Request_3url_2__set__(struct __pyx_o
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":445
+/* "blacksheep/messages.pyx":449
  *         self.remove_header(b"host")
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -19766,7 +19795,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_4__repr__(struct __pyx
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__repr__", 1);
 
-  /* "blacksheep/messages.pyx":446
+  /* "blacksheep/messages.pyx":450
  * 
  *     def __repr__(self):
  *         return f'<Request {self.method} {self.url.value.decode()}>'             # <<<<<<<<<<<<<<
@@ -19774,7 +19803,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_4__repr__(struct __pyx
  *     @property
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyTuple_New(5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 446, __pyx_L1_error)
+  __pyx_t_1 = PyTuple_New(5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 450, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_2 = 0;
   __pyx_t_3 = 127;
@@ -19782,7 +19811,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_4__repr__(struct __pyx
   __pyx_t_2 += 9;
   __Pyx_GIVEREF(__pyx_kp_u_Request);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_kp_u_Request);
-  __pyx_t_4 = __Pyx_PyUnicode_Unicode(__pyx_v_self->method); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 446, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyUnicode_Unicode(__pyx_v_self->method); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 450, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_t_3 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_4) > __pyx_t_3) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_4) : __pyx_t_3;
   __pyx_t_2 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_4);
@@ -19793,12 +19822,12 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_4__repr__(struct __pyx
   __pyx_t_2 += 1;
   __Pyx_GIVEREF(__pyx_kp_u__21);
   PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_kp_u__21);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_url); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 446, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_url); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 450, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_value); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 446, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_value); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 450, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_decode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 446, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_decode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 450, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __pyx_t_6 = NULL;
@@ -19819,11 +19848,11 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_4__repr__(struct __pyx
     PyObject *__pyx_callargs[2] = {__pyx_t_6, NULL};
     __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_7, 0+__pyx_t_7);
     __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 446, __pyx_L1_error)
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 450, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   }
-  __pyx_t_5 = __Pyx_PyObject_FormatSimple(__pyx_t_4, __pyx_empty_unicode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 446, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_FormatSimple(__pyx_t_4, __pyx_empty_unicode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 450, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __pyx_t_3 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_5) > __pyx_t_3) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_5) : __pyx_t_3;
@@ -19835,14 +19864,14 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_4__repr__(struct __pyx
   __pyx_t_2 += 1;
   __Pyx_GIVEREF(__pyx_kp_u__22);
   PyTuple_SET_ITEM(__pyx_t_1, 4, __pyx_kp_u__22);
-  __pyx_t_5 = __Pyx_PyUnicode_Join(__pyx_t_1, 5, __pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 446, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyUnicode_Join(__pyx_t_1, 5, __pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 450, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_r = __pyx_t_5;
   __pyx_t_5 = 0;
   goto __pyx_L0;
 
-  /* "blacksheep/messages.pyx":445
+  /* "blacksheep/messages.pyx":449
  *         self.remove_header(b"host")
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -19864,7 +19893,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_4__repr__(struct __pyx
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":448
+/* "blacksheep/messages.pyx":452
  *         return f'<Request {self.method} {self.url.value.decode()}>'
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -19920,31 +19949,31 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 1);
 
-  /* "blacksheep/messages.pyx":452
+  /* "blacksheep/messages.pyx":456
  *         cdef bytes header
  *         cdef list cookies_headers
  *         cdef dict cookies = {}             # <<<<<<<<<<<<<<
  * 
  *         cookies_headers = self.get_headers(b'cookie')
  */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 452, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 456, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_cookies = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "blacksheep/messages.pyx":454
+  /* "blacksheep/messages.pyx":458
  *         cdef dict cookies = {}
  * 
  *         cookies_headers = self.get_headers(b'cookie')             # <<<<<<<<<<<<<<
  *         if cookies_headers:
  *             for header in cookies_headers:
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_10blacksheep_8messages_Request *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.get_headers(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_self), __pyx_n_b_cookie, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 454, __pyx_L1_error)
+  __pyx_t_1 = ((struct __pyx_vtabstruct_10blacksheep_8messages_Request *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.get_headers(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_self), __pyx_n_b_cookie, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 458, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_cookies_headers = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "blacksheep/messages.pyx":455
+  /* "blacksheep/messages.pyx":459
  * 
  *         cookies_headers = self.get_headers(b'cookie')
  *         if cookies_headers:             # <<<<<<<<<<<<<<
@@ -19954,7 +19983,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
   __pyx_t_2 = (__pyx_v_cookies_headers != Py_None)&&(PyList_GET_SIZE(__pyx_v_cookies_headers) != 0);
   if (__pyx_t_2) {
 
-    /* "blacksheep/messages.pyx":456
+    /* "blacksheep/messages.pyx":460
  *         cookies_headers = self.get_headers(b'cookie')
  *         if cookies_headers:
  *             for header in cookies_headers:             # <<<<<<<<<<<<<<
@@ -19963,7 +19992,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
  */
     if (unlikely(__pyx_v_cookies_headers == Py_None)) {
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-      __PYX_ERR(0, 456, __pyx_L1_error)
+      __PYX_ERR(0, 460, __pyx_L1_error)
     }
     __pyx_t_1 = __pyx_v_cookies_headers; __Pyx_INCREF(__pyx_t_1);
     __pyx_t_3 = 0;
@@ -19971,33 +20000,33 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
       {
         Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
         #if !CYTHON_ASSUME_SAFE_MACROS
-        if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 456, __pyx_L1_error)
+        if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 460, __pyx_L1_error)
         #endif
         if (__pyx_t_3 >= __pyx_temp) break;
       }
       #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-      __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_4); __pyx_t_3++; if (unlikely((0 < 0))) __PYX_ERR(0, 456, __pyx_L1_error)
+      __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_4); __pyx_t_3++; if (unlikely((0 < 0))) __PYX_ERR(0, 460, __pyx_L1_error)
       #else
-      __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 456, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 460, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       #endif
-      if (!(likely(PyBytes_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_4))) __PYX_ERR(0, 456, __pyx_L1_error)
+      if (!(likely(PyBytes_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_4))) __PYX_ERR(0, 460, __pyx_L1_error)
       __Pyx_XDECREF_SET(__pyx_v_header, ((PyObject*)__pyx_t_4));
       __pyx_t_4 = 0;
 
-      /* "blacksheep/messages.pyx":459
+      /* "blacksheep/messages.pyx":463
  *                 # a single cookie header is expected from the client, but anyway here
  *                 # multiple headers are handled:
  *                 pairs = header.split(b'; ')             # <<<<<<<<<<<<<<
  * 
  *                 for fragment in pairs:
  */
-      __pyx_t_4 = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyBytes_Type_split, __pyx_v_header, __pyx_kp_b__23); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 459, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyBytes_Type_split, __pyx_v_header, __pyx_kp_b__23); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 463, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_XDECREF_SET(__pyx_v_pairs, __pyx_t_4);
       __pyx_t_4 = 0;
 
-      /* "blacksheep/messages.pyx":461
+      /* "blacksheep/messages.pyx":465
  *                 pairs = header.split(b'; ')
  * 
  *                 for fragment in pairs:             # <<<<<<<<<<<<<<
@@ -20009,9 +20038,9 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
         __pyx_t_5 = 0;
         __pyx_t_6 = NULL;
       } else {
-        __pyx_t_5 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_pairs); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 461, __pyx_L1_error)
+        __pyx_t_5 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_pairs); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 465, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
-        __pyx_t_6 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 461, __pyx_L1_error)
+        __pyx_t_6 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 465, __pyx_L1_error)
       }
       for (;;) {
         if (likely(!__pyx_t_6)) {
@@ -20019,28 +20048,28 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
             {
               Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_4);
               #if !CYTHON_ASSUME_SAFE_MACROS
-              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 461, __pyx_L1_error)
+              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 465, __pyx_L1_error)
               #endif
               if (__pyx_t_5 >= __pyx_temp) break;
             }
             #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-            __pyx_t_7 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_7); __pyx_t_5++; if (unlikely((0 < 0))) __PYX_ERR(0, 461, __pyx_L1_error)
+            __pyx_t_7 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_7); __pyx_t_5++; if (unlikely((0 < 0))) __PYX_ERR(0, 465, __pyx_L1_error)
             #else
-            __pyx_t_7 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 461, __pyx_L1_error)
+            __pyx_t_7 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 465, __pyx_L1_error)
             __Pyx_GOTREF(__pyx_t_7);
             #endif
           } else {
             {
               Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_4);
               #if !CYTHON_ASSUME_SAFE_MACROS
-              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 461, __pyx_L1_error)
+              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 465, __pyx_L1_error)
               #endif
               if (__pyx_t_5 >= __pyx_temp) break;
             }
             #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-            __pyx_t_7 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_7); __pyx_t_5++; if (unlikely((0 < 0))) __PYX_ERR(0, 461, __pyx_L1_error)
+            __pyx_t_7 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_7); __pyx_t_5++; if (unlikely((0 < 0))) __PYX_ERR(0, 465, __pyx_L1_error)
             #else
-            __pyx_t_7 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 461, __pyx_L1_error)
+            __pyx_t_7 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 465, __pyx_L1_error)
             __Pyx_GOTREF(__pyx_t_7);
             #endif
           }
@@ -20050,7 +20079,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
             PyObject* exc_type = PyErr_Occurred();
             if (exc_type) {
               if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-              else __PYX_ERR(0, 461, __pyx_L1_error)
+              else __PYX_ERR(0, 465, __pyx_L1_error)
             }
             break;
           }
@@ -20059,7 +20088,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
         __Pyx_XDECREF_SET(__pyx_v_fragment, __pyx_t_7);
         __pyx_t_7 = 0;
 
-        /* "blacksheep/messages.pyx":462
+        /* "blacksheep/messages.pyx":466
  * 
  *                 for fragment in pairs:
  *                     try:             # <<<<<<<<<<<<<<
@@ -20075,15 +20104,15 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
           __Pyx_XGOTREF(__pyx_t_10);
           /*try:*/ {
 
-            /* "blacksheep/messages.pyx":463
+            /* "blacksheep/messages.pyx":467
  *                 for fragment in pairs:
  *                     try:
  *                         name, value = split_value(fragment, b"=")             # <<<<<<<<<<<<<<
  *                     except ValueError as unpack_error:
  *                         # discard cookie: in this case it's better to eat the exception
  */
-            if (!(likely(PyBytes_CheckExact(__pyx_v_fragment))||((__pyx_v_fragment) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_v_fragment))) __PYX_ERR(0, 463, __pyx_L8_error)
-            __pyx_t_7 = __pyx_f_10blacksheep_7cookies_split_value(((PyObject*)__pyx_v_fragment), __pyx_kp_b__24); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 463, __pyx_L8_error)
+            if (!(likely(PyBytes_CheckExact(__pyx_v_fragment))||((__pyx_v_fragment) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_v_fragment))) __PYX_ERR(0, 467, __pyx_L8_error)
+            __pyx_t_7 = __pyx_f_10blacksheep_7cookies_split_value(((PyObject*)__pyx_v_fragment), __pyx_kp_b__24); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 467, __pyx_L8_error)
             __Pyx_GOTREF(__pyx_t_7);
             if (likely(__pyx_t_7 != Py_None)) {
               PyObject* sequence = __pyx_t_7;
@@ -20091,7 +20120,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
               if (unlikely(size != 2)) {
                 if (size > 2) __Pyx_RaiseTooManyValuesError(2);
                 else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-                __PYX_ERR(0, 463, __pyx_L8_error)
+                __PYX_ERR(0, 467, __pyx_L8_error)
               }
               #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
               __pyx_t_11 = PyTuple_GET_ITEM(sequence, 0); 
@@ -20099,21 +20128,21 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
               __Pyx_INCREF(__pyx_t_11);
               __Pyx_INCREF(__pyx_t_12);
               #else
-              __pyx_t_11 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 463, __pyx_L8_error)
+              __pyx_t_11 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 467, __pyx_L8_error)
               __Pyx_GOTREF(__pyx_t_11);
-              __pyx_t_12 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 463, __pyx_L8_error)
+              __pyx_t_12 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 467, __pyx_L8_error)
               __Pyx_GOTREF(__pyx_t_12);
               #endif
               __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
             } else {
-              __Pyx_RaiseNoneNotIterableError(); __PYX_ERR(0, 463, __pyx_L8_error)
+              __Pyx_RaiseNoneNotIterableError(); __PYX_ERR(0, 467, __pyx_L8_error)
             }
             __Pyx_XDECREF_SET(__pyx_v_name, __pyx_t_11);
             __pyx_t_11 = 0;
             __Pyx_XDECREF_SET(__pyx_v_value, __pyx_t_12);
             __pyx_t_12 = 0;
 
-            /* "blacksheep/messages.pyx":462
+            /* "blacksheep/messages.pyx":466
  * 
  *                 for fragment in pairs:
  *                     try:             # <<<<<<<<<<<<<<
@@ -20122,7 +20151,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
  */
           }
 
-          /* "blacksheep/messages.pyx":469
+          /* "blacksheep/messages.pyx":473
  *                         pass
  *                     else:
  *                         cookies[unquote(name.decode())] = unquote(value.rstrip(b'; ').decode())             # <<<<<<<<<<<<<<
@@ -20130,9 +20159,9 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
  * 
  */
           /*else:*/ {
-            __Pyx_GetModuleGlobalName(__pyx_t_12, __pyx_n_s_unquote); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 469, __pyx_L10_except_error)
+            __Pyx_GetModuleGlobalName(__pyx_t_12, __pyx_n_s_unquote); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 473, __pyx_L10_except_error)
             __Pyx_GOTREF(__pyx_t_12);
-            __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_v_value, __pyx_n_s_rstrip); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 469, __pyx_L10_except_error)
+            __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_v_value, __pyx_n_s_rstrip); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 473, __pyx_L10_except_error)
             __Pyx_GOTREF(__pyx_t_14);
             __pyx_t_15 = NULL;
             __pyx_t_16 = 0;
@@ -20152,11 +20181,11 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
               PyObject *__pyx_callargs[2] = {__pyx_t_15, __pyx_kp_b__23};
               __pyx_t_13 = __Pyx_PyObject_FastCall(__pyx_t_14, __pyx_callargs+1-__pyx_t_16, 1+__pyx_t_16);
               __Pyx_XDECREF(__pyx_t_15); __pyx_t_15 = 0;
-              if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 469, __pyx_L10_except_error)
+              if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 473, __pyx_L10_except_error)
               __Pyx_GOTREF(__pyx_t_13);
               __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
             }
-            __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_t_13, __pyx_n_s_decode); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 469, __pyx_L10_except_error)
+            __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_t_13, __pyx_n_s_decode); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 473, __pyx_L10_except_error)
             __Pyx_GOTREF(__pyx_t_14);
             __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
             __pyx_t_13 = NULL;
@@ -20177,7 +20206,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
               PyObject *__pyx_callargs[2] = {__pyx_t_13, NULL};
               __pyx_t_11 = __Pyx_PyObject_FastCall(__pyx_t_14, __pyx_callargs+1-__pyx_t_16, 0+__pyx_t_16);
               __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
-              if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 469, __pyx_L10_except_error)
+              if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 473, __pyx_L10_except_error)
               __Pyx_GOTREF(__pyx_t_11);
               __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
             }
@@ -20200,13 +20229,13 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
               __pyx_t_7 = __Pyx_PyObject_FastCall(__pyx_t_12, __pyx_callargs+1-__pyx_t_16, 1+__pyx_t_16);
               __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
               __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-              if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 469, __pyx_L10_except_error)
+              if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 473, __pyx_L10_except_error)
               __Pyx_GOTREF(__pyx_t_7);
               __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
             }
-            __Pyx_GetModuleGlobalName(__pyx_t_11, __pyx_n_s_unquote); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 469, __pyx_L10_except_error)
+            __Pyx_GetModuleGlobalName(__pyx_t_11, __pyx_n_s_unquote); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 473, __pyx_L10_except_error)
             __Pyx_GOTREF(__pyx_t_11);
-            __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_v_name, __pyx_n_s_decode); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 469, __pyx_L10_except_error)
+            __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_v_name, __pyx_n_s_decode); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 473, __pyx_L10_except_error)
             __Pyx_GOTREF(__pyx_t_13);
             __pyx_t_15 = NULL;
             __pyx_t_16 = 0;
@@ -20226,7 +20255,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
               PyObject *__pyx_callargs[2] = {__pyx_t_15, NULL};
               __pyx_t_14 = __Pyx_PyObject_FastCall(__pyx_t_13, __pyx_callargs+1-__pyx_t_16, 0+__pyx_t_16);
               __Pyx_XDECREF(__pyx_t_15); __pyx_t_15 = 0;
-              if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 469, __pyx_L10_except_error)
+              if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 473, __pyx_L10_except_error)
               __Pyx_GOTREF(__pyx_t_14);
               __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
             }
@@ -20249,11 +20278,11 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
               __pyx_t_12 = __Pyx_PyObject_FastCall(__pyx_t_11, __pyx_callargs+1-__pyx_t_16, 1+__pyx_t_16);
               __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
               __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-              if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 469, __pyx_L10_except_error)
+              if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 473, __pyx_L10_except_error)
               __Pyx_GOTREF(__pyx_t_12);
               __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
             }
-            if (unlikely((PyDict_SetItem(__pyx_v_cookies, __pyx_t_12, __pyx_t_7) < 0))) __PYX_ERR(0, 469, __pyx_L10_except_error)
+            if (unlikely((PyDict_SetItem(__pyx_v_cookies, __pyx_t_12, __pyx_t_7) < 0))) __PYX_ERR(0, 473, __pyx_L10_except_error)
             __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
             __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
           }
@@ -20266,7 +20295,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
           __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
           __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
 
-          /* "blacksheep/messages.pyx":464
+          /* "blacksheep/messages.pyx":468
  *                     try:
  *                         name, value = split_value(fragment, b"=")
  *                     except ValueError as unpack_error:             # <<<<<<<<<<<<<<
@@ -20276,7 +20305,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
           __pyx_t_17 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_ValueError);
           if (__pyx_t_17) {
             __Pyx_AddTraceback("blacksheep.messages.Request.cookies.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-            if (__Pyx_GetException(&__pyx_t_7, &__pyx_t_12, &__pyx_t_11) < 0) __PYX_ERR(0, 464, __pyx_L10_except_error)
+            if (__Pyx_GetException(&__pyx_t_7, &__pyx_t_12, &__pyx_t_11) < 0) __PYX_ERR(0, 468, __pyx_L10_except_error)
             __Pyx_XGOTREF(__pyx_t_7);
             __Pyx_XGOTREF(__pyx_t_12);
             __Pyx_XGOTREF(__pyx_t_11);
@@ -20298,7 +20327,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
           }
           goto __pyx_L10_except_error;
 
-          /* "blacksheep/messages.pyx":462
+          /* "blacksheep/messages.pyx":466
  * 
  *                 for fragment in pairs:
  *                     try:             # <<<<<<<<<<<<<<
@@ -20319,7 +20348,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
           __pyx_L15_try_end:;
         }
 
-        /* "blacksheep/messages.pyx":461
+        /* "blacksheep/messages.pyx":465
  *                 pairs = header.split(b'; ')
  * 
  *                 for fragment in pairs:             # <<<<<<<<<<<<<<
@@ -20329,7 +20358,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
       }
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-      /* "blacksheep/messages.pyx":456
+      /* "blacksheep/messages.pyx":460
  *         cookies_headers = self.get_headers(b'cookie')
  *         if cookies_headers:
  *             for header in cookies_headers:             # <<<<<<<<<<<<<<
@@ -20339,7 +20368,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
     }
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "blacksheep/messages.pyx":455
+    /* "blacksheep/messages.pyx":459
  * 
  *         cookies_headers = self.get_headers(b'cookie')
  *         if cookies_headers:             # <<<<<<<<<<<<<<
@@ -20348,7 +20377,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
  */
   }
 
-  /* "blacksheep/messages.pyx":470
+  /* "blacksheep/messages.pyx":474
  *                     else:
  *                         cookies[unquote(name.decode())] = unquote(value.rstrip(b'; ').decode())
  *         return cookies             # <<<<<<<<<<<<<<
@@ -20360,7 +20389,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
   __pyx_r = __pyx_v_cookies;
   goto __pyx_L0;
 
-  /* "blacksheep/messages.pyx":448
+  /* "blacksheep/messages.pyx":452
  *         return f'<Request {self.method} {self.url.value.decode()}>'
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -20394,7 +20423,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_7cookies___get__(struc
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":472
+/* "blacksheep/messages.pyx":476
  *         return cookies
  * 
  *     def get_cookie(self, str name):             # <<<<<<<<<<<<<<
@@ -20455,12 +20484,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 472, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 476, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "get_cookie") < 0)) __PYX_ERR(0, 472, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "get_cookie") < 0)) __PYX_ERR(0, 476, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
@@ -20471,7 +20500,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get_cookie", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 472, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("get_cookie", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 476, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -20485,7 +20514,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_name), (&PyUnicode_Type), 1, "name", 1))) __PYX_ERR(0, 472, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_name), (&PyUnicode_Type), 1, "name", 1))) __PYX_ERR(0, 476, __pyx_L1_error)
   __pyx_r = __pyx_pf_10blacksheep_8messages_7Request_6get_cookie(((struct __pyx_obj_10blacksheep_8messages_Request *)__pyx_v_self), __pyx_v_name);
 
   /* function exit code */
@@ -20515,7 +20544,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_6get_cookie(struct __p
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_cookie", 1);
 
-  /* "blacksheep/messages.pyx":473
+  /* "blacksheep/messages.pyx":477
  * 
  *     def get_cookie(self, str name):
  *         return self.cookies.get(name)             # <<<<<<<<<<<<<<
@@ -20523,9 +20552,9 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_6get_cookie(struct __p
  *     def set_cookie(self, str name, str value):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_cookies); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 473, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_cookies); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 477, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_get); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 473, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_get); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 477, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_t_2 = NULL;
@@ -20546,7 +20575,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_6get_cookie(struct __p
     PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_v_name};
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 473, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 477, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   }
@@ -20554,7 +20583,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_6get_cookie(struct __p
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "blacksheep/messages.pyx":472
+  /* "blacksheep/messages.pyx":476
  *         return cookies
  * 
  *     def get_cookie(self, str name):             # <<<<<<<<<<<<<<
@@ -20575,7 +20604,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_6get_cookie(struct __p
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":475
+/* "blacksheep/messages.pyx":479
  *         return self.cookies.get(name)
  * 
  *     def set_cookie(self, str name, str value):             # <<<<<<<<<<<<<<
@@ -20640,7 +20669,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 475, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 479, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
@@ -20648,14 +20677,14 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 475, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 479, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("set_cookie", 1, 2, 2, 1); __PYX_ERR(0, 475, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("set_cookie", 1, 2, 2, 1); __PYX_ERR(0, 479, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "set_cookie") < 0)) __PYX_ERR(0, 475, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "set_cookie") < 0)) __PYX_ERR(0, 479, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 2)) {
       goto __pyx_L5_argtuple_error;
@@ -20668,7 +20697,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("set_cookie", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 475, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("set_cookie", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 479, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -20682,8 +20711,8 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_name), (&PyUnicode_Type), 1, "name", 1))) __PYX_ERR(0, 475, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_value), (&PyUnicode_Type), 1, "value", 1))) __PYX_ERR(0, 475, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_name), (&PyUnicode_Type), 1, "name", 1))) __PYX_ERR(0, 479, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_value), (&PyUnicode_Type), 1, "value", 1))) __PYX_ERR(0, 479, __pyx_L1_error)
   __pyx_r = __pyx_pf_10blacksheep_8messages_7Request_8set_cookie(((struct __pyx_obj_10blacksheep_8messages_Request *)__pyx_v_self), __pyx_v_name, __pyx_v_value);
 
   /* function exit code */
@@ -20719,14 +20748,14 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_8set_cookie(struct __p
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("set_cookie", 1);
 
-  /* "blacksheep/messages.pyx":483
+  /* "blacksheep/messages.pyx":487
  *         cdef bytes existing_cookie
  * 
  *         new_value = (quote(name) + "=" + quote(value)).encode()             # <<<<<<<<<<<<<<
  *         existing_cookie = self.get_first_header(b"cookie")
  * 
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_quote); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_quote); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 487, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_4 = NULL;
   __pyx_t_5 = 0;
@@ -20746,14 +20775,14 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_8set_cookie(struct __p
     PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_v_name};
     __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 483, __pyx_L1_error)
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 487, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   }
-  __pyx_t_3 = PyNumber_Add(__pyx_t_2, __pyx_kp_u__24); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __pyx_t_3 = PyNumber_Add(__pyx_t_2, __pyx_kp_u__24); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 487, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_quote); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_quote); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 487, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_t_6 = NULL;
   __pyx_t_5 = 0;
@@ -20773,15 +20802,15 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_8set_cookie(struct __p
     PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_v_value};
     __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
     __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 483, __pyx_L1_error)
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 487, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   }
-  __pyx_t_4 = PyNumber_Add(__pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __pyx_t_4 = PyNumber_Add(__pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 487, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_encode); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 483, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_encode); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 487, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __pyx_t_4 = NULL;
@@ -20802,27 +20831,27 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_8set_cookie(struct __p
     PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 483, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 487, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   }
-  if (!(likely(PyBytes_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_1))) __PYX_ERR(0, 483, __pyx_L1_error)
+  if (!(likely(PyBytes_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_1))) __PYX_ERR(0, 487, __pyx_L1_error)
   __pyx_v_new_value = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "blacksheep/messages.pyx":484
+  /* "blacksheep/messages.pyx":488
  * 
  *         new_value = (quote(name) + "=" + quote(value)).encode()
  *         existing_cookie = self.get_first_header(b"cookie")             # <<<<<<<<<<<<<<
  * 
  *         if existing_cookie:
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_10blacksheep_8messages_Request *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.get_first_header(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_self), __pyx_n_b_cookie, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 484, __pyx_L1_error)
+  __pyx_t_1 = ((struct __pyx_vtabstruct_10blacksheep_8messages_Request *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.get_first_header(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_self), __pyx_n_b_cookie, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 488, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_existing_cookie = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "blacksheep/messages.pyx":486
+  /* "blacksheep/messages.pyx":490
  *         existing_cookie = self.get_first_header(b"cookie")
  * 
  *         if existing_cookie:             # <<<<<<<<<<<<<<
@@ -20832,22 +20861,22 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_8set_cookie(struct __p
   __pyx_t_7 = (__pyx_v_existing_cookie != Py_None)&&(PyBytes_GET_SIZE(__pyx_v_existing_cookie) != 0);
   if (__pyx_t_7) {
 
-    /* "blacksheep/messages.pyx":487
+    /* "blacksheep/messages.pyx":491
  * 
  *         if existing_cookie:
  *             self.set_header(b"cookie", existing_cookie + b";" + new_value)             # <<<<<<<<<<<<<<
  *         else:
  *             self._raw_headers.append((b"cookie", new_value))
  */
-    __pyx_t_1 = PyNumber_Add(__pyx_v_existing_cookie, __pyx_kp_b__25); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 487, __pyx_L1_error)
+    __pyx_t_1 = PyNumber_Add(__pyx_v_existing_cookie, __pyx_kp_b__25); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 491, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = PyNumber_Add(__pyx_t_1, __pyx_v_new_value); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 487, __pyx_L1_error)
+    __pyx_t_2 = PyNumber_Add(__pyx_t_1, __pyx_v_new_value); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 491, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    ((struct __pyx_vtabstruct_10blacksheep_8messages_Request *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.set_header(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_self), __pyx_n_b_cookie, ((PyObject*)__pyx_t_2), 0); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 487, __pyx_L1_error)
+    ((struct __pyx_vtabstruct_10blacksheep_8messages_Request *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.set_header(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_self), __pyx_n_b_cookie, ((PyObject*)__pyx_t_2), 0); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 491, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-    /* "blacksheep/messages.pyx":486
+    /* "blacksheep/messages.pyx":490
  *         existing_cookie = self.get_first_header(b"cookie")
  * 
  *         if existing_cookie:             # <<<<<<<<<<<<<<
@@ -20857,7 +20886,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_8set_cookie(struct __p
     goto __pyx_L3;
   }
 
-  /* "blacksheep/messages.pyx":489
+  /* "blacksheep/messages.pyx":493
  *             self.set_header(b"cookie", existing_cookie + b";" + new_value)
  *         else:
  *             self._raw_headers.append((b"cookie", new_value))             # <<<<<<<<<<<<<<
@@ -20867,22 +20896,22 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_8set_cookie(struct __p
   /*else*/ {
     if (unlikely(__pyx_v_self->__pyx_base._raw_headers == Py_None)) {
       PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "append");
-      __PYX_ERR(0, 489, __pyx_L1_error)
+      __PYX_ERR(0, 493, __pyx_L1_error)
     }
-    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 489, __pyx_L1_error)
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 493, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_INCREF(__pyx_n_b_cookie);
     __Pyx_GIVEREF(__pyx_n_b_cookie);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_n_b_cookie)) __PYX_ERR(0, 489, __pyx_L1_error);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_n_b_cookie)) __PYX_ERR(0, 493, __pyx_L1_error);
     __Pyx_INCREF(__pyx_v_new_value);
     __Pyx_GIVEREF(__pyx_v_new_value);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_new_value)) __PYX_ERR(0, 489, __pyx_L1_error);
-    __pyx_t_8 = __Pyx_PyList_Append(__pyx_v_self->__pyx_base._raw_headers, __pyx_t_2); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 489, __pyx_L1_error)
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_new_value)) __PYX_ERR(0, 493, __pyx_L1_error);
+    __pyx_t_8 = __Pyx_PyList_Append(__pyx_v_self->__pyx_base._raw_headers, __pyx_t_2); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 493, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   }
   __pyx_L3:;
 
-  /* "blacksheep/messages.pyx":475
+  /* "blacksheep/messages.pyx":479
  *         return self.cookies.get(name)
  * 
  *     def set_cookie(self, str name, str value):             # <<<<<<<<<<<<<<
@@ -20909,7 +20938,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_8set_cookie(struct __p
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":491
+/* "blacksheep/messages.pyx":495
  *             self._raw_headers.append((b"cookie", new_value))
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -20941,7 +20970,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_4etag___get__(struct _
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 1);
 
-  /* "blacksheep/messages.pyx":493
+  /* "blacksheep/messages.pyx":497
  *     @property
  *     def etag(self):
  *         return self.get_first_header(b"etag")             # <<<<<<<<<<<<<<
@@ -20949,13 +20978,13 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_4etag___get__(struct _
  *     @property
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_10blacksheep_8messages_Request *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.get_first_header(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_self), __pyx_n_b_etag, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 493, __pyx_L1_error)
+  __pyx_t_1 = ((struct __pyx_vtabstruct_10blacksheep_8messages_Request *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.get_first_header(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_self), __pyx_n_b_etag, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 497, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "blacksheep/messages.pyx":491
+  /* "blacksheep/messages.pyx":495
  *             self._raw_headers.append((b"cookie", new_value))
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -20974,7 +21003,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_4etag___get__(struct _
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":495
+/* "blacksheep/messages.pyx":499
  *         return self.get_first_header(b"etag")
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -21006,7 +21035,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_13if_none_match___get_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 1);
 
-  /* "blacksheep/messages.pyx":497
+  /* "blacksheep/messages.pyx":501
  *     @property
  *     def if_none_match(self):
  *         return self.get_first_header(b"if-none-match")             # <<<<<<<<<<<<<<
@@ -21014,13 +21043,13 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_13if_none_match___get_
  *     cpdef bint expect_100_continue(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_10blacksheep_8messages_Request *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.get_first_header(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_self), __pyx_kp_b_if_none_match, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 497, __pyx_L1_error)
+  __pyx_t_1 = ((struct __pyx_vtabstruct_10blacksheep_8messages_Request *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.get_first_header(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_self), __pyx_kp_b_if_none_match, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 501, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "blacksheep/messages.pyx":495
+  /* "blacksheep/messages.pyx":499
  *         return self.get_first_header(b"etag")
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -21039,7 +21068,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_13if_none_match___get_
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":499
+/* "blacksheep/messages.pyx":503
  *         return self.get_first_header(b"if-none-match")
  * 
  *     cpdef bint expect_100_continue(self):             # <<<<<<<<<<<<<<
@@ -21078,7 +21107,7 @@ static int __pyx_f_10blacksheep_8messages_7Request_expect_100_continue(struct __
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_typedict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_expect_100_continue); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 499, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_expect_100_continue); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 503, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       if (!__Pyx_IsSameCFunction(__pyx_t_1, (void*) __pyx_pw_10blacksheep_8messages_7Request_11expect_100_continue)) {
         __Pyx_INCREF(__pyx_t_1);
@@ -21100,11 +21129,11 @@ static int __pyx_f_10blacksheep_8messages_7Request_expect_100_continue(struct __
           PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
           __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
           __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 499, __pyx_L1_error)
+          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 503, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
           __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
         }
-        __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 499, __pyx_L1_error)
+        __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 503, __pyx_L1_error)
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
         __pyx_r = __pyx_t_6;
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -21123,19 +21152,19 @@ static int __pyx_f_10blacksheep_8messages_7Request_expect_100_continue(struct __
     #endif
   }
 
-  /* "blacksheep/messages.pyx":501
+  /* "blacksheep/messages.pyx":505
  *     cpdef bint expect_100_continue(self):
  *         cdef bytes value
  *         value = self.get_first_header(b'expect')             # <<<<<<<<<<<<<<
  *         if value and value.lower() == b'100-continue':
  *             return True
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_10blacksheep_8messages_Request *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.get_first_header(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_self), __pyx_n_b_expect, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 501, __pyx_L1_error)
+  __pyx_t_1 = ((struct __pyx_vtabstruct_10blacksheep_8messages_Request *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.get_first_header(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_self), __pyx_n_b_expect, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 505, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_value = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "blacksheep/messages.pyx":502
+  /* "blacksheep/messages.pyx":506
  *         cdef bytes value
  *         value = self.get_first_header(b'expect')
  *         if value and value.lower() == b'100-continue':             # <<<<<<<<<<<<<<
@@ -21148,15 +21177,15 @@ static int __pyx_f_10blacksheep_8messages_7Request_expect_100_continue(struct __
     __pyx_t_6 = __pyx_t_7;
     goto __pyx_L4_bool_binop_done;
   }
-  __pyx_t_1 = __Pyx_CallUnboundCMethod0(&__pyx_umethod_PyBytes_Type_lower, __pyx_v_value); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 502, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_CallUnboundCMethod0(&__pyx_umethod_PyBytes_Type_lower, __pyx_v_value); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 506, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_7 = (__Pyx_PyBytes_Equals(__pyx_t_1, __pyx_kp_b_100_continue, Py_EQ)); if (unlikely((__pyx_t_7 < 0))) __PYX_ERR(0, 502, __pyx_L1_error)
+  __pyx_t_7 = (__Pyx_PyBytes_Equals(__pyx_t_1, __pyx_kp_b_100_continue, Py_EQ)); if (unlikely((__pyx_t_7 < 0))) __PYX_ERR(0, 506, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_6 = __pyx_t_7;
   __pyx_L4_bool_binop_done:;
   if (__pyx_t_6) {
 
-    /* "blacksheep/messages.pyx":503
+    /* "blacksheep/messages.pyx":507
  *         value = self.get_first_header(b'expect')
  *         if value and value.lower() == b'100-continue':
  *             return True             # <<<<<<<<<<<<<<
@@ -21166,7 +21195,7 @@ static int __pyx_f_10blacksheep_8messages_7Request_expect_100_continue(struct __
     __pyx_r = 1;
     goto __pyx_L0;
 
-    /* "blacksheep/messages.pyx":502
+    /* "blacksheep/messages.pyx":506
  *         cdef bytes value
  *         value = self.get_first_header(b'expect')
  *         if value and value.lower() == b'100-continue':             # <<<<<<<<<<<<<<
@@ -21175,17 +21204,17 @@ static int __pyx_f_10blacksheep_8messages_7Request_expect_100_continue(struct __
  */
   }
 
-  /* "blacksheep/messages.pyx":504
+  /* "blacksheep/messages.pyx":508
  *         if value and value.lower() == b'100-continue':
  *             return True
  *         return False             # <<<<<<<<<<<<<<
  * 
- *     async def is_disconnected(self):
+ *     cpdef void release(self):
  */
   __pyx_r = 0;
   goto __pyx_L0;
 
-  /* "blacksheep/messages.pyx":499
+  /* "blacksheep/messages.pyx":503
  *         return self.get_first_header(b"if-none-match")
  * 
  *     cpdef bint expect_100_continue(self):             # <<<<<<<<<<<<<<
@@ -21258,8 +21287,8 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_10expect_100_continue(
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("expect_100_continue", 1);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_10blacksheep_8messages_7Request_expect_100_continue(__pyx_v_self, 1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 499, __pyx_L1_error)
-  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 499, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_10blacksheep_8messages_7Request_expect_100_continue(__pyx_v_self, 1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 503, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 503, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
@@ -21275,26 +21304,237 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_10expect_100_continue(
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
-static PyObject *__pyx_gb_10blacksheep_8messages_7Request_14generator8(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value); /* proto */
 
-/* "blacksheep/messages.pyx":506
+/* "blacksheep/messages.pyx":510
  *         return False
  * 
+ *     cpdef void release(self):             # <<<<<<<<<<<<<<
+ *         # detaches the request from its ASGI request/response cycle, once the
+ *         # response has been sent
+ */
+
+static PyObject *__pyx_pw_10blacksheep_8messages_7Request_13release(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static void __pyx_f_10blacksheep_8messages_7Request_release(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self, int __pyx_skip_dispatch) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  unsigned int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("release", 1);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || __Pyx_PyType_HasFeature(Py_TYPE(((PyObject *)__pyx_v_self)), (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_typedict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_release); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 510, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!__Pyx_IsSameCFunction(__pyx_t_1, (void*) __pyx_pw_10blacksheep_8messages_7Request_13release)) {
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        __pyx_t_5 = 0;
+        #if CYTHON_UNPACK_METHODS
+        if (unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+            __pyx_t_5 = 1;
+          }
+        }
+        #endif
+        {
+          PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
+          __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
+          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 510, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        }
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_typedict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "blacksheep/messages.pyx":513
+ *         # detaches the request from its ASGI request/response cycle, once the
+ *         # response has been sent
+ *         self.scope = None             # <<<<<<<<<<<<<<
+ *         if isinstance(self.content, ASGIContent):
+ *             (<ASGIContent>self.content).dispose()
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->scope);
+  __Pyx_DECREF(__pyx_v_self->scope);
+  __pyx_v_self->scope = Py_None;
+
+  /* "blacksheep/messages.pyx":514
+ *         # response has been sent
+ *         self.scope = None
+ *         if isinstance(self.content, ASGIContent):             # <<<<<<<<<<<<<<
+ *             (<ASGIContent>self.content).dispose()
+ * 
+ */
+  __pyx_t_1 = ((PyObject *)__pyx_v_self->__pyx_base.content);
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_6 = __Pyx_TypeCheck(__pyx_t_1, __pyx_ptype_10blacksheep_8contents_ASGIContent); 
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_6) {
+
+    /* "blacksheep/messages.pyx":515
+ *         self.scope = None
+ *         if isinstance(self.content, ASGIContent):
+ *             (<ASGIContent>self.content).dispose()             # <<<<<<<<<<<<<<
+ * 
+ *     async def is_disconnected(self):
+ */
+    ((struct __pyx_vtabstruct_10blacksheep_8contents_ASGIContent *)((struct __pyx_obj_10blacksheep_8contents_ASGIContent *)__pyx_v_self->__pyx_base.content)->__pyx_vtab)->dispose(((struct __pyx_obj_10blacksheep_8contents_ASGIContent *)__pyx_v_self->__pyx_base.content), 0); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 515, __pyx_L1_error)
+
+    /* "blacksheep/messages.pyx":514
+ *         # response has been sent
+ *         self.scope = None
+ *         if isinstance(self.content, ASGIContent):             # <<<<<<<<<<<<<<
+ *             (<ASGIContent>self.content).dispose()
+ * 
+ */
+  }
+
+  /* "blacksheep/messages.pyx":510
+ *         return False
+ * 
+ *     cpdef void release(self):             # <<<<<<<<<<<<<<
+ *         # detaches the request from its ASGI request/response cycle, once the
+ *         # response has been sent
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("blacksheep.messages.Request.release", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_10blacksheep_8messages_7Request_13release(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_10blacksheep_8messages_7Request_13release = {"release", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10blacksheep_8messages_7Request_13release, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10blacksheep_8messages_7Request_13release(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("release (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("release", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "release", 0))) return NULL;
+  __pyx_r = __pyx_pf_10blacksheep_8messages_7Request_12release(((struct __pyx_obj_10blacksheep_8messages_Request *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_10blacksheep_8messages_7Request_12release(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("release", 1);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_f_10blacksheep_8messages_7Request_release(__pyx_v_self, 1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 510, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_void_to_None(NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 510, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("blacksheep.messages.Request.release", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+static PyObject *__pyx_gb_10blacksheep_8messages_7Request_16generator8(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value); /* proto */
+
+/* "blacksheep/messages.pyx":517
+ *             (<ASGIContent>self.content).dispose()
+ * 
  *     async def is_disconnected(self):             # <<<<<<<<<<<<<<
  *         if not isinstance(self.content, ASGIContent):
  *             raise TypeError(
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_10blacksheep_8messages_7Request_13is_disconnected(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_10blacksheep_8messages_7Request_15is_disconnected(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_10blacksheep_8messages_7Request_13is_disconnected = {"is_disconnected", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10blacksheep_8messages_7Request_13is_disconnected, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_10blacksheep_8messages_7Request_13is_disconnected(PyObject *__pyx_v_self, 
+static PyMethodDef __pyx_mdef_10blacksheep_8messages_7Request_15is_disconnected = {"is_disconnected", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10blacksheep_8messages_7Request_15is_disconnected, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10blacksheep_8messages_7Request_15is_disconnected(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -21319,14 +21559,14 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   if (unlikely(__pyx_nargs > 0)) {
     __Pyx_RaiseArgtupleInvalid("is_disconnected", 1, 0, 0, __pyx_nargs); return NULL;}
   if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "is_disconnected", 0))) return NULL;
-  __pyx_r = __pyx_pf_10blacksheep_8messages_7Request_12is_disconnected(((struct __pyx_obj_10blacksheep_8messages_Request *)__pyx_v_self));
+  __pyx_r = __pyx_pf_10blacksheep_8messages_7Request_14is_disconnected(((struct __pyx_obj_10blacksheep_8messages_Request *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10blacksheep_8messages_7Request_12is_disconnected(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self) {
+static PyObject *__pyx_pf_10blacksheep_8messages_7Request_14is_disconnected(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self) {
   struct __pyx_obj_10blacksheep_8messages___pyx_scope_struct_8_is_disconnected *__pyx_cur_scope;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
@@ -21338,7 +21578,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_12is_disconnected(stru
   if (unlikely(!__pyx_cur_scope)) {
     __pyx_cur_scope = ((struct __pyx_obj_10blacksheep_8messages___pyx_scope_struct_8_is_disconnected *)Py_None);
     __Pyx_INCREF(Py_None);
-    __PYX_ERR(0, 506, __pyx_L1_error)
+    __PYX_ERR(0, 517, __pyx_L1_error)
   } else {
     __Pyx_GOTREF((PyObject *)__pyx_cur_scope);
   }
@@ -21346,7 +21586,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_12is_disconnected(stru
   __Pyx_INCREF((PyObject *)__pyx_cur_scope->__pyx_v_self);
   __Pyx_GIVEREF((PyObject *)__pyx_cur_scope->__pyx_v_self);
   {
-    __pyx_CoroutineObject *gen = __Pyx_Coroutine_New((__pyx_coroutine_body_t) __pyx_gb_10blacksheep_8messages_7Request_14generator8, __pyx_codeobj__26, (PyObject *) __pyx_cur_scope, __pyx_n_s_is_disconnected, __pyx_n_s_Request_is_disconnected, __pyx_n_s_blacksheep_messages); if (unlikely(!gen)) __PYX_ERR(0, 506, __pyx_L1_error)
+    __pyx_CoroutineObject *gen = __Pyx_Coroutine_New((__pyx_coroutine_body_t) __pyx_gb_10blacksheep_8messages_7Request_16generator8, __pyx_codeobj__26, (PyObject *) __pyx_cur_scope, __pyx_n_s_is_disconnected, __pyx_n_s_Request_is_disconnected, __pyx_n_s_blacksheep_messages); if (unlikely(!gen)) __PYX_ERR(0, 517, __pyx_L1_error)
     __Pyx_DECREF(__pyx_cur_scope);
     __Pyx_RefNannyFinishContext();
     return (PyObject *) gen;
@@ -21362,7 +21602,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_12is_disconnected(stru
   return __pyx_r;
 }
 
-static PyObject *__pyx_gb_10blacksheep_8messages_7Request_14generator8(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value) /* generator body */
+static PyObject *__pyx_gb_10blacksheep_8messages_7Request_16generator8(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value) /* generator body */
 {
   struct __pyx_obj_10blacksheep_8messages___pyx_scope_struct_8_is_disconnected *__pyx_cur_scope = ((struct __pyx_obj_10blacksheep_8messages___pyx_scope_struct_8_is_disconnected *)__pyx_generator->closure);
   PyObject *__pyx_r = NULL;
@@ -21391,9 +21631,9 @@ static PyObject *__pyx_gb_10blacksheep_8messages_7Request_14generator8(__pyx_Cor
     return NULL;
   }
   __pyx_L3_first_run:;
-  if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 506, __pyx_L1_error)
+  if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 517, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":507
+  /* "blacksheep/messages.pyx":518
  * 
  *     async def is_disconnected(self):
  *         if not isinstance(self.content, ASGIContent):             # <<<<<<<<<<<<<<
@@ -21407,20 +21647,20 @@ static PyObject *__pyx_gb_10blacksheep_8messages_7Request_14generator8(__pyx_Cor
   __pyx_t_3 = (!__pyx_t_2);
   if (unlikely(__pyx_t_3)) {
 
-    /* "blacksheep/messages.pyx":508
+    /* "blacksheep/messages.pyx":519
  *     async def is_disconnected(self):
  *         if not isinstance(self.content, ASGIContent):
  *             raise TypeError(             # <<<<<<<<<<<<<<
  *                 "This method is only supported when a request is bound to "
  *                 "an instance of ASGIContent and to an ASGI "
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__27, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 508, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__27, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 519, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_Raise(__pyx_t_1, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(0, 508, __pyx_L1_error)
+    __PYX_ERR(0, 519, __pyx_L1_error)
 
-    /* "blacksheep/messages.pyx":507
+    /* "blacksheep/messages.pyx":518
  * 
  *     async def is_disconnected(self):
  *         if not isinstance(self.content, ASGIContent):             # <<<<<<<<<<<<<<
@@ -21429,29 +21669,29 @@ static PyObject *__pyx_gb_10blacksheep_8messages_7Request_14generator8(__pyx_Cor
  */
   }
 
-  /* "blacksheep/messages.pyx":514
+  /* "blacksheep/messages.pyx":525
  *             )
  * 
  *         self.init_prop("_is_disconnected", False)             # <<<<<<<<<<<<<<
  *         if self._is_disconnected is True:
  *             return True
  */
-  ((struct __pyx_vtabstruct_10blacksheep_8messages_Request *)__pyx_cur_scope->__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.init_prop(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_cur_scope->__pyx_v_self), __pyx_n_u_is_disconnected_2, Py_False); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 514, __pyx_L1_error)
+  ((struct __pyx_vtabstruct_10blacksheep_8messages_Request *)__pyx_cur_scope->__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.init_prop(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_cur_scope->__pyx_v_self), __pyx_n_u_is_disconnected_2, Py_False); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 525, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":515
+  /* "blacksheep/messages.pyx":526
  * 
  *         self.init_prop("_is_disconnected", False)
  *         if self._is_disconnected is True:             # <<<<<<<<<<<<<<
  *             return True
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_cur_scope->__pyx_v_self), __pyx_n_s_is_disconnected_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 515, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_cur_scope->__pyx_v_self), __pyx_n_s_is_disconnected_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 526, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_3 = (__pyx_t_1 == Py_True);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   if (__pyx_t_3) {
 
-    /* "blacksheep/messages.pyx":516
+    /* "blacksheep/messages.pyx":527
  *         self.init_prop("_is_disconnected", False)
  *         if self._is_disconnected is True:
  *             return True             # <<<<<<<<<<<<<<
@@ -21462,7 +21702,7 @@ static PyObject *__pyx_gb_10blacksheep_8messages_7Request_14generator8(__pyx_Cor
     __pyx_r = NULL; __Pyx_ReturnWithStopIteration(Py_True);
     goto __pyx_L0;
 
-    /* "blacksheep/messages.pyx":515
+    /* "blacksheep/messages.pyx":526
  * 
  *         self.init_prop("_is_disconnected", False)
  *         if self._is_disconnected is True:             # <<<<<<<<<<<<<<
@@ -21471,7 +21711,7 @@ static PyObject *__pyx_gb_10blacksheep_8messages_7Request_14generator8(__pyx_Cor
  */
   }
 
-  /* "blacksheep/messages.pyx":518
+  /* "blacksheep/messages.pyx":529
  *             return True
  * 
  *         try:             # <<<<<<<<<<<<<<
@@ -21485,16 +21725,16 @@ static PyObject *__pyx_gb_10blacksheep_8messages_7Request_14generator8(__pyx_Cor
     __Pyx_XGOTREF(__pyx_t_6);
     /*try:*/ {
 
-      /* "blacksheep/messages.pyx":519
+      /* "blacksheep/messages.pyx":530
  * 
  *         try:
  *             await _call_soon(_read_stream(self))             # <<<<<<<<<<<<<<
  *         except MessageAborted:
  *             self._is_disconnected = True
  */
-      __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_n_s_call_soon); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 519, __pyx_L6_error)
+      __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_n_s_call_soon); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 530, __pyx_L6_error)
       __Pyx_GOTREF(__pyx_t_7);
-      __Pyx_GetModuleGlobalName(__pyx_t_9, __pyx_n_s_read_stream); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 519, __pyx_L6_error)
+      __Pyx_GetModuleGlobalName(__pyx_t_9, __pyx_n_s_read_stream); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 530, __pyx_L6_error)
       __Pyx_GOTREF(__pyx_t_9);
       __pyx_t_10 = NULL;
       __pyx_t_11 = 0;
@@ -21514,7 +21754,7 @@ static PyObject *__pyx_gb_10blacksheep_8messages_7Request_14generator8(__pyx_Cor
         PyObject *__pyx_callargs[2] = {__pyx_t_10, ((PyObject *)__pyx_cur_scope->__pyx_v_self)};
         __pyx_t_8 = __Pyx_PyObject_FastCall(__pyx_t_9, __pyx_callargs+1-__pyx_t_11, 1+__pyx_t_11);
         __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
-        if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 519, __pyx_L6_error)
+        if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 530, __pyx_L6_error)
         __Pyx_GOTREF(__pyx_t_8);
         __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
       }
@@ -21537,7 +21777,7 @@ static PyObject *__pyx_gb_10blacksheep_8messages_7Request_14generator8(__pyx_Cor
         __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_7, __pyx_callargs+1-__pyx_t_11, 1+__pyx_t_11);
         __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
         __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 519, __pyx_L6_error)
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 530, __pyx_L6_error)
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       }
@@ -21567,16 +21807,16 @@ static PyObject *__pyx_gb_10blacksheep_8messages_7Request_14generator8(__pyx_Cor
         __pyx_t_6 = __pyx_cur_scope->__pyx_t_2;
         __pyx_cur_scope->__pyx_t_2 = 0;
         __Pyx_XGOTREF(__pyx_t_6);
-        if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 519, __pyx_L6_error)
+        if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 530, __pyx_L6_error)
       } else {
         PyObject* exc_type = __Pyx_PyErr_CurrentExceptionType();
         if (exc_type) {
           if (likely(exc_type == PyExc_StopIteration || (exc_type != PyExc_GeneratorExit && __Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration)))) PyErr_Clear();
-          else __PYX_ERR(0, 519, __pyx_L6_error)
+          else __PYX_ERR(0, 530, __pyx_L6_error)
         }
       }
 
-      /* "blacksheep/messages.pyx":518
+      /* "blacksheep/messages.pyx":529
  *             return True
  * 
  *         try:             # <<<<<<<<<<<<<<
@@ -21595,7 +21835,7 @@ static PyObject *__pyx_gb_10blacksheep_8messages_7Request_14generator8(__pyx_Cor
     __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
     __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
 
-    /* "blacksheep/messages.pyx":520
+    /* "blacksheep/messages.pyx":531
  *         try:
  *             await _call_soon(_read_stream(self))
  *         except MessageAborted:             # <<<<<<<<<<<<<<
@@ -21605,19 +21845,19 @@ static PyObject *__pyx_gb_10blacksheep_8messages_7Request_14generator8(__pyx_Cor
     __pyx_t_12 = __Pyx_PyErr_ExceptionMatches(((PyObject *)__pyx_ptype_10blacksheep_10exceptions_MessageAborted));
     if (__pyx_t_12) {
       __Pyx_AddTraceback("blacksheep.messages.Request.is_disconnected", __pyx_clineno, __pyx_lineno, __pyx_filename);
-      if (__Pyx_GetException(&__pyx_t_1, &__pyx_t_7, &__pyx_t_8) < 0) __PYX_ERR(0, 520, __pyx_L8_except_error)
+      if (__Pyx_GetException(&__pyx_t_1, &__pyx_t_7, &__pyx_t_8) < 0) __PYX_ERR(0, 531, __pyx_L8_except_error)
       __Pyx_XGOTREF(__pyx_t_1);
       __Pyx_XGOTREF(__pyx_t_7);
       __Pyx_XGOTREF(__pyx_t_8);
 
-      /* "blacksheep/messages.pyx":521
+      /* "blacksheep/messages.pyx":532
  *             await _call_soon(_read_stream(self))
  *         except MessageAborted:
  *             self._is_disconnected = True             # <<<<<<<<<<<<<<
  * 
  *         return self._is_disconnected
  */
-      if (__Pyx_PyObject_SetAttrStr(((PyObject *)__pyx_cur_scope->__pyx_v_self), __pyx_n_s_is_disconnected_2, Py_True) < 0) __PYX_ERR(0, 521, __pyx_L8_except_error)
+      if (__Pyx_PyObject_SetAttrStr(((PyObject *)__pyx_cur_scope->__pyx_v_self), __pyx_n_s_is_disconnected_2, Py_True) < 0) __PYX_ERR(0, 532, __pyx_L8_except_error)
       __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
       __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -21625,7 +21865,7 @@ static PyObject *__pyx_gb_10blacksheep_8messages_7Request_14generator8(__pyx_Cor
     }
     goto __pyx_L8_except_error;
 
-    /* "blacksheep/messages.pyx":518
+    /* "blacksheep/messages.pyx":529
  *             return True
  * 
  *         try:             # <<<<<<<<<<<<<<
@@ -21646,7 +21886,7 @@ static PyObject *__pyx_gb_10blacksheep_8messages_7Request_14generator8(__pyx_Cor
     __pyx_L11_try_end:;
   }
 
-  /* "blacksheep/messages.pyx":523
+  /* "blacksheep/messages.pyx":534
  *             self._is_disconnected = True
  * 
  *         return self._is_disconnected             # <<<<<<<<<<<<<<
@@ -21654,15 +21894,15 @@ static PyObject *__pyx_gb_10blacksheep_8messages_7Request_14generator8(__pyx_Cor
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_cur_scope->__pyx_v_self), __pyx_n_s_is_disconnected_2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 523, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_cur_scope->__pyx_v_self), __pyx_n_s_is_disconnected_2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 534, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
   __pyx_r = NULL; __Pyx_ReturnWithStopIteration(__pyx_t_8);
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
   goto __pyx_L0;
   CYTHON_MAYBE_UNUSED_VAR(__pyx_cur_scope);
 
-  /* "blacksheep/messages.pyx":506
- *         return False
+  /* "blacksheep/messages.pyx":517
+ *             (<ASGIContent>self.content).dispose()
  * 
  *     async def is_disconnected(self):             # <<<<<<<<<<<<<<
  *         if not isinstance(self.content, ASGIContent):
@@ -22150,7 +22390,7 @@ static int __pyx_pf_10blacksheep_8messages_7Request_10_raw_query_4__del__(struct
  *     cdef public bytes _raw_query
  *     cdef public object route_values             # <<<<<<<<<<<<<<
  *     cdef public object scope
- * 
+ *     cdef object _session
  */
 
 /* Python wrapper */
@@ -22250,8 +22490,8 @@ static int __pyx_pf_10blacksheep_8messages_7Request_12route_values_4__del__(stru
  *     cdef public bytes _raw_query
  *     cdef public object route_values
  *     cdef public object scope             # <<<<<<<<<<<<<<
+ *     cdef object _session
  * 
- *     cdef dict __dict__
  */
 
 /* Python wrapper */
@@ -22354,15 +22594,15 @@ static int __pyx_pf_10blacksheep_8messages_7Request_5scope_4__del__(struct __pyx
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_10blacksheep_8messages_7Request_16__reduce_cython__(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_10blacksheep_8messages_7Request_18__reduce_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_10blacksheep_8messages_7Request_16__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10blacksheep_8messages_7Request_16__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_10blacksheep_8messages_7Request_16__reduce_cython__(PyObject *__pyx_v_self, 
+static PyMethodDef __pyx_mdef_10blacksheep_8messages_7Request_18__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10blacksheep_8messages_7Request_18__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10blacksheep_8messages_7Request_18__reduce_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -22387,14 +22627,14 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   if (unlikely(__pyx_nargs > 0)) {
     __Pyx_RaiseArgtupleInvalid("__reduce_cython__", 1, 0, 0, __pyx_nargs); return NULL;}
   if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__reduce_cython__", 0))) return NULL;
-  __pyx_r = __pyx_pf_10blacksheep_8messages_7Request_15__reduce_cython__(((struct __pyx_obj_10blacksheep_8messages_Request *)__pyx_v_self));
+  __pyx_r = __pyx_pf_10blacksheep_8messages_7Request_17__reduce_cython__(((struct __pyx_obj_10blacksheep_8messages_Request *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10blacksheep_8messages_7Request_15__reduce_cython__(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self) {
+static PyObject *__pyx_pf_10blacksheep_8messages_7Request_17__reduce_cython__(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self) {
   PyObject *__pyx_v_state = 0;
   PyObject *__pyx_v__dict = 0;
   int __pyx_v_use_setstate;
@@ -22413,11 +22653,11 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_15__reduce_cython__(st
   /* "(tree fragment)":5
  *     cdef object _dict
  *     cdef bint use_setstate
- *     state = (self._path, self._raw_headers, self._raw_query, self._url, self.content, self.method, self.route_values, self.scope)             # <<<<<<<<<<<<<<
+ *     state = (self._path, self._raw_headers, self._raw_query, self._session, self._url, self.content, self.method, self.route_values, self.scope)             # <<<<<<<<<<<<<<
  *     _dict = getattr(self, '__dict__', None)
  *     if _dict is not None:
  */
-  __pyx_t_1 = PyTuple_New(8); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 5, __pyx_L1_error)
+  __pyx_t_1 = PyTuple_New(9); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 5, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_v_self->_path);
   __Pyx_GIVEREF(__pyx_v_self->_path);
@@ -22428,27 +22668,30 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_15__reduce_cython__(st
   __Pyx_INCREF(__pyx_v_self->_raw_query);
   __Pyx_GIVEREF(__pyx_v_self->_raw_query);
   if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_self->_raw_query)) __PYX_ERR(3, 5, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_v_self->_session);
+  __Pyx_GIVEREF(__pyx_v_self->_session);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 3, __pyx_v_self->_session)) __PYX_ERR(3, 5, __pyx_L1_error);
   __Pyx_INCREF((PyObject *)__pyx_v_self->_url);
   __Pyx_GIVEREF((PyObject *)__pyx_v_self->_url);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 3, ((PyObject *)__pyx_v_self->_url))) __PYX_ERR(3, 5, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 4, ((PyObject *)__pyx_v_self->_url))) __PYX_ERR(3, 5, __pyx_L1_error);
   __Pyx_INCREF((PyObject *)__pyx_v_self->__pyx_base.content);
   __Pyx_GIVEREF((PyObject *)__pyx_v_self->__pyx_base.content);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 4, ((PyObject *)__pyx_v_self->__pyx_base.content))) __PYX_ERR(3, 5, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 5, ((PyObject *)__pyx_v_self->__pyx_base.content))) __PYX_ERR(3, 5, __pyx_L1_error);
   __Pyx_INCREF(__pyx_v_self->method);
   __Pyx_GIVEREF(__pyx_v_self->method);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 5, __pyx_v_self->method)) __PYX_ERR(3, 5, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 6, __pyx_v_self->method)) __PYX_ERR(3, 5, __pyx_L1_error);
   __Pyx_INCREF(__pyx_v_self->route_values);
   __Pyx_GIVEREF(__pyx_v_self->route_values);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 6, __pyx_v_self->route_values)) __PYX_ERR(3, 5, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 7, __pyx_v_self->route_values)) __PYX_ERR(3, 5, __pyx_L1_error);
   __Pyx_INCREF(__pyx_v_self->scope);
   __Pyx_GIVEREF(__pyx_v_self->scope);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 7, __pyx_v_self->scope)) __PYX_ERR(3, 5, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 8, __pyx_v_self->scope)) __PYX_ERR(3, 5, __pyx_L1_error);
   __pyx_v_state = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
   /* "(tree fragment)":6
  *     cdef bint use_setstate
- *     state = (self._path, self._raw_headers, self._raw_query, self._url, self.content, self.method, self.route_values, self.scope)
+ *     state = (self._path, self._raw_headers, self._raw_query, self._session, self._url, self.content, self.method, self.route_values, self.scope)
  *     _dict = getattr(self, '__dict__', None)             # <<<<<<<<<<<<<<
  *     if _dict is not None:
  *         state += (_dict,)
@@ -22459,7 +22702,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_15__reduce_cython__(st
   __pyx_t_1 = 0;
 
   /* "(tree fragment)":7
- *     state = (self._path, self._raw_headers, self._raw_query, self._url, self.content, self.method, self.route_values, self.scope)
+ *     state = (self._path, self._raw_headers, self._raw_query, self._session, self._url, self.content, self.method, self.route_values, self.scope)
  *     _dict = getattr(self, '__dict__', None)
  *     if _dict is not None:             # <<<<<<<<<<<<<<
  *         state += (_dict,)
@@ -22491,12 +22734,12 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_15__reduce_cython__(st
  *         state += (_dict,)
  *         use_setstate = True             # <<<<<<<<<<<<<<
  *     else:
- *         use_setstate = self._path is not None or self._raw_headers is not None or self._raw_query is not None or self._url is not None or self.content is not None or self.method is not None or self.route_values is not None or self.scope is not None
+ *         use_setstate = self._path is not None or self._raw_headers is not None or self._raw_query is not None or self._session is not None or self._url is not None or self.content is not None or self.method is not None or self.route_values is not None or self.scope is not None
  */
     __pyx_v_use_setstate = 1;
 
     /* "(tree fragment)":7
- *     state = (self._path, self._raw_headers, self._raw_query, self._url, self.content, self.method, self.route_values, self.scope)
+ *     state = (self._path, self._raw_headers, self._raw_query, self._session, self._url, self.content, self.method, self.route_values, self.scope)
  *     _dict = getattr(self, '__dict__', None)
  *     if _dict is not None:             # <<<<<<<<<<<<<<
  *         state += (_dict,)
@@ -22508,9 +22751,9 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_15__reduce_cython__(st
   /* "(tree fragment)":11
  *         use_setstate = True
  *     else:
- *         use_setstate = self._path is not None or self._raw_headers is not None or self._raw_query is not None or self._url is not None or self.content is not None or self.method is not None or self.route_values is not None or self.scope is not None             # <<<<<<<<<<<<<<
+ *         use_setstate = self._path is not None or self._raw_headers is not None or self._raw_query is not None or self._session is not None or self._url is not None or self.content is not None or self.method is not None or self.route_values is not None or self.scope is not None             # <<<<<<<<<<<<<<
  *     if use_setstate:
- *         return __pyx_unpickle_Request, (type(self), 0x80165aa, None), state
+ *         return __pyx_unpickle_Request, (type(self), 0xba91f9e, None), state
  */
   /*else*/ {
     __pyx_t_4 = (__pyx_v_self->_path != ((PyObject*)Py_None));
@@ -22531,6 +22774,12 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_15__reduce_cython__(st
       __pyx_t_2 = __pyx_t_4;
       goto __pyx_L4_bool_binop_done;
     }
+    __pyx_t_4 = (__pyx_v_self->_session != Py_None);
+    if (!__pyx_t_4) {
+    } else {
+      __pyx_t_2 = __pyx_t_4;
+      goto __pyx_L4_bool_binop_done;
+    }
     __pyx_t_4 = (((PyObject *)__pyx_v_self->_url) != Py_None);
     if (!__pyx_t_4) {
     } else {
@@ -22564,19 +22813,19 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_15__reduce_cython__(st
 
   /* "(tree fragment)":12
  *     else:
- *         use_setstate = self._path is not None or self._raw_headers is not None or self._raw_query is not None or self._url is not None or self.content is not None or self.method is not None or self.route_values is not None or self.scope is not None
+ *         use_setstate = self._path is not None or self._raw_headers is not None or self._raw_query is not None or self._session is not None or self._url is not None or self.content is not None or self.method is not None or self.route_values is not None or self.scope is not None
  *     if use_setstate:             # <<<<<<<<<<<<<<
- *         return __pyx_unpickle_Request, (type(self), 0x80165aa, None), state
+ *         return __pyx_unpickle_Request, (type(self), 0xba91f9e, None), state
  *     else:
  */
   if (__pyx_v_use_setstate) {
 
     /* "(tree fragment)":13
- *         use_setstate = self._path is not None or self._raw_headers is not None or self._raw_query is not None or self._url is not None or self.content is not None or self.method is not None or self.route_values is not None or self.scope is not None
+ *         use_setstate = self._path is not None or self._raw_headers is not None or self._raw_query is not None or self._session is not None or self._url is not None or self.content is not None or self.method is not None or self.route_values is not None or self.scope is not None
  *     if use_setstate:
- *         return __pyx_unpickle_Request, (type(self), 0x80165aa, None), state             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_Request, (type(self), 0xba91f9e, None), state             # <<<<<<<<<<<<<<
  *     else:
- *         return __pyx_unpickle_Request, (type(self), 0x80165aa, state)
+ *         return __pyx_unpickle_Request, (type(self), 0xba91f9e, state)
  */
     __Pyx_XDECREF(__pyx_r);
     __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_pyx_unpickle_Request); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 13, __pyx_L1_error)
@@ -22586,9 +22835,9 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_15__reduce_cython__(st
     __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
     __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
     if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))))) __PYX_ERR(3, 13, __pyx_L1_error);
-    __Pyx_INCREF(__pyx_int_134309290);
-    __Pyx_GIVEREF(__pyx_int_134309290);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_int_134309290)) __PYX_ERR(3, 13, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_int_195633054);
+    __Pyx_GIVEREF(__pyx_int_195633054);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_int_195633054)) __PYX_ERR(3, 13, __pyx_L1_error);
     __Pyx_INCREF(Py_None);
     __Pyx_GIVEREF(Py_None);
     if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 2, Py_None)) __PYX_ERR(3, 13, __pyx_L1_error);
@@ -22609,17 +22858,17 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_15__reduce_cython__(st
 
     /* "(tree fragment)":12
  *     else:
- *         use_setstate = self._path is not None or self._raw_headers is not None or self._raw_query is not None or self._url is not None or self.content is not None or self.method is not None or self.route_values is not None or self.scope is not None
+ *         use_setstate = self._path is not None or self._raw_headers is not None or self._raw_query is not None or self._session is not None or self._url is not None or self.content is not None or self.method is not None or self.route_values is not None or self.scope is not None
  *     if use_setstate:             # <<<<<<<<<<<<<<
- *         return __pyx_unpickle_Request, (type(self), 0x80165aa, None), state
+ *         return __pyx_unpickle_Request, (type(self), 0xba91f9e, None), state
  *     else:
  */
   }
 
   /* "(tree fragment)":15
- *         return __pyx_unpickle_Request, (type(self), 0x80165aa, None), state
+ *         return __pyx_unpickle_Request, (type(self), 0xba91f9e, None), state
  *     else:
- *         return __pyx_unpickle_Request, (type(self), 0x80165aa, state)             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_Request, (type(self), 0xba91f9e, state)             # <<<<<<<<<<<<<<
  * def __setstate_cython__(self, __pyx_state):
  *     __pyx_unpickle_Request__set_state(self, __pyx_state)
  */
@@ -22632,9 +22881,9 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_15__reduce_cython__(st
     __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
     __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
     if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))))) __PYX_ERR(3, 15, __pyx_L1_error);
-    __Pyx_INCREF(__pyx_int_134309290);
-    __Pyx_GIVEREF(__pyx_int_134309290);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_int_134309290)) __PYX_ERR(3, 15, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_int_195633054);
+    __Pyx_GIVEREF(__pyx_int_195633054);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_int_195633054)) __PYX_ERR(3, 15, __pyx_L1_error);
     __Pyx_INCREF(__pyx_v_state);
     __Pyx_GIVEREF(__pyx_v_state);
     if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_state)) __PYX_ERR(3, 15, __pyx_L1_error);
@@ -22674,21 +22923,21 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_15__reduce_cython__(st
 
 /* "(tree fragment)":16
  *     else:
- *         return __pyx_unpickle_Request, (type(self), 0x80165aa, state)
+ *         return __pyx_unpickle_Request, (type(self), 0xba91f9e, state)
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     __pyx_unpickle_Request__set_state(self, __pyx_state)
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_10blacksheep_8messages_7Request_18__setstate_cython__(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_10blacksheep_8messages_7Request_20__setstate_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_10blacksheep_8messages_7Request_18__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10blacksheep_8messages_7Request_18__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_10blacksheep_8messages_7Request_18__setstate_cython__(PyObject *__pyx_v_self, 
+static PyMethodDef __pyx_mdef_10blacksheep_8messages_7Request_20__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10blacksheep_8messages_7Request_20__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10blacksheep_8messages_7Request_20__setstate_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -22762,7 +23011,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_10blacksheep_8messages_7Request_17__setstate_cython__(((struct __pyx_obj_10blacksheep_8messages_Request *)__pyx_v_self), __pyx_v___pyx_state);
+  __pyx_r = __pyx_pf_10blacksheep_8messages_7Request_19__setstate_cython__(((struct __pyx_obj_10blacksheep_8messages_Request *)__pyx_v_self), __pyx_v___pyx_state);
 
   /* function exit code */
   {
@@ -22775,7 +23024,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10blacksheep_8messages_7Request_17__setstate_cython__(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pf_10blacksheep_8messages_7Request_19__setstate_cython__(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -22785,7 +23034,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_17__setstate_cython__(
   __Pyx_RefNannySetupContext("__setstate_cython__", 1);
 
   /* "(tree fragment)":17
- *         return __pyx_unpickle_Request, (type(self), 0x80165aa, state)
+ *         return __pyx_unpickle_Request, (type(self), 0xba91f9e, state)
  * def __setstate_cython__(self, __pyx_state):
  *     __pyx_unpickle_Request__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
  */
@@ -22796,7 +23045,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_17__setstate_cython__(
 
   /* "(tree fragment)":16
  *     else:
- *         return __pyx_unpickle_Request, (type(self), 0x80165aa, state)
+ *         return __pyx_unpickle_Request, (type(self), 0xba91f9e, state)
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     __pyx_unpickle_Request__set_state(self, __pyx_state)
  */
@@ -22814,7 +23063,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_7Request_17__setstate_cython__(
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":528
+/* "blacksheep/messages.pyx":539
  * cdef class Response(Message):
  * 
  *     def __init__(             # <<<<<<<<<<<<<<
@@ -22846,7 +23095,7 @@ static int __pyx_pw_10blacksheep_8messages_8Response_1__init__(PyObject *__pyx_v
   {
     PyObject **__pyx_pyargnames[] = {&__pyx_n_s_status,&__pyx_n_s_headers,&__pyx_n_s_content,0};
 
-    /* "blacksheep/messages.pyx":531
+    /* "blacksheep/messages.pyx":542
  *         self,
  *         int status,
  *         list headers = None,             # <<<<<<<<<<<<<<
@@ -22855,7 +23104,7 @@ static int __pyx_pw_10blacksheep_8messages_8Response_1__init__(PyObject *__pyx_v
  */
     values[1] = __Pyx_Arg_NewRef_VARARGS(((PyObject*)Py_None));
 
-    /* "blacksheep/messages.pyx":532
+    /* "blacksheep/messages.pyx":543
  *         int status,
  *         list headers = None,
  *         Content content = None             # <<<<<<<<<<<<<<
@@ -22882,26 +23131,26 @@ static int __pyx_pw_10blacksheep_8messages_8Response_1__init__(PyObject *__pyx_v
           (void)__Pyx_Arg_NewRef_VARARGS(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 528, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 539, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_headers);
           if (value) { values[1] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 528, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 539, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_content);
           if (value) { values[2] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 528, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 539, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__init__") < 0)) __PYX_ERR(0, 528, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__init__") < 0)) __PYX_ERR(0, 539, __pyx_L3_error)
       }
     } else {
       switch (__pyx_nargs) {
@@ -22914,13 +23163,13 @@ static int __pyx_pw_10blacksheep_8messages_8Response_1__init__(PyObject *__pyx_v
         default: goto __pyx_L5_argtuple_error;
       }
     }
-    __pyx_v_status = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_status == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 530, __pyx_L3_error)
+    __pyx_v_status = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_status == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 541, __pyx_L3_error)
     __pyx_v_headers = ((PyObject*)values[1]);
     __pyx_v_content = ((struct __pyx_obj_10blacksheep_8contents_Content *)values[2]);
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 0, 1, 3, __pyx_nargs); __PYX_ERR(0, 528, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 1, 3, __pyx_nargs); __PYX_ERR(0, 539, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -22934,11 +23183,11 @@ static int __pyx_pw_10blacksheep_8messages_8Response_1__init__(PyObject *__pyx_v
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_headers), (&PyList_Type), 1, "headers", 1))) __PYX_ERR(0, 531, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_content), __pyx_ptype_10blacksheep_8contents_Content, 1, "content", 0))) __PYX_ERR(0, 532, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_headers), (&PyList_Type), 1, "headers", 1))) __PYX_ERR(0, 542, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_content), __pyx_ptype_10blacksheep_8contents_Content, 1, "content", 0))) __PYX_ERR(0, 543, __pyx_L1_error)
   __pyx_r = __pyx_pf_10blacksheep_8messages_8Response___init__(((struct __pyx_obj_10blacksheep_8messages_Response *)__pyx_v_self), __pyx_v_status, __pyx_v_headers, __pyx_v_content);
 
-  /* "blacksheep/messages.pyx":528
+  /* "blacksheep/messages.pyx":539
  * cdef class Response(Message):
  * 
  *     def __init__(             # <<<<<<<<<<<<<<
@@ -22972,21 +23221,21 @@ static int __pyx_pf_10blacksheep_8messages_8Response___init__(struct __pyx_obj_1
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 1);
 
-  /* "blacksheep/messages.pyx":534
+  /* "blacksheep/messages.pyx":545
  *         Content content = None
  *     ):
  *         self._raw_headers = headers or []             # <<<<<<<<<<<<<<
  *         self.status = status
  *         self.content = content
  */
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_headers); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 534, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_headers); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 545, __pyx_L1_error)
   if (!__pyx_t_2) {
   } else {
     __Pyx_INCREF(__pyx_v_headers);
     __pyx_t_1 = __pyx_v_headers;
     goto __pyx_L3_bool_binop_done;
   }
-  __pyx_t_3 = PyList_New(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 534, __pyx_L1_error)
+  __pyx_t_3 = PyList_New(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 545, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_INCREF(__pyx_t_3);
   __pyx_t_1 = __pyx_t_3;
@@ -22998,7 +23247,7 @@ static int __pyx_pf_10blacksheep_8messages_8Response___init__(struct __pyx_obj_1
   __pyx_v_self->__pyx_base._raw_headers = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "blacksheep/messages.pyx":535
+  /* "blacksheep/messages.pyx":546
  *     ):
  *         self._raw_headers = headers or []
  *         self.status = status             # <<<<<<<<<<<<<<
@@ -23007,7 +23256,7 @@ static int __pyx_pf_10blacksheep_8messages_8Response___init__(struct __pyx_obj_1
  */
   __pyx_v_self->status = __pyx_v_status;
 
-  /* "blacksheep/messages.pyx":536
+  /* "blacksheep/messages.pyx":547
  *         self._raw_headers = headers or []
  *         self.status = status
  *         self.content = content             # <<<<<<<<<<<<<<
@@ -23020,7 +23269,7 @@ static int __pyx_pf_10blacksheep_8messages_8Response___init__(struct __pyx_obj_1
   __Pyx_DECREF((PyObject *)__pyx_v_self->__pyx_base.content);
   __pyx_v_self->__pyx_base.content = __pyx_v_content;
 
-  /* "blacksheep/messages.pyx":528
+  /* "blacksheep/messages.pyx":539
  * cdef class Response(Message):
  * 
  *     def __init__(             # <<<<<<<<<<<<<<
@@ -23041,7 +23290,7 @@ static int __pyx_pf_10blacksheep_8messages_8Response___init__(struct __pyx_obj_1
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":538
+/* "blacksheep/messages.pyx":549
  *         self.content = content
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -23076,7 +23325,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_2__repr__(struct __py
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__repr__", 1);
 
-  /* "blacksheep/messages.pyx":539
+  /* "blacksheep/messages.pyx":550
  * 
  *     def __repr__(self):
  *         return f'<Response {self.status}>'             # <<<<<<<<<<<<<<
@@ -23084,7 +23333,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_2__repr__(struct __py
  *     @property
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 539, __pyx_L1_error)
+  __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 550, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_2 = 0;
   __pyx_t_3 = 127;
@@ -23092,7 +23341,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_2__repr__(struct __py
   __pyx_t_2 += 10;
   __Pyx_GIVEREF(__pyx_kp_u_Response);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_kp_u_Response);
-  __pyx_t_4 = __Pyx_PyUnicode_From_int(__pyx_v_self->status, 0, ' ', 'd'); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 539, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyUnicode_From_int(__pyx_v_self->status, 0, ' ', 'd'); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 550, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_t_2 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_4);
   __Pyx_GIVEREF(__pyx_t_4);
@@ -23102,14 +23351,14 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_2__repr__(struct __py
   __pyx_t_2 += 1;
   __Pyx_GIVEREF(__pyx_kp_u__22);
   PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_kp_u__22);
-  __pyx_t_4 = __Pyx_PyUnicode_Join(__pyx_t_1, 3, __pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 539, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyUnicode_Join(__pyx_t_1, 3, __pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 550, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_r = __pyx_t_4;
   __pyx_t_4 = 0;
   goto __pyx_L0;
 
-  /* "blacksheep/messages.pyx":538
+  /* "blacksheep/messages.pyx":549
  *         self.content = content
  * 
  *     def __repr__(self):             # <<<<<<<<<<<<<<
@@ -23129,7 +23378,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_2__repr__(struct __py
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":541
+/* "blacksheep/messages.pyx":552
  *         return f'<Response {self.status}>'
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -23164,7 +23413,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_7cookies___get__(stru
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 1);
 
-  /* "blacksheep/messages.pyx":543
+  /* "blacksheep/messages.pyx":554
  *     @property
  *     def cookies(self):
  *         return self.get_cookies()             # <<<<<<<<<<<<<<
@@ -23172,7 +23421,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_7cookies___get__(stru
  *     @property
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get_cookies); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 543, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get_cookies); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 554, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   __pyx_t_4 = 0;
@@ -23192,7 +23441,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_7cookies___get__(stru
     PyObject *__pyx_callargs[2] = {__pyx_t_3, NULL};
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 0+__pyx_t_4);
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 543, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 554, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   }
@@ -23200,7 +23449,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_7cookies___get__(stru
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "blacksheep/messages.pyx":541
+  /* "blacksheep/messages.pyx":552
  *         return f'<Response {self.status}>'
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -23221,7 +23470,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_7cookies___get__(stru
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":545
+/* "blacksheep/messages.pyx":556
  *         return self.get_cookies()
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -23257,7 +23506,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_6reason___get__(struc
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 1);
 
-  /* "blacksheep/messages.pyx":547
+  /* "blacksheep/messages.pyx":558
  *     @property
  *     def reason(self) -> str:
  *         return http.HTTPStatus(self.status).phrase             # <<<<<<<<<<<<<<
@@ -23265,12 +23514,12 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_6reason___get__(struc
  *     def get_cookies(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_http); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 547, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_http); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 558, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_HTTPStatus); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 547, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_HTTPStatus); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 558, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->status); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 547, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->status); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 558, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_4 = NULL;
   __pyx_t_5 = 0;
@@ -23291,18 +23540,18 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_6reason___get__(struc
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 547, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 558, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   }
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_phrase); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 547, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_phrase); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 558, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_r = __pyx_t_3;
   __pyx_t_3 = 0;
   goto __pyx_L0;
 
-  /* "blacksheep/messages.pyx":545
+  /* "blacksheep/messages.pyx":556
  *         return self.get_cookies()
  * 
  *     @property             # <<<<<<<<<<<<<<
@@ -23324,7 +23573,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_6reason___get__(struc
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":549
+/* "blacksheep/messages.pyx":560
  *         return http.HTTPStatus(self.status).phrase
  * 
  *     def get_cookies(self):             # <<<<<<<<<<<<<<
@@ -23389,31 +23638,31 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_4get_cookies(struct _
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_cookies", 1);
 
-  /* "blacksheep/messages.pyx":555
+  /* "blacksheep/messages.pyx":566
  *         cdef list set_cookies_headers
  * 
  *         cookies = {}             # <<<<<<<<<<<<<<
  *         set_cookies_headers = self.get_headers(b'set-cookie')
  *         if set_cookies_headers:
  */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 555, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 566, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_cookies = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "blacksheep/messages.pyx":556
+  /* "blacksheep/messages.pyx":567
  * 
  *         cookies = {}
  *         set_cookies_headers = self.get_headers(b'set-cookie')             # <<<<<<<<<<<<<<
  *         if set_cookies_headers:
  *             for value in set_cookies_headers:
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_10blacksheep_8messages_Response *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.get_headers(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_self), __pyx_kp_b_set_cookie, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 556, __pyx_L1_error)
+  __pyx_t_1 = ((struct __pyx_vtabstruct_10blacksheep_8messages_Response *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.get_headers(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_self), __pyx_kp_b_set_cookie, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 567, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_set_cookies_headers = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "blacksheep/messages.pyx":557
+  /* "blacksheep/messages.pyx":568
  *         cookies = {}
  *         set_cookies_headers = self.get_headers(b'set-cookie')
  *         if set_cookies_headers:             # <<<<<<<<<<<<<<
@@ -23423,7 +23672,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_4get_cookies(struct _
   __pyx_t_2 = (__pyx_v_set_cookies_headers != Py_None)&&(PyList_GET_SIZE(__pyx_v_set_cookies_headers) != 0);
   if (__pyx_t_2) {
 
-    /* "blacksheep/messages.pyx":558
+    /* "blacksheep/messages.pyx":569
  *         set_cookies_headers = self.get_headers(b'set-cookie')
  *         if set_cookies_headers:
  *             for value in set_cookies_headers:             # <<<<<<<<<<<<<<
@@ -23432,7 +23681,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_4get_cookies(struct _
  */
     if (unlikely(__pyx_v_set_cookies_headers == Py_None)) {
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-      __PYX_ERR(0, 558, __pyx_L1_error)
+      __PYX_ERR(0, 569, __pyx_L1_error)
     }
     __pyx_t_1 = __pyx_v_set_cookies_headers; __Pyx_INCREF(__pyx_t_1);
     __pyx_t_3 = 0;
@@ -23440,45 +23689,45 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_4get_cookies(struct _
       {
         Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
         #if !CYTHON_ASSUME_SAFE_MACROS
-        if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 558, __pyx_L1_error)
+        if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 569, __pyx_L1_error)
         #endif
         if (__pyx_t_3 >= __pyx_temp) break;
       }
       #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-      __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_4); __pyx_t_3++; if (unlikely((0 < 0))) __PYX_ERR(0, 558, __pyx_L1_error)
+      __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_4); __pyx_t_3++; if (unlikely((0 < 0))) __PYX_ERR(0, 569, __pyx_L1_error)
       #else
-      __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 558, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 569, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       #endif
-      if (!(likely(PyBytes_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_4))) __PYX_ERR(0, 558, __pyx_L1_error)
+      if (!(likely(PyBytes_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_4))) __PYX_ERR(0, 569, __pyx_L1_error)
       __Pyx_XDECREF_SET(__pyx_v_value, ((PyObject*)__pyx_t_4));
       __pyx_t_4 = 0;
 
-      /* "blacksheep/messages.pyx":559
+      /* "blacksheep/messages.pyx":570
  *         if set_cookies_headers:
  *             for value in set_cookies_headers:
  *                 cookie = parse_cookie(value)             # <<<<<<<<<<<<<<
  *                 cookies[cookie.name] = cookie
  *         return cookies
  */
-      __pyx_t_4 = ((PyObject *)__pyx_f_10blacksheep_7cookies_parse_cookie(__pyx_v_value, 0)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 559, __pyx_L1_error)
+      __pyx_t_4 = ((PyObject *)__pyx_f_10blacksheep_7cookies_parse_cookie(__pyx_v_value, 0)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 570, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_XDECREF_SET(__pyx_v_cookie, ((struct __pyx_obj_10blacksheep_7cookies_Cookie *)__pyx_t_4));
       __pyx_t_4 = 0;
 
-      /* "blacksheep/messages.pyx":560
+      /* "blacksheep/messages.pyx":571
  *             for value in set_cookies_headers:
  *                 cookie = parse_cookie(value)
  *                 cookies[cookie.name] = cookie             # <<<<<<<<<<<<<<
  *         return cookies
  * 
  */
-      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_cookie), __pyx_n_s_name); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 560, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_cookie), __pyx_n_s_name); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 571, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      if (unlikely((PyDict_SetItem(__pyx_v_cookies, __pyx_t_4, ((PyObject *)__pyx_v_cookie)) < 0))) __PYX_ERR(0, 560, __pyx_L1_error)
+      if (unlikely((PyDict_SetItem(__pyx_v_cookies, __pyx_t_4, ((PyObject *)__pyx_v_cookie)) < 0))) __PYX_ERR(0, 571, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-      /* "blacksheep/messages.pyx":558
+      /* "blacksheep/messages.pyx":569
  *         set_cookies_headers = self.get_headers(b'set-cookie')
  *         if set_cookies_headers:
  *             for value in set_cookies_headers:             # <<<<<<<<<<<<<<
@@ -23488,7 +23737,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_4get_cookies(struct _
     }
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "blacksheep/messages.pyx":557
+    /* "blacksheep/messages.pyx":568
  *         cookies = {}
  *         set_cookies_headers = self.get_headers(b'set-cookie')
  *         if set_cookies_headers:             # <<<<<<<<<<<<<<
@@ -23497,7 +23746,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_4get_cookies(struct _
  */
   }
 
-  /* "blacksheep/messages.pyx":561
+  /* "blacksheep/messages.pyx":572
  *                 cookie = parse_cookie(value)
  *                 cookies[cookie.name] = cookie
  *         return cookies             # <<<<<<<<<<<<<<
@@ -23509,7 +23758,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_4get_cookies(struct _
   __pyx_r = __pyx_v_cookies;
   goto __pyx_L0;
 
-  /* "blacksheep/messages.pyx":549
+  /* "blacksheep/messages.pyx":560
  *         return http.HTTPStatus(self.status).phrase
  * 
  *     def get_cookies(self):             # <<<<<<<<<<<<<<
@@ -23533,7 +23782,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_4get_cookies(struct _
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":563
+/* "blacksheep/messages.pyx":574
  *         return cookies
  * 
  *     def get_cookie(self, str name):             # <<<<<<<<<<<<<<
@@ -23594,12 +23843,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 563, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 574, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "get_cookie") < 0)) __PYX_ERR(0, 563, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "get_cookie") < 0)) __PYX_ERR(0, 574, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
@@ -23610,7 +23859,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get_cookie", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 563, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("get_cookie", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 574, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -23624,7 +23873,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_name), (&PyUnicode_Type), 1, "name", 1))) __PYX_ERR(0, 563, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_name), (&PyUnicode_Type), 1, "name", 1))) __PYX_ERR(0, 574, __pyx_L1_error)
   __pyx_r = __pyx_pf_10blacksheep_8messages_8Response_6get_cookie(((struct __pyx_obj_10blacksheep_8messages_Response *)__pyx_v_self), __pyx_v_name);
 
   /* function exit code */
@@ -23657,19 +23906,19 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_6get_cookie(struct __
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_cookie", 1);
 
-  /* "blacksheep/messages.pyx":565
+  /* "blacksheep/messages.pyx":576
  *     def get_cookie(self, str name):
  *         cdef bytes value
  *         cdef list set_cookies_headers = self.get_headers(b'set-cookie')             # <<<<<<<<<<<<<<
  * 
  *         if set_cookies_headers:
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_10blacksheep_8messages_Response *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.get_headers(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_self), __pyx_kp_b_set_cookie, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 565, __pyx_L1_error)
+  __pyx_t_1 = ((struct __pyx_vtabstruct_10blacksheep_8messages_Response *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.get_headers(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_self), __pyx_kp_b_set_cookie, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 576, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_set_cookies_headers = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "blacksheep/messages.pyx":567
+  /* "blacksheep/messages.pyx":578
  *         cdef list set_cookies_headers = self.get_headers(b'set-cookie')
  * 
  *         if set_cookies_headers:             # <<<<<<<<<<<<<<
@@ -23679,7 +23928,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_6get_cookie(struct __
   __pyx_t_2 = (__pyx_v_set_cookies_headers != Py_None)&&(PyList_GET_SIZE(__pyx_v_set_cookies_headers) != 0);
   if (__pyx_t_2) {
 
-    /* "blacksheep/messages.pyx":568
+    /* "blacksheep/messages.pyx":579
  * 
  *         if set_cookies_headers:
  *             for value in set_cookies_headers:             # <<<<<<<<<<<<<<
@@ -23688,7 +23937,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_6get_cookie(struct __
  */
     if (unlikely(__pyx_v_set_cookies_headers == Py_None)) {
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-      __PYX_ERR(0, 568, __pyx_L1_error)
+      __PYX_ERR(0, 579, __pyx_L1_error)
     }
     __pyx_t_1 = __pyx_v_set_cookies_headers; __Pyx_INCREF(__pyx_t_1);
     __pyx_t_3 = 0;
@@ -23696,46 +23945,46 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_6get_cookie(struct __
       {
         Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
         #if !CYTHON_ASSUME_SAFE_MACROS
-        if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 568, __pyx_L1_error)
+        if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 579, __pyx_L1_error)
         #endif
         if (__pyx_t_3 >= __pyx_temp) break;
       }
       #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-      __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_4); __pyx_t_3++; if (unlikely((0 < 0))) __PYX_ERR(0, 568, __pyx_L1_error)
+      __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_4); __pyx_t_3++; if (unlikely((0 < 0))) __PYX_ERR(0, 579, __pyx_L1_error)
       #else
-      __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 568, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 579, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       #endif
-      if (!(likely(PyBytes_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_4))) __PYX_ERR(0, 568, __pyx_L1_error)
+      if (!(likely(PyBytes_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_4))) __PYX_ERR(0, 579, __pyx_L1_error)
       __Pyx_XDECREF_SET(__pyx_v_value, ((PyObject*)__pyx_t_4));
       __pyx_t_4 = 0;
 
-      /* "blacksheep/messages.pyx":569
+      /* "blacksheep/messages.pyx":580
  *         if set_cookies_headers:
  *             for value in set_cookies_headers:
  *                 cookie = parse_cookie(value)             # <<<<<<<<<<<<<<
  *                 if cookie.name == name:
  *                     return cookie
  */
-      __pyx_t_4 = ((PyObject *)__pyx_f_10blacksheep_7cookies_parse_cookie(__pyx_v_value, 0)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 569, __pyx_L1_error)
+      __pyx_t_4 = ((PyObject *)__pyx_f_10blacksheep_7cookies_parse_cookie(__pyx_v_value, 0)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 580, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_XDECREF_SET(__pyx_v_cookie, ((struct __pyx_obj_10blacksheep_7cookies_Cookie *)__pyx_t_4));
       __pyx_t_4 = 0;
 
-      /* "blacksheep/messages.pyx":570
+      /* "blacksheep/messages.pyx":581
  *             for value in set_cookies_headers:
  *                 cookie = parse_cookie(value)
  *                 if cookie.name == name:             # <<<<<<<<<<<<<<
  *                     return cookie
  * 
  */
-      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_cookie), __pyx_n_s_name); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 570, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_cookie), __pyx_n_s_name); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 581, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_2 = (__Pyx_PyUnicode_Equals(__pyx_t_4, __pyx_v_name, Py_EQ)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 570, __pyx_L1_error)
+      __pyx_t_2 = (__Pyx_PyUnicode_Equals(__pyx_t_4, __pyx_v_name, Py_EQ)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 581, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (__pyx_t_2) {
 
-        /* "blacksheep/messages.pyx":571
+        /* "blacksheep/messages.pyx":582
  *                 cookie = parse_cookie(value)
  *                 if cookie.name == name:
  *                     return cookie             # <<<<<<<<<<<<<<
@@ -23748,7 +23997,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_6get_cookie(struct __
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
         goto __pyx_L0;
 
-        /* "blacksheep/messages.pyx":570
+        /* "blacksheep/messages.pyx":581
  *             for value in set_cookies_headers:
  *                 cookie = parse_cookie(value)
  *                 if cookie.name == name:             # <<<<<<<<<<<<<<
@@ -23757,7 +24006,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_6get_cookie(struct __
  */
       }
 
-      /* "blacksheep/messages.pyx":568
+      /* "blacksheep/messages.pyx":579
  * 
  *         if set_cookies_headers:
  *             for value in set_cookies_headers:             # <<<<<<<<<<<<<<
@@ -23767,7 +24016,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_6get_cookie(struct __
     }
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "blacksheep/messages.pyx":567
+    /* "blacksheep/messages.pyx":578
  *         cdef list set_cookies_headers = self.get_headers(b'set-cookie')
  * 
  *         if set_cookies_headers:             # <<<<<<<<<<<<<<
@@ -23776,7 +24025,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_6get_cookie(struct __
  */
   }
 
-  /* "blacksheep/messages.pyx":573
+  /* "blacksheep/messages.pyx":584
  *                     return cookie
  * 
  *         return None             # <<<<<<<<<<<<<<
@@ -23787,7 +24036,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_6get_cookie(struct __
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
 
-  /* "blacksheep/messages.pyx":563
+  /* "blacksheep/messages.pyx":574
  *         return cookies
  * 
  *     def get_cookie(self, str name):             # <<<<<<<<<<<<<<
@@ -23810,7 +24059,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_6get_cookie(struct __
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":575
+/* "blacksheep/messages.pyx":586
  *         return None
  * 
  *     def set_cookie(self, Cookie cookie):             # <<<<<<<<<<<<<<
@@ -23871,12 +24120,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 575, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 586, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "set_cookie") < 0)) __PYX_ERR(0, 575, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "set_cookie") < 0)) __PYX_ERR(0, 586, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
@@ -23887,7 +24136,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("set_cookie", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 575, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("set_cookie", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 586, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -23901,7 +24150,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_cookie), __pyx_ptype_10blacksheep_7cookies_Cookie, 1, "cookie", 0))) __PYX_ERR(0, 575, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_cookie), __pyx_ptype_10blacksheep_7cookies_Cookie, 1, "cookie", 0))) __PYX_ERR(0, 586, __pyx_L1_error)
   __pyx_r = __pyx_pf_10blacksheep_8messages_8Response_8set_cookie(((struct __pyx_obj_10blacksheep_8messages_Response *)__pyx_v_self), __pyx_v_cookie);
 
   /* function exit code */
@@ -23930,7 +24179,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_8set_cookie(struct __
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("set_cookie", 1);
 
-  /* "blacksheep/messages.pyx":576
+  /* "blacksheep/messages.pyx":587
  * 
  *     def set_cookie(self, Cookie cookie):
  *         self._raw_headers.append((b'set-cookie', write_cookie_for_response(cookie)))             # <<<<<<<<<<<<<<
@@ -23939,22 +24188,22 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_8set_cookie(struct __
  */
   if (unlikely(__pyx_v_self->__pyx_base._raw_headers == Py_None)) {
     PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "append");
-    __PYX_ERR(0, 576, __pyx_L1_error)
+    __PYX_ERR(0, 587, __pyx_L1_error)
   }
-  __pyx_t_1 = __pyx_f_10blacksheep_7cookies_write_cookie_for_response(__pyx_v_cookie); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 576, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_10blacksheep_7cookies_write_cookie_for_response(__pyx_v_cookie); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 587, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 576, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 587, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(__pyx_kp_b_set_cookie);
   __Pyx_GIVEREF(__pyx_kp_b_set_cookie);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_kp_b_set_cookie)) __PYX_ERR(0, 576, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_kp_b_set_cookie)) __PYX_ERR(0, 587, __pyx_L1_error);
   __Pyx_GIVEREF(__pyx_t_1);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_1)) __PYX_ERR(0, 576, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_1)) __PYX_ERR(0, 587, __pyx_L1_error);
   __pyx_t_1 = 0;
-  __pyx_t_3 = __Pyx_PyList_Append(__pyx_v_self->__pyx_base._raw_headers, __pyx_t_2); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 576, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyList_Append(__pyx_v_self->__pyx_base._raw_headers, __pyx_t_2); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 587, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "blacksheep/messages.pyx":575
+  /* "blacksheep/messages.pyx":586
  *         return None
  * 
  *     def set_cookie(self, Cookie cookie):             # <<<<<<<<<<<<<<
@@ -23976,7 +24225,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_8set_cookie(struct __
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":578
+/* "blacksheep/messages.pyx":589
  *         self._raw_headers.append((b'set-cookie', write_cookie_for_response(cookie)))
  * 
  *     def set_cookies(self, list cookies):             # <<<<<<<<<<<<<<
@@ -24037,12 +24286,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 578, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 589, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "set_cookies") < 0)) __PYX_ERR(0, 578, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "set_cookies") < 0)) __PYX_ERR(0, 589, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
@@ -24053,7 +24302,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("set_cookies", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 578, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("set_cookies", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 589, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -24067,7 +24316,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_cookies), (&PyList_Type), 1, "cookies", 1))) __PYX_ERR(0, 578, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_cookies), (&PyList_Type), 1, "cookies", 1))) __PYX_ERR(0, 589, __pyx_L1_error)
   __pyx_r = __pyx_pf_10blacksheep_8messages_8Response_10set_cookies(((struct __pyx_obj_10blacksheep_8messages_Response *)__pyx_v_self), __pyx_v_cookies);
 
   /* function exit code */
@@ -24100,7 +24349,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_10set_cookies(struct
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("set_cookies", 1);
 
-  /* "blacksheep/messages.pyx":580
+  /* "blacksheep/messages.pyx":591
  *     def set_cookies(self, list cookies):
  *         cdef Cookie cookie
  *         for cookie in cookies:             # <<<<<<<<<<<<<<
@@ -24109,7 +24358,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_10set_cookies(struct
  */
   if (unlikely(__pyx_v_cookies == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-    __PYX_ERR(0, 580, __pyx_L1_error)
+    __PYX_ERR(0, 591, __pyx_L1_error)
   }
   __pyx_t_1 = __pyx_v_cookies; __Pyx_INCREF(__pyx_t_1);
   __pyx_t_2 = 0;
@@ -24117,28 +24366,28 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_10set_cookies(struct
     {
       Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
       #if !CYTHON_ASSUME_SAFE_MACROS
-      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 580, __pyx_L1_error)
+      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 591, __pyx_L1_error)
       #endif
       if (__pyx_t_2 >= __pyx_temp) break;
     }
     #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely((0 < 0))) __PYX_ERR(0, 580, __pyx_L1_error)
+    __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely((0 < 0))) __PYX_ERR(0, 591, __pyx_L1_error)
     #else
-    __pyx_t_3 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 580, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 591, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     #endif
-    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_10blacksheep_7cookies_Cookie))))) __PYX_ERR(0, 580, __pyx_L1_error)
+    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_10blacksheep_7cookies_Cookie))))) __PYX_ERR(0, 591, __pyx_L1_error)
     __Pyx_XDECREF_SET(__pyx_v_cookie, ((struct __pyx_obj_10blacksheep_7cookies_Cookie *)__pyx_t_3));
     __pyx_t_3 = 0;
 
-    /* "blacksheep/messages.pyx":581
+    /* "blacksheep/messages.pyx":592
  *         cdef Cookie cookie
  *         for cookie in cookies:
  *             self.set_cookie(cookie)             # <<<<<<<<<<<<<<
  * 
  *     def unset_cookie(self, str name):
  */
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_set_cookie_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 581, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_set_cookie_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 592, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_5 = NULL;
     __pyx_t_6 = 0;
@@ -24158,13 +24407,13 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_10set_cookies(struct
       PyObject *__pyx_callargs[2] = {__pyx_t_5, ((PyObject *)__pyx_v_cookie)};
       __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_6, 1+__pyx_t_6);
       __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 581, __pyx_L1_error)
+      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 592, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     }
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-    /* "blacksheep/messages.pyx":580
+    /* "blacksheep/messages.pyx":591
  *     def set_cookies(self, list cookies):
  *         cdef Cookie cookie
  *         for cookie in cookies:             # <<<<<<<<<<<<<<
@@ -24174,7 +24423,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_10set_cookies(struct
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "blacksheep/messages.pyx":578
+  /* "blacksheep/messages.pyx":589
  *         self._raw_headers.append((b'set-cookie', write_cookie_for_response(cookie)))
  * 
  *     def set_cookies(self, list cookies):             # <<<<<<<<<<<<<<
@@ -24199,7 +24448,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_10set_cookies(struct
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":583
+/* "blacksheep/messages.pyx":594
  *             self.set_cookie(cookie)
  * 
  *     def unset_cookie(self, str name):             # <<<<<<<<<<<<<<
@@ -24260,12 +24509,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 583, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 594, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "unset_cookie") < 0)) __PYX_ERR(0, 583, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "unset_cookie") < 0)) __PYX_ERR(0, 594, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
@@ -24276,7 +24525,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("unset_cookie", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 583, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("unset_cookie", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 594, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -24290,7 +24539,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_name), (&PyUnicode_Type), 1, "name", 1))) __PYX_ERR(0, 583, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_name), (&PyUnicode_Type), 1, "name", 1))) __PYX_ERR(0, 594, __pyx_L1_error)
   __pyx_r = __pyx_pf_10blacksheep_8messages_8Response_12unset_cookie(((struct __pyx_obj_10blacksheep_8messages_Response *)__pyx_v_self), __pyx_v_name);
 
   /* function exit code */
@@ -24323,24 +24572,24 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_12unset_cookie(struct
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("unset_cookie", 1);
 
-  /* "blacksheep/messages.pyx":584
+  /* "blacksheep/messages.pyx":595
  * 
  *     def unset_cookie(self, str name):
  *         self.set_cookie(             # <<<<<<<<<<<<<<
  *             Cookie(
  *                 name,
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_set_cookie_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 584, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_set_cookie_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 595, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
 
-  /* "blacksheep/messages.pyx":588
+  /* "blacksheep/messages.pyx":599
  *                 name,
  *                 '',
  *                 utcnow() - timedelta(days=365)             # <<<<<<<<<<<<<<
  *             )
  *         )
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_utcnow); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 588, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_utcnow); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 599, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_t_5 = NULL;
   __pyx_t_6 = 0;
@@ -24360,43 +24609,43 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_12unset_cookie(struct
     PyObject *__pyx_callargs[2] = {__pyx_t_5, NULL};
     __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_6, 0+__pyx_t_6);
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 588, __pyx_L1_error)
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 599, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   }
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_timedelta); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 588, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_timedelta); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 599, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 588, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 599, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_days, __pyx_int_365) < 0) __PYX_ERR(0, 588, __pyx_L1_error)
-  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_empty_tuple, __pyx_t_5); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 588, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_days, __pyx_int_365) < 0) __PYX_ERR(0, 599, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_empty_tuple, __pyx_t_5); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 599, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = PyNumber_Subtract(__pyx_t_3, __pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 588, __pyx_L1_error)
+  __pyx_t_5 = PyNumber_Subtract(__pyx_t_3, __pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 599, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
 
-  /* "blacksheep/messages.pyx":585
+  /* "blacksheep/messages.pyx":596
  *     def unset_cookie(self, str name):
  *         self.set_cookie(
  *             Cookie(             # <<<<<<<<<<<<<<
  *                 name,
  *                 '',
  */
-  __pyx_t_7 = PyTuple_New(3); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 585, __pyx_L1_error)
+  __pyx_t_7 = PyTuple_New(3); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 596, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_INCREF(__pyx_v_name);
   __Pyx_GIVEREF(__pyx_v_name);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_name)) __PYX_ERR(0, 585, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_name)) __PYX_ERR(0, 596, __pyx_L1_error);
   __Pyx_INCREF(__pyx_kp_u__9);
   __Pyx_GIVEREF(__pyx_kp_u__9);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_kp_u__9)) __PYX_ERR(0, 585, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_kp_u__9)) __PYX_ERR(0, 596, __pyx_L1_error);
   __Pyx_GIVEREF(__pyx_t_5);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 2, __pyx_t_5)) __PYX_ERR(0, 585, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 2, __pyx_t_5)) __PYX_ERR(0, 596, __pyx_L1_error);
   __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_10blacksheep_7cookies_Cookie), __pyx_t_7, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 585, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_10blacksheep_7cookies_Cookie), __pyx_t_7, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 596, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
   __pyx_t_7 = NULL;
@@ -24418,13 +24667,13 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_12unset_cookie(struct
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_6, 1+__pyx_t_6);
     __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 584, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 595, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "blacksheep/messages.pyx":583
+  /* "blacksheep/messages.pyx":594
  *             self.set_cookie(cookie)
  * 
  *     def unset_cookie(self, str name):             # <<<<<<<<<<<<<<
@@ -24450,7 +24699,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_12unset_cookie(struct
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":592
+/* "blacksheep/messages.pyx":603
  *         )
  * 
  *     def remove_cookie(self, str name):             # <<<<<<<<<<<<<<
@@ -24511,12 +24760,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 592, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 603, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "remove_cookie") < 0)) __PYX_ERR(0, 592, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "remove_cookie") < 0)) __PYX_ERR(0, 603, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
@@ -24527,7 +24776,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("remove_cookie", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 592, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("remove_cookie", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 603, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -24541,7 +24790,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_name), (&PyUnicode_Type), 1, "name", 1))) __PYX_ERR(0, 592, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_name), (&PyUnicode_Type), 1, "name", 1))) __PYX_ERR(0, 603, __pyx_L1_error)
   __pyx_r = __pyx_pf_10blacksheep_8messages_8Response_14remove_cookie(((struct __pyx_obj_10blacksheep_8messages_Response *)__pyx_v_self), __pyx_v_name);
 
   /* function exit code */
@@ -24577,31 +24826,31 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_14remove_cookie(struc
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("remove_cookie", 1);
 
-  /* "blacksheep/messages.pyx":593
+  /* "blacksheep/messages.pyx":604
  * 
  *     def remove_cookie(self, str name):
  *         cdef list to_remove = []             # <<<<<<<<<<<<<<
  *         cdef tuple value
  *         cdef list set_cookies_headers = self.get_headers_tuples(b'set-cookie')
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 593, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 604, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_to_remove = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "blacksheep/messages.pyx":595
+  /* "blacksheep/messages.pyx":606
  *         cdef list to_remove = []
  *         cdef tuple value
  *         cdef list set_cookies_headers = self.get_headers_tuples(b'set-cookie')             # <<<<<<<<<<<<<<
  * 
  *         if set_cookies_headers:
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_10blacksheep_8messages_Response *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.get_headers_tuples(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_self), __pyx_kp_b_set_cookie); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 595, __pyx_L1_error)
+  __pyx_t_1 = ((struct __pyx_vtabstruct_10blacksheep_8messages_Response *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.get_headers_tuples(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_self), __pyx_kp_b_set_cookie); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 606, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_set_cookies_headers = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "blacksheep/messages.pyx":597
+  /* "blacksheep/messages.pyx":608
  *         cdef list set_cookies_headers = self.get_headers_tuples(b'set-cookie')
  * 
  *         if set_cookies_headers:             # <<<<<<<<<<<<<<
@@ -24611,7 +24860,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_14remove_cookie(struc
   __pyx_t_2 = (__pyx_v_set_cookies_headers != Py_None)&&(PyList_GET_SIZE(__pyx_v_set_cookies_headers) != 0);
   if (__pyx_t_2) {
 
-    /* "blacksheep/messages.pyx":598
+    /* "blacksheep/messages.pyx":609
  * 
  *         if set_cookies_headers:
  *             for value in set_cookies_headers:             # <<<<<<<<<<<<<<
@@ -24620,7 +24869,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_14remove_cookie(struc
  */
     if (unlikely(__pyx_v_set_cookies_headers == Py_None)) {
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-      __PYX_ERR(0, 598, __pyx_L1_error)
+      __PYX_ERR(0, 609, __pyx_L1_error)
     }
     __pyx_t_1 = __pyx_v_set_cookies_headers; __Pyx_INCREF(__pyx_t_1);
     __pyx_t_3 = 0;
@@ -24628,21 +24877,21 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_14remove_cookie(struc
       {
         Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
         #if !CYTHON_ASSUME_SAFE_MACROS
-        if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 598, __pyx_L1_error)
+        if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 609, __pyx_L1_error)
         #endif
         if (__pyx_t_3 >= __pyx_temp) break;
       }
       #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-      __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_4); __pyx_t_3++; if (unlikely((0 < 0))) __PYX_ERR(0, 598, __pyx_L1_error)
+      __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_4); __pyx_t_3++; if (unlikely((0 < 0))) __PYX_ERR(0, 609, __pyx_L1_error)
       #else
-      __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 598, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 609, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       #endif
-      if (!(likely(PyTuple_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None) || __Pyx_RaiseUnexpectedTypeError("tuple", __pyx_t_4))) __PYX_ERR(0, 598, __pyx_L1_error)
+      if (!(likely(PyTuple_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None) || __Pyx_RaiseUnexpectedTypeError("tuple", __pyx_t_4))) __PYX_ERR(0, 609, __pyx_L1_error)
       __Pyx_XDECREF_SET(__pyx_v_value, ((PyObject*)__pyx_t_4));
       __pyx_t_4 = 0;
 
-      /* "blacksheep/messages.pyx":599
+      /* "blacksheep/messages.pyx":610
  *         if set_cookies_headers:
  *             for value in set_cookies_headers:
  *                 cookie = parse_cookie(value[1])             # <<<<<<<<<<<<<<
@@ -24651,40 +24900,40 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_14remove_cookie(struc
  */
       if (unlikely(__pyx_v_value == Py_None)) {
         PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-        __PYX_ERR(0, 599, __pyx_L1_error)
+        __PYX_ERR(0, 610, __pyx_L1_error)
       }
-      __pyx_t_4 = __Pyx_GetItemInt_Tuple(__pyx_v_value, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 599, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_GetItemInt_Tuple(__pyx_v_value, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 610, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      if (!(likely(PyBytes_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_4))) __PYX_ERR(0, 599, __pyx_L1_error)
-      __pyx_t_5 = ((PyObject *)__pyx_f_10blacksheep_7cookies_parse_cookie(((PyObject*)__pyx_t_4), 0)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 599, __pyx_L1_error)
+      if (!(likely(PyBytes_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_4))) __PYX_ERR(0, 610, __pyx_L1_error)
+      __pyx_t_5 = ((PyObject *)__pyx_f_10blacksheep_7cookies_parse_cookie(((PyObject*)__pyx_t_4), 0)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 610, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_XDECREF_SET(__pyx_v_cookie, ((struct __pyx_obj_10blacksheep_7cookies_Cookie *)__pyx_t_5));
       __pyx_t_5 = 0;
 
-      /* "blacksheep/messages.pyx":600
+      /* "blacksheep/messages.pyx":611
  *             for value in set_cookies_headers:
  *                 cookie = parse_cookie(value[1])
  *                 if cookie.name == name:             # <<<<<<<<<<<<<<
  *                     to_remove.append(value)
  * 
  */
-      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_cookie), __pyx_n_s_name); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 600, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_cookie), __pyx_n_s_name); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 611, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_2 = (__Pyx_PyUnicode_Equals(__pyx_t_5, __pyx_v_name, Py_EQ)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 600, __pyx_L1_error)
+      __pyx_t_2 = (__Pyx_PyUnicode_Equals(__pyx_t_5, __pyx_v_name, Py_EQ)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 611, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       if (__pyx_t_2) {
 
-        /* "blacksheep/messages.pyx":601
+        /* "blacksheep/messages.pyx":612
  *                 cookie = parse_cookie(value[1])
  *                 if cookie.name == name:
  *                     to_remove.append(value)             # <<<<<<<<<<<<<<
  * 
  *         self.remove_headers(to_remove)
  */
-        __pyx_t_6 = __Pyx_PyList_Append(__pyx_v_to_remove, __pyx_v_value); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 601, __pyx_L1_error)
+        __pyx_t_6 = __Pyx_PyList_Append(__pyx_v_to_remove, __pyx_v_value); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 612, __pyx_L1_error)
 
-        /* "blacksheep/messages.pyx":600
+        /* "blacksheep/messages.pyx":611
  *             for value in set_cookies_headers:
  *                 cookie = parse_cookie(value[1])
  *                 if cookie.name == name:             # <<<<<<<<<<<<<<
@@ -24693,7 +24942,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_14remove_cookie(struc
  */
       }
 
-      /* "blacksheep/messages.pyx":598
+      /* "blacksheep/messages.pyx":609
  * 
  *         if set_cookies_headers:
  *             for value in set_cookies_headers:             # <<<<<<<<<<<<<<
@@ -24703,7 +24952,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_14remove_cookie(struc
     }
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "blacksheep/messages.pyx":597
+    /* "blacksheep/messages.pyx":608
  *         cdef list set_cookies_headers = self.get_headers_tuples(b'set-cookie')
  * 
  *         if set_cookies_headers:             # <<<<<<<<<<<<<<
@@ -24712,16 +24961,16 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_14remove_cookie(struc
  */
   }
 
-  /* "blacksheep/messages.pyx":603
+  /* "blacksheep/messages.pyx":614
  *                     to_remove.append(value)
  * 
  *         self.remove_headers(to_remove)             # <<<<<<<<<<<<<<
  * 
  *     cpdef bint is_redirect(self):
  */
-  ((struct __pyx_vtabstruct_10blacksheep_8messages_Response *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.remove_headers(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_self), __pyx_v_to_remove); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 603, __pyx_L1_error)
+  ((struct __pyx_vtabstruct_10blacksheep_8messages_Response *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.remove_headers(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_self), __pyx_v_to_remove); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 614, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":592
+  /* "blacksheep/messages.pyx":603
  *         )
  * 
  *     def remove_cookie(self, str name):             # <<<<<<<<<<<<<<
@@ -24748,7 +24997,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_14remove_cookie(struc
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":605
+/* "blacksheep/messages.pyx":616
  *         self.remove_headers(to_remove)
  * 
  *     cpdef bint is_redirect(self):             # <<<<<<<<<<<<<<
@@ -24785,7 +25034,7 @@ static int __pyx_f_10blacksheep_8messages_8Response_is_redirect(struct __pyx_obj
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_typedict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_is_redirect); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 605, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_is_redirect); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 616, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       if (!__Pyx_IsSameCFunction(__pyx_t_1, (void*) __pyx_pw_10blacksheep_8messages_8Response_17is_redirect)) {
         __Pyx_INCREF(__pyx_t_1);
@@ -24807,11 +25056,11 @@ static int __pyx_f_10blacksheep_8messages_8Response_is_redirect(struct __pyx_obj
           PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
           __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
           __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 605, __pyx_L1_error)
+          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 616, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
           __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
         }
-        __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 605, __pyx_L1_error)
+        __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 616, __pyx_L1_error)
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
         __pyx_r = __pyx_t_6;
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -24830,7 +25079,7 @@ static int __pyx_f_10blacksheep_8messages_8Response_is_redirect(struct __pyx_obj
     #endif
   }
 
-  /* "blacksheep/messages.pyx":606
+  /* "blacksheep/messages.pyx":617
  * 
  *     cpdef bint is_redirect(self):
  *         return self.status in {301, 302, 303, 307, 308}             # <<<<<<<<<<<<<<
@@ -24852,7 +25101,7 @@ static int __pyx_f_10blacksheep_8messages_8Response_is_redirect(struct __pyx_obj
   __pyx_r = __pyx_t_6;
   goto __pyx_L0;
 
-  /* "blacksheep/messages.pyx":605
+  /* "blacksheep/messages.pyx":616
  *         self.remove_headers(to_remove)
  * 
  *     cpdef bint is_redirect(self):             # <<<<<<<<<<<<<<
@@ -24924,8 +25173,8 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_16is_redirect(struct
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("is_redirect", 1);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_10blacksheep_8messages_8Response_is_redirect(__pyx_v_self, 1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 605, __pyx_L1_error)
-  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 605, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_10blacksheep_8messages_8Response_is_redirect(__pyx_v_self, 1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 616, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 616, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
@@ -24942,7 +25191,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_16is_redirect(struct
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pxd":60
+/* "blacksheep/messages.pxd":62
  * 
  * cdef class Response(Message):
  *     cdef public int status             # <<<<<<<<<<<<<<
@@ -24974,7 +25223,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_6status___get__(struc
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 1);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->status); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 60, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->status); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 62, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -25012,7 +25261,7 @@ static int __pyx_pf_10blacksheep_8messages_8Response_6status_2__set__(struct __p
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(2, 60, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(2, 62, __pyx_L1_error)
   __pyx_v_self->status = __pyx_t_1;
 
   /* function exit code */
@@ -25443,7 +25692,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_8Response_20__setstate_cython__
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":609
+/* "blacksheep/messages.pyx":620
  * 
  * 
  * cpdef bint is_cors_request(Request request):             # <<<<<<<<<<<<<<
@@ -25468,21 +25717,21 @@ static int __pyx_f_10blacksheep_8messages_is_cors_request(struct __pyx_obj_10bla
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("is_cors_request", 1);
 
-  /* "blacksheep/messages.pyx":610
+  /* "blacksheep/messages.pyx":621
  * 
  * cpdef bint is_cors_request(Request request):
  *     return bool(request.get_first_header(b"Origin"))             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_10blacksheep_8messages_Request *)__pyx_v_request->__pyx_base.__pyx_vtab)->__pyx_base.get_first_header(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_request), __pyx_n_b_Origin, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 610, __pyx_L1_error)
+  __pyx_t_1 = ((struct __pyx_vtabstruct_10blacksheep_8messages_Request *)__pyx_v_request->__pyx_base.__pyx_vtab)->__pyx_base.get_first_header(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_request), __pyx_n_b_Origin, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 621, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_2 = (__pyx_t_1 != Py_None)&&(PyBytes_GET_SIZE(__pyx_t_1) != 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_r = (!(!__pyx_t_2));
   goto __pyx_L0;
 
-  /* "blacksheep/messages.pyx":609
+  /* "blacksheep/messages.pyx":620
  * 
  * 
  * cpdef bint is_cors_request(Request request):             # <<<<<<<<<<<<<<
@@ -25553,12 +25802,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 609, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 620, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "is_cors_request") < 0)) __PYX_ERR(0, 609, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "is_cors_request") < 0)) __PYX_ERR(0, 620, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
@@ -25569,7 +25818,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("is_cors_request", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 609, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("is_cors_request", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 620, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -25583,7 +25832,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_request), __pyx_ptype_10blacksheep_8messages_Request, 1, "request", 0))) __PYX_ERR(0, 609, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_request), __pyx_ptype_10blacksheep_8messages_Request, 1, "request", 0))) __PYX_ERR(0, 620, __pyx_L1_error)
   __pyx_r = __pyx_pf_10blacksheep_8messages_10is_cors_request(__pyx_self, __pyx_v_request);
 
   /* function exit code */
@@ -25611,8 +25860,8 @@ static PyObject *__pyx_pf_10blacksheep_8messages_10is_cors_request(CYTHON_UNUSED
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("is_cors_request", 1);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_10blacksheep_8messages_is_cors_request(__pyx_v_request, 0); if (unlikely(__pyx_t_1 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 609, __pyx_L1_error)
-  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 609, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_10blacksheep_8messages_is_cors_request(__pyx_v_request, 0); if (unlikely(__pyx_t_1 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 620, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 620, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
@@ -25629,7 +25878,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_10is_cors_request(CYTHON_UNUSED
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":613
+/* "blacksheep/messages.pyx":624
  * 
  * 
  * cpdef bint is_cors_preflight_request(Request request):             # <<<<<<<<<<<<<<
@@ -25657,26 +25906,26 @@ static int __pyx_f_10blacksheep_8messages_is_cors_preflight_request(struct __pyx
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("is_cors_preflight_request", 1);
 
-  /* "blacksheep/messages.pyx":614
+  /* "blacksheep/messages.pyx":625
  * 
  * cpdef bint is_cors_preflight_request(Request request):
  *     if request.method != "OPTIONS" or not is_cors_request(request):             # <<<<<<<<<<<<<<
  *         return False
  * 
  */
-  __pyx_t_2 = (__Pyx_PyUnicode_Equals(__pyx_v_request->method, __pyx_n_u_OPTIONS, Py_NE)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 614, __pyx_L1_error)
+  __pyx_t_2 = (__Pyx_PyUnicode_Equals(__pyx_v_request->method, __pyx_n_u_OPTIONS, Py_NE)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 625, __pyx_L1_error)
   if (!__pyx_t_2) {
   } else {
     __pyx_t_1 = __pyx_t_2;
     goto __pyx_L4_bool_binop_done;
   }
-  __pyx_t_2 = __pyx_f_10blacksheep_8messages_is_cors_request(__pyx_v_request, 0); if (unlikely(__pyx_t_2 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 614, __pyx_L1_error)
+  __pyx_t_2 = __pyx_f_10blacksheep_8messages_is_cors_request(__pyx_v_request, 0); if (unlikely(__pyx_t_2 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 625, __pyx_L1_error)
   __pyx_t_3 = (!__pyx_t_2);
   __pyx_t_1 = __pyx_t_3;
   __pyx_L4_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "blacksheep/messages.pyx":615
+    /* "blacksheep/messages.pyx":626
  * cpdef bint is_cors_preflight_request(Request request):
  *     if request.method != "OPTIONS" or not is_cors_request(request):
  *         return False             # <<<<<<<<<<<<<<
@@ -25686,7 +25935,7 @@ static int __pyx_f_10blacksheep_8messages_is_cors_preflight_request(struct __pyx
     __pyx_r = 0;
     goto __pyx_L0;
 
-    /* "blacksheep/messages.pyx":614
+    /* "blacksheep/messages.pyx":625
  * 
  * cpdef bint is_cors_preflight_request(Request request):
  *     if request.method != "OPTIONS" or not is_cors_request(request):             # <<<<<<<<<<<<<<
@@ -25695,19 +25944,19 @@ static int __pyx_f_10blacksheep_8messages_is_cors_preflight_request(struct __pyx
  */
   }
 
-  /* "blacksheep/messages.pyx":617
+  /* "blacksheep/messages.pyx":628
  *         return False
  * 
  *     next_request_method = request.get_first_header(             # <<<<<<<<<<<<<<
  *         b"Access-Control-Request-Method"
  *     )
  */
-  __pyx_t_4 = ((struct __pyx_vtabstruct_10blacksheep_8messages_Request *)__pyx_v_request->__pyx_base.__pyx_vtab)->__pyx_base.get_first_header(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_request), __pyx_kp_b_Access_Control_Request_Method, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 617, __pyx_L1_error)
+  __pyx_t_4 = ((struct __pyx_vtabstruct_10blacksheep_8messages_Request *)__pyx_v_request->__pyx_base.__pyx_vtab)->__pyx_base.get_first_header(((struct __pyx_obj_10blacksheep_8messages_Message *)__pyx_v_request), __pyx_kp_b_Access_Control_Request_Method, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 628, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_v_next_request_method = ((PyObject*)__pyx_t_4);
   __pyx_t_4 = 0;
 
-  /* "blacksheep/messages.pyx":621
+  /* "blacksheep/messages.pyx":632
  *     )
  * 
  *     return bool(next_request_method)             # <<<<<<<<<<<<<<
@@ -25718,7 +25967,7 @@ static int __pyx_f_10blacksheep_8messages_is_cors_preflight_request(struct __pyx
   __pyx_r = (!(!__pyx_t_1));
   goto __pyx_L0;
 
-  /* "blacksheep/messages.pyx":613
+  /* "blacksheep/messages.pyx":624
  * 
  * 
  * cpdef bint is_cors_preflight_request(Request request):             # <<<<<<<<<<<<<<
@@ -25790,12 +26039,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 613, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 624, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "is_cors_preflight_request") < 0)) __PYX_ERR(0, 613, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "is_cors_preflight_request") < 0)) __PYX_ERR(0, 624, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
@@ -25806,7 +26055,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("is_cors_preflight_request", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 613, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("is_cors_preflight_request", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 624, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -25820,7 +26069,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_request), __pyx_ptype_10blacksheep_8messages_Request, 1, "request", 0))) __PYX_ERR(0, 613, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_request), __pyx_ptype_10blacksheep_8messages_Request, 1, "request", 0))) __PYX_ERR(0, 624, __pyx_L1_error)
   __pyx_r = __pyx_pf_10blacksheep_8messages_12is_cors_preflight_request(__pyx_self, __pyx_v_request);
 
   /* function exit code */
@@ -25848,8 +26097,8 @@ static PyObject *__pyx_pf_10blacksheep_8messages_12is_cors_preflight_request(CYT
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("is_cors_preflight_request", 1);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_10blacksheep_8messages_is_cors_preflight_request(__pyx_v_request, 0); if (unlikely(__pyx_t_1 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 613, __pyx_L1_error)
-  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 613, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_10blacksheep_8messages_is_cors_preflight_request(__pyx_v_request, 0); if (unlikely(__pyx_t_1 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 624, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 624, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
@@ -25866,7 +26115,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_12is_cors_preflight_request(CYT
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":624
+/* "blacksheep/messages.pyx":635
  * 
  * 
  * cdef bytes ensure_bytes(value):             # <<<<<<<<<<<<<<
@@ -25887,7 +26136,7 @@ static PyObject *__pyx_f_10blacksheep_8messages_ensure_bytes(PyObject *__pyx_v_v
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("ensure_bytes", 1);
 
-  /* "blacksheep/messages.pyx":625
+  /* "blacksheep/messages.pyx":636
  * 
  * cdef bytes ensure_bytes(value):
  *     if isinstance(value, str):             # <<<<<<<<<<<<<<
@@ -25897,7 +26146,7 @@ static PyObject *__pyx_f_10blacksheep_8messages_ensure_bytes(PyObject *__pyx_v_v
   __pyx_t_1 = PyUnicode_Check(__pyx_v_value); 
   if (__pyx_t_1) {
 
-    /* "blacksheep/messages.pyx":626
+    /* "blacksheep/messages.pyx":637
  * cdef bytes ensure_bytes(value):
  *     if isinstance(value, str):
  *         return value.encode()             # <<<<<<<<<<<<<<
@@ -25905,7 +26154,7 @@ static PyObject *__pyx_f_10blacksheep_8messages_ensure_bytes(PyObject *__pyx_v_v
  *         return value
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_value, __pyx_n_s_encode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 626, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_value, __pyx_n_s_encode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 637, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_4 = NULL;
     __pyx_t_5 = 0;
@@ -25925,16 +26174,16 @@ static PyObject *__pyx_f_10blacksheep_8messages_ensure_bytes(PyObject *__pyx_v_v
       PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
       __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
       __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 626, __pyx_L1_error)
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 637, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     }
-    if (!(likely(PyBytes_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_2))) __PYX_ERR(0, 626, __pyx_L1_error)
+    if (!(likely(PyBytes_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_2))) __PYX_ERR(0, 637, __pyx_L1_error)
     __pyx_r = ((PyObject*)__pyx_t_2);
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "blacksheep/messages.pyx":625
+    /* "blacksheep/messages.pyx":636
  * 
  * cdef bytes ensure_bytes(value):
  *     if isinstance(value, str):             # <<<<<<<<<<<<<<
@@ -25943,7 +26192,7 @@ static PyObject *__pyx_f_10blacksheep_8messages_ensure_bytes(PyObject *__pyx_v_v
  */
   }
 
-  /* "blacksheep/messages.pyx":627
+  /* "blacksheep/messages.pyx":638
  *     if isinstance(value, str):
  *         return value.encode()
  *     if isinstance(value, bytes):             # <<<<<<<<<<<<<<
@@ -25953,7 +26202,7 @@ static PyObject *__pyx_f_10blacksheep_8messages_ensure_bytes(PyObject *__pyx_v_v
   __pyx_t_1 = PyBytes_Check(__pyx_v_value); 
   if (__pyx_t_1) {
 
-    /* "blacksheep/messages.pyx":628
+    /* "blacksheep/messages.pyx":639
  *         return value.encode()
  *     if isinstance(value, bytes):
  *         return value             # <<<<<<<<<<<<<<
@@ -25961,12 +26210,12 @@ static PyObject *__pyx_f_10blacksheep_8messages_ensure_bytes(PyObject *__pyx_v_v
  * 
  */
     __Pyx_XDECREF(__pyx_r);
-    if (!(likely(PyBytes_CheckExact(__pyx_v_value))||((__pyx_v_value) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_v_value))) __PYX_ERR(0, 628, __pyx_L1_error)
+    if (!(likely(PyBytes_CheckExact(__pyx_v_value))||((__pyx_v_value) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_v_value))) __PYX_ERR(0, 639, __pyx_L1_error)
     __Pyx_INCREF(__pyx_v_value);
     __pyx_r = ((PyObject*)__pyx_v_value);
     goto __pyx_L0;
 
-    /* "blacksheep/messages.pyx":627
+    /* "blacksheep/messages.pyx":638
  *     if isinstance(value, str):
  *         return value.encode()
  *     if isinstance(value, bytes):             # <<<<<<<<<<<<<<
@@ -25975,20 +26224,20 @@ static PyObject *__pyx_f_10blacksheep_8messages_ensure_bytes(PyObject *__pyx_v_v
  */
   }
 
-  /* "blacksheep/messages.pyx":629
+  /* "blacksheep/messages.pyx":640
  *     if isinstance(value, bytes):
  *         return value
  *     raise ValueError("Input value must be bytes or str")             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__28, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 629, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__28, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 640, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_Raise(__pyx_t_2, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __PYX_ERR(0, 629, __pyx_L1_error)
+  __PYX_ERR(0, 640, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":624
+  /* "blacksheep/messages.pyx":635
  * 
  * 
  * cdef bytes ensure_bytes(value):             # <<<<<<<<<<<<<<
@@ -26009,7 +26258,7 @@ static PyObject *__pyx_f_10blacksheep_8messages_ensure_bytes(PyObject *__pyx_v_v
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":632
+/* "blacksheep/messages.pyx":643
  * 
  * 
  * cpdef URL get_request_absolute_url(Request request):             # <<<<<<<<<<<<<<
@@ -26038,23 +26287,23 @@ static struct __pyx_obj_10blacksheep_3url_URL *__pyx_f_10blacksheep_8messages_ge
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_request_absolute_url", 1);
 
-  /* "blacksheep/messages.pyx":633
+  /* "blacksheep/messages.pyx":644
  * 
  * cpdef URL get_request_absolute_url(Request request):
  *     if request.url.is_absolute:             # <<<<<<<<<<<<<<
  *         # outgoing request
  *         return request.url
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_request), __pyx_n_s_url); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 633, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_request), __pyx_n_s_url); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 644, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_is_absolute); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 633, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_is_absolute); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 644, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_3 < 0))) __PYX_ERR(0, 633, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_3 < 0))) __PYX_ERR(0, 644, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   if (__pyx_t_3) {
 
-    /* "blacksheep/messages.pyx":635
+    /* "blacksheep/messages.pyx":646
  *     if request.url.is_absolute:
  *         # outgoing request
  *         return request.url             # <<<<<<<<<<<<<<
@@ -26062,14 +26311,14 @@ static struct __pyx_obj_10blacksheep_3url_URL *__pyx_f_10blacksheep_8messages_ge
  *     # incoming request
  */
     __Pyx_XDECREF((PyObject *)__pyx_r);
-    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_request), __pyx_n_s_url); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 635, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_request), __pyx_n_s_url); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 646, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_10blacksheep_3url_URL))))) __PYX_ERR(0, 635, __pyx_L1_error)
+    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_10blacksheep_3url_URL))))) __PYX_ERR(0, 646, __pyx_L1_error)
     __pyx_r = ((struct __pyx_obj_10blacksheep_3url_URL *)__pyx_t_2);
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "blacksheep/messages.pyx":633
+    /* "blacksheep/messages.pyx":644
  * 
  * cpdef URL get_request_absolute_url(Request request):
  *     if request.url.is_absolute:             # <<<<<<<<<<<<<<
@@ -26078,7 +26327,7 @@ static struct __pyx_obj_10blacksheep_3url_URL *__pyx_f_10blacksheep_8messages_ge
  */
   }
 
-  /* "blacksheep/messages.pyx":638
+  /* "blacksheep/messages.pyx":649
  * 
  *     # incoming request
  *     return build_absolute_url(             # <<<<<<<<<<<<<<
@@ -26087,46 +26336,46 @@ static struct __pyx_obj_10blacksheep_3url_URL *__pyx_f_10blacksheep_8messages_ge
  */
   __Pyx_XDECREF((PyObject *)__pyx_r);
 
-  /* "blacksheep/messages.pyx":639
+  /* "blacksheep/messages.pyx":650
  *     # incoming request
  *     return build_absolute_url(
  *         ensure_bytes(request.scheme),             # <<<<<<<<<<<<<<
  *         ensure_bytes(request.host),
  *         ensure_bytes(request.base_path),
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_request), __pyx_n_s_scheme); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 639, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_request), __pyx_n_s_scheme); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 650, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __pyx_f_10blacksheep_8messages_ensure_bytes(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 639, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_10blacksheep_8messages_ensure_bytes(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 650, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "blacksheep/messages.pyx":640
+  /* "blacksheep/messages.pyx":651
  *     return build_absolute_url(
  *         ensure_bytes(request.scheme),
  *         ensure_bytes(request.host),             # <<<<<<<<<<<<<<
  *         ensure_bytes(request.base_path),
  *         request._path
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_request), __pyx_n_s_host); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 640, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_request), __pyx_n_s_host); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 651, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = __pyx_f_10blacksheep_8messages_ensure_bytes(__pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 640, __pyx_L1_error)
+  __pyx_t_4 = __pyx_f_10blacksheep_8messages_ensure_bytes(__pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 651, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "blacksheep/messages.pyx":641
+  /* "blacksheep/messages.pyx":652
  *         ensure_bytes(request.scheme),
  *         ensure_bytes(request.host),
  *         ensure_bytes(request.base_path),             # <<<<<<<<<<<<<<
  *         request._path
  *     )
  */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_request), __pyx_n_s_base_path); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 641, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_request), __pyx_n_s_base_path); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 652, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __pyx_f_10blacksheep_8messages_ensure_bytes(__pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 641, __pyx_L1_error)
+  __pyx_t_5 = __pyx_f_10blacksheep_8messages_ensure_bytes(__pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 652, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "blacksheep/messages.pyx":642
+  /* "blacksheep/messages.pyx":653
  *         ensure_bytes(request.host),
  *         ensure_bytes(request.base_path),
  *         request._path             # <<<<<<<<<<<<<<
@@ -26136,14 +26385,14 @@ static struct __pyx_obj_10blacksheep_3url_URL *__pyx_f_10blacksheep_8messages_ge
   __pyx_t_2 = __pyx_v_request->_path;
   __Pyx_INCREF(__pyx_t_2);
 
-  /* "blacksheep/messages.pyx":638
+  /* "blacksheep/messages.pyx":649
  * 
  *     # incoming request
  *     return build_absolute_url(             # <<<<<<<<<<<<<<
  *         ensure_bytes(request.scheme),
  *         ensure_bytes(request.host),
  */
-  __pyx_t_6 = ((PyObject *)__pyx_f_10blacksheep_3url_build_absolute_url(((PyObject*)__pyx_t_1), ((PyObject*)__pyx_t_4), ((PyObject*)__pyx_t_5), ((PyObject*)__pyx_t_2), 0)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 638, __pyx_L1_error)
+  __pyx_t_6 = ((PyObject *)__pyx_f_10blacksheep_3url_build_absolute_url(((PyObject*)__pyx_t_1), ((PyObject*)__pyx_t_4), ((PyObject*)__pyx_t_5), ((PyObject*)__pyx_t_2), 0)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 649, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -26153,7 +26402,7 @@ static struct __pyx_obj_10blacksheep_3url_URL *__pyx_f_10blacksheep_8messages_ge
   __pyx_t_6 = 0;
   goto __pyx_L0;
 
-  /* "blacksheep/messages.pyx":632
+  /* "blacksheep/messages.pyx":643
  * 
  * 
  * cpdef URL get_request_absolute_url(Request request):             # <<<<<<<<<<<<<<
@@ -26229,12 +26478,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 632, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 643, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "get_request_absolute_url") < 0)) __PYX_ERR(0, 632, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "get_request_absolute_url") < 0)) __PYX_ERR(0, 643, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
@@ -26245,7 +26494,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get_request_absolute_url", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 632, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("get_request_absolute_url", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 643, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -26259,7 +26508,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_request), __pyx_ptype_10blacksheep_8messages_Request, 1, "request", 0))) __PYX_ERR(0, 632, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_request), __pyx_ptype_10blacksheep_8messages_Request, 1, "request", 0))) __PYX_ERR(0, 643, __pyx_L1_error)
   __pyx_r = __pyx_pf_10blacksheep_8messages_14get_request_absolute_url(__pyx_self, __pyx_v_request);
 
   /* function exit code */
@@ -26286,7 +26535,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_14get_request_absolute_url(CYTH
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_request_absolute_url", 1);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((PyObject *)__pyx_f_10blacksheep_8messages_get_request_absolute_url(__pyx_v_request, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 632, __pyx_L1_error)
+  __pyx_t_1 = ((PyObject *)__pyx_f_10blacksheep_8messages_get_request_absolute_url(__pyx_v_request, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 643, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -26303,7 +26552,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_14get_request_absolute_url(CYTH
   return __pyx_r;
 }
 
-/* "blacksheep/messages.pyx":646
+/* "blacksheep/messages.pyx":657
  * 
  * 
  * cpdef URL get_absolute_url_to_path(Request request, str path):             # <<<<<<<<<<<<<<
@@ -26331,7 +26580,7 @@ static struct __pyx_obj_10blacksheep_3url_URL *__pyx_f_10blacksheep_8messages_ge
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_absolute_url_to_path", 1);
 
-  /* "blacksheep/messages.pyx":647
+  /* "blacksheep/messages.pyx":658
  * 
  * cpdef URL get_absolute_url_to_path(Request request, str path):
  *     return build_absolute_url(             # <<<<<<<<<<<<<<
@@ -26340,62 +26589,62 @@ static struct __pyx_obj_10blacksheep_3url_URL *__pyx_f_10blacksheep_8messages_ge
  */
   __Pyx_XDECREF((PyObject *)__pyx_r);
 
-  /* "blacksheep/messages.pyx":648
+  /* "blacksheep/messages.pyx":659
  * cpdef URL get_absolute_url_to_path(Request request, str path):
  *     return build_absolute_url(
  *         ensure_bytes(request.scheme),             # <<<<<<<<<<<<<<
  *         ensure_bytes(request.host),
  *         ensure_bytes(request.base_path),
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_request), __pyx_n_s_scheme); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 648, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_request), __pyx_n_s_scheme); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 659, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __pyx_f_10blacksheep_8messages_ensure_bytes(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 648, __pyx_L1_error)
+  __pyx_t_2 = __pyx_f_10blacksheep_8messages_ensure_bytes(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 659, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "blacksheep/messages.pyx":649
+  /* "blacksheep/messages.pyx":660
  *     return build_absolute_url(
  *         ensure_bytes(request.scheme),
  *         ensure_bytes(request.host),             # <<<<<<<<<<<<<<
  *         ensure_bytes(request.base_path),
  *         ensure_bytes(path)
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_request), __pyx_n_s_host); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 649, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_request), __pyx_n_s_host); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 660, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = __pyx_f_10blacksheep_8messages_ensure_bytes(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 649, __pyx_L1_error)
+  __pyx_t_3 = __pyx_f_10blacksheep_8messages_ensure_bytes(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 660, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "blacksheep/messages.pyx":650
+  /* "blacksheep/messages.pyx":661
  *         ensure_bytes(request.scheme),
  *         ensure_bytes(request.host),
  *         ensure_bytes(request.base_path),             # <<<<<<<<<<<<<<
  *         ensure_bytes(path)
  *     )
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_request), __pyx_n_s_base_path); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 650, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_request), __pyx_n_s_base_path); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 661, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = __pyx_f_10blacksheep_8messages_ensure_bytes(__pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 650, __pyx_L1_error)
+  __pyx_t_4 = __pyx_f_10blacksheep_8messages_ensure_bytes(__pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 661, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "blacksheep/messages.pyx":651
+  /* "blacksheep/messages.pyx":662
  *         ensure_bytes(request.host),
  *         ensure_bytes(request.base_path),
  *         ensure_bytes(path)             # <<<<<<<<<<<<<<
  *     )
  */
-  __pyx_t_1 = __pyx_f_10blacksheep_8messages_ensure_bytes(__pyx_v_path); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 651, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_10blacksheep_8messages_ensure_bytes(__pyx_v_path); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 662, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
 
-  /* "blacksheep/messages.pyx":647
+  /* "blacksheep/messages.pyx":658
  * 
  * cpdef URL get_absolute_url_to_path(Request request, str path):
  *     return build_absolute_url(             # <<<<<<<<<<<<<<
  *         ensure_bytes(request.scheme),
  *         ensure_bytes(request.host),
  */
-  __pyx_t_5 = ((PyObject *)__pyx_f_10blacksheep_3url_build_absolute_url(((PyObject*)__pyx_t_2), ((PyObject*)__pyx_t_3), ((PyObject*)__pyx_t_4), ((PyObject*)__pyx_t_1), 0)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 647, __pyx_L1_error)
+  __pyx_t_5 = ((PyObject *)__pyx_f_10blacksheep_3url_build_absolute_url(((PyObject*)__pyx_t_2), ((PyObject*)__pyx_t_3), ((PyObject*)__pyx_t_4), ((PyObject*)__pyx_t_1), 0)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 658, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -26405,7 +26654,7 @@ static struct __pyx_obj_10blacksheep_3url_URL *__pyx_f_10blacksheep_8messages_ge
   __pyx_t_5 = 0;
   goto __pyx_L0;
 
-  /* "blacksheep/messages.pyx":646
+  /* "blacksheep/messages.pyx":657
  * 
  * 
  * cpdef URL get_absolute_url_to_path(Request request, str path):             # <<<<<<<<<<<<<<
@@ -26484,7 +26733,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 646, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 657, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
@@ -26492,14 +26741,14 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 646, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 657, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("get_absolute_url_to_path", 1, 2, 2, 1); __PYX_ERR(0, 646, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("get_absolute_url_to_path", 1, 2, 2, 1); __PYX_ERR(0, 657, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "get_absolute_url_to_path") < 0)) __PYX_ERR(0, 646, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "get_absolute_url_to_path") < 0)) __PYX_ERR(0, 657, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 2)) {
       goto __pyx_L5_argtuple_error;
@@ -26512,7 +26761,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get_absolute_url_to_path", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 646, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("get_absolute_url_to_path", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 657, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -26526,8 +26775,8 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_request), __pyx_ptype_10blacksheep_8messages_Request, 1, "request", 0))) __PYX_ERR(0, 646, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_path), (&PyUnicode_Type), 1, "path", 1))) __PYX_ERR(0, 646, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_request), __pyx_ptype_10blacksheep_8messages_Request, 1, "request", 0))) __PYX_ERR(0, 657, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_path), (&PyUnicode_Type), 1, "path", 1))) __PYX_ERR(0, 657, __pyx_L1_error)
   __pyx_r = __pyx_pf_10blacksheep_8messages_16get_absolute_url_to_path(__pyx_self, __pyx_v_request, __pyx_v_path);
 
   /* function exit code */
@@ -26554,7 +26803,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_16get_absolute_url_to_path(CYTH
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_absolute_url_to_path", 1);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((PyObject *)__pyx_f_10blacksheep_8messages_get_absolute_url_to_path(__pyx_v_request, __pyx_v_path, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 646, __pyx_L1_error)
+  __pyx_t_1 = ((PyObject *)__pyx_f_10blacksheep_8messages_get_absolute_url_to_path(__pyx_v_request, __pyx_v_path, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 657, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -27177,9 +27426,9 @@ static PyObject *__pyx_pf_10blacksheep_8messages_20__pyx_unpickle_Request(CYTHON
   /* "(tree fragment)":4
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
- *     if __pyx_checksum not in (0x80165aa, 0xc07cd1e, 0xc6d580b):             # <<<<<<<<<<<<<<
+ *     if __pyx_checksum not in (0xba91f9e, 0xa59023d, 0xc52fccb):             # <<<<<<<<<<<<<<
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0x80165aa, 0xc07cd1e, 0xc6d580b) = (_path, _raw_headers, _raw_query, _url, content, method, route_values, scope))" % __pyx_checksum
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0xba91f9e, 0xa59023d, 0xc52fccb) = (_path, _raw_headers, _raw_query, _session, _url, content, method, route_values, scope))" % __pyx_checksum
  */
   __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
@@ -27189,9 +27438,9 @@ static PyObject *__pyx_pf_10blacksheep_8messages_20__pyx_unpickle_Request(CYTHON
 
     /* "(tree fragment)":5
  *     cdef object __pyx_result
- *     if __pyx_checksum not in (0x80165aa, 0xc07cd1e, 0xc6d580b):
+ *     if __pyx_checksum not in (0xba91f9e, 0xa59023d, 0xc52fccb):
  *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
- *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0x80165aa, 0xc07cd1e, 0xc6d580b) = (_path, _raw_headers, _raw_query, _url, content, method, route_values, scope))" % __pyx_checksum
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0xba91f9e, 0xa59023d, 0xc52fccb) = (_path, _raw_headers, _raw_query, _session, _url, content, method, route_values, scope))" % __pyx_checksum
  *     __pyx_result = Request.__new__(__pyx_type)
  */
     __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 5, __pyx_L1_error)
@@ -27210,9 +27459,9 @@ static PyObject *__pyx_pf_10blacksheep_8messages_20__pyx_unpickle_Request(CYTHON
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
     /* "(tree fragment)":6
- *     if __pyx_checksum not in (0x80165aa, 0xc07cd1e, 0xc6d580b):
+ *     if __pyx_checksum not in (0xba91f9e, 0xa59023d, 0xc52fccb):
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0x80165aa, 0xc07cd1e, 0xc6d580b) = (_path, _raw_headers, _raw_query, _url, content, method, route_values, scope))" % __pyx_checksum             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0xba91f9e, 0xa59023d, 0xc52fccb) = (_path, _raw_headers, _raw_query, _session, _url, content, method, route_values, scope))" % __pyx_checksum             # <<<<<<<<<<<<<<
  *     __pyx_result = Request.__new__(__pyx_type)
  *     if __pyx_state is not None:
  */
@@ -27228,15 +27477,15 @@ static PyObject *__pyx_pf_10blacksheep_8messages_20__pyx_unpickle_Request(CYTHON
     /* "(tree fragment)":4
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
- *     if __pyx_checksum not in (0x80165aa, 0xc07cd1e, 0xc6d580b):             # <<<<<<<<<<<<<<
+ *     if __pyx_checksum not in (0xba91f9e, 0xa59023d, 0xc52fccb):             # <<<<<<<<<<<<<<
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0x80165aa, 0xc07cd1e, 0xc6d580b) = (_path, _raw_headers, _raw_query, _url, content, method, route_values, scope))" % __pyx_checksum
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0xba91f9e, 0xa59023d, 0xc52fccb) = (_path, _raw_headers, _raw_query, _session, _url, content, method, route_values, scope))" % __pyx_checksum
  */
   }
 
   /* "(tree fragment)":7
  *         from pickle import PickleError as __pyx_PickleError
- *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0x80165aa, 0xc07cd1e, 0xc6d580b) = (_path, _raw_headers, _raw_query, _url, content, method, route_values, scope))" % __pyx_checksum
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0xba91f9e, 0xa59023d, 0xc52fccb) = (_path, _raw_headers, _raw_query, _session, _url, content, method, route_values, scope))" % __pyx_checksum
  *     __pyx_result = Request.__new__(__pyx_type)             # <<<<<<<<<<<<<<
  *     if __pyx_state is not None:
  *         __pyx_unpickle_Request__set_state(<Request> __pyx_result, __pyx_state)
@@ -27269,7 +27518,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_20__pyx_unpickle_Request(CYTHON
   __pyx_t_1 = 0;
 
   /* "(tree fragment)":8
- *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0x80165aa, 0xc07cd1e, 0xc6d580b) = (_path, _raw_headers, _raw_query, _url, content, method, route_values, scope))" % __pyx_checksum
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0xba91f9e, 0xa59023d, 0xc52fccb) = (_path, _raw_headers, _raw_query, _session, _url, content, method, route_values, scope))" % __pyx_checksum
  *     __pyx_result = Request.__new__(__pyx_type)
  *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
  *         __pyx_unpickle_Request__set_state(<Request> __pyx_result, __pyx_state)
@@ -27291,7 +27540,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_20__pyx_unpickle_Request(CYTHON
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
     /* "(tree fragment)":8
- *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0x80165aa, 0xc07cd1e, 0xc6d580b) = (_path, _raw_headers, _raw_query, _url, content, method, route_values, scope))" % __pyx_checksum
+ *         raise __pyx_PickleError, "Incompatible checksums (0x%x vs (0xba91f9e, 0xa59023d, 0xc52fccb) = (_path, _raw_headers, _raw_query, _session, _url, content, method, route_values, scope))" % __pyx_checksum
  *     __pyx_result = Request.__new__(__pyx_type)
  *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
  *         __pyx_unpickle_Request__set_state(<Request> __pyx_result, __pyx_state)
@@ -27304,7 +27553,7 @@ static PyObject *__pyx_pf_10blacksheep_8messages_20__pyx_unpickle_Request(CYTHON
  *         __pyx_unpickle_Request__set_state(<Request> __pyx_result, __pyx_state)
  *     return __pyx_result             # <<<<<<<<<<<<<<
  * cdef __pyx_unpickle_Request__set_state(Request __pyx_result, tuple __pyx_state):
- *     __pyx_result._path = __pyx_state[0]; __pyx_result._raw_headers = __pyx_state[1]; __pyx_result._raw_query = __pyx_state[2]; __pyx_result._url = __pyx_state[3]; __pyx_result.content = __pyx_state[4]; __pyx_result.method = __pyx_state[5]; __pyx_result.route_values = __pyx_state[6]; __pyx_result.scope = __pyx_state[7]
+ *     __pyx_result._path = __pyx_state[0]; __pyx_result._raw_headers = __pyx_state[1]; __pyx_result._raw_query = __pyx_state[2]; __pyx_result._session = __pyx_state[3]; __pyx_result._url = __pyx_state[4]; __pyx_result.content = __pyx_state[5]; __pyx_result.method = __pyx_state[6]; __pyx_result.route_values = __pyx_state[7]; __pyx_result.scope = __pyx_state[8]
  */
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v___pyx_result);
@@ -27336,8 +27585,8 @@ static PyObject *__pyx_pf_10blacksheep_8messages_20__pyx_unpickle_Request(CYTHON
  *         __pyx_unpickle_Request__set_state(<Request> __pyx_result, __pyx_state)
  *     return __pyx_result
  * cdef __pyx_unpickle_Request__set_state(Request __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     __pyx_result._path = __pyx_state[0]; __pyx_result._raw_headers = __pyx_state[1]; __pyx_result._raw_query = __pyx_state[2]; __pyx_result._url = __pyx_state[3]; __pyx_result.content = __pyx_state[4]; __pyx_result.method = __pyx_state[5]; __pyx_result.route_values = __pyx_state[6]; __pyx_result.scope = __pyx_state[7]
- *     if len(__pyx_state) > 8 and hasattr(__pyx_result, '__dict__'):
+ *     __pyx_result._path = __pyx_state[0]; __pyx_result._raw_headers = __pyx_state[1]; __pyx_result._raw_query = __pyx_state[2]; __pyx_result._session = __pyx_state[3]; __pyx_result._url = __pyx_state[4]; __pyx_result.content = __pyx_state[5]; __pyx_result.method = __pyx_state[6]; __pyx_result.route_values = __pyx_state[7]; __pyx_result.scope = __pyx_state[8]
+ *     if len(__pyx_state) > 9 and hasattr(__pyx_result, '__dict__'):
  */
 
 static PyObject *__pyx_f_10blacksheep_8messages___pyx_unpickle_Request__set_state(struct __pyx_obj_10blacksheep_8messages_Request *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
@@ -27359,9 +27608,9 @@ static PyObject *__pyx_f_10blacksheep_8messages___pyx_unpickle_Request__set_stat
   /* "(tree fragment)":12
  *     return __pyx_result
  * cdef __pyx_unpickle_Request__set_state(Request __pyx_result, tuple __pyx_state):
- *     __pyx_result._path = __pyx_state[0]; __pyx_result._raw_headers = __pyx_state[1]; __pyx_result._raw_query = __pyx_state[2]; __pyx_result._url = __pyx_state[3]; __pyx_result.content = __pyx_state[4]; __pyx_result.method = __pyx_state[5]; __pyx_result.route_values = __pyx_state[6]; __pyx_result.scope = __pyx_state[7]             # <<<<<<<<<<<<<<
- *     if len(__pyx_state) > 8 and hasattr(__pyx_result, '__dict__'):
- *         __pyx_result.__dict__.update(__pyx_state[8])
+ *     __pyx_result._path = __pyx_state[0]; __pyx_result._raw_headers = __pyx_state[1]; __pyx_result._raw_query = __pyx_state[2]; __pyx_result._session = __pyx_state[3]; __pyx_result._url = __pyx_state[4]; __pyx_result.content = __pyx_state[5]; __pyx_result.method = __pyx_state[6]; __pyx_result.route_values = __pyx_state[7]; __pyx_result.scope = __pyx_state[8]             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 9 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[9])
  */
   if (unlikely(__pyx_v___pyx_state == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
@@ -27405,6 +27654,17 @@ static PyObject *__pyx_f_10blacksheep_8messages___pyx_unpickle_Request__set_stat
   }
   __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 3, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 12, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->_session);
+  __Pyx_DECREF(__pyx_v___pyx_result->_session);
+  __pyx_v___pyx_result->_session = __pyx_t_1;
+  __pyx_t_1 = 0;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(3, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 4, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
   if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_10blacksheep_3url_URL))))) __PYX_ERR(3, 12, __pyx_L1_error)
   __Pyx_GIVEREF(__pyx_t_1);
   __Pyx_GOTREF((PyObject *)__pyx_v___pyx_result->_url);
@@ -27415,7 +27675,7 @@ static PyObject *__pyx_f_10blacksheep_8messages___pyx_unpickle_Request__set_stat
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
     __PYX_ERR(3, 12, __pyx_L1_error)
   }
-  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 4, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 12, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 5, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 12, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_10blacksheep_8contents_Content))))) __PYX_ERR(3, 12, __pyx_L1_error)
   __Pyx_GIVEREF(__pyx_t_1);
@@ -27427,7 +27687,7 @@ static PyObject *__pyx_f_10blacksheep_8messages___pyx_unpickle_Request__set_stat
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
     __PYX_ERR(3, 12, __pyx_L1_error)
   }
-  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 5, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 12, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 6, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 12, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   if (!(likely(PyUnicode_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("unicode", __pyx_t_1))) __PYX_ERR(3, 12, __pyx_L1_error)
   __Pyx_GIVEREF(__pyx_t_1);
@@ -27439,7 +27699,7 @@ static PyObject *__pyx_f_10blacksheep_8messages___pyx_unpickle_Request__set_stat
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
     __PYX_ERR(3, 12, __pyx_L1_error)
   }
-  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 6, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 12, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 7, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 12, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
   __Pyx_GOTREF(__pyx_v___pyx_result->route_values);
@@ -27450,7 +27710,7 @@ static PyObject *__pyx_f_10blacksheep_8messages___pyx_unpickle_Request__set_stat
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
     __PYX_ERR(3, 12, __pyx_L1_error)
   }
-  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 7, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 12, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 8, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 12, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
   __Pyx_GOTREF(__pyx_v___pyx_result->scope);
@@ -27460,16 +27720,16 @@ static PyObject *__pyx_f_10blacksheep_8messages___pyx_unpickle_Request__set_stat
 
   /* "(tree fragment)":13
  * cdef __pyx_unpickle_Request__set_state(Request __pyx_result, tuple __pyx_state):
- *     __pyx_result._path = __pyx_state[0]; __pyx_result._raw_headers = __pyx_state[1]; __pyx_result._raw_query = __pyx_state[2]; __pyx_result._url = __pyx_state[3]; __pyx_result.content = __pyx_state[4]; __pyx_result.method = __pyx_state[5]; __pyx_result.route_values = __pyx_state[6]; __pyx_result.scope = __pyx_state[7]
- *     if len(__pyx_state) > 8 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
- *         __pyx_result.__dict__.update(__pyx_state[8])
+ *     __pyx_result._path = __pyx_state[0]; __pyx_result._raw_headers = __pyx_state[1]; __pyx_result._raw_query = __pyx_state[2]; __pyx_result._session = __pyx_state[3]; __pyx_result._url = __pyx_state[4]; __pyx_result.content = __pyx_state[5]; __pyx_result.method = __pyx_state[6]; __pyx_result.route_values = __pyx_state[7]; __pyx_result.scope = __pyx_state[8]
+ *     if len(__pyx_state) > 9 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[9])
  */
   if (unlikely(__pyx_v___pyx_state == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
     __PYX_ERR(3, 13, __pyx_L1_error)
   }
   __pyx_t_3 = __Pyx_PyTuple_GET_SIZE(__pyx_v___pyx_state); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(3, 13, __pyx_L1_error)
-  __pyx_t_4 = (__pyx_t_3 > 8);
+  __pyx_t_4 = (__pyx_t_3 > 9);
   if (__pyx_t_4) {
   } else {
     __pyx_t_2 = __pyx_t_4;
@@ -27481,9 +27741,9 @@ static PyObject *__pyx_f_10blacksheep_8messages___pyx_unpickle_Request__set_stat
   if (__pyx_t_2) {
 
     /* "(tree fragment)":14
- *     __pyx_result._path = __pyx_state[0]; __pyx_result._raw_headers = __pyx_state[1]; __pyx_result._raw_query = __pyx_state[2]; __pyx_result._url = __pyx_state[3]; __pyx_result.content = __pyx_state[4]; __pyx_result.method = __pyx_state[5]; __pyx_result.route_values = __pyx_state[6]; __pyx_result.scope = __pyx_state[7]
- *     if len(__pyx_state) > 8 and hasattr(__pyx_result, '__dict__'):
- *         __pyx_result.__dict__.update(__pyx_state[8])             # <<<<<<<<<<<<<<
+ *     __pyx_result._path = __pyx_state[0]; __pyx_result._raw_headers = __pyx_state[1]; __pyx_result._raw_query = __pyx_state[2]; __pyx_result._session = __pyx_state[3]; __pyx_result._url = __pyx_state[4]; __pyx_result.content = __pyx_state[5]; __pyx_result.method = __pyx_state[6]; __pyx_result.route_values = __pyx_state[7]; __pyx_result.scope = __pyx_state[8]
+ *     if len(__pyx_state) > 9 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[9])             # <<<<<<<<<<<<<<
  */
     __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v___pyx_result->__dict__, __pyx_n_s_update); if (unlikely(!__pyx_t_5)) __PYX_ERR(3, 14, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
@@ -27491,7 +27751,7 @@ static PyObject *__pyx_f_10blacksheep_8messages___pyx_unpickle_Request__set_stat
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
       __PYX_ERR(3, 14, __pyx_L1_error)
     }
-    __pyx_t_6 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 8, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(3, 14, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 9, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(3, 14, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __pyx_t_7 = NULL;
     __pyx_t_8 = 0;
@@ -27520,9 +27780,9 @@ static PyObject *__pyx_f_10blacksheep_8messages___pyx_unpickle_Request__set_stat
 
     /* "(tree fragment)":13
  * cdef __pyx_unpickle_Request__set_state(Request __pyx_result, tuple __pyx_state):
- *     __pyx_result._path = __pyx_state[0]; __pyx_result._raw_headers = __pyx_state[1]; __pyx_result._raw_query = __pyx_state[2]; __pyx_result._url = __pyx_state[3]; __pyx_result.content = __pyx_state[4]; __pyx_result.method = __pyx_state[5]; __pyx_result.route_values = __pyx_state[6]; __pyx_result.scope = __pyx_state[7]
- *     if len(__pyx_state) > 8 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
- *         __pyx_result.__dict__.update(__pyx_state[8])
+ *     __pyx_result._path = __pyx_state[0]; __pyx_result._raw_headers = __pyx_state[1]; __pyx_result._raw_query = __pyx_state[2]; __pyx_result._session = __pyx_state[3]; __pyx_result._url = __pyx_state[4]; __pyx_result.content = __pyx_state[5]; __pyx_result.method = __pyx_state[6]; __pyx_result.route_values = __pyx_state[7]; __pyx_result.scope = __pyx_state[8]
+ *     if len(__pyx_state) > 9 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[9])
  */
   }
 
@@ -27530,8 +27790,8 @@ static PyObject *__pyx_f_10blacksheep_8messages___pyx_unpickle_Request__set_stat
  *         __pyx_unpickle_Request__set_state(<Request> __pyx_result, __pyx_state)
  *     return __pyx_result
  * cdef __pyx_unpickle_Request__set_state(Request __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     __pyx_result._path = __pyx_state[0]; __pyx_result._raw_headers = __pyx_state[1]; __pyx_result._raw_query = __pyx_state[2]; __pyx_result._url = __pyx_state[3]; __pyx_result.content = __pyx_state[4]; __pyx_result.method = __pyx_state[5]; __pyx_result.route_values = __pyx_state[6]; __pyx_result.scope = __pyx_state[7]
- *     if len(__pyx_state) > 8 and hasattr(__pyx_result, '__dict__'):
+ *     __pyx_result._path = __pyx_state[0]; __pyx_result._raw_headers = __pyx_state[1]; __pyx_result._raw_query = __pyx_state[2]; __pyx_result._session = __pyx_state[3]; __pyx_result._url = __pyx_state[4]; __pyx_result.content = __pyx_state[5]; __pyx_result.method = __pyx_state[6]; __pyx_result.route_values = __pyx_state[7]; __pyx_result.scope = __pyx_state[8]
+ *     if len(__pyx_state) > 9 and hasattr(__pyx_result, '__dict__'):
  */
 
   /* function exit code */
@@ -28239,6 +28499,7 @@ static PyObject *__pyx_tp_new_10blacksheep_8messages_Request(PyTypeObject *t, Py
   p->_raw_query = ((PyObject*)Py_None); Py_INCREF(Py_None);
   p->route_values = Py_None; Py_INCREF(Py_None);
   p->scope = Py_None; Py_INCREF(Py_None);
+  p->_session = Py_None; Py_INCREF(Py_None);
   p->__dict__ = PyDict_New(); if (unlikely(!p->__dict__)) goto bad;return o;
   bad:
   Py_DECREF(o); o = 0;
@@ -28262,6 +28523,7 @@ static void __pyx_tp_dealloc_10blacksheep_8messages_Request(PyObject *o) {
   Py_CLEAR(p->_raw_query);
   Py_CLEAR(p->route_values);
   Py_CLEAR(p->scope);
+  Py_CLEAR(p->_session);
   Py_CLEAR(p->__dict__);
   PyObject_GC_Track(o);
   __pyx_tp_dealloc_10blacksheep_8messages_Message(o);
@@ -28280,6 +28542,9 @@ static int __pyx_tp_traverse_10blacksheep_8messages_Request(PyObject *o, visitpr
   if (p->scope) {
     e = (*v)(p->scope, a); if (e) return e;
   }
+  if (p->_session) {
+    e = (*v)(p->_session, a); if (e) return e;
+  }
   if (p->__dict__) {
     e = (*v)(p->__dict__, a); if (e) return e;
   }
@@ -28299,6 +28564,9 @@ static int __pyx_tp_clear_10blacksheep_8messages_Request(PyObject *o) {
   tmp = ((PyObject*)p->scope);
   p->scope = Py_None; Py_INCREF(Py_None);
   Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->_session);
+  p->_session = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
   tmp = ((PyObject*)p->__dict__);
   p->__dict__ = ((PyObject*)Py_None); Py_INCREF(Py_None);
   Py_XDECREF(tmp);
@@ -28547,9 +28815,9 @@ static PyMethodDef __pyx_methods_10blacksheep_8messages_Request[] = {
   {"__repr__", (PyCFunction)__pyx_specialmethod___pyx_pw_10blacksheep_8messages_7Request_5__repr__, METH_NOARGS|METH_COEXIST, 0},
   {"get_cookie", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10blacksheep_8messages_7Request_7get_cookie, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
   {"set_cookie", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10blacksheep_8messages_7Request_9set_cookie, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_10blacksheep_8messages_7Request_8set_cookie},
-  {"is_disconnected", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10blacksheep_8messages_7Request_13is_disconnected, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10blacksheep_8messages_7Request_16__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
-  {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10blacksheep_8messages_7Request_18__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"is_disconnected", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10blacksheep_8messages_7Request_15is_disconnected, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10blacksheep_8messages_7Request_18__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_10blacksheep_8messages_7Request_20__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
   {0, 0, 0, 0}
 };
 
@@ -30525,6 +30793,7 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_Request_get_cookie, __pyx_k_Request_get_cookie, sizeof(__pyx_k_Request_get_cookie), 0, 0, 1, 1},
     {&__pyx_n_s_Request_incoming, __pyx_k_Request_incoming, sizeof(__pyx_k_Request_incoming), 0, 0, 1, 1},
     {&__pyx_n_s_Request_is_disconnected, __pyx_k_Request_is_disconnected, sizeof(__pyx_k_Request_is_disconnected), 0, 0, 1, 1},
+    {&__pyx_n_s_Request_release, __pyx_k_Request_release, sizeof(__pyx_k_Request_release), 0, 0, 1, 1},
     {&__pyx_n_s_Request_set_cookie, __pyx_k_Request_set_cookie, sizeof(__pyx_k_Request_set_cookie), 0, 0, 1, 1},
     {&__pyx_kp_u_Response, __pyx_k_Response, sizeof(__pyx_k_Response), 0, 1, 0, 0},
     {&__pyx_n_s_Response_2, __pyx_k_Response_2, sizeof(__pyx_k_Response_2), 0, 0, 1, 1},
@@ -30693,6 +30962,7 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
     {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
     {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+    {&__pyx_n_s_release, __pyx_k_release, sizeof(__pyx_k_release), 0, 0, 1, 1},
     {&__pyx_n_s_remove, __pyx_k_remove, sizeof(__pyx_k_remove), 0, 0, 1, 1},
     {&__pyx_n_s_remove_cookie, __pyx_k_remove_cookie, sizeof(__pyx_k_remove_cookie), 0, 0, 1, 1},
     {&__pyx_n_s_remove_header, __pyx_k_remove_header, sizeof(__pyx_k_remove_header), 0, 0, 1, 1},
@@ -30703,7 +30973,6 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_u_scheme, __pyx_k_scheme, sizeof(__pyx_k_scheme), 0, 1, 0, 1},
     {&__pyx_n_s_self, __pyx_k_self, sizeof(__pyx_k_self), 0, 0, 1, 1},
     {&__pyx_n_s_send, __pyx_k_send, sizeof(__pyx_k_send), 0, 0, 1, 1},
-    {&__pyx_n_s_session, __pyx_k_session, sizeof(__pyx_k_session), 0, 0, 1, 1},
     {&__pyx_kp_b_set_cookie, __pyx_k_set_cookie, sizeof(__pyx_k_set_cookie), 0, 0, 0, 0},
     {&__pyx_n_s_set_cookie_2, __pyx_k_set_cookie_2, sizeof(__pyx_k_set_cookie_2), 0, 0, 1, 1},
     {&__pyx_n_s_set_cookies, __pyx_k_set_cookies, sizeof(__pyx_k_set_cookies), 0, 0, 1, 1},
@@ -30851,36 +31120,36 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__18);
   __Pyx_GIVEREF(__pyx_tuple__18);
 
-  /* "blacksheep/messages.pyx":430
+  /* "blacksheep/messages.pyx":434
  *                 _url = value
  *             else:
  *                 raise TypeError('Invalid value type, expected bytes, str, or URL')             # <<<<<<<<<<<<<<
  *         else:
  *             _url = None
  */
-  __pyx_tuple__20 = PyTuple_Pack(1, __pyx_kp_u_Invalid_value_type_expected_byte); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(0, 430, __pyx_L1_error)
+  __pyx_tuple__20 = PyTuple_Pack(1, __pyx_kp_u_Invalid_value_type_expected_byte); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(0, 434, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__20);
   __Pyx_GIVEREF(__pyx_tuple__20);
 
-  /* "blacksheep/messages.pyx":508
+  /* "blacksheep/messages.pyx":519
  *     async def is_disconnected(self):
  *         if not isinstance(self.content, ASGIContent):
  *             raise TypeError(             # <<<<<<<<<<<<<<
  *                 "This method is only supported when a request is bound to "
  *                 "an instance of ASGIContent and to an ASGI "
  */
-  __pyx_tuple__27 = PyTuple_Pack(1, __pyx_kp_u_This_method_is_only_supported_wh); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(0, 508, __pyx_L1_error)
+  __pyx_tuple__27 = PyTuple_Pack(1, __pyx_kp_u_This_method_is_only_supported_wh); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(0, 519, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__27);
   __Pyx_GIVEREF(__pyx_tuple__27);
 
-  /* "blacksheep/messages.pyx":629
+  /* "blacksheep/messages.pyx":640
  *     if isinstance(value, bytes):
  *         return value
  *     raise ValueError("Input value must be bytes or str")             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_tuple__28 = PyTuple_Pack(1, __pyx_kp_u_Input_value_must_be_bytes_or_str); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(0, 629, __pyx_L1_error)
+  __pyx_tuple__28 = PyTuple_Pack(1, __pyx_kp_u_Input_value_must_be_bytes_or_str); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(0, 640, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__28);
   __Pyx_GIVEREF(__pyx_tuple__28);
 
@@ -30894,7 +31163,7 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __pyx_tuple__29 = PyTuple_Pack(3, __pyx_int_243617669, __pyx_int_160707978, __pyx_int_156416356); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(3, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__29);
   __Pyx_GIVEREF(__pyx_tuple__29);
-  __pyx_tuple__31 = PyTuple_Pack(3, __pyx_int_134309290, __pyx_int_201837854, __pyx_int_208492555); if (unlikely(!__pyx_tuple__31)) __PYX_ERR(3, 4, __pyx_L1_error)
+  __pyx_tuple__31 = PyTuple_Pack(3, __pyx_int_195633054, __pyx_int_173605437, __pyx_int_206765259); if (unlikely(!__pyx_tuple__31)) __PYX_ERR(3, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__31);
   __Pyx_GIVEREF(__pyx_tuple__31);
   __pyx_tuple__32 = PyTuple_Pack(3, __pyx_int_77885639, __pyx_int_69391364, __pyx_int_204556426); if (unlikely(!__pyx_tuple__32)) __PYX_ERR(3, 4, __pyx_L1_error)
@@ -31175,155 +31444,164 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *         self._session = value
  * 
  *     @classmethod             # <<<<<<<<<<<<<<
- *     def incoming(cls, str method, bytes path, bytes query, list headers):
- *         request = cls(method, None, headers)
+ *     def incoming(cls, str method, bytes path, bytes query, object headers):
+ *         # ASGI servers pass headers as lists in most cases: these are used as-is, to
  */
   __pyx_tuple__68 = PyTuple_Pack(6, __pyx_n_s_cls, __pyx_n_s_method, __pyx_n_s_path, __pyx_n_s_query, __pyx_n_s_headers, __pyx_n_s_request); if (unlikely(!__pyx_tuple__68)) __PYX_ERR(0, 387, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__68);
   __Pyx_GIVEREF(__pyx_tuple__68);
   __pyx_codeobj__69 = (PyObject*)__Pyx_PyCode_New(5, 0, 0, 6, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__68, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_incoming, 387, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__69)) __PYX_ERR(0, 387, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":472
+  /* "blacksheep/messages.pyx":476
  *         return cookies
  * 
  *     def get_cookie(self, str name):             # <<<<<<<<<<<<<<
  *         return self.cookies.get(name)
  * 
  */
-  __pyx_tuple__70 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_name); if (unlikely(!__pyx_tuple__70)) __PYX_ERR(0, 472, __pyx_L1_error)
+  __pyx_tuple__70 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_name); if (unlikely(!__pyx_tuple__70)) __PYX_ERR(0, 476, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__70);
   __Pyx_GIVEREF(__pyx_tuple__70);
-  __pyx_codeobj__71 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__70, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_get_cookie, 472, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__71)) __PYX_ERR(0, 472, __pyx_L1_error)
+  __pyx_codeobj__71 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__70, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_get_cookie, 476, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__71)) __PYX_ERR(0, 476, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":475
+  /* "blacksheep/messages.pyx":479
  *         return self.cookies.get(name)
  * 
  *     def set_cookie(self, str name, str value):             # <<<<<<<<<<<<<<
  *         """
  *         Sets a cookie in the request. This method also ensures that a single
  */
-  __pyx_tuple__72 = PyTuple_Pack(5, __pyx_n_s_self, __pyx_n_s_name, __pyx_n_s_value, __pyx_n_s_new_value, __pyx_n_s_existing_cookie); if (unlikely(!__pyx_tuple__72)) __PYX_ERR(0, 475, __pyx_L1_error)
+  __pyx_tuple__72 = PyTuple_Pack(5, __pyx_n_s_self, __pyx_n_s_name, __pyx_n_s_value, __pyx_n_s_new_value, __pyx_n_s_existing_cookie); if (unlikely(!__pyx_tuple__72)) __PYX_ERR(0, 479, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__72);
   __Pyx_GIVEREF(__pyx_tuple__72);
-  __pyx_codeobj__73 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__72, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_set_cookie_2, 475, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__73)) __PYX_ERR(0, 475, __pyx_L1_error)
+  __pyx_codeobj__73 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__72, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_set_cookie_2, 479, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__73)) __PYX_ERR(0, 479, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":499
+  /* "blacksheep/messages.pyx":503
  *         return self.get_first_header(b"if-none-match")
  * 
  *     cpdef bint expect_100_continue(self):             # <<<<<<<<<<<<<<
  *         cdef bytes value
  *         value = self.get_first_header(b'expect')
  */
-  __pyx_codeobj__74 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__50, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_expect_100_continue, 499, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__74)) __PYX_ERR(0, 499, __pyx_L1_error)
+  __pyx_codeobj__74 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__50, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_expect_100_continue, 503, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__74)) __PYX_ERR(0, 503, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":506
+  /* "blacksheep/messages.pyx":510
  *         return False
  * 
+ *     cpdef void release(self):             # <<<<<<<<<<<<<<
+ *         # detaches the request from its ASGI request/response cycle, once the
+ *         # response has been sent
+ */
+  __pyx_codeobj__75 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__50, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_release, 510, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__75)) __PYX_ERR(0, 510, __pyx_L1_error)
+
+  /* "blacksheep/messages.pyx":517
+ *             (<ASGIContent>self.content).dispose()
+ * 
  *     async def is_disconnected(self):             # <<<<<<<<<<<<<<
  *         if not isinstance(self.content, ASGIContent):
  *             raise TypeError(
  */
-  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS|CO_COROUTINE, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__50, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_is_disconnected, 506, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(0, 506, __pyx_L1_error)
+  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS|CO_COROUTINE, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__50, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_is_disconnected, 517, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(0, 517, __pyx_L1_error)
 
   /* "(tree fragment)":1
  * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
  *     cdef tuple state
  *     cdef object _dict
  */
-  __pyx_codeobj__75 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__62, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__75)) __PYX_ERR(3, 1, __pyx_L1_error)
+  __pyx_codeobj__76 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__62, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__76)) __PYX_ERR(3, 1, __pyx_L1_error)
 
   /* "(tree fragment)":16
  *     else:
- *         return __pyx_unpickle_Request, (type(self), 0x80165aa, state)
+ *         return __pyx_unpickle_Request, (type(self), 0xba91f9e, state)
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     __pyx_unpickle_Request__set_state(self, __pyx_state)
  */
-  __pyx_codeobj__76 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__64, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 16, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__76)) __PYX_ERR(3, 16, __pyx_L1_error)
+  __pyx_codeobj__77 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__64, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 16, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__77)) __PYX_ERR(3, 16, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":549
+  /* "blacksheep/messages.pyx":560
  *         return http.HTTPStatus(self.status).phrase
  * 
  *     def get_cookies(self):             # <<<<<<<<<<<<<<
  *         cdef bytes value
  *         cdef Cookie cookie
  */
-  __pyx_tuple__77 = PyTuple_Pack(5, __pyx_n_s_self, __pyx_n_s_value, __pyx_n_s_cookie, __pyx_n_s_cookies, __pyx_n_s_set_cookies_headers); if (unlikely(!__pyx_tuple__77)) __PYX_ERR(0, 549, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__77);
-  __Pyx_GIVEREF(__pyx_tuple__77);
-  __pyx_codeobj__78 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__77, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_get_cookies, 549, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__78)) __PYX_ERR(0, 549, __pyx_L1_error)
+  __pyx_tuple__78 = PyTuple_Pack(5, __pyx_n_s_self, __pyx_n_s_value, __pyx_n_s_cookie, __pyx_n_s_cookies, __pyx_n_s_set_cookies_headers); if (unlikely(!__pyx_tuple__78)) __PYX_ERR(0, 560, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__78);
+  __Pyx_GIVEREF(__pyx_tuple__78);
+  __pyx_codeobj__79 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__78, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_get_cookies, 560, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__79)) __PYX_ERR(0, 560, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":563
+  /* "blacksheep/messages.pyx":574
  *         return cookies
  * 
  *     def get_cookie(self, str name):             # <<<<<<<<<<<<<<
  *         cdef bytes value
  *         cdef list set_cookies_headers = self.get_headers(b'set-cookie')
  */
-  __pyx_tuple__79 = PyTuple_Pack(5, __pyx_n_s_self, __pyx_n_s_name, __pyx_n_s_value, __pyx_n_s_set_cookies_headers, __pyx_n_s_cookie); if (unlikely(!__pyx_tuple__79)) __PYX_ERR(0, 563, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__79);
-  __Pyx_GIVEREF(__pyx_tuple__79);
-  __pyx_codeobj__80 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__79, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_get_cookie, 563, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__80)) __PYX_ERR(0, 563, __pyx_L1_error)
+  __pyx_tuple__80 = PyTuple_Pack(5, __pyx_n_s_self, __pyx_n_s_name, __pyx_n_s_value, __pyx_n_s_set_cookies_headers, __pyx_n_s_cookie); if (unlikely(!__pyx_tuple__80)) __PYX_ERR(0, 574, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__80);
+  __Pyx_GIVEREF(__pyx_tuple__80);
+  __pyx_codeobj__81 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__80, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_get_cookie, 574, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__81)) __PYX_ERR(0, 574, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":575
+  /* "blacksheep/messages.pyx":586
  *         return None
  * 
  *     def set_cookie(self, Cookie cookie):             # <<<<<<<<<<<<<<
  *         self._raw_headers.append((b'set-cookie', write_cookie_for_response(cookie)))
  * 
  */
-  __pyx_tuple__81 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_cookie); if (unlikely(!__pyx_tuple__81)) __PYX_ERR(0, 575, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__81);
-  __Pyx_GIVEREF(__pyx_tuple__81);
-  __pyx_codeobj__82 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__81, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_set_cookie_2, 575, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__82)) __PYX_ERR(0, 575, __pyx_L1_error)
+  __pyx_tuple__82 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_cookie); if (unlikely(!__pyx_tuple__82)) __PYX_ERR(0, 586, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__82);
+  __Pyx_GIVEREF(__pyx_tuple__82);
+  __pyx_codeobj__83 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__82, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_set_cookie_2, 586, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__83)) __PYX_ERR(0, 586, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":578
+  /* "blacksheep/messages.pyx":589
  *         self._raw_headers.append((b'set-cookie', write_cookie_for_response(cookie)))
  * 
  *     def set_cookies(self, list cookies):             # <<<<<<<<<<<<<<
  *         cdef Cookie cookie
  *         for cookie in cookies:
  */
-  __pyx_tuple__83 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_cookies, __pyx_n_s_cookie); if (unlikely(!__pyx_tuple__83)) __PYX_ERR(0, 578, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__83);
-  __Pyx_GIVEREF(__pyx_tuple__83);
-  __pyx_codeobj__84 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__83, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_set_cookies, 578, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__84)) __PYX_ERR(0, 578, __pyx_L1_error)
+  __pyx_tuple__84 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_cookies, __pyx_n_s_cookie); if (unlikely(!__pyx_tuple__84)) __PYX_ERR(0, 589, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__84);
+  __Pyx_GIVEREF(__pyx_tuple__84);
+  __pyx_codeobj__85 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__84, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_set_cookies, 589, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__85)) __PYX_ERR(0, 589, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":583
+  /* "blacksheep/messages.pyx":594
  *             self.set_cookie(cookie)
  * 
  *     def unset_cookie(self, str name):             # <<<<<<<<<<<<<<
  *         self.set_cookie(
  *             Cookie(
  */
-  __pyx_codeobj__85 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__70, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_unset_cookie, 583, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__85)) __PYX_ERR(0, 583, __pyx_L1_error)
+  __pyx_codeobj__86 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__70, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_unset_cookie, 594, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__86)) __PYX_ERR(0, 594, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":592
+  /* "blacksheep/messages.pyx":603
  *         )
  * 
  *     def remove_cookie(self, str name):             # <<<<<<<<<<<<<<
  *         cdef list to_remove = []
  *         cdef tuple value
  */
-  __pyx_tuple__86 = PyTuple_Pack(6, __pyx_n_s_self, __pyx_n_s_name, __pyx_n_s_to_remove, __pyx_n_s_value, __pyx_n_s_set_cookies_headers, __pyx_n_s_cookie); if (unlikely(!__pyx_tuple__86)) __PYX_ERR(0, 592, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__86);
-  __Pyx_GIVEREF(__pyx_tuple__86);
-  __pyx_codeobj__87 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 6, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__86, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_remove_cookie, 592, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__87)) __PYX_ERR(0, 592, __pyx_L1_error)
+  __pyx_tuple__87 = PyTuple_Pack(6, __pyx_n_s_self, __pyx_n_s_name, __pyx_n_s_to_remove, __pyx_n_s_value, __pyx_n_s_set_cookies_headers, __pyx_n_s_cookie); if (unlikely(!__pyx_tuple__87)) __PYX_ERR(0, 603, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__87);
+  __Pyx_GIVEREF(__pyx_tuple__87);
+  __pyx_codeobj__88 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 6, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__87, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_remove_cookie, 603, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__88)) __PYX_ERR(0, 603, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":605
+  /* "blacksheep/messages.pyx":616
  *         self.remove_headers(to_remove)
  * 
  *     cpdef bint is_redirect(self):             # <<<<<<<<<<<<<<
  *         return self.status in {301, 302, 303, 307, 308}
  * 
  */
-  __pyx_codeobj__88 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__50, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_is_redirect, 605, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__88)) __PYX_ERR(0, 605, __pyx_L1_error)
+  __pyx_codeobj__89 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__50, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_is_redirect, 616, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__89)) __PYX_ERR(0, 616, __pyx_L1_error)
 
   /* "(tree fragment)":1
  * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
  *     cdef tuple state
  *     cdef object _dict
  */
-  __pyx_codeobj__89 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__62, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__89)) __PYX_ERR(3, 1, __pyx_L1_error)
+  __pyx_codeobj__90 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__62, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__90)) __PYX_ERR(3, 1, __pyx_L1_error)
 
   /* "(tree fragment)":16
  *     else:
@@ -31331,61 +31609,61 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     __pyx_unpickle_Response__set_state(self, __pyx_state)
  */
-  __pyx_codeobj__90 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__64, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 16, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__90)) __PYX_ERR(3, 16, __pyx_L1_error)
+  __pyx_codeobj__91 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__64, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 16, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__91)) __PYX_ERR(3, 16, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":609
+  /* "blacksheep/messages.pyx":620
  * 
  * 
  * cpdef bint is_cors_request(Request request):             # <<<<<<<<<<<<<<
  *     return bool(request.get_first_header(b"Origin"))
  * 
  */
-  __pyx_tuple__91 = PyTuple_Pack(1, __pyx_n_s_request); if (unlikely(!__pyx_tuple__91)) __PYX_ERR(0, 609, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__91);
-  __Pyx_GIVEREF(__pyx_tuple__91);
-  __pyx_codeobj__92 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__91, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_is_cors_request, 609, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__92)) __PYX_ERR(0, 609, __pyx_L1_error)
+  __pyx_tuple__92 = PyTuple_Pack(1, __pyx_n_s_request); if (unlikely(!__pyx_tuple__92)) __PYX_ERR(0, 620, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__92);
+  __Pyx_GIVEREF(__pyx_tuple__92);
+  __pyx_codeobj__93 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__92, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_is_cors_request, 620, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__93)) __PYX_ERR(0, 620, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":613
+  /* "blacksheep/messages.pyx":624
  * 
  * 
  * cpdef bint is_cors_preflight_request(Request request):             # <<<<<<<<<<<<<<
  *     if request.method != "OPTIONS" or not is_cors_request(request):
  *         return False
  */
-  __pyx_codeobj__93 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__91, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_is_cors_preflight_request, 613, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__93)) __PYX_ERR(0, 613, __pyx_L1_error)
+  __pyx_codeobj__94 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__92, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_is_cors_preflight_request, 624, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__94)) __PYX_ERR(0, 624, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":632
+  /* "blacksheep/messages.pyx":643
  * 
  * 
  * cpdef URL get_request_absolute_url(Request request):             # <<<<<<<<<<<<<<
  *     if request.url.is_absolute:
  *         # outgoing request
  */
-  __pyx_codeobj__94 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__91, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_get_request_absolute_url, 632, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__94)) __PYX_ERR(0, 632, __pyx_L1_error)
+  __pyx_codeobj__95 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__92, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_get_request_absolute_url, 643, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__95)) __PYX_ERR(0, 643, __pyx_L1_error)
 
-  /* "blacksheep/messages.pyx":646
+  /* "blacksheep/messages.pyx":657
  * 
  * 
  * cpdef URL get_absolute_url_to_path(Request request, str path):             # <<<<<<<<<<<<<<
  *     return build_absolute_url(
  *         ensure_bytes(request.scheme),
  */
-  __pyx_tuple__95 = PyTuple_Pack(2, __pyx_n_s_request, __pyx_n_s_path); if (unlikely(!__pyx_tuple__95)) __PYX_ERR(0, 646, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__95);
-  __Pyx_GIVEREF(__pyx_tuple__95);
-  __pyx_codeobj__96 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__95, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_get_absolute_url_to_path, 646, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__96)) __PYX_ERR(0, 646, __pyx_L1_error)
+  __pyx_tuple__96 = PyTuple_Pack(2, __pyx_n_s_request, __pyx_n_s_path); if (unlikely(!__pyx_tuple__96)) __PYX_ERR(0, 657, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__96);
+  __Pyx_GIVEREF(__pyx_tuple__96);
+  __pyx_codeobj__97 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__96, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_messages_pyx, __pyx_n_s_get_absolute_url_to_path, 657, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__97)) __PYX_ERR(0, 657, __pyx_L1_error)
 
   /* "(tree fragment)":1
  * def __pyx_unpickle_Message(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
-  __pyx_tuple__97 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__97)) __PYX_ERR(3, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__97);
-  __Pyx_GIVEREF(__pyx_tuple__97);
-  __pyx_codeobj__98 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__97, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_Message, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__98)) __PYX_ERR(3, 1, __pyx_L1_error)
-  __pyx_codeobj__99 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__97, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_Request, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__99)) __PYX_ERR(3, 1, __pyx_L1_error)
-  __pyx_codeobj__100 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__97, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_Response, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__100)) __PYX_ERR(3, 1, __pyx_L1_error)
+  __pyx_tuple__98 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__98)) __PYX_ERR(3, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__98);
+  __Pyx_GIVEREF(__pyx_tuple__98);
+  __pyx_codeobj__99 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__98, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_Message, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__99)) __PYX_ERR(3, 1, __pyx_L1_error)
+  __pyx_codeobj__100 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__98, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_Request, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__100)) __PYX_ERR(3, 1, __pyx_L1_error)
+  __pyx_codeobj__101 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__98, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_Response, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__101)) __PYX_ERR(3, 1, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -31407,12 +31685,12 @@ static CYTHON_SMALL_CODE int __Pyx_InitConstants(void) {
   __pyx_int_365 = PyInt_FromLong(365); if (unlikely(!__pyx_int_365)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_69391364 = PyInt_FromLong(69391364L); if (unlikely(!__pyx_int_69391364)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_77885639 = PyInt_FromLong(77885639L); if (unlikely(!__pyx_int_77885639)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_134309290 = PyInt_FromLong(134309290L); if (unlikely(!__pyx_int_134309290)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_156416356 = PyInt_FromLong(156416356L); if (unlikely(!__pyx_int_156416356)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_160707978 = PyInt_FromLong(160707978L); if (unlikely(!__pyx_int_160707978)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_201837854 = PyInt_FromLong(201837854L); if (unlikely(!__pyx_int_201837854)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_173605437 = PyInt_FromLong(173605437L); if (unlikely(!__pyx_int_173605437)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_195633054 = PyInt_FromLong(195633054L); if (unlikely(!__pyx_int_195633054)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_204556426 = PyInt_FromLong(204556426L); if (unlikely(!__pyx_int_204556426)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_208492555 = PyInt_FromLong(208492555L); if (unlikely(!__pyx_int_208492555)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_206765259 = PyInt_FromLong(206765259L); if (unlikely(!__pyx_int_206765259)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_243617669 = PyInt_FromLong(243617669L); if (unlikely(!__pyx_int_243617669)) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
@@ -31528,6 +31806,7 @@ static int __Pyx_modinit_type_init_code(void) {
   __pyx_vtabptr_10blacksheep_8messages_Request = &__pyx_vtable_10blacksheep_8messages_Request;
   __pyx_vtable_10blacksheep_8messages_Request.__pyx_base = *__pyx_vtabptr_10blacksheep_8messages_Message;
   __pyx_vtable_10blacksheep_8messages_Request.expect_100_continue = (int (*)(struct __pyx_obj_10blacksheep_8messages_Request *, int __pyx_skip_dispatch))__pyx_f_10blacksheep_8messages_7Request_expect_100_continue;
+  __pyx_vtable_10blacksheep_8messages_Request.release = (void (*)(struct __pyx_obj_10blacksheep_8messages_Request *, int __pyx_skip_dispatch))__pyx_f_10blacksheep_8messages_7Request_release;
   #if CYTHON_USE_TYPE_SPECS
   __pyx_t_1 = PyTuple_Pack(1, (PyObject *)__pyx_ptype_10blacksheep_8messages_Message); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 274, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
@@ -31560,12 +31839,12 @@ static int __Pyx_modinit_type_init_code(void) {
   __pyx_vtable_10blacksheep_8messages_Response.__pyx_base = *__pyx_vtabptr_10blacksheep_8messages_Message;
   __pyx_vtable_10blacksheep_8messages_Response.is_redirect = (int (*)(struct __pyx_obj_10blacksheep_8messages_Response *, int __pyx_skip_dispatch))__pyx_f_10blacksheep_8messages_8Response_is_redirect;
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_t_1 = PyTuple_Pack(1, (PyObject *)__pyx_ptype_10blacksheep_8messages_Message); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 526, __pyx_L1_error)
+  __pyx_t_1 = PyTuple_Pack(1, (PyObject *)__pyx_ptype_10blacksheep_8messages_Message); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 537, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_ptype_10blacksheep_8messages_Response = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_10blacksheep_8messages_Response_spec, __pyx_t_1);
   __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (unlikely(!__pyx_ptype_10blacksheep_8messages_Response)) __PYX_ERR(0, 526, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_10blacksheep_8messages_Response_spec, __pyx_ptype_10blacksheep_8messages_Response) < 0) __PYX_ERR(0, 526, __pyx_L1_error)
+  if (unlikely(!__pyx_ptype_10blacksheep_8messages_Response)) __PYX_ERR(0, 537, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_10blacksheep_8messages_Response_spec, __pyx_ptype_10blacksheep_8messages_Response) < 0) __PYX_ERR(0, 537, __pyx_L1_error)
   #else
   __pyx_ptype_10blacksheep_8messages_Response = &__pyx_type_10blacksheep_8messages_Response;
   #endif
@@ -31573,19 +31852,19 @@ static int __Pyx_modinit_type_init_code(void) {
   __pyx_ptype_10blacksheep_8messages_Response->tp_base = __pyx_ptype_10blacksheep_8messages_Message;
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_ptype_10blacksheep_8messages_Response) < 0) __PYX_ERR(0, 526, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_ptype_10blacksheep_8messages_Response) < 0) __PYX_ERR(0, 537, __pyx_L1_error)
   #endif
   #if PY_MAJOR_VERSION < 3
   __pyx_ptype_10blacksheep_8messages_Response->tp_print = 0;
   #endif
-  if (__Pyx_SetVtable(__pyx_ptype_10blacksheep_8messages_Response, __pyx_vtabptr_10blacksheep_8messages_Response) < 0) __PYX_ERR(0, 526, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_ptype_10blacksheep_8messages_Response, __pyx_vtabptr_10blacksheep_8messages_Response) < 0) __PYX_ERR(0, 537, __pyx_L1_error)
   #if !CYTHON_COMPILING_IN_LIMITED_API
-  if (__Pyx_MergeVtables(__pyx_ptype_10blacksheep_8messages_Response) < 0) __PYX_ERR(0, 526, __pyx_L1_error)
+  if (__Pyx_MergeVtables(__pyx_ptype_10blacksheep_8messages_Response) < 0) __PYX_ERR(0, 537, __pyx_L1_error)
   #endif
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Response_2, (PyObject *) __pyx_ptype_10blacksheep_8messages_Response) < 0) __PYX_ERR(0, 526, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Response_2, (PyObject *) __pyx_ptype_10blacksheep_8messages_Response) < 0) __PYX_ERR(0, 537, __pyx_L1_error)
   if (__pyx_ptype_10blacksheep_8messages_Response->tp_weaklistoffset == 0) __pyx_ptype_10blacksheep_8messages_Response->tp_weaklistoffset = offsetof(struct __pyx_obj_10blacksheep_8messages_Response, __pyx_base.__weakref__);
   #if !CYTHON_COMPILING_IN_LIMITED_API
-  if (__Pyx_setup_reduce((PyObject *) __pyx_ptype_10blacksheep_8messages_Response) < 0) __PYX_ERR(0, 526, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_ptype_10blacksheep_8messages_Response) < 0) __PYX_ERR(0, 537, __pyx_L1_error)
   #endif
   #if CYTHON_USE_TYPE_SPECS
   __pyx_ptype_10blacksheep_8messages___pyx_scope_struct___read_stream = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_10blacksheep_8messages___pyx_scope_struct___read_stream_spec, NULL); if (unlikely(!__pyx_ptype_10blacksheep_8messages___pyx_scope_struct___read_stream)) __PYX_ERR(0, 34, __pyx_L1_error)
@@ -31740,15 +32019,15 @@ static int __Pyx_modinit_type_init_code(void) {
   }
   #endif
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_ptype_10blacksheep_8messages___pyx_scope_struct_8_is_disconnected = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_10blacksheep_8messages___pyx_scope_struct_8_is_disconnected_spec, NULL); if (unlikely(!__pyx_ptype_10blacksheep_8messages___pyx_scope_struct_8_is_disconnected)) __PYX_ERR(0, 506, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_10blacksheep_8messages___pyx_scope_struct_8_is_disconnected_spec, __pyx_ptype_10blacksheep_8messages___pyx_scope_struct_8_is_disconnected) < 0) __PYX_ERR(0, 506, __pyx_L1_error)
+  __pyx_ptype_10blacksheep_8messages___pyx_scope_struct_8_is_disconnected = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_10blacksheep_8messages___pyx_scope_struct_8_is_disconnected_spec, NULL); if (unlikely(!__pyx_ptype_10blacksheep_8messages___pyx_scope_struct_8_is_disconnected)) __PYX_ERR(0, 517, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_10blacksheep_8messages___pyx_scope_struct_8_is_disconnected_spec, __pyx_ptype_10blacksheep_8messages___pyx_scope_struct_8_is_disconnected) < 0) __PYX_ERR(0, 517, __pyx_L1_error)
   #else
   __pyx_ptype_10blacksheep_8messages___pyx_scope_struct_8_is_disconnected = &__pyx_type_10blacksheep_8messages___pyx_scope_struct_8_is_disconnected;
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_ptype_10blacksheep_8messages___pyx_scope_struct_8_is_disconnected) < 0) __PYX_ERR(0, 506, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_ptype_10blacksheep_8messages___pyx_scope_struct_8_is_disconnected) < 0) __PYX_ERR(0, 517, __pyx_L1_error)
   #endif
   #if PY_MAJOR_VERSION < 3
   __pyx_ptype_10blacksheep_8messages___pyx_scope_struct_8_is_disconnected->tp_print = 0;
@@ -32695,8 +32974,8 @@ if (!__Pyx_RefNanny) {
  *         self._session = value
  * 
  *     @classmethod             # <<<<<<<<<<<<<<
- *     def incoming(cls, str method, bytes path, bytes query, list headers):
- *         request = cls(method, None, headers)
+ *     def incoming(cls, str method, bytes path, bytes query, object headers):
+ *         # ASGI servers pass headers as lists in most cases: these are used as-is, to
  */
   __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_7Request_3incoming, __Pyx_CYFUNCTION_CLASSMETHOD | __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Request_incoming, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__69)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 387, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
@@ -32712,55 +32991,68 @@ if (!__Pyx_RefNanny) {
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_10blacksheep_8messages_Request);
 
-  /* "blacksheep/messages.pyx":472
+  /* "blacksheep/messages.pyx":476
  *         return cookies
  * 
  *     def get_cookie(self, str name):             # <<<<<<<<<<<<<<
  *         return self.cookies.get(name)
  * 
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_7Request_7get_cookie, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Request_get_cookie, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__71)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 472, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_7Request_7get_cookie, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Request_get_cookie, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__71)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 476, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Request, __pyx_n_s_get_cookie, __pyx_t_3) < 0) __PYX_ERR(0, 472, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Request, __pyx_n_s_get_cookie, __pyx_t_3) < 0) __PYX_ERR(0, 476, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_10blacksheep_8messages_Request);
 
-  /* "blacksheep/messages.pyx":475
+  /* "blacksheep/messages.pyx":479
  *         return self.cookies.get(name)
  * 
  *     def set_cookie(self, str name, str value):             # <<<<<<<<<<<<<<
  *         """
  *         Sets a cookie in the request. This method also ensures that a single
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_7Request_9set_cookie, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Request_set_cookie, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__73)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 475, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_7Request_9set_cookie, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Request_set_cookie, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__73)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 479, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Request, __pyx_n_s_set_cookie_2, __pyx_t_3) < 0) __PYX_ERR(0, 475, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Request, __pyx_n_s_set_cookie_2, __pyx_t_3) < 0) __PYX_ERR(0, 479, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_10blacksheep_8messages_Request);
 
-  /* "blacksheep/messages.pyx":499
+  /* "blacksheep/messages.pyx":503
  *         return self.get_first_header(b"if-none-match")
  * 
  *     cpdef bint expect_100_continue(self):             # <<<<<<<<<<<<<<
  *         cdef bytes value
  *         value = self.get_first_header(b'expect')
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_7Request_11expect_100_continue, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Request_expect_100_continue, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__74)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 499, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_7Request_11expect_100_continue, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Request_expect_100_continue, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__74)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 503, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Request, __pyx_n_s_expect_100_continue, __pyx_t_3) < 0) __PYX_ERR(0, 499, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Request, __pyx_n_s_expect_100_continue, __pyx_t_3) < 0) __PYX_ERR(0, 503, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_10blacksheep_8messages_Request);
 
-  /* "blacksheep/messages.pyx":506
+  /* "blacksheep/messages.pyx":510
  *         return False
  * 
+ *     cpdef void release(self):             # <<<<<<<<<<<<<<
+ *         # detaches the request from its ASGI request/response cycle, once the
+ *         # response has been sent
+ */
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_7Request_13release, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Request_release, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__75)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 510, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Request, __pyx_n_s_release, __pyx_t_3) < 0) __PYX_ERR(0, 510, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  PyType_Modified(__pyx_ptype_10blacksheep_8messages_Request);
+
+  /* "blacksheep/messages.pyx":517
+ *             (<ASGIContent>self.content).dispose()
+ * 
  *     async def is_disconnected(self):             # <<<<<<<<<<<<<<
  *         if not isinstance(self.content, ASGIContent):
  *             raise TypeError(
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_7Request_13is_disconnected, __Pyx_CYFUNCTION_CCLASS | __Pyx_CYFUNCTION_COROUTINE, __pyx_n_s_Request_is_disconnected, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__26)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 506, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_7Request_15is_disconnected, __Pyx_CYFUNCTION_CCLASS | __Pyx_CYFUNCTION_COROUTINE, __pyx_n_s_Request_is_disconnected, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__26)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 517, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Request, __pyx_n_s_is_disconnected, __pyx_t_3) < 0) __PYX_ERR(0, 506, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Request, __pyx_n_s_is_disconnected, __pyx_t_3) < 0) __PYX_ERR(0, 517, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_10blacksheep_8messages_Request);
 
@@ -32769,7 +33061,7 @@ if (!__Pyx_RefNanny) {
  *     cdef tuple state
  *     cdef object _dict
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_7Request_16__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Request___reduce_cython, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__75)); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 1, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_7Request_18__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Request___reduce_cython, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__76)); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Request, __pyx_n_s_reduce_cython, __pyx_t_3) < 0) __PYX_ERR(3, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -32777,104 +33069,104 @@ if (!__Pyx_RefNanny) {
 
   /* "(tree fragment)":16
  *     else:
- *         return __pyx_unpickle_Request, (type(self), 0x80165aa, state)
+ *         return __pyx_unpickle_Request, (type(self), 0xba91f9e, state)
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     __pyx_unpickle_Request__set_state(self, __pyx_state)
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_7Request_18__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Request___setstate_cython, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__76)); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 16, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_7Request_20__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Request___setstate_cython, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__77)); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 16, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Request, __pyx_n_s_setstate_cython, __pyx_t_3) < 0) __PYX_ERR(3, 16, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_10blacksheep_8messages_Request);
 
-  /* "blacksheep/messages.pyx":549
+  /* "blacksheep/messages.pyx":560
  *         return http.HTTPStatus(self.status).phrase
  * 
  *     def get_cookies(self):             # <<<<<<<<<<<<<<
  *         cdef bytes value
  *         cdef Cookie cookie
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_8Response_5get_cookies, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Response_get_cookies, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__78)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 549, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_8Response_5get_cookies, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Response_get_cookies, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__79)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 560, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Response, __pyx_n_s_get_cookies, __pyx_t_3) < 0) __PYX_ERR(0, 549, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Response, __pyx_n_s_get_cookies, __pyx_t_3) < 0) __PYX_ERR(0, 560, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_10blacksheep_8messages_Response);
 
-  /* "blacksheep/messages.pyx":563
+  /* "blacksheep/messages.pyx":574
  *         return cookies
  * 
  *     def get_cookie(self, str name):             # <<<<<<<<<<<<<<
  *         cdef bytes value
  *         cdef list set_cookies_headers = self.get_headers(b'set-cookie')
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_8Response_7get_cookie, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Response_get_cookie, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__80)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 563, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_8Response_7get_cookie, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Response_get_cookie, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__81)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 574, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Response, __pyx_n_s_get_cookie, __pyx_t_3) < 0) __PYX_ERR(0, 563, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Response, __pyx_n_s_get_cookie, __pyx_t_3) < 0) __PYX_ERR(0, 574, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_10blacksheep_8messages_Response);
 
-  /* "blacksheep/messages.pyx":575
+  /* "blacksheep/messages.pyx":586
  *         return None
  * 
  *     def set_cookie(self, Cookie cookie):             # <<<<<<<<<<<<<<
  *         self._raw_headers.append((b'set-cookie', write_cookie_for_response(cookie)))
  * 
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_8Response_9set_cookie, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Response_set_cookie, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__82)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 575, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_8Response_9set_cookie, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Response_set_cookie, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__83)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 586, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Response, __pyx_n_s_set_cookie_2, __pyx_t_3) < 0) __PYX_ERR(0, 575, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Response, __pyx_n_s_set_cookie_2, __pyx_t_3) < 0) __PYX_ERR(0, 586, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_10blacksheep_8messages_Response);
 
-  /* "blacksheep/messages.pyx":578
+  /* "blacksheep/messages.pyx":589
  *         self._raw_headers.append((b'set-cookie', write_cookie_for_response(cookie)))
  * 
  *     def set_cookies(self, list cookies):             # <<<<<<<<<<<<<<
  *         cdef Cookie cookie
  *         for cookie in cookies:
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_8Response_11set_cookies, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Response_set_cookies, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__84)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 578, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_8Response_11set_cookies, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Response_set_cookies, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__85)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 589, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Response, __pyx_n_s_set_cookies, __pyx_t_3) < 0) __PYX_ERR(0, 578, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Response, __pyx_n_s_set_cookies, __pyx_t_3) < 0) __PYX_ERR(0, 589, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_10blacksheep_8messages_Response);
 
-  /* "blacksheep/messages.pyx":583
+  /* "blacksheep/messages.pyx":594
  *             self.set_cookie(cookie)
  * 
  *     def unset_cookie(self, str name):             # <<<<<<<<<<<<<<
  *         self.set_cookie(
  *             Cookie(
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_8Response_13unset_cookie, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Response_unset_cookie, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__85)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 583, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_8Response_13unset_cookie, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Response_unset_cookie, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__86)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 594, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Response, __pyx_n_s_unset_cookie, __pyx_t_3) < 0) __PYX_ERR(0, 583, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Response, __pyx_n_s_unset_cookie, __pyx_t_3) < 0) __PYX_ERR(0, 594, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_10blacksheep_8messages_Response);
 
-  /* "blacksheep/messages.pyx":592
+  /* "blacksheep/messages.pyx":603
  *         )
  * 
  *     def remove_cookie(self, str name):             # <<<<<<<<<<<<<<
  *         cdef list to_remove = []
  *         cdef tuple value
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_8Response_15remove_cookie, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Response_remove_cookie, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__87)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 592, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_8Response_15remove_cookie, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Response_remove_cookie, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__88)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 603, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Response, __pyx_n_s_remove_cookie, __pyx_t_3) < 0) __PYX_ERR(0, 592, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Response, __pyx_n_s_remove_cookie, __pyx_t_3) < 0) __PYX_ERR(0, 603, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_10blacksheep_8messages_Response);
 
-  /* "blacksheep/messages.pyx":605
+  /* "blacksheep/messages.pyx":616
  *         self.remove_headers(to_remove)
  * 
  *     cpdef bint is_redirect(self):             # <<<<<<<<<<<<<<
  *         return self.status in {301, 302, 303, 307, 308}
  * 
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_8Response_17is_redirect, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Response_is_redirect, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__88)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 605, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_8Response_17is_redirect, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Response_is_redirect, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__89)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 616, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Response, __pyx_n_s_is_redirect, __pyx_t_3) < 0) __PYX_ERR(0, 605, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Response, __pyx_n_s_is_redirect, __pyx_t_3) < 0) __PYX_ERR(0, 616, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_10blacksheep_8messages_Response);
 
@@ -32883,7 +33175,7 @@ if (!__Pyx_RefNanny) {
  *     cdef tuple state
  *     cdef object _dict
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_8Response_19__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Response___reduce_cython, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__89)); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 1, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_8Response_19__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Response___reduce_cython, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__90)); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Response, __pyx_n_s_reduce_cython, __pyx_t_3) < 0) __PYX_ERR(3, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -32895,58 +33187,58 @@ if (!__Pyx_RefNanny) {
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     __pyx_unpickle_Response__set_state(self, __pyx_state)
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_8Response_21__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Response___setstate_cython, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__90)); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 16, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_8Response_21__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Response___setstate_cython, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__91)); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 16, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_10blacksheep_8messages_Response, __pyx_n_s_setstate_cython, __pyx_t_3) < 0) __PYX_ERR(3, 16, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_10blacksheep_8messages_Response);
 
-  /* "blacksheep/messages.pyx":609
+  /* "blacksheep/messages.pyx":620
  * 
  * 
  * cpdef bint is_cors_request(Request request):             # <<<<<<<<<<<<<<
  *     return bool(request.get_first_header(b"Origin"))
  * 
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_11is_cors_request, 0, __pyx_n_s_is_cors_request, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__92)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 609, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_11is_cors_request, 0, __pyx_n_s_is_cors_request, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__93)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 620, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_is_cors_request, __pyx_t_3) < 0) __PYX_ERR(0, 609, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_is_cors_request, __pyx_t_3) < 0) __PYX_ERR(0, 620, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "blacksheep/messages.pyx":613
+  /* "blacksheep/messages.pyx":624
  * 
  * 
  * cpdef bint is_cors_preflight_request(Request request):             # <<<<<<<<<<<<<<
  *     if request.method != "OPTIONS" or not is_cors_request(request):
  *         return False
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_13is_cors_preflight_request, 0, __pyx_n_s_is_cors_preflight_request, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__93)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 613, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_13is_cors_preflight_request, 0, __pyx_n_s_is_cors_preflight_request, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__94)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 624, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_is_cors_preflight_request, __pyx_t_3) < 0) __PYX_ERR(0, 613, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_is_cors_preflight_request, __pyx_t_3) < 0) __PYX_ERR(0, 624, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "blacksheep/messages.pyx":632
+  /* "blacksheep/messages.pyx":643
  * 
  * 
  * cpdef URL get_request_absolute_url(Request request):             # <<<<<<<<<<<<<<
  *     if request.url.is_absolute:
  *         # outgoing request
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_15get_request_absolute_url, 0, __pyx_n_s_get_request_absolute_url, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__94)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 632, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_15get_request_absolute_url, 0, __pyx_n_s_get_request_absolute_url, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__95)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 643, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_get_request_absolute_url, __pyx_t_3) < 0) __PYX_ERR(0, 632, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_get_request_absolute_url, __pyx_t_3) < 0) __PYX_ERR(0, 643, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "blacksheep/messages.pyx":646
+  /* "blacksheep/messages.pyx":657
  * 
  * 
  * cpdef URL get_absolute_url_to_path(Request request, str path):             # <<<<<<<<<<<<<<
  *     return build_absolute_url(
  *         ensure_bytes(request.scheme),
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_17get_absolute_url_to_path, 0, __pyx_n_s_get_absolute_url_to_path, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__96)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 646, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_17get_absolute_url_to_path, 0, __pyx_n_s_get_absolute_url_to_path, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__97)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 657, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_get_absolute_url_to_path, __pyx_t_3) < 0) __PYX_ERR(0, 646, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_get_absolute_url_to_path, __pyx_t_3) < 0) __PYX_ERR(0, 657, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
   /* "(tree fragment)":1
@@ -32954,7 +33246,7 @@ if (!__Pyx_RefNanny) {
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_19__pyx_unpickle_Message, 0, __pyx_n_s_pyx_unpickle_Message, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__98)); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 1, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_19__pyx_unpickle_Message, 0, __pyx_n_s_pyx_unpickle_Message, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__99)); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_Message, __pyx_t_3) < 0) __PYX_ERR(3, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -32966,7 +33258,7 @@ if (!__Pyx_RefNanny) {
  *     __pyx_result._raw_headers = __pyx_state[0]; __pyx_result.content = __pyx_state[1]
  *     if len(__pyx_state) > 2 and hasattr(__pyx_result, '__dict__'):
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_21__pyx_unpickle_Request, 0, __pyx_n_s_pyx_unpickle_Request, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__99)); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 1, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_21__pyx_unpickle_Request, 0, __pyx_n_s_pyx_unpickle_Request, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__100)); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_Request, __pyx_t_3) < 0) __PYX_ERR(3, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -32976,7 +33268,7 @@ if (!__Pyx_RefNanny) {
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
-  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_23__pyx_unpickle_Response, 0, __pyx_n_s_pyx_unpickle_Response, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__100)); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 1, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_8messages_23__pyx_unpickle_Response, 0, __pyx_n_s_pyx_unpickle_Response, NULL, __pyx_n_s_blacksheep_messages, __pyx_d, ((PyObject *)__pyx_codeobj__101)); if (unlikely(!__pyx_t_3)) __PYX_ERR(3, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_Response, __pyx_t_3) < 0) __PYX_ERR(3, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -36953,20 +37245,6 @@ static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *o, PyObject *n, PyObject
 #endif
 }
 
-/* PyObjectSetAttrStr */
-  #if CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value) {
-    PyTypeObject* tp = Py_TYPE(obj);
-    if (likely(tp->tp_setattro))
-        return tp->tp_setattro(obj, attr_name, value);
-#if PY_MAJOR_VERSION < 3
-    if (likely(tp->tp_setattr))
-        return tp->tp_setattr(obj, PyString_AS_STRING(attr_name), value);
-#endif
-    return PyObject_SetAttr(obj, attr_name, value);
-}
-#endif
-
 /* CallUnboundCMethod1 */
   #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg) {
@@ -37132,6 +37410,20 @@ bad:
     }
 }
 
+/* PyObjectSetAttrStr */
+  #if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_setattro))
+        return tp->tp_setattro(obj, attr_name, value);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_setattr))
+        return tp->tp_setattr(obj, PyString_AS_STRING(attr_name), value);
+#endif
+    return PyObject_SetAttr(obj, attr_name, value);
+}
+#endif
+
 /* PyUnicode_Unicode */
   static CYTHON_INLINE PyObject* __Pyx_PyUnicode_Unicode(PyObject *obj) {
     if (unlikely(obj == Py_None))
@@ -50,10 +50,12 @@ cdef class Request(Message):
     cdef public bytes _raw_query
     cdef public object route_values
     cdef public object scope
+    cdef object _session
 
     cdef dict __dict__
 
     cpdef bint expect_100_continue(self)
+    cpdef void release(self)
 
 
 cdef class Response(Message):
@@ -71,7 +71,7 @@ class Request(Message):
 
     @classmethod
     def incoming(
-        cls, method: str, path: bytes, query: bytes, headers: List[HeaderType]
+        cls, method: str, path: bytes, query: bytes, headers: Sequence[HeaderType]
     ) -> "Request": ...
     @property
     def query(self) -> Dict[str, List[str]]: ...
@@ -95,6 +95,7 @@ class Request(Message):
     @property
     def if_none_match(self) -> Optional[bytes]: ...
     def expect_100_continue(self) -> bool: ...
+    def release(self) -> None: ...
     def with_content(self, content: Content) -> "Request": ...
     @property
     def session(self) -> Session: ...
@@ -385,8 +385,12 @@ cdef class Request(Message):
         self._session = value
 
     @classmethod
-    def incoming(cls, str method, bytes path, bytes query, list headers):
-        request = cls(method, None, headers)
+    def incoming(cls, str method, bytes path, bytes query, object headers):
+        # ASGI servers pass headers as lists in most cases: these are used as-is, to
+        # not copy them for each request
+        request = cls(
+            method, None, headers if type(headers) is list else list(headers)
+        )
         request._path = path
         request._raw_query = query
         return request
@@ -503,6 +507,13 @@ cdef class Request(Message):
             return True
         return False
 
+    cpdef void release(self):
+        # detaches the request from its ASGI request/response cycle, once the
+        # response has been sent
+        self.scope = None
+        if isinstance(self.content, ASGIContent):
+            (<ASGIContent>self.content).dispose()
+
     async def is_disconnected(self):
         if not isinstance(self.content, ASGIContent):
             raise TypeError(
@@ -2,8 +2,11 @@ from blacksheep.normalization import copy_special_attributes
 
 
 def middleware_partial(handler, next_handler):
-    async def middleware_wrapper(request):
-        return await handler(request, next_handler)
+    # the wrapper returns the awaitable of the middleware as-is, rather than awaiting
+    # it inside a coroutine of its own: this spares one coroutine object and one frame
+    # per middleware, for each request
+    def middleware_wrapper(request):
+        return handler(request, next_handler)
 
     return middleware_wrapper
 
@@ -1523,9 +1523,9 @@ static const char *__pyx_filename;
 
 static const char *__pyx_f[] = {
   "blacksheep/scribe.pyx",
-  ".venv/lib64/python3.12/site-packages/Cython/Includes/cpython/datetime.pxd",
+  "datetime.pxd",
   "blacksheep/contents.pxd",
-  ".venv/lib64/python3.12/site-packages/Cython/Includes/cpython/type.pxd",
+  "type.pxd",
   "blacksheep/cookies.pxd",
   "blacksheep/exceptions.pxd",
   "blacksheep/url.pxd",
@@ -1935,11 +1935,12 @@ struct __pyx_obj_10blacksheep_8messages_Request {
   PyObject *_raw_query;
   PyObject *route_values;
   PyObject *scope;
+  PyObject *_session;
   PyObject *__dict__;
 };
 
 
-/* "messages.pxd":59
+/* "messages.pxd":61
  * 
  * 
  * cdef class Response(Message):             # <<<<<<<<<<<<<<
@@ -2059,7 +2060,7 @@ struct __pyx_obj_10blacksheep_6scribe___pyx_scope_struct_5_write_response {
 };
 
 
-/* "blacksheep/scribe.pyx":308
+/* "blacksheep/scribe.pyx":338
  * 
  * 
  * async def send_asgi_response(Response response, object send):             # <<<<<<<<<<<<<<
@@ -2169,11 +2170,12 @@ static struct __pyx_vtabstruct_10blacksheep_8messages_Message *__pyx_vtabptr_10b
 struct __pyx_vtabstruct_10blacksheep_8messages_Request {
   struct __pyx_vtabstruct_10blacksheep_8messages_Message __pyx_base;
   int (*expect_100_continue)(struct __pyx_obj_10blacksheep_8messages_Request *, int __pyx_skip_dispatch);
+  void (*release)(struct __pyx_obj_10blacksheep_8messages_Request *, int __pyx_skip_dispatch);
 };
 static struct __pyx_vtabstruct_10blacksheep_8messages_Request *__pyx_vtabptr_10blacksheep_8messages_Request;
 
 
-/* "messages.pxd":59
+/* "messages.pxd":61
  * 
  * 
  * cdef class Response(Message):             # <<<<<<<<<<<<<<
@@ -3146,6 +3148,8 @@ static PyObject *(*__pyx_f_10blacksheep_7cookies_write_cookie_for_response)(stru
 
 /* Module declarations from "blacksheep.scribe" */
 static int __pyx_v_10blacksheep_6scribe_MAX_RESPONSE_CHUNK_SIZE;
+static PyObject *__pyx_v_10blacksheep_6scribe__START_MESSAGE = 0;
+static PyObject *__pyx_v_10blacksheep_6scribe__BODY_MESSAGE = 0;
 static PyObject *__pyx_7genexpr__pyx_v_10blacksheep_6scribe_status_code;
 static PyObject *__pyx_f_10blacksheep_6scribe_get_status_line(int, int __pyx_skip_dispatch); /*proto*/
 static int __pyx_f_10blacksheep_6scribe_is_small_request(struct __pyx_obj_10blacksheep_8messages_Request *, int __pyx_skip_dispatch); /*proto*/
@@ -3165,6 +3169,8 @@ static int __pyx_f_10blacksheep_6scribe_should_use_chunked_encoding(struct __pyx
 static PyObject *__pyx_f_10blacksheep_6scribe_write_response_cookie(struct __pyx_obj_10blacksheep_7cookies_Cookie *, int __pyx_skip_dispatch); /*proto*/
 static PyObject *__pyx_f_10blacksheep_6scribe_py_write_small_response(struct __pyx_obj_10blacksheep_8messages_Response *, int __pyx_skip_dispatch); /*proto*/
 static PyObject *__pyx_f_10blacksheep_6scribe_py_write_small_request(struct __pyx_obj_10blacksheep_8messages_Request *, int __pyx_skip_dispatch); /*proto*/
+static PyObject *__pyx_f_10blacksheep_6scribe__get_start_message(struct __pyx_obj_10blacksheep_8messages_Response *); /*proto*/
+static PyObject *__pyx_f_10blacksheep_6scribe__get_body_message(PyObject *, int); /*proto*/
 /* #### Code section: typeinfo ### */
 /* #### Code section: before_global_var ### */
 #define __Pyx_MODULE_NAME "blacksheep.scribe"
@@ -3517,6 +3523,7 @@ typedef struct {
   PyObject *__pyx_n_s_write_small_request;
   PyObject *__pyx_int_0;
   PyObject *__pyx_int_2;
+  PyObject *__pyx_int_200;
   PyObject *__pyx_tuple_;
   PyObject *__pyx_slice__8;
   PyObject *__pyx_tuple__10;
@@ -3745,6 +3752,7 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_write_small_request);
   Py_CLEAR(clear_module_state->__pyx_int_0);
   Py_CLEAR(clear_module_state->__pyx_int_2);
+  Py_CLEAR(clear_module_state->__pyx_int_200);
   Py_CLEAR(clear_module_state->__pyx_tuple_);
   Py_CLEAR(clear_module_state->__pyx_slice__8);
   Py_CLEAR(clear_module_state->__pyx_tuple__10);
@@ -3951,6 +3959,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_write_small_request);
   Py_VISIT(traverse_module_state->__pyx_int_0);
   Py_VISIT(traverse_module_state->__pyx_int_2);
+  Py_VISIT(traverse_module_state->__pyx_int_200);
   Py_VISIT(traverse_module_state->__pyx_tuple_);
   Py_VISIT(traverse_module_state->__pyx_slice__8);
   Py_VISIT(traverse_module_state->__pyx_tuple__10);
@@ -4195,6 +4204,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_write_small_request __pyx_mstate_global->__pyx_n_s_write_small_request
 #define __pyx_int_0 __pyx_mstate_global->__pyx_int_0
 #define __pyx_int_2 __pyx_mstate_global->__pyx_int_2
+#define __pyx_int_200 __pyx_mstate_global->__pyx_int_200
 #define __pyx_tuple_ __pyx_mstate_global->__pyx_tuple_
 #define __pyx_slice__8 __pyx_mstate_global->__pyx_slice__8
 #define __pyx_tuple__10 __pyx_mstate_global->__pyx_tuple__10
@@ -12818,9 +12828,217 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_33generator5(__pyx_CoroutineObjec
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
+
+/* "blacksheep/scribe.pyx":323
+ * 
+ * 
+ * cdef dict _get_start_message(Response response):             # <<<<<<<<<<<<<<
+ *     cdef dict message = _START_MESSAGE.copy()
+ *     message['status'] = response.status
+ */
+
+static PyObject *__pyx_f_10blacksheep_6scribe__get_start_message(struct __pyx_obj_10blacksheep_8messages_Response *__pyx_v_response) {
+  PyObject *__pyx_v_message = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_get_start_message", 1);
+
+  /* "blacksheep/scribe.pyx":324
+ * 
+ * cdef dict _get_start_message(Response response):
+ *     cdef dict message = _START_MESSAGE.copy()             # <<<<<<<<<<<<<<
+ *     message['status'] = response.status
+ *     message['headers'] = response._raw_headers
+ */
+  if (unlikely(__pyx_v_10blacksheep_6scribe__START_MESSAGE == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "copy");
+    __PYX_ERR(0, 324, __pyx_L1_error)
+  }
+  __pyx_t_1 = PyDict_Copy(__pyx_v_10blacksheep_6scribe__START_MESSAGE); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 324, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_message = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "blacksheep/scribe.pyx":325
+ * cdef dict _get_start_message(Response response):
+ *     cdef dict message = _START_MESSAGE.copy()
+ *     message['status'] = response.status             # <<<<<<<<<<<<<<
+ *     message['headers'] = response._raw_headers
+ *     return message
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_response->status); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 325, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (unlikely(__pyx_v_message == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 325, __pyx_L1_error)
+  }
+  if (unlikely((PyDict_SetItem(__pyx_v_message, __pyx_n_u_status, __pyx_t_1) < 0))) __PYX_ERR(0, 325, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "blacksheep/scribe.pyx":326
+ *     cdef dict message = _START_MESSAGE.copy()
+ *     message['status'] = response.status
+ *     message['headers'] = response._raw_headers             # <<<<<<<<<<<<<<
+ *     return message
+ * 
+ */
+  __pyx_t_1 = __pyx_v_response->__pyx_base._raw_headers;
+  __Pyx_INCREF(__pyx_t_1);
+  if (unlikely(__pyx_v_message == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 326, __pyx_L1_error)
+  }
+  if (unlikely((PyDict_SetItem(__pyx_v_message, __pyx_n_u_headers, __pyx_t_1) < 0))) __PYX_ERR(0, 326, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "blacksheep/scribe.pyx":327
+ *     message['status'] = response.status
+ *     message['headers'] = response._raw_headers
+ *     return message             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_message);
+  __pyx_r = __pyx_v_message;
+  goto __pyx_L0;
+
+  /* "blacksheep/scribe.pyx":323
+ * 
+ * 
+ * cdef dict _get_start_message(Response response):             # <<<<<<<<<<<<<<
+ *     cdef dict message = _START_MESSAGE.copy()
+ *     message['status'] = response.status
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("blacksheep.scribe._get_start_message", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_message);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "blacksheep/scribe.pyx":330
+ * 
+ * 
+ * cdef dict _get_body_message(bytes body, bint more_body):             # <<<<<<<<<<<<<<
+ *     cdef dict message = _BODY_MESSAGE.copy()
+ *     message['body'] = body
+ */
+
+static PyObject *__pyx_f_10blacksheep_6scribe__get_body_message(PyObject *__pyx_v_body, int __pyx_v_more_body) {
+  PyObject *__pyx_v_message = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_get_body_message", 1);
+
+  /* "blacksheep/scribe.pyx":331
+ * 
+ * cdef dict _get_body_message(bytes body, bint more_body):
+ *     cdef dict message = _BODY_MESSAGE.copy()             # <<<<<<<<<<<<<<
+ *     message['body'] = body
+ *     if more_body:
+ */
+  if (unlikely(__pyx_v_10blacksheep_6scribe__BODY_MESSAGE == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "copy");
+    __PYX_ERR(0, 331, __pyx_L1_error)
+  }
+  __pyx_t_1 = PyDict_Copy(__pyx_v_10blacksheep_6scribe__BODY_MESSAGE); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 331, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_message = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "blacksheep/scribe.pyx":332
+ * cdef dict _get_body_message(bytes body, bint more_body):
+ *     cdef dict message = _BODY_MESSAGE.copy()
+ *     message['body'] = body             # <<<<<<<<<<<<<<
+ *     if more_body:
+ *         message['more_body'] = True
+ */
+  if (unlikely(__pyx_v_message == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 332, __pyx_L1_error)
+  }
+  if (unlikely((PyDict_SetItem(__pyx_v_message, __pyx_n_u_body, __pyx_v_body) < 0))) __PYX_ERR(0, 332, __pyx_L1_error)
+
+  /* "blacksheep/scribe.pyx":333
+ *     cdef dict message = _BODY_MESSAGE.copy()
+ *     message['body'] = body
+ *     if more_body:             # <<<<<<<<<<<<<<
+ *         message['more_body'] = True
+ *     return message
+ */
+  if (__pyx_v_more_body) {
+
+    /* "blacksheep/scribe.pyx":334
+ *     message['body'] = body
+ *     if more_body:
+ *         message['more_body'] = True             # <<<<<<<<<<<<<<
+ *     return message
+ * 
+ */
+    if (unlikely(__pyx_v_message == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 334, __pyx_L1_error)
+    }
+    if (unlikely((PyDict_SetItem(__pyx_v_message, __pyx_n_u_more_body, Py_True) < 0))) __PYX_ERR(0, 334, __pyx_L1_error)
+
+    /* "blacksheep/scribe.pyx":333
+ *     cdef dict message = _BODY_MESSAGE.copy()
+ *     message['body'] = body
+ *     if more_body:             # <<<<<<<<<<<<<<
+ *         message['more_body'] = True
+ *     return message
+ */
+  }
+
+  /* "blacksheep/scribe.pyx":335
+ *     if more_body:
+ *         message['more_body'] = True
+ *     return message             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_message);
+  __pyx_r = __pyx_v_message;
+  goto __pyx_L0;
+
+  /* "blacksheep/scribe.pyx":330
+ * 
+ * 
+ * cdef dict _get_body_message(bytes body, bint more_body):             # <<<<<<<<<<<<<<
+ *     cdef dict message = _BODY_MESSAGE.copy()
+ *     message['body'] = body
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("blacksheep.scribe._get_body_message", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_message);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value); /* proto */
 
-/* "blacksheep/scribe.pyx":308
+/* "blacksheep/scribe.pyx":338
  * 
  * 
  * async def send_asgi_response(Response response, object send):             # <<<<<<<<<<<<<<
@@ -12884,7 +13102,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 308, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 338, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
@@ -12892,14 +13110,14 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 308, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 338, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("send_asgi_response", 1, 2, 2, 1); __PYX_ERR(0, 308, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("send_asgi_response", 1, 2, 2, 1); __PYX_ERR(0, 338, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "send_asgi_response") < 0)) __PYX_ERR(0, 308, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "send_asgi_response") < 0)) __PYX_ERR(0, 338, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 2)) {
       goto __pyx_L5_argtuple_error;
@@ -12912,7 +13130,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("send_asgi_response", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 308, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("send_asgi_response", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 338, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -12926,7 +13144,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_response), __pyx_ptype_10blacksheep_8messages_Response, 1, "response", 0))) __PYX_ERR(0, 308, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_response), __pyx_ptype_10blacksheep_8messages_Response, 1, "response", 0))) __PYX_ERR(0, 338, __pyx_L1_error)
   __pyx_r = __pyx_pf_10blacksheep_6scribe_34send_asgi_response(__pyx_self, __pyx_v_response, __pyx_v_send);
 
   /* function exit code */
@@ -12956,7 +13174,7 @@ static PyObject *__pyx_pf_10blacksheep_6scribe_34send_asgi_response(CYTHON_UNUSE
   if (unlikely(!__pyx_cur_scope)) {
     __pyx_cur_scope = ((struct __pyx_obj_10blacksheep_6scribe___pyx_scope_struct_6_send_asgi_response *)Py_None);
     __Pyx_INCREF(Py_None);
-    __PYX_ERR(0, 308, __pyx_L1_error)
+    __PYX_ERR(0, 338, __pyx_L1_error)
   } else {
     __Pyx_GOTREF((PyObject *)__pyx_cur_scope);
   }
@@ -12967,7 +13185,7 @@ static PyObject *__pyx_pf_10blacksheep_6scribe_34send_asgi_response(CYTHON_UNUSE
   __Pyx_INCREF(__pyx_cur_scope->__pyx_v_send);
   __Pyx_GIVEREF(__pyx_cur_scope->__pyx_v_send);
   {
-    __pyx_CoroutineObject *gen = __Pyx_Coroutine_New((__pyx_coroutine_body_t) __pyx_gb_10blacksheep_6scribe_36generator6, __pyx_codeobj__16, (PyObject *) __pyx_cur_scope, __pyx_n_s_send_asgi_response, __pyx_n_s_send_asgi_response, __pyx_n_s_blacksheep_scribe); if (unlikely(!gen)) __PYX_ERR(0, 308, __pyx_L1_error)
+    __pyx_CoroutineObject *gen = __Pyx_Coroutine_New((__pyx_coroutine_body_t) __pyx_gb_10blacksheep_6scribe_36generator6, __pyx_codeobj__16, (PyObject *) __pyx_cur_scope, __pyx_n_s_send_asgi_response, __pyx_n_s_send_asgi_response, __pyx_n_s_blacksheep_scribe); if (unlikely(!gen)) __PYX_ERR(0, 338, __pyx_L1_error)
     __Pyx_DECREF(__pyx_cur_scope);
     __Pyx_RefNannyFinishContext();
     return (PyObject *) gen;
@@ -13016,9 +13234,9 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
     return NULL;
   }
   __pyx_L3_first_run:;
-  if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 308, __pyx_L1_error)
+  if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 338, __pyx_L1_error)
 
-  /* "blacksheep/scribe.pyx":310
+  /* "blacksheep/scribe.pyx":340
  * async def send_asgi_response(Response response, object send):
  *     cdef bytes chunk
  *     cdef Content content = response.content             # <<<<<<<<<<<<<<
@@ -13031,46 +13249,24 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
   __pyx_cur_scope->__pyx_v_content = ((struct __pyx_obj_10blacksheep_8contents_Content *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "blacksheep/scribe.pyx":312
+  /* "blacksheep/scribe.pyx":342
  *     cdef Content content = response.content
  * 
  *     set_headers_for_response_content(response)             # <<<<<<<<<<<<<<
  * 
- *     await send({
+ *     await send(_get_start_message(response))
  */
-  __pyx_f_10blacksheep_6scribe_set_headers_for_response_content(__pyx_cur_scope->__pyx_v_response); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 312, __pyx_L1_error)
+  __pyx_f_10blacksheep_6scribe_set_headers_for_response_content(__pyx_cur_scope->__pyx_v_response); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 342, __pyx_L1_error)
 
-  /* "blacksheep/scribe.pyx":315
+  /* "blacksheep/scribe.pyx":344
+ *     set_headers_for_response_content(response)
  * 
- *     await send({
- *         'type': 'http.response.start',             # <<<<<<<<<<<<<<
- *         'status': response.status,
- *         'headers': response._raw_headers
- */
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 315, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_2, __pyx_n_u_type, __pyx_kp_u_http_response_start) < 0) __PYX_ERR(0, 315, __pyx_L1_error)
-
-  /* "blacksheep/scribe.pyx":316
- *     await send({
- *         'type': 'http.response.start',
- *         'status': response.status,             # <<<<<<<<<<<<<<
- *         'headers': response._raw_headers
- *     })
- */
-  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_cur_scope->__pyx_v_response->status); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 316, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_t_2, __pyx_n_u_status, __pyx_t_3) < 0) __PYX_ERR(0, 315, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  /* "blacksheep/scribe.pyx":317
- *         'type': 'http.response.start',
- *         'status': response.status,
- *         'headers': response._raw_headers             # <<<<<<<<<<<<<<
- *     })
+ *     await send(_get_start_message(response))             # <<<<<<<<<<<<<<
  * 
+ *     if content:
  */
-  if (PyDict_SetItem(__pyx_t_2, __pyx_n_u_headers, __pyx_cur_scope->__pyx_v_response->__pyx_base._raw_headers) < 0) __PYX_ERR(0, 315, __pyx_L1_error)
+  __pyx_t_2 = __pyx_f_10blacksheep_6scribe__get_start_message(__pyx_cur_scope->__pyx_v_response); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 344, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(__pyx_cur_scope->__pyx_v_send);
   __pyx_t_3 = __pyx_cur_scope->__pyx_v_send; __pyx_t_4 = NULL;
   __pyx_t_5 = 0;
@@ -13091,7 +13287,7 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 314, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 344, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   }
@@ -13106,26 +13302,26 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
     __pyx_generator->resume_label = 1;
     return __pyx_r;
     __pyx_L4_resume_from_await:;
-    if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 314, __pyx_L1_error)
+    if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 344, __pyx_L1_error)
   } else {
     PyObject* exc_type = __Pyx_PyErr_CurrentExceptionType();
     if (exc_type) {
       if (likely(exc_type == PyExc_StopIteration || (exc_type != PyExc_GeneratorExit && __Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration)))) PyErr_Clear();
-      else __PYX_ERR(0, 314, __pyx_L1_error)
+      else __PYX_ERR(0, 344, __pyx_L1_error)
     }
   }
 
-  /* "blacksheep/scribe.pyx":320
- *     })
+  /* "blacksheep/scribe.pyx":346
+ *     await send(_get_start_message(response))
  * 
  *     if content:             # <<<<<<<<<<<<<<
  *         if content.length < 0 or isinstance(content, StreamedContent):
  *             # NB: ASGI HTTP Servers automatically handle chunked encoding,
  */
-  __pyx_t_6 = __Pyx_PyObject_IsTrue(((PyObject *)__pyx_cur_scope->__pyx_v_content)); if (unlikely((__pyx_t_6 < 0))) __PYX_ERR(0, 320, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_IsTrue(((PyObject *)__pyx_cur_scope->__pyx_v_content)); if (unlikely((__pyx_t_6 < 0))) __PYX_ERR(0, 346, __pyx_L1_error)
   if (__pyx_t_6) {
 
-    /* "blacksheep/scribe.pyx":321
+    /* "blacksheep/scribe.pyx":347
  * 
  *     if content:
  *         if content.length < 0 or isinstance(content, StreamedContent):             # <<<<<<<<<<<<<<
@@ -13143,7 +13339,7 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
     __pyx_L7_bool_binop_done:;
     if (__pyx_t_6) {
 
-      /* "blacksheep/scribe.pyx":325
+      /* "blacksheep/scribe.pyx":351
  *             # there is no need to write the length of each chunk
  *             # (see write_chunks function)
  *             closing_chunk = False             # <<<<<<<<<<<<<<
@@ -13152,14 +13348,14 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
  */
       __pyx_cur_scope->__pyx_v_closing_chunk = 0;
 
-      /* "blacksheep/scribe.pyx":326
+      /* "blacksheep/scribe.pyx":352
  *             # (see write_chunks function)
  *             closing_chunk = False
  *             async for chunk in content.get_parts():             # <<<<<<<<<<<<<<
  *                 if not chunk:
  *                     closing_chunk = True
  */
-      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_cur_scope->__pyx_v_content), __pyx_n_s_get_parts); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 326, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_cur_scope->__pyx_v_content), __pyx_n_s_get_parts); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 352, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __pyx_t_2 = NULL;
       __pyx_t_5 = 0;
@@ -13179,15 +13375,15 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
         PyObject *__pyx_callargs[2] = {__pyx_t_2, NULL};
         __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
         __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 326, __pyx_L1_error)
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 352, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       }
-      __pyx_t_3 = __Pyx_Coroutine_GetAsyncIter(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 326, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_Coroutine_GetAsyncIter(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 352, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
       for (;;) {
-        __pyx_t_1 = __Pyx_Coroutine_AsyncIterNext(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 326, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_Coroutine_AsyncIterNext(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 352, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         __pyx_r = __Pyx_Coroutine_Yield_From(__pyx_generator, __pyx_t_1);
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -13211,7 +13407,7 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
               PyErr_Clear();
               break;
             }
-            __PYX_ERR(0, 326, __pyx_L1_error)
+            __PYX_ERR(0, 352, __pyx_L1_error)
           }
           __pyx_t_1 = __pyx_sent_value; __Pyx_INCREF(__pyx_t_1);
         } else {
@@ -13221,76 +13417,54 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
             break;
           }
           __pyx_t_1 = NULL;
-          if (__Pyx_PyGen_FetchStopIterationValue(&__pyx_t_1) < 0) __PYX_ERR(0, 326, __pyx_L1_error)
+          if (__Pyx_PyGen_FetchStopIterationValue(&__pyx_t_1) < 0) __PYX_ERR(0, 352, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_1);
         }
-        if (!(likely(PyBytes_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_1))) __PYX_ERR(0, 326, __pyx_L1_error)
+        if (!(likely(PyBytes_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_1))) __PYX_ERR(0, 352, __pyx_L1_error)
         __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_chunk);
         __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_chunk, ((PyObject*)__pyx_t_1));
         __Pyx_GIVEREF(__pyx_t_1);
         __pyx_t_1 = 0;
 
-        /* "blacksheep/scribe.pyx":327
+        /* "blacksheep/scribe.pyx":353
  *             closing_chunk = False
  *             async for chunk in content.get_parts():
  *                 if not chunk:             # <<<<<<<<<<<<<<
  *                     closing_chunk = True
- *                 await send({
+ *                 await send(_get_body_message(chunk, bool(chunk)))
  */
         __pyx_t_6 = (__pyx_cur_scope->__pyx_v_chunk != Py_None)&&(PyBytes_GET_SIZE(__pyx_cur_scope->__pyx_v_chunk) != 0);
         __pyx_t_7 = (!__pyx_t_6);
         if (__pyx_t_7) {
 
-          /* "blacksheep/scribe.pyx":328
+          /* "blacksheep/scribe.pyx":354
  *             async for chunk in content.get_parts():
  *                 if not chunk:
  *                     closing_chunk = True             # <<<<<<<<<<<<<<
- *                 await send({
- *                     'type': 'http.response.body',
+ *                 await send(_get_body_message(chunk, bool(chunk)))
+ * 
  */
           __pyx_cur_scope->__pyx_v_closing_chunk = 1;
 
-          /* "blacksheep/scribe.pyx":327
+          /* "blacksheep/scribe.pyx":353
  *             closing_chunk = False
  *             async for chunk in content.get_parts():
  *                 if not chunk:             # <<<<<<<<<<<<<<
  *                     closing_chunk = True
- *                 await send({
+ *                 await send(_get_body_message(chunk, bool(chunk)))
  */
         }
 
-        /* "blacksheep/scribe.pyx":330
+        /* "blacksheep/scribe.pyx":355
+ *                 if not chunk:
  *                     closing_chunk = True
- *                 await send({
- *                     'type': 'http.response.body',             # <<<<<<<<<<<<<<
- *                     'body': chunk,
- *                     'more_body': bool(chunk)
- */
-        __pyx_t_2 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 330, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-        if (PyDict_SetItem(__pyx_t_2, __pyx_n_u_type, __pyx_kp_u_http_response_body) < 0) __PYX_ERR(0, 330, __pyx_L1_error)
-
-        /* "blacksheep/scribe.pyx":331
- *                 await send({
- *                     'type': 'http.response.body',
- *                     'body': chunk,             # <<<<<<<<<<<<<<
- *                     'more_body': bool(chunk)
- *                 })
- */
-        if (PyDict_SetItem(__pyx_t_2, __pyx_n_u_body, __pyx_cur_scope->__pyx_v_chunk) < 0) __PYX_ERR(0, 330, __pyx_L1_error)
-
-        /* "blacksheep/scribe.pyx":332
- *                     'type': 'http.response.body',
- *                     'body': chunk,
- *                     'more_body': bool(chunk)             # <<<<<<<<<<<<<<
- *                 })
+ *                 await send(_get_body_message(chunk, bool(chunk)))             # <<<<<<<<<<<<<<
  * 
+ *             if not closing_chunk:
  */
         __pyx_t_7 = (__pyx_cur_scope->__pyx_v_chunk != Py_None)&&(PyBytes_GET_SIZE(__pyx_cur_scope->__pyx_v_chunk) != 0);
-        __pyx_t_4 = __Pyx_PyBool_FromLong((!(!__pyx_t_7))); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 332, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        if (PyDict_SetItem(__pyx_t_2, __pyx_n_u_more_body, __pyx_t_4) < 0) __PYX_ERR(0, 330, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_t_2 = __pyx_f_10blacksheep_6scribe__get_body_message(__pyx_cur_scope->__pyx_v_chunk, (!(!__pyx_t_7))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 355, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
         __Pyx_INCREF(__pyx_cur_scope->__pyx_v_send);
         __pyx_t_4 = __pyx_cur_scope->__pyx_v_send; __pyx_t_8 = NULL;
         __pyx_t_5 = 0;
@@ -13311,7 +13485,7 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
           __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
           __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
           __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-          if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 329, __pyx_L1_error)
+          if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 355, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_1);
           __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
         }
@@ -13331,16 +13505,16 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
           __pyx_t_3 = __pyx_cur_scope->__pyx_t_0;
           __pyx_cur_scope->__pyx_t_0 = 0;
           __Pyx_XGOTREF(__pyx_t_3);
-          if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 329, __pyx_L1_error)
+          if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 355, __pyx_L1_error)
         } else {
           PyObject* exc_type = __Pyx_PyErr_CurrentExceptionType();
           if (exc_type) {
             if (likely(exc_type == PyExc_StopIteration || (exc_type != PyExc_GeneratorExit && __Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration)))) PyErr_Clear();
-            else __PYX_ERR(0, 329, __pyx_L1_error)
+            else __PYX_ERR(0, 355, __pyx_L1_error)
           }
         }
 
-        /* "blacksheep/scribe.pyx":326
+        /* "blacksheep/scribe.pyx":352
  *             # (see write_chunks function)
  *             closing_chunk = False
  *             async for chunk in content.get_parts():             # <<<<<<<<<<<<<<
@@ -13350,8 +13524,8 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
       }
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-      /* "blacksheep/scribe.pyx":335
- *                 })
+      /* "blacksheep/scribe.pyx":357
+ *                 await send(_get_body_message(chunk, bool(chunk)))
  * 
  *             if not closing_chunk:             # <<<<<<<<<<<<<<
  *                 # This is needed, otherwise uvicorn complains with:
@@ -13360,26 +13534,19 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
       __pyx_t_7 = (!__pyx_cur_scope->__pyx_v_closing_chunk);
       if (__pyx_t_7) {
 
-        /* "blacksheep/scribe.pyx":339
+        /* "blacksheep/scribe.pyx":360
+ *                 # This is needed, otherwise uvicorn complains with:
  *                 # ERROR:    ASGI callable returned without completing response.
- *                 await send({
- *                     'type': 'http.response.body',             # <<<<<<<<<<<<<<
- *                     'body': b"",
- *                     'more_body': False
- */
-        __pyx_t_1 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 339, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        if (PyDict_SetItem(__pyx_t_1, __pyx_n_u_type, __pyx_kp_u_http_response_body) < 0) __PYX_ERR(0, 339, __pyx_L1_error)
-        if (PyDict_SetItem(__pyx_t_1, __pyx_n_u_body, __pyx_kp_b__13) < 0) __PYX_ERR(0, 339, __pyx_L1_error)
-
-        /* "blacksheep/scribe.pyx":341
- *                     'type': 'http.response.body',
- *                     'body': b"",
- *                     'more_body': False             # <<<<<<<<<<<<<<
- *                 })
+ *                 await send(_BODY_MESSAGE.copy())             # <<<<<<<<<<<<<<
  *         else:
+ *             if content.length > MAX_RESPONSE_CHUNK_SIZE:
  */
-        if (PyDict_SetItem(__pyx_t_1, __pyx_n_u_more_body, Py_False) < 0) __PYX_ERR(0, 339, __pyx_L1_error)
+        if (unlikely(__pyx_v_10blacksheep_6scribe__BODY_MESSAGE == Py_None)) {
+          PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "copy");
+          __PYX_ERR(0, 360, __pyx_L1_error)
+        }
+        __pyx_t_1 = PyDict_Copy(__pyx_v_10blacksheep_6scribe__BODY_MESSAGE); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 360, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
         __Pyx_INCREF(__pyx_cur_scope->__pyx_v_send);
         __pyx_t_4 = __pyx_cur_scope->__pyx_v_send; __pyx_t_2 = NULL;
         __pyx_t_5 = 0;
@@ -13400,7 +13567,7 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
           __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
           __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
           __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-          if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 338, __pyx_L1_error)
+          if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 360, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_3);
           __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
         }
@@ -13415,17 +13582,17 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
           __pyx_generator->resume_label = 4;
           return __pyx_r;
           __pyx_L16_resume_from_await:;
-          if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 338, __pyx_L1_error)
+          if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 360, __pyx_L1_error)
         } else {
           PyObject* exc_type = __Pyx_PyErr_CurrentExceptionType();
           if (exc_type) {
             if (likely(exc_type == PyExc_StopIteration || (exc_type != PyExc_GeneratorExit && __Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration)))) PyErr_Clear();
-            else __PYX_ERR(0, 338, __pyx_L1_error)
+            else __PYX_ERR(0, 360, __pyx_L1_error)
           }
         }
 
-        /* "blacksheep/scribe.pyx":335
- *                 })
+        /* "blacksheep/scribe.pyx":357
+ *                 await send(_get_body_message(chunk, bool(chunk)))
  * 
  *             if not closing_chunk:             # <<<<<<<<<<<<<<
  *                 # This is needed, otherwise uvicorn complains with:
@@ -13433,7 +13600,7 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
  */
       }
 
-      /* "blacksheep/scribe.pyx":321
+      /* "blacksheep/scribe.pyx":347
  * 
  *     if content:
  *         if content.length < 0 or isinstance(content, StreamedContent):             # <<<<<<<<<<<<<<
@@ -13443,8 +13610,8 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
       goto __pyx_L6;
     }
 
-    /* "blacksheep/scribe.pyx":344
- *                 })
+    /* "blacksheep/scribe.pyx":362
+ *                 await send(_BODY_MESSAGE.copy())
  *         else:
  *             if content.length > MAX_RESPONSE_CHUNK_SIZE:             # <<<<<<<<<<<<<<
  *                 # Note: get_chunks yields the closing bytes fragment therefore
@@ -13454,14 +13621,14 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
       __pyx_t_7 = (__pyx_cur_scope->__pyx_v_content->length > __pyx_v_10blacksheep_6scribe_MAX_RESPONSE_CHUNK_SIZE);
       if (__pyx_t_7) {
 
-        /* "blacksheep/scribe.pyx":347
+        /* "blacksheep/scribe.pyx":365
  *                 # Note: get_chunks yields the closing bytes fragment therefore
  *                 # we do not need to check for the closing message!
  *                 for chunk in get_chunks(content.body):             # <<<<<<<<<<<<<<
- *                     await send({
- *                         'type': 'http.response.body',
+ *                     await send(_get_body_message(chunk, bool(chunk)))
+ *             else:
  */
-        __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_get_chunks); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 347, __pyx_L1_error)
+        __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_get_chunks); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 365, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         __pyx_t_1 = NULL;
         __pyx_t_5 = 0;
@@ -13481,7 +13648,7 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
           PyObject *__pyx_callargs[2] = {__pyx_t_1, __pyx_cur_scope->__pyx_v_content->body};
           __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
           __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-          if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 347, __pyx_L1_error)
+          if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 365, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_3);
           __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
         }
@@ -13490,9 +13657,9 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
           __pyx_t_9 = 0;
           __pyx_t_10 = NULL;
         } else {
-          __pyx_t_9 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 347, __pyx_L1_error)
+          __pyx_t_9 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 365, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_4);
-          __pyx_t_10 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_4); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 347, __pyx_L1_error)
+          __pyx_t_10 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_4); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 365, __pyx_L1_error)
         }
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
         for (;;) {
@@ -13501,28 +13668,28 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
               {
                 Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_4);
                 #if !CYTHON_ASSUME_SAFE_MACROS
-                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 347, __pyx_L1_error)
+                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 365, __pyx_L1_error)
                 #endif
                 if (__pyx_t_9 >= __pyx_temp) break;
               }
               #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-              __pyx_t_3 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_9); __Pyx_INCREF(__pyx_t_3); __pyx_t_9++; if (unlikely((0 < 0))) __PYX_ERR(0, 347, __pyx_L1_error)
+              __pyx_t_3 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_9); __Pyx_INCREF(__pyx_t_3); __pyx_t_9++; if (unlikely((0 < 0))) __PYX_ERR(0, 365, __pyx_L1_error)
               #else
-              __pyx_t_3 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 347, __pyx_L1_error)
+              __pyx_t_3 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 365, __pyx_L1_error)
               __Pyx_GOTREF(__pyx_t_3);
               #endif
             } else {
               {
                 Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_4);
                 #if !CYTHON_ASSUME_SAFE_MACROS
-                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 347, __pyx_L1_error)
+                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 365, __pyx_L1_error)
                 #endif
                 if (__pyx_t_9 >= __pyx_temp) break;
               }
               #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-              __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_9); __Pyx_INCREF(__pyx_t_3); __pyx_t_9++; if (unlikely((0 < 0))) __PYX_ERR(0, 347, __pyx_L1_error)
+              __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_9); __Pyx_INCREF(__pyx_t_3); __pyx_t_9++; if (unlikely((0 < 0))) __PYX_ERR(0, 365, __pyx_L1_error)
               #else
-              __pyx_t_3 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 347, __pyx_L1_error)
+              __pyx_t_3 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 365, __pyx_L1_error)
               __Pyx_GOTREF(__pyx_t_3);
               #endif
             }
@@ -13532,50 +13699,28 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
               PyObject* exc_type = PyErr_Occurred();
               if (exc_type) {
                 if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-                else __PYX_ERR(0, 347, __pyx_L1_error)
+                else __PYX_ERR(0, 365, __pyx_L1_error)
               }
               break;
             }
             __Pyx_GOTREF(__pyx_t_3);
           }
-          if (!(likely(PyBytes_CheckExact(__pyx_t_3))||((__pyx_t_3) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_3))) __PYX_ERR(0, 347, __pyx_L1_error)
+          if (!(likely(PyBytes_CheckExact(__pyx_t_3))||((__pyx_t_3) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_3))) __PYX_ERR(0, 365, __pyx_L1_error)
           __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_chunk);
           __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_chunk, ((PyObject*)__pyx_t_3));
           __Pyx_GIVEREF(__pyx_t_3);
           __pyx_t_3 = 0;
 
-          /* "blacksheep/scribe.pyx":349
+          /* "blacksheep/scribe.pyx":366
+ *                 # we do not need to check for the closing message!
  *                 for chunk in get_chunks(content.body):
- *                     await send({
- *                         'type': 'http.response.body',             # <<<<<<<<<<<<<<
- *                         'body': chunk,
- *                         'more_body': bool(chunk)
- */
-          __pyx_t_1 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 349, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_1);
-          if (PyDict_SetItem(__pyx_t_1, __pyx_n_u_type, __pyx_kp_u_http_response_body) < 0) __PYX_ERR(0, 349, __pyx_L1_error)
-
-          /* "blacksheep/scribe.pyx":350
- *                     await send({
- *                         'type': 'http.response.body',
- *                         'body': chunk,             # <<<<<<<<<<<<<<
- *                         'more_body': bool(chunk)
- *                     })
- */
-          if (PyDict_SetItem(__pyx_t_1, __pyx_n_u_body, __pyx_cur_scope->__pyx_v_chunk) < 0) __PYX_ERR(0, 349, __pyx_L1_error)
-
-          /* "blacksheep/scribe.pyx":351
- *                         'type': 'http.response.body',
- *                         'body': chunk,
- *                         'more_body': bool(chunk)             # <<<<<<<<<<<<<<
- *                     })
+ *                     await send(_get_body_message(chunk, bool(chunk)))             # <<<<<<<<<<<<<<
  *             else:
+ *                 await send(_get_body_message(content.body, False))
  */
           __pyx_t_7 = (__pyx_cur_scope->__pyx_v_chunk != Py_None)&&(PyBytes_GET_SIZE(__pyx_cur_scope->__pyx_v_chunk) != 0);
-          __pyx_t_2 = __Pyx_PyBool_FromLong((!(!__pyx_t_7))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 351, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_2);
-          if (PyDict_SetItem(__pyx_t_1, __pyx_n_u_more_body, __pyx_t_2) < 0) __PYX_ERR(0, 349, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+          __pyx_t_1 = __pyx_f_10blacksheep_6scribe__get_body_message(__pyx_cur_scope->__pyx_v_chunk, (!(!__pyx_t_7))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 366, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_1);
           __Pyx_INCREF(__pyx_cur_scope->__pyx_v_send);
           __pyx_t_2 = __pyx_cur_scope->__pyx_v_send; __pyx_t_8 = NULL;
           __pyx_t_5 = 0;
@@ -13596,7 +13741,7 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
             __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
             __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
             __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-            if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 348, __pyx_L1_error)
+            if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 366, __pyx_L1_error)
             __Pyx_GOTREF(__pyx_t_3);
             __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
           }
@@ -13620,27 +13765,27 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
             __Pyx_XGOTREF(__pyx_t_4);
             __pyx_t_9 = __pyx_cur_scope->__pyx_t_1;
             __pyx_t_10 = __pyx_cur_scope->__pyx_t_2;
-            if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 348, __pyx_L1_error)
+            if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 366, __pyx_L1_error)
           } else {
             PyObject* exc_type = __Pyx_PyErr_CurrentExceptionType();
             if (exc_type) {
               if (likely(exc_type == PyExc_StopIteration || (exc_type != PyExc_GeneratorExit && __Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration)))) PyErr_Clear();
-              else __PYX_ERR(0, 348, __pyx_L1_error)
+              else __PYX_ERR(0, 366, __pyx_L1_error)
             }
           }
 
-          /* "blacksheep/scribe.pyx":347
+          /* "blacksheep/scribe.pyx":365
  *                 # Note: get_chunks yields the closing bytes fragment therefore
  *                 # we do not need to check for the closing message!
  *                 for chunk in get_chunks(content.body):             # <<<<<<<<<<<<<<
- *                     await send({
- *                         'type': 'http.response.body',
+ *                     await send(_get_body_message(chunk, bool(chunk)))
+ *             else:
  */
         }
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-        /* "blacksheep/scribe.pyx":344
- *                 })
+        /* "blacksheep/scribe.pyx":362
+ *                 await send(_BODY_MESSAGE.copy())
  *         else:
  *             if content.length > MAX_RESPONSE_CHUNK_SIZE:             # <<<<<<<<<<<<<<
  *                 # Note: get_chunks yields the closing bytes fragment therefore
@@ -13649,66 +13794,42 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
         goto __pyx_L17;
       }
 
-      /* "blacksheep/scribe.pyx":354
- *                     })
- *             else:
- *                 await send({             # <<<<<<<<<<<<<<
- *                     'type': 'http.response.body',
- *                     'body': content.body,
- */
-      /*else*/ {
-
-        /* "blacksheep/scribe.pyx":355
+      /* "blacksheep/scribe.pyx":368
+ *                     await send(_get_body_message(chunk, bool(chunk)))
  *             else:
- *                 await send({
- *                     'type': 'http.response.body',             # <<<<<<<<<<<<<<
- *                     'body': content.body,
- *                     'more_body': False
- */
-        __pyx_t_3 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 355, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_3);
-        if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_type, __pyx_kp_u_http_response_body) < 0) __PYX_ERR(0, 355, __pyx_L1_error)
-
-        /* "blacksheep/scribe.pyx":356
- *                 await send({
- *                     'type': 'http.response.body',
- *                     'body': content.body,             # <<<<<<<<<<<<<<
- *                     'more_body': False
- *                 })
- */
-        if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_body, __pyx_cur_scope->__pyx_v_content->body) < 0) __PYX_ERR(0, 355, __pyx_L1_error)
-
-        /* "blacksheep/scribe.pyx":357
- *                     'type': 'http.response.body',
- *                     'body': content.body,
- *                     'more_body': False             # <<<<<<<<<<<<<<
- *                 })
+ *                 await send(_get_body_message(content.body, False))             # <<<<<<<<<<<<<<
  *     else:
+ *         await send(_BODY_MESSAGE.copy())
  */
-        if (PyDict_SetItem(__pyx_t_3, __pyx_n_u_more_body, Py_False) < 0) __PYX_ERR(0, 355, __pyx_L1_error)
+      /*else*/ {
+        __pyx_t_3 = __pyx_cur_scope->__pyx_v_content->body;
+        __Pyx_INCREF(__pyx_t_3);
+        __pyx_t_2 = __pyx_f_10blacksheep_6scribe__get_body_message(((PyObject*)__pyx_t_3), 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 368, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_INCREF(__pyx_cur_scope->__pyx_v_send);
-        __pyx_t_2 = __pyx_cur_scope->__pyx_v_send; __pyx_t_1 = NULL;
+        __pyx_t_3 = __pyx_cur_scope->__pyx_v_send; __pyx_t_1 = NULL;
         __pyx_t_5 = 0;
         #if CYTHON_UNPACK_METHODS
-        if (unlikely(PyMethod_Check(__pyx_t_2))) {
-          __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_2);
+        if (unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_3);
           if (likely(__pyx_t_1)) {
-            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
             __Pyx_INCREF(__pyx_t_1);
             __Pyx_INCREF(function);
-            __Pyx_DECREF_SET(__pyx_t_2, function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
             __pyx_t_5 = 1;
           }
         }
         #endif
         {
-          PyObject *__pyx_callargs[2] = {__pyx_t_1, __pyx_t_3};
-          __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+          PyObject *__pyx_callargs[2] = {__pyx_t_1, __pyx_t_2};
+          __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
           __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-          if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 354, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_4);
           __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+          if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 368, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
         }
         __pyx_r = __Pyx_Coroutine_Yield_From(__pyx_generator, __pyx_t_4);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -13721,12 +13842,12 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
           __pyx_generator->resume_label = 6;
           return __pyx_r;
           __pyx_L22_resume_from_await:;
-          if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 354, __pyx_L1_error)
+          if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 368, __pyx_L1_error)
         } else {
           PyObject* exc_type = __Pyx_PyErr_CurrentExceptionType();
           if (exc_type) {
             if (likely(exc_type == PyExc_StopIteration || (exc_type != PyExc_GeneratorExit && __Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration)))) PyErr_Clear();
-            else __PYX_ERR(0, 354, __pyx_L1_error)
+            else __PYX_ERR(0, 368, __pyx_L1_error)
           }
         }
       }
@@ -13734,8 +13855,8 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
     }
     __pyx_L6:;
 
-    /* "blacksheep/scribe.pyx":320
- *     })
+    /* "blacksheep/scribe.pyx":346
+ *     await send(_get_start_message(response))
  * 
  *     if content:             # <<<<<<<<<<<<<<
  *         if content.length < 0 or isinstance(content, StreamedContent):
@@ -13744,49 +13865,43 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
     goto __pyx_L5;
   }
 
-  /* "blacksheep/scribe.pyx":360
- *                 })
+  /* "blacksheep/scribe.pyx":370
+ *                 await send(_get_body_message(content.body, False))
  *     else:
- *         await send({             # <<<<<<<<<<<<<<
- *             'type': 'http.response.body',
- *             'body': b''
+ *         await send(_BODY_MESSAGE.copy())             # <<<<<<<<<<<<<<
+ * 
+ * 
  */
   /*else*/ {
-
-    /* "blacksheep/scribe.pyx":361
- *     else:
- *         await send({
- *             'type': 'http.response.body',             # <<<<<<<<<<<<<<
- *             'body': b''
- *         })
- */
-    __pyx_t_2 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 361, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    if (PyDict_SetItem(__pyx_t_2, __pyx_n_u_type, __pyx_kp_u_http_response_body) < 0) __PYX_ERR(0, 361, __pyx_L1_error)
-    if (PyDict_SetItem(__pyx_t_2, __pyx_n_u_body, __pyx_kp_b__13) < 0) __PYX_ERR(0, 361, __pyx_L1_error)
+    if (unlikely(__pyx_v_10blacksheep_6scribe__BODY_MESSAGE == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "copy");
+      __PYX_ERR(0, 370, __pyx_L1_error)
+    }
+    __pyx_t_3 = PyDict_Copy(__pyx_v_10blacksheep_6scribe__BODY_MESSAGE); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 370, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
     __Pyx_INCREF(__pyx_cur_scope->__pyx_v_send);
-    __pyx_t_3 = __pyx_cur_scope->__pyx_v_send; __pyx_t_1 = NULL;
+    __pyx_t_2 = __pyx_cur_scope->__pyx_v_send; __pyx_t_1 = NULL;
     __pyx_t_5 = 0;
     #if CYTHON_UNPACK_METHODS
-    if (unlikely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_3);
+    if (unlikely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_2);
       if (likely(__pyx_t_1)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
         __Pyx_INCREF(__pyx_t_1);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
         __pyx_t_5 = 1;
       }
     }
     #endif
     {
-      PyObject *__pyx_callargs[2] = {__pyx_t_1, __pyx_t_2};
-      __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+      PyObject *__pyx_callargs[2] = {__pyx_t_1, __pyx_t_3};
+      __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
       __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 360, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 370, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     }
     __pyx_r = __Pyx_Coroutine_Yield_From(__pyx_generator, __pyx_t_4);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -13799,19 +13914,19 @@ static PyObject *__pyx_gb_10blacksheep_6scribe_36generator6(__pyx_CoroutineObjec
       __pyx_generator->resume_label = 7;
       return __pyx_r;
       __pyx_L23_resume_from_await:;
-      if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 360, __pyx_L1_error)
+      if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 370, __pyx_L1_error)
     } else {
       PyObject* exc_type = __Pyx_PyErr_CurrentExceptionType();
       if (exc_type) {
         if (likely(exc_type == PyExc_StopIteration || (exc_type != PyExc_GeneratorExit && __Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration)))) PyErr_Clear();
-        else __PYX_ERR(0, 360, __pyx_L1_error)
+        else __PYX_ERR(0, 370, __pyx_L1_error)
       }
     }
   }
   __pyx_L5:;
   CYTHON_MAYBE_UNUSED_VAR(__pyx_cur_scope);
 
-  /* "blacksheep/scribe.pyx":308
+  /* "blacksheep/scribe.pyx":338
  * 
  * 
  * async def send_asgi_response(Response response, object send):             # <<<<<<<<<<<<<<
@@ -15386,24 +15501,24 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_GIVEREF(__pyx_tuple__34);
   __pyx_codeobj__15 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS|CO_ASYNC_GENERATOR, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__34, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_scribe_pyx, __pyx_n_s_write_response, 294, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__15)) __PYX_ERR(0, 294, __pyx_L1_error)
 
-  /* "blacksheep/scribe.pyx":308
+  /* "blacksheep/scribe.pyx":338
  * 
  * 
  * async def send_asgi_response(Response response, object send):             # <<<<<<<<<<<<<<
  *     cdef bytes chunk
  *     cdef Content content = response.content
  */
-  __pyx_tuple__35 = PyTuple_Pack(5, __pyx_n_s_response, __pyx_n_s_send, __pyx_n_s_chunk, __pyx_n_s_content, __pyx_n_s_closing_chunk); if (unlikely(!__pyx_tuple__35)) __PYX_ERR(0, 308, __pyx_L1_error)
+  __pyx_tuple__35 = PyTuple_Pack(5, __pyx_n_s_response, __pyx_n_s_send, __pyx_n_s_chunk, __pyx_n_s_content, __pyx_n_s_closing_chunk); if (unlikely(!__pyx_tuple__35)) __PYX_ERR(0, 338, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__35);
   __Pyx_GIVEREF(__pyx_tuple__35);
-  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS|CO_COROUTINE, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__35, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_scribe_pyx, __pyx_n_s_send_asgi_response, 308, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(0, 308, __pyx_L1_error)
+  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS|CO_COROUTINE, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__35, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_blacksheep_scribe_pyx, __pyx_n_s_send_asgi_response, 338, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(0, 338, __pyx_L1_error)
 
-  /* "blacksheep/scribe.pyx":366
+  /* "blacksheep/scribe.pyx":373
  * 
  * 
  * _NEW_LINES_RX = re.compile("\r\n|\n")             # <<<<<<<<<<<<<<
  */
-  __pyx_tuple__37 = PyTuple_Pack(1, __pyx_kp_u__36); if (unlikely(!__pyx_tuple__37)) __PYX_ERR(0, 366, __pyx_L1_error)
+  __pyx_tuple__37 = PyTuple_Pack(1, __pyx_kp_u__36); if (unlikely(!__pyx_tuple__37)) __PYX_ERR(0, 373, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__37);
   __Pyx_GIVEREF(__pyx_tuple__37);
   __Pyx_RefNannyFinishContext();
@@ -15420,6 +15535,7 @@ static CYTHON_SMALL_CODE int __Pyx_InitConstants(void) {
   if (__Pyx_CreateStringTabAndInitStrings() < 0) __PYX_ERR(0, 1, __pyx_L1_error);
   __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_200 = PyInt_FromLong(200); if (unlikely(!__pyx_int_200)) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -15443,6 +15559,8 @@ static int __Pyx_modinit_global_init_code(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
   /*--- Global init code ---*/
+  __pyx_v_10blacksheep_6scribe__START_MESSAGE = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  __pyx_v_10blacksheep_6scribe__BODY_MESSAGE = ((PyObject*)Py_None); Py_INCREF(Py_None);
   __pyx_7genexpr__pyx_v_10blacksheep_6scribe_status_code = Py_None; Py_INCREF(Py_None);
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -15608,15 +15726,15 @@ static int __Pyx_modinit_type_init_code(void) {
   }
   #endif
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_ptype_10blacksheep_6scribe___pyx_scope_struct_6_send_asgi_response = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_10blacksheep_6scribe___pyx_scope_struct_6_send_asgi_response_spec, NULL); if (unlikely(!__pyx_ptype_10blacksheep_6scribe___pyx_scope_struct_6_send_asgi_response)) __PYX_ERR(0, 308, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_10blacksheep_6scribe___pyx_scope_struct_6_send_asgi_response_spec, __pyx_ptype_10blacksheep_6scribe___pyx_scope_struct_6_send_asgi_response) < 0) __PYX_ERR(0, 308, __pyx_L1_error)
+  __pyx_ptype_10blacksheep_6scribe___pyx_scope_struct_6_send_asgi_response = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_10blacksheep_6scribe___pyx_scope_struct_6_send_asgi_response_spec, NULL); if (unlikely(!__pyx_ptype_10blacksheep_6scribe___pyx_scope_struct_6_send_asgi_response)) __PYX_ERR(0, 338, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_10blacksheep_6scribe___pyx_scope_struct_6_send_asgi_response_spec, __pyx_ptype_10blacksheep_6scribe___pyx_scope_struct_6_send_asgi_response) < 0) __PYX_ERR(0, 338, __pyx_L1_error)
   #else
   __pyx_ptype_10blacksheep_6scribe___pyx_scope_struct_6_send_asgi_response = &__pyx_type_10blacksheep_6scribe___pyx_scope_struct_6_send_asgi_response;
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_ptype_10blacksheep_6scribe___pyx_scope_struct_6_send_asgi_response) < 0) __PYX_ERR(0, 308, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_ptype_10blacksheep_6scribe___pyx_scope_struct_6_send_asgi_response) < 0) __PYX_ERR(0, 338, __pyx_L1_error)
   #endif
   #if PY_MAJOR_VERSION < 3
   __pyx_ptype_10blacksheep_6scribe___pyx_scope_struct_6_send_asgi_response->tp_print = 0;
@@ -15701,8 +15819,8 @@ static int __Pyx_modinit_type_import_code(void) {
   __pyx_vtabptr_10blacksheep_8messages_Message = (struct __pyx_vtabstruct_10blacksheep_8messages_Message*)__Pyx_GetVtable(__pyx_ptype_10blacksheep_8messages_Message); if (unlikely(!__pyx_vtabptr_10blacksheep_8messages_Message)) __PYX_ERR(7, 18, __pyx_L1_error)
   __pyx_ptype_10blacksheep_8messages_Request = __Pyx_ImportType_3_0_11(__pyx_t_1, "blacksheep.messages", "Request", sizeof(struct __pyx_obj_10blacksheep_8messages_Request), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(struct __pyx_obj_10blacksheep_8messages_Request),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_10blacksheep_8messages_Request) __PYX_ERR(7, 46, __pyx_L1_error)
   __pyx_vtabptr_10blacksheep_8messages_Request = (struct __pyx_vtabstruct_10blacksheep_8messages_Request*)__Pyx_GetVtable(__pyx_ptype_10blacksheep_8messages_Request); if (unlikely(!__pyx_vtabptr_10blacksheep_8messages_Request)) __PYX_ERR(7, 46, __pyx_L1_error)
-  __pyx_ptype_10blacksheep_8messages_Response = __Pyx_ImportType_3_0_11(__pyx_t_1, "blacksheep.messages", "Response", sizeof(struct __pyx_obj_10blacksheep_8messages_Response), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(struct __pyx_obj_10blacksheep_8messages_Response),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_10blacksheep_8messages_Response) __PYX_ERR(7, 59, __pyx_L1_error)
-  __pyx_vtabptr_10blacksheep_8messages_Response = (struct __pyx_vtabstruct_10blacksheep_8messages_Response*)__Pyx_GetVtable(__pyx_ptype_10blacksheep_8messages_Response); if (unlikely(!__pyx_vtabptr_10blacksheep_8messages_Response)) __PYX_ERR(7, 59, __pyx_L1_error)
+  __pyx_ptype_10blacksheep_8messages_Response = __Pyx_ImportType_3_0_11(__pyx_t_1, "blacksheep.messages", "Response", sizeof(struct __pyx_obj_10blacksheep_8messages_Response), __PYX_GET_STRUCT_ALIGNMENT_3_0_11(struct __pyx_obj_10blacksheep_8messages_Response),__Pyx_ImportType_CheckSize_Warn_3_0_11); if (!__pyx_ptype_10blacksheep_8messages_Response) __PYX_ERR(7, 61, __pyx_L1_error)
+  __pyx_vtabptr_10blacksheep_8messages_Response = (struct __pyx_vtabstruct_10blacksheep_8messages_Response*)__Pyx_GetVtable(__pyx_ptype_10blacksheep_8messages_Response); if (unlikely(!__pyx_vtabptr_10blacksheep_8messages_Response)) __PYX_ERR(7, 61, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -16289,32 +16407,85 @@ if (!__Pyx_RefNanny) {
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_write_response, __pyx_t_2) < 0) __PYX_ERR(0, 294, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "blacksheep/scribe.pyx":308
+  /* "blacksheep/scribe.pyx":311
+ * # building a new dict from a literal for each message
+ * cdef dict _START_MESSAGE = {
+ *     'type': 'http.response.start',             # <<<<<<<<<<<<<<
+ *     'status': 200,
+ *     'headers': []
+ */
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 311, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_u_type, __pyx_kp_u_http_response_start) < 0) __PYX_ERR(0, 311, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_u_status, __pyx_int_200) < 0) __PYX_ERR(0, 311, __pyx_L1_error)
+
+  /* "blacksheep/scribe.pyx":313
+ *     'type': 'http.response.start',
+ *     'status': 200,
+ *     'headers': []             # <<<<<<<<<<<<<<
+ * }
+ * 
+ */
+  __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 313, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_u_headers, __pyx_t_4) < 0) __PYX_ERR(0, 311, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_XGOTREF(__pyx_v_10blacksheep_6scribe__START_MESSAGE);
+  __Pyx_DECREF_SET(__pyx_v_10blacksheep_6scribe__START_MESSAGE, ((PyObject*)__pyx_t_2));
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "blacksheep/scribe.pyx":317
+ * 
+ * cdef dict _BODY_MESSAGE = {
+ *     'type': 'http.response.body',             # <<<<<<<<<<<<<<
+ *     'body': b'',
+ *     'more_body': False
+ */
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_u_type, __pyx_kp_u_http_response_body) < 0) __PYX_ERR(0, 317, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_u_body, __pyx_kp_b__13) < 0) __PYX_ERR(0, 317, __pyx_L1_error)
+
+  /* "blacksheep/scribe.pyx":319
+ *     'type': 'http.response.body',
+ *     'body': b'',
+ *     'more_body': False             # <<<<<<<<<<<<<<
+ * }
+ * 
+ */
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_u_more_body, Py_False) < 0) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_XGOTREF(__pyx_v_10blacksheep_6scribe__BODY_MESSAGE);
+  __Pyx_DECREF_SET(__pyx_v_10blacksheep_6scribe__BODY_MESSAGE, ((PyObject*)__pyx_t_2));
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "blacksheep/scribe.pyx":338
  * 
  * 
  * async def send_asgi_response(Response response, object send):             # <<<<<<<<<<<<<<
  *     cdef bytes chunk
  *     cdef Content content = response.content
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_6scribe_35send_asgi_response, __Pyx_CYFUNCTION_COROUTINE, __pyx_n_s_send_asgi_response, NULL, __pyx_n_s_blacksheep_scribe, __pyx_d, ((PyObject *)__pyx_codeobj__16)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 308, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_10blacksheep_6scribe_35send_asgi_response, __Pyx_CYFUNCTION_COROUTINE, __pyx_n_s_send_asgi_response, NULL, __pyx_n_s_blacksheep_scribe, __pyx_d, ((PyObject *)__pyx_codeobj__16)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 338, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_send_asgi_response, __pyx_t_2) < 0) __PYX_ERR(0, 308, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_send_asgi_response, __pyx_t_2) < 0) __PYX_ERR(0, 338, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "blacksheep/scribe.pyx":366
+  /* "blacksheep/scribe.pyx":373
  * 
  * 
  * _NEW_LINES_RX = re.compile("\r\n|\n")             # <<<<<<<<<<<<<<
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_re); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 366, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_re); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 373, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_compile); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 366, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_compile); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 373, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_tuple__37, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 366, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_tuple__37, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 373, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_NEW_LINES_RX, __pyx_t_2) < 0) __PYX_ERR(0, 366, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_NEW_LINES_RX, __pyx_t_2) < 0) __PYX_ERR(0, 373, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
   /* "blacksheep/scribe.pyx":1
@@ -305,17 +305,43 @@ async def write_response(Response response):
         yield chunk
 
 
+# ASGI messages are created copying these templates, which is cheaper than
+# building a new dict from a literal for each message
+cdef dict _START_MESSAGE = {
+    'type': 'http.response.start',
+    'status': 200,
+    'headers': []
+}
+
+cdef dict _BODY_MESSAGE = {
+    'type': 'http.response.body',
+    'body': b'',
+    'more_body': False
+}
+
+
+cdef dict _get_start_message(Response response):
+    cdef dict message = _START_MESSAGE.copy()
+    message['status'] = response.status
+    message['headers'] = response._raw_headers
+    return message
+
+
+cdef dict _get_body_message(bytes body, bint more_body):
+    cdef dict message = _BODY_MESSAGE.copy()
+    message['body'] = body
+    if more_body:
+        message['more_body'] = True
+    return message
+
+
 async def send_asgi_response(Response response, object send):
     cdef bytes chunk
     cdef Content content = response.content
 
     set_headers_for_response_content(response)
 
-    await send({
-        'type': 'http.response.start',
-        'status': response.status,
-        'headers': response._raw_headers
-    })
+    await send(_get_start_message(response))
 
     if content:
         if content.length < 0 or isinstance(content, StreamedContent):
@@ -326,41 +352,22 @@ async def send_asgi_response(Response response, object send):
             async for chunk in content.get_parts():
                 if not chunk:
                     closing_chunk = True
-                await send({
-                    'type': 'http.response.body',
-                    'body': chunk,
-                    'more_body': bool(chunk)
-                })
+                await send(_get_body_message(chunk, bool(chunk)))
 
             if not closing_chunk:
                 # This is needed, otherwise uvicorn complains with:
                 # ERROR:    ASGI callable returned without completing response.
-                await send({
-                    'type': 'http.response.body',
-                    'body': b"",
-                    'more_body': False
-                })
+                await send(_BODY_MESSAGE.copy())
         else:
             if content.length > MAX_RESPONSE_CHUNK_SIZE:
                 # Note: get_chunks yields the closing bytes fragment therefore
                 # we do not need to check for the closing message!
                 for chunk in get_chunks(content.body):
-                    await send({
-                        'type': 'http.response.body',
-                        'body': chunk,
-                        'more_body': bool(chunk)
-                    })
+                    await send(_get_body_message(chunk, bool(chunk)))
             else:
-                await send({
-                    'type': 'http.response.body',
-                    'body': content.body,
-                    'more_body': False
-                })
+                await send(_get_body_message(content.body, False))
     else:
-        await send({
-            'type': 'http.response.body',
-            'body': b''
-        })
+        await send(_BODY_MESSAGE.copy())
 
 
 _NEW_LINES_RX = re.compile("\r\n|\n")
\ No newline at end of file
@@ -1,12 +1,15 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from functools import wraps
-from inspect import signature, unwrap
+from inspect import CO_VARARGS, CO_VARKEYWORDS, signature
 from pathlib import Path
+from types import FunctionType
 from typing import (
     Any,
     Awaitable,
     Callable,
+    Dict,
     Iterable,
     List,
     Optional,
@@ -59,6 +62,9 @@ from blacksheep.server.routing import (
 from blacksheep.server.routing import router as default_router
 from blacksheep.server.websocket import WebSocket, format_reason
 from blacksheep.sessions import SessionMiddleware, SessionSerializer
+from blacksheep.utils.meta import compile_function
+
+_GET_WS = RouteMethod.GET_WS.encode()
 
 
 def get_default_headers_middleware(
@@ -66,34 +72,71 @@ def get_default_headers_middleware(
 ) -> Callable[..., Awaitable[Response]]:
     raw_headers = tuple((name.encode(), value.encode()) for name, value in headers)
 
-    async def default_headers_middleware(
-        request: Request, handler: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        response = await handler(request)
-        for name, value in raw_headers:
-            response.add_header(name, value)
-        return response
+    # the middleware is generated with the encoded headers written as constants in
+    # its body, so responses are decorated without iterating over the headers, and
+    # with the method adding headers looked up once per response
+    source = (
+        "async def default_headers_middleware(request, handler):\n"
+        "    response = await handler(request)\n"
+        "    add_header = response.add_header\n"
+        + "".join(
+            f"    add_header({name!r}, {value!r})\n" for name, value in raw_headers
+        )
+        + "    return response\n"
+    )
+    return compile_function(source, "default_headers_middleware", {})
+
 
-    return default_headers_middleware
+async def _gather(*awaitables: Awaitable[Any]) -> List[Any]:
+    """
+    Awaits the given awaitables concurrently like asyncio.gather, but raises the first
+    exception only once all of them completed, so none is left running unobserved.
+    """
+    results = await asyncio.gather(*awaitables, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
+def _accepts_no_parameters(function) -> bool:
+    if type(function) is FunctionType and not hasattr(function, "__wrapped__"):
+        # plain functions are inspected through their code object, which is much
+        # cheaper than building their Signature
+        code = function.__code__
+        return (
+            code.co_argcount == 0
+            and code.co_kwonlyargcount == 0
+            and not code.co_flags & (CO_VARARGS | CO_VARKEYWORDS)
+        )
+    return len(signature(function).parameters) == 0
 
 
 class ApplicationEvent:
-    def __init__(self, context: Any) -> None:
+    """
+    Event whose subscribers are awaited, in order of registration, when the event is
+    fired.
+
+    If `concurrent` is True, subscribers are instead awaited concurrently: this can
+    reduce the time needed to fire the event when its subscribers do independent I/O
+    (e.g. opening connection pools), but it must be used only when subscribers do not
+    depend on each other. If subscribers fail, the first exception is raised once all
+    subscribers completed.
+    """
+
+    def __init__(self, context: Any, concurrent: bool = False) -> None:
         self._handlers: List[Callable[..., Any]] = []
+        self._wrappers: Dict[Callable[..., Any], Callable[..., Any]] = {}
         self.context = context
+        self.concurrent = concurrent
 
     def __iadd__(self, handler: Callable[..., Any]) -> "ApplicationEvent":
         self._handlers.append(self._wrap_discard(handler))
         return self
 
     def __isub__(self, handler: Callable[..., Any]) -> "ApplicationEvent":
-        to_remove = [
-            callback
-            for callback in self._handlers
-            if callback is handler or unwrap(callback) is handler
-        ]
-        for callback in to_remove:
-            self._handlers.remove(callback)
+        callback = self._pop_wrapper(handler)
+        self._handlers[:] = [item for item in self._handlers if item is not callback]
         return self
 
     def __len__(self) -> int:
@@ -111,6 +154,15 @@ class ApplicationEvent:
         return decorator
 
     async def fire(self, *args: Any, **kwargs: Any) -> None:
+        if not self._handlers:
+            return
+
+        if self.concurrent and len(self._handlers) > 1:
+            await _gather(
+                *[handler(self.context, *args, **kwargs) for handler in self._handlers]
+            )
+            return
+
         for handler in self._handlers:
             await handler(self.context, *args, **kwargs)
 
@@ -119,15 +171,42 @@ class ApplicationEvent:
         If the given function does not accept any parameter, returns a wrapper with a
         discard parameter; otherwise returns the same function.
         """
-        if len(signature(function).parameters) == 0:
+        if not _accepts_no_parameters(function):
+            return function
 
-            @wraps(function)
-            async def wrap_handler(_):
-                await function()
+        try:
+            hash(function)
+        except TypeError:
+            # unhashable callables (e.g. dataclass instances) are not kept in
+            # _wrappers, their wrapper is found by identity
+            return self._find_wrapper(function) or self._get_wrapper(function)
+
+        # wrappers are kept by original function, to find them when the original
+        # function is removed
+        wrapper = self._wrappers.get(function)
+        if wrapper is None:
+            wrapper = self._wrappers[function] = self._get_wrapper(function)
+        return wrapper
+
+    def _get_wrapper(self, function):
+        @wraps(function)
+        async def wrap_handler(_):
+            await function()
+
+        return wrap_handler
+
+    def _find_wrapper(self, function):
+        for handler in self._handlers:
+            if getattr(handler, "__wrapped__", None) is function:
+                return handler
+        return None
 
-            return wrap_handler
-        else:
-            return function
+    def _pop_wrapper(self, function):
+        try:
+            hash(function)
+        except TypeError:
+            return self._find_wrapper(function) or function
+        return self._wrappers.pop(function, function)
 
 
 class ApplicationSyncEvent(ApplicationEvent):
@@ -135,9 +214,33 @@ class ApplicationSyncEvent(ApplicationEvent):
     ApplicationEvent whose subscribers must be synchronous functions.
     """
 
+    def __init__(self, context: Any) -> None:
+        super().__init__(context)
+        self._fire: Optional[Callable[..., None]] = None
+
+    def __iadd__(self, handler: Callable[..., Any]) -> "ApplicationEvent":
+        self._fire = None
+        return super().__iadd__(handler)
+
+    def __isub__(self, handler: Callable[..., Any]) -> "ApplicationEvent":
+        self._fire = None
+        return super().__isub__(handler)
+
+    def _get_fire_function(self) -> Callable[..., None]:
+        # subscribers are called by a function generated with one call per
+        # subscriber, regenerated only when subscribers change
+        namespace = {f"handler_{index}": h for index, h in enumerate(self._handlers)}
+        source = "def fire_sync(context, *args, **keywargs):\n" + (
+            "".join(f"    {name}(context, *args, **keywargs)\n" for name in namespace)
+            or "    pass\n"
+        )
+        return compile_function(source, "fire_sync", namespace)
+
     def fire_sync(self, *args: Any, **keywargs: Any) -> None:
-        for handler in self._handlers:
-            handler(self.context, *args, **keywargs)
+        fire = self._fire
+        if fire is None:
+            fire = self._fire = self._get_fire_function()
+        fire(self.context, *args, **keywargs)
 
     async def fire(self, *args: Any, **keywargs: Any) -> None:
         raise TypeError(
@@ -145,6 +248,30 @@ class ApplicationSyncEvent(ApplicationEvent):
         )
 
 
+class _LifespanContext:
+    """
+    Holds an async context manager registered with Application.lifespan, and the
+    object it returns for the application, between start and shutdown.
+    """
+
+    __slots__ = ("callback", "obj")
+
+    def __init__(self, callback: Callable[..., Any]) -> None:
+        self.callback = callback
+        self.obj: Any = None
+
+    async def enter(self, application: "Application") -> None:
+        try:
+            self.obj = self.callback(application)
+        except TypeError:
+            self.obj = self.callback()
+        await self.obj.__aenter__()
+
+    async def exit(self, application: "Application") -> None:
+        if self.obj is not None:
+            await self.obj.__aexit__(None, None, None)
+
+
 class ApplicationStartupError(RuntimeError):
     """Base class for errors occurring when an application starts."""
 
@@ -180,11 +307,20 @@ class Application(BaseApplication):
         self.after_start = ApplicationEvent(self)
         self.on_stop = ApplicationEvent(self)
         self.on_middlewares_configuration = ApplicationSyncEvent(self)
+        self._child_apps: List["Application"] = []
         self.started = False
         self.files_handler = FilesHandler()
         self.server_error_details_handler = ServerErrorDetailsHandler()
         self._session_middleware: Optional[SessionMiddleware] = None
         self.mount_registry = mount
+        self._http_handler: Optional[Callable[..., Awaitable[None]]] = None
+        self._asgi_handlers = {
+            "http": self._handle_http,
+            "websocket": self._handle_websocket,
+            "lifespan": lambda scope, receive, send: self._handle_lifespan(
+                receive, send
+            ),
+        }
 
         validate_router(self)
 
@@ -206,21 +342,57 @@ class Application(BaseApplication):
         return self._cors_strategy
 
     def _bind_child_app_events(self, app: "Application") -> None:
-        @self.on_start
-        async def handle_child_app_start(_):
-            await app.start()
+        # a single handler per event is registered for all child apps, which are
+        # started and stopped concurrently since they are independent of each other;
+        # all child apps are handled at the position in the parent's events where
+        # the first child app was bound
+        if not self._child_apps:
+            self.on_start += self._start_child_apps
+            self.after_start += self._fire_child_apps_after_start
+            self.on_middlewares_configuration += (
+                self._fire_child_apps_on_middlewares_configuration
+            )
+            self.on_stop += self._stop_child_apps
 
-        @self.after_start
-        async def handle_child_app_after_start(_):
-            await app.after_start.fire()
+        self._child_apps.append(app)
 
-        @self.on_middlewares_configuration
-        def handle_child_app_on_middlewares_configuration(_):
+    async def _start_child_apps(self, _) -> None:
+        results = await asyncio.gather(
+            *[app.start() for app in self._child_apps], return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+
+        if errors:
+            # child apps that started are stopped, to not leave them running when
+            # the parent application fails to start
+            await asyncio.gather(
+                *[
+                    app.stop()
+                    for app, result in zip(self._child_apps, results)
+                    if not isinstance(result, BaseException)
+                ],
+                return_exceptions=True,
+            )
+            raise errors[0]
+
+    async def _fire_child_apps_after_start(self, _) -> None:
+        try:
+            await _gather(*[app.after_start.fire() for app in self._child_apps])
+        except BaseException:
+            # like when a child app fails to start, child apps are not left running
+            # when the parent application fails to start
+            await asyncio.gather(
+                *[app.stop() for app in self._child_apps], return_exceptions=True
+            )
+            raise
+
+    def _fire_child_apps_on_middlewares_configuration(self, _) -> None:
+        for app in self._child_apps:
             app.on_middlewares_configuration.fire_sync()
 
-        @self.on_stop
-        async def handle_child_app_stop(_):
-            await app.stop()
+    async def _stop_child_apps(self, _) -> None:
+        # all child apps are stopped even if some fail to stop
+        await _gather(*[app.stop() for app in self._child_apps])
 
     def use_sessions(
         self,
@@ -397,23 +569,9 @@ class Application(BaseApplication):
         if not hasattr(callback, "__aenter__"):
             callback = asynccontextmanager(callback)
 
-        obj = None
-
-        @self.on_start
-        async def register_aenter(_):
-            nonlocal obj
-            try:
-                obj = callback(self)
-            except TypeError:
-                obj = callback()
-            await obj.__aenter__()
-
-        @self.on_stop
-        async def register_aexit(_):
-            nonlocal obj
-            if obj is not None:
-                await obj.__aexit__(None, None, None)
-
+        context = _LifespanContext(callback)
+        self.on_start += context.enter
+        self.on_stop += context.exit
         return callback
 
     def serve_files(
@@ -465,8 +623,19 @@ class Application(BaseApplication):
         )
 
     def _apply_middlewares_in_routes(self):
+        # the same request handler can be shared by several routes (e.g. when
+        # registered for more HTTP methods): its chain is built only once
+        chains = {}
+
         for route in self.router:
-            route.handler = get_middlewares_chain(self.middlewares, route.handler)
+            handler = route.handler
+            chain = chains.get(id(handler))
+
+            if chain is None:
+                chain = get_middlewares_chain(self.middlewares, handler)
+                chains[id(handler)] = chain
+
+            route.handler = chain
 
     def _normalize_middlewares(self):
         self.middlewares = [
@@ -475,19 +644,25 @@ class Application(BaseApplication):
         ]
 
     def normalize_handlers(self):
-        configured_handlers = set()
+        # a request handler is normalized once for each route pattern, even when it
+        # is registered for several routes with the same pattern (e.g. for more
+        # HTTP methods), since binders only depend on the route pattern
+        normalized_handlers = {}
 
         self.router.sort_routes()
 
         for method, route in self.router.iter_with_methods():
-            if route.handler in configured_handlers:
-                continue
+            key = (id(route.handler), route.pattern)
+            normalized = normalized_handlers.get(key)
 
-            route.handler = normalize_handler(route, self.services, method)
-            configured_handlers.add(route.handler)
+            if normalized is None:
+                normalized = normalize_handler(route, self.services, method)
+                normalized_handlers[key] = normalized
+                normalized_handlers[(id(normalized), route.pattern)] = normalized
+
+            route.handler = normalized
 
         self._normalize_fallback_route()
-        configured_handlers.clear()
 
     def _normalize_fallback_route(self):
         fallback = self.router.fallback
@@ -542,15 +717,18 @@ class Application(BaseApplication):
             return
 
         self.started = True
-        if self.on_start:
-            await self.on_start.fire()
+        await self.on_start.fire()
 
         validate_default_router()
         self.normalize_handlers()
         self.configure_middlewares()
 
-        if self.after_start:
-            await self.after_start.fire()
+        # HTTP requests are then handled without the indirection of _handle_http,
+        # unless a subclass overrides it
+        if type(self)._handle_http is Application._handle_http:
+            self._asgi_handlers["http"] = self._get_cached_http_handler()
+
+        await self.after_start.fire()
 
     async def stop(self):
         await self.on_stop.fire()
@@ -577,8 +755,10 @@ class Application(BaseApplication):
     async def _handle_websocket(self, scope, receive, send) -> None:
         ws = WebSocket(scope, receive, send)
         # TODO: support filters
+        # the router is queried with bytes, like it is for HTTP requests, so that the
+        # method and path don't need to be encoded when matching routes
         route = self.router.get_match_by_method_and_path(
-            RouteMethod.GET_WS, scope["path"]
+            _GET_WS, scope.get("raw_path") or scope["path"].encode()
         )
 
         if route is None:
@@ -602,33 +782,52 @@ class Application(BaseApplication):
                 # will anyway respond 403 to the client.
                 await ws.close()
 
-    async def _handle_http(self, scope, receive, send) -> None:
-        assert scope["type"] == "http"
+    def _get_http_handler(self) -> Callable[..., Awaitable[None]]:
+        """
+        Returns the function used to handle HTTP requests once the application is
+        started, with the method handling requests and the other names used for each
+        request bound once rather than looked up for each request.
+        """
+        handle = self.handle
+        incoming = Request.incoming
+        content_type = ASGIContent
+        send_response = send_asgi_response
+
+        async def handle_http(scope, receive, send) -> None:
+            # the scope type is not checked again: scopes are dispatched by type in
+            # __call__
+            request = incoming(
+                scope["method"],
+                scope["raw_path"],
+                scope["query_string"],
+                scope["headers"],
+            )
 
-        request = Request.incoming(
-            scope["method"],
-            scope["raw_path"],
-            scope["query_string"],
-            list(scope["headers"]),
-        )
+            request.scope = scope
+            request.content = content_type(receive)
 
-        request.scope = scope
-        request.content = ASGIContent(receive)
+            response = await handle(request)
+            await send_response(response, send)
 
-        response = await self.handle(request)
-        await send_asgi_response(response, send)
+            request.release()
 
-        request.scope = None  # type: ignore
-        request.content.dispose()
+        return handle_http
 
-    async def __call__(self, scope, receive, send):
-        if scope["type"] == "http":
-            return await self._handle_http(scope, receive, send)
+    def _get_cached_http_handler(self) -> Callable[..., Awaitable[None]]:
+        handler = self._http_handler
+        if handler is None:
+            handler = self._http_handler = self._get_http_handler()
+        return handler
 
-        if scope["type"] == "websocket":
-            return await self._handle_websocket(scope, receive, send)
+    async def _handle_http(self, scope, receive, send) -> None:
+        # used until the application is started, or always if overridden in a
+        # subclass: see start()
+        await self._get_cached_http_handler()(scope, receive, send)
+
+    async def __call__(self, scope, receive, send):
+        handler = self._asgi_handlers.get(scope["type"])
 
-        if scope["type"] == "lifespan":
-            return await self._handle_lifespan(receive, send)
+        if handler is None:
+            raise TypeError(f"Unsupported scope type: {scope['type']}")
 
-        raise TypeError(f"Unsupported scope type: {scope['type']}")
+        return await handler(scope, receive, send)
@@ -298,6 +298,9 @@ class Binder(metaclass=BinderMeta):  # type: ignore
         except ValueError as value_error:
             raise BadRequest("Invalid parameter.") from value_error
 
+        return self._get_parameter_from_value(value)
+
+    def _get_parameter_from_value(self, value: Any) -> Any:
         if value is None and self.default is not empty:
             return self.default
 
@@ -633,7 +636,23 @@ class SyncBinder(Binder):
     def _empty_iterable(self, value):
         return value in self._empty_iterables
 
+    def get_parameter_sync(self, request: Request) -> Any:
+        """
+        Gets a parameter to be passed to a request handler, like get_parameter, but
+        synchronously. This is used only for binders that don't override get_value
+        and get_parameter, which are otherwise awaited.
+        """
+        try:
+            value = self.get_value_sync(request)
+        except ValueError as value_error:
+            raise BadRequest("Invalid parameter.") from value_error
+
+        return self._get_parameter_from_value(value)
+
     async def get_value(self, request: Request) -> Optional[Any]:
+        return self.get_value_sync(request)
+
+    def get_value_sync(self, request: Request) -> Optional[Any]:
         # TODO: support get_raw_value returning None, to not instantiate lists
         # when a parameter is not present
         raw_value = self.get_raw_value(request)
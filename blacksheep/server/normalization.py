@@ -1,10 +1,12 @@
 import inspect
-from functools import wraps
-from inspect import Signature, _empty, _ParameterKind  # type: ignore
+from functools import lru_cache, wraps
+from inspect import CO_COROUTINE, Signature, _empty, _ParameterKind  # type: ignore
+from types import FunctionType
 from typing import (
     Any,
     Awaitable,
     Callable,
+    Dict,
     ForwardRef,
     List,
     Mapping,
@@ -26,6 +28,7 @@ from blacksheep.messages import Request, Response
 from blacksheep.normalization import copy_special_attributes
 from blacksheep.server.routing import Route
 from blacksheep.server.websocket import WebSocket
+from blacksheep.utils.meta import compile_function
 
 from .bindings import (
     Binder,
@@ -35,12 +38,21 @@ from .bindings import (
     QueryBinder,
     RouteBinder,
     ServiceBinder,
+    SyncBinder,
     empty,
     get_binder_by_type,
 )
 
 _next_handler_binder = object()
 
+_unsupported_parameter_kinds = frozenset(
+    {
+        _ParameterKind.VAR_POSITIONAL,
+        _ParameterKind.VAR_KEYWORD,
+        _ParameterKind.KEYWORD_ONLY,
+    }
+)
+
 
 # region PEP 604
 try:
@@ -50,12 +62,6 @@ except ImportError:  # pragma: no cover
     UnionType = ...
 
 
-def _is_union_type(annotation):
-    if UnionType is not ... and isinstance(annotation, UnionType):  # type: ignore
-        return True
-    return False
-
-
 # endregion
 
 
@@ -63,20 +69,84 @@ def _is_union_type(annotation):
 
 
 class ParamInfo:
-    __slots__ = ("name", "annotation", "kind", "default", "_str")
+    __slots__ = ("name", "annotation", "kind", "default", "_parameter")
 
-    def __init__(self, name, annotation, kind, default, str_repr):
+    def __init__(self, name, annotation, kind, default, parameter):
         self.name = name
         self.annotation = annotation
         self.kind = kind
         self.default = default
-        self._str = str_repr
+        # the original parameter is kept to describe this one only when needed
+        self._parameter = parameter
 
     def __str__(self) -> str:
-        return self._str
+        return str(self._parameter)
 
 
 def _get_method_annotations_or_throw(method):
+    # methods with their own namespaces to resolve annotations are not cached,
+    # since their namespaces can be replaced
+    if (
+        getattr(method, "_globals", None) is not None
+        or getattr(method, "_locals", None) is not None
+    ):
+        return _get_type_hints(method)
+
+    try:
+        hash(method)
+    except TypeError:
+        return _get_type_hints(method)
+    return _get_cached_type_hints(method)
+
+
+@lru_cache(maxsize=1200)
+def _get_cached_type_hints(method):
+    # the returned dictionary is shared by all callers and must not be modified
+    return _get_type_hints(method)
+
+
+def _is_resolved_annotation(annotation) -> bool:
+    if getattr(annotation, "__origin__", None) is None:
+        if type(annotation) is UnionType:
+            return all(_is_resolved_annotation(arg) for arg in annotation.__args__)
+        return isinstance(annotation, type)
+
+    if hasattr(annotation, "__metadata__"):
+        # Annotated[...] is unwrapped by get_type_hints
+        return False
+
+    # bare generics like List or Dict have an origin but no arguments,
+    # they are left to get_type_hints
+    args = getattr(annotation, "__args__", None)
+    if args is None:
+        return False
+    return all(_is_resolved_annotation(arg) for arg in args)
+
+
+def _get_resolved_annotations(method: FunctionType) -> Optional[Dict[str, Any]]:
+    """
+    Returns a copy of the annotations of a function, if they are all types that
+    get_type_hints would return unchanged, otherwise None. This is the case for most
+    request handlers, and spares evaluating them.
+    """
+    # get_type_hints wraps in Optional parameters having None default, on Python < 3.11
+    if any(value is None for value in method.__defaults__ or ()) or any(
+        value is None for value in (method.__kwdefaults__ or {}).values()
+    ):
+        return None
+
+    annotations = method.__annotations__
+    if all(_is_resolved_annotation(value) for value in annotations.values()):
+        return dict(annotations)
+    return None
+
+
+def _get_type_hints(method):
+    if type(method) is FunctionType:
+        annotations = _get_resolved_annotations(method)
+        if annotations is not None:
+            return annotations
+
     method_locals = getattr(method, "_locals", None)
     method_globals = getattr(method, "_globals", None)
 
@@ -91,22 +161,42 @@ def _get_method_annotations_or_throw(method):
         raise  # pragma: no cover
 
 
+def _is_async_function(method) -> bool:
+    # plain async functions are recognized by the flags of their code object,
+    # other callables (partials, methods, marked functions) are left to inspect
+    if type(method) is FunctionType and method.__code__.co_flags & CO_COROUTINE:
+        return True
+    return inspect.iscoroutinefunction(method)
+
+
+def _get_signature(method) -> Signature:
+    try:
+        hash(method)
+    except TypeError:
+        return Signature.from_callable(method)
+    return _get_cached_signature(method)
+
+
+@lru_cache(maxsize=1200)
+def _get_cached_signature(method) -> Signature:
+    return Signature.from_callable(method)
+
+
 def _get_method_annotations_base(method, signature: Optional[Signature] = None):
     if signature is None:
-        signature = Signature.from_callable(method)
-    params = {
+        signature = _get_signature(method)
+    annotations = _get_method_annotations_or_throw(method)
+    return {
         key: ParamInfo(
-            value.name, value.annotation, value.kind, value.default, str(value)
+            value.name,
+            annotations.get(key, value.annotation),
+            value.kind,
+            value.default,
+            value,
         )
         for key, value in signature.parameters.items()
     }
 
-    annotations = _get_method_annotations_or_throw(method)
-    for key, value in params.items():
-        if key in annotations:
-            value.annotation = annotations[key]
-    return params
-
 
 # endregion
 
@@ -151,44 +241,46 @@ class RouteBinderMismatch(NormalizationError):
         )
 
 
-_types_handled_with_query = {
-    str,
-    int,
-    float,
-    bool,
-    list,
-    set,
-    tuple,
-    List[str],
-    List[int],
-    List[float],
-    List[bool],
-    Sequence[str],
-    Sequence[int],
-    Sequence[float],
-    Sequence[bool],
-    Set[str],
-    Set[int],
-    Set[float],
-    Set[bool],
-    Tuple[str],
-    Tuple[int],
-    Tuple[float],
-    Tuple[bool],
-    UUID,
-    List[UUID],
-    Set[UUID],
-    Tuple[UUID],
-    list[str],
-    list[int],
-    list[float],
-    list[bool],
-    list[UUID],
-    tuple[str],
-    tuple[int],
-    tuple[float],
-    tuple[bool],
-}
+_types_handled_with_query = frozenset(
+    {
+        str,
+        int,
+        float,
+        bool,
+        list,
+        set,
+        tuple,
+        List[str],
+        List[int],
+        List[float],
+        List[bool],
+        Sequence[str],
+        Sequence[int],
+        Sequence[float],
+        Sequence[bool],
+        Set[str],
+        Set[int],
+        Set[float],
+        Set[bool],
+        Tuple[str],
+        Tuple[int],
+        Tuple[float],
+        Tuple[bool],
+        UUID,
+        List[UUID],
+        Set[UUID],
+        Tuple[UUID],
+        list[str],
+        list[int],
+        list[float],
+        list[bool],
+        list[UUID],
+        tuple[str],
+        tuple[int],
+        tuple[float],
+        tuple[bool],
+    }
+)
 
 
 def _check_union(
@@ -204,25 +296,29 @@ def _check_union(
     the request object.
     """
 
+    # on Python < 3.10, UnionType is a placeholder that no type can be
     if (
-        hasattr(annotation, "__origin__") and annotation.__origin__ is Union
-    ) or _is_union_type(annotation):
-        # support only Union[None, Type] - that is equivalent of Optional[Type],
-        # and also PEP 604 T | Non; None | T
-        if type(None) not in annotation.__args__ or len(annotation.__args__) > 2:
-            raise NormalizationError(
-                f'Unsupported parameter type "{parameter.name}" '
-                f'for method "{method.__name__}"; '
-                f"only Optional types are supported for automatic binding. "
-                f"Read the desired value from the request itself."
-            )
-
-        for possible_type in annotation.__args__:
-            if type(None) is possible_type:
-                continue
-            return True, possible_type
-
-    return False, annotation
+        getattr(annotation, "__origin__", None) is not Union
+        and type(annotation) is not UnionType
+    ):
+        return False, annotation
+
+    # support only Union[None, Type] - that is equivalent of Optional[Type],
+    # and also PEP 604 T | Non; None | T
+    args = annotation.__args__
+    if len(args) == 2:
+        first_type, second_type = args
+        if second_type is type(None):
+            return True, first_type
+        if first_type is type(None):
+            return True, second_type
+
+    raise NormalizationError(
+        f'Unsupported parameter type "{parameter.name}" '
+        f'for method "{method.__name__}"; '
+        f"only Optional types are supported for automatic binding. "
+        f"Read the desired value from the request itself."
+    )
 
 
 def _get_parameter_binder_without_annotation(
@@ -243,14 +339,31 @@ def _get_parameter_binder_without_annotation(
     return QueryBinder(List[str], name, True)
 
 
+# the functions below depend only on annotations, which are shared by many
+# parameters, so their results are cached
+
+
 def _is_bound_value_annotation(annotation: Any) -> bool:
+    try:
+        hash(annotation)
+    except TypeError:
+        return _is_bound_value_type(annotation)
+    return _is_cached_bound_value_annotation(annotation)
+
+
+@lru_cache(maxsize=None)
+def _is_cached_bound_value_annotation(annotation: Any) -> bool:
+    return _is_bound_value_type(annotation)
+
+
+def _is_bound_value_type(annotation: Any) -> bool:
     if inspect.isclass(annotation) and issubclass(annotation, BoundValue):
         return True
-    return "__origin__" in annotation.__dict__ and issubclass(
-        annotation.__dict__["__origin__"], BoundValue
-    )
+    origin = getattr(annotation, "__origin__", None)
+    return inspect.isclass(origin) and issubclass(origin, BoundValue)
 
 
+@lru_cache(maxsize=None)
 def _get_raw_bound_value_type(bound_type: Type[BoundValue]) -> Type[Any]:
     if hasattr(bound_type, "__args__"):
         return bound_type.__args__[0]  # type: ignore
@@ -263,6 +376,7 @@ def _get_raw_bound_value_type(bound_type: Type[BoundValue]) -> Type[Any]:
     return str
 
 
+@lru_cache(maxsize=None)
 def _get_bound_value_type(bound_type: Type[BoundValue]) -> Type[Any]:
     value_type = _get_raw_bound_value_type(bound_type)
     assert not isinstance(value_type, TypeVar)
@@ -288,12 +402,13 @@ def _get_parameter_binder(
     if isinstance(annotation, (str, ForwardRef)):  # pragma: no cover
         raise UnsupportedForwardRefInSignatureError(original_annotation)
 
+    binder_type = Binder.handlers.get(annotation)
     if (
-        annotation in Binder.handlers
+        binder_type is not None
         and annotation not in services
         and not issubclass(annotation, BoundValue)
     ):
-        return Binder.handlers[annotation](annotation, parameter.name)
+        return binder_type(annotation, parameter.name)
 
     # 1. is the type annotation of BoundValue[T] type?
     if _is_bound_value_annotation(annotation):
@@ -351,8 +466,10 @@ def _get_parameter_binder(
             annotation, name, implicit=True, required=not is_root_optional
         )
 
-    print(parameter, services, route, method)
-    raise ValueError("No matching binder.")
+    raise ValueError(
+        f"No matching binder for parameter {parameter} "
+        f"of {getattr(method, '__qualname__', method)}."
+    )
 
 
 def get_parameter_binder(
@@ -370,9 +487,13 @@ def get_parameter_binder(
 
 
 def _get_binders_for_function(
-    method: Callable[..., Any], services: ContainerProtocol, route: Optional[Route]
+    method: Callable[..., Any],
+    services: ContainerProtocol,
+    route: Optional[Route],
+    parameters: Optional[Mapping[str, ParamInfo]] = None,
 ) -> List[Binder]:
-    parameters = _get_method_annotations_base(method)
+    if parameters is None:
+        parameters = _get_method_annotations_base(method)
     body_binder = None
 
     binders = []
@@ -392,20 +513,53 @@ def _get_binders_for_function(
     return binders
 
 
-def get_binders(route: Route, services: ContainerProtocol) -> List[Binder]:
+def get_binders(
+    route: Route,
+    services: ContainerProtocol,
+    parameters: Optional[Mapping[str, ParamInfo]] = None,
+) -> List[Binder]:
     """
     Returns a list of binders to extract parameters
-    for a request handler.
+    for a request handler. If the parameters of the request handler were already
+    inspected, they can be passed to not inspect them again.
     """
-    binders = _get_binders_for_function(route.handler, services, route)
+    binders = _get_binders_for_function(route.handler, services, route, parameters)
     setattr(route.handler, "binders", binders)
     return binders
 
 
 def get_binders_for_middleware(
-    method: Callable[..., Any], services: ContainerProtocol
+    method: Callable[..., Any],
+    services: ContainerProtocol,
+    parameters: Optional[Mapping[str, ParamInfo]] = None,
 ) -> Sequence[Binder]:
-    return _get_binders_for_function(method, services, None)
+    return _get_binders_for_function(method, services, None, parameters)
+
+
+def _is_sync_binder(binder: Binder) -> bool:
+    binder_type = type(binder)
+    return (
+        isinstance(binder, SyncBinder)
+        and binder_type.get_value is SyncBinder.get_value
+        and binder_type.get_parameter is Binder.get_parameter
+    )
+
+
+def _get_parameter_expression(
+    binder: Binder, index: int, namespace: Dict[str, Any]
+) -> str:
+    """
+    Returns the expression reading the parameter of the given binder, in the source
+    of generated wrappers, and adds the function it calls to the given namespace.
+    Binders reading values synchronously, which don't override how values are
+    read, are called without awaiting them.
+    """
+    name = f"get_parameter_{index}"
+    if _is_sync_binder(binder):
+        namespace[name] = binder.get_parameter_sync  # type: ignore
+        return f"{name}(request)"
+    namespace[name] = binder.get_parameter
+    return f"await {name}(request)"
 
 
 def get_async_wrapper(
@@ -420,21 +574,28 @@ def get_async_wrapper(
     """
 
     if params_len == 1:
-        param_name = list(params)[0]
         # There is no need to wrap the request handler if it was
         # defined as asynchronous function accepting a single request or
-        # websocket parameter
-        if params[param_name].annotation in {Request, WebSocket}:
+        # websocket parameter. Parameters are recognized by annotation only:
+        # parameters without annotation are bound from route, services or query.
+        (param,) = params.values()
+        if param.annotation is Request or param.annotation is WebSocket:
             return method
 
-    binders = get_binders(route, services)
+    binders = get_binders(route, services, params)
 
-    @wraps(method)
-    async def handler(request: Request) -> Response:  # type: ignore
-        values = [await binder.get_parameter(request) for binder in binders]
-        return await method(*values)
+    # the handler is generated with one call per binder, to not build a list of
+    # values iterating over binders at each request
+    namespace: Dict[str, Any] = {"method": method}
+    values = []
+    for index, binder in enumerate(binders):
+        values.append(_get_parameter_expression(binder, index, namespace))
 
-    return handler
+    source = (
+        "async def handler(request):\n"
+        f"    return await method({', '.join(values)})\n"
+    )
+    return wraps(method)(compile_function(source, "handler", namespace))
 
 
 def normalize_handler(
@@ -452,78 +613,85 @@ def normalize_handler(
     """
     method = route.handler
 
-    sig = Signature.from_callable(method)
+    sig = _get_signature(method)
     params = _get_method_annotations_base(method, sig)
 
-    if any(
-        str(param).startswith("*") or param.kind.value == _ParameterKind.KEYWORD_ONLY
-        for param in params.values()
-    ):
+    if any(param.kind in _unsupported_parameter_kinds for param in params.values()):
         raise UnsupportedSignatureError(method)
 
     # normalize input
-    if not inspect.iscoroutinefunction(method):
+    if not _is_async_function(method):
         raise TypeError("Only async function allowed as handler!")
 
     normalized = get_async_wrapper(services, route, method, params, len(params))
 
     if normalized is not method:
-        setattr(normalized, "root_fn", method)
-        copy_special_attributes(method, normalized)
+        # functools.wraps already copied the __dict__ of plain functions, which is
+        # where their special attributes are stored
+        if type(method) is not FunctionType:
+            copy_special_attributes(method, normalized)
+        if "root_fn" not in normalized.__dict__:
+            setattr(normalized, "root_fn", method)
 
     return normalized
 
 
 def _is_basic_middleware_signature(parameters: Mapping[str, inspect.Parameter]) -> bool:
-    values = list(parameters.values())
-
-    if len(values) != 2:
+    if len(parameters) != 2:
         return False
 
-    first_one = values[0]
-    second_one = values[1]
+    first_one, second_one = parameters.values()
     if first_one.name == "request" and second_one.name in {"handler", "next_handler"}:
         return True
     return False
 
 
 def _get_middleware_async_binder(
-    method: Callable[..., Awaitable[Response]], services: ContainerProtocol
+    method: Callable[..., Awaitable[Response]],
+    services: ContainerProtocol,
+    params: Optional[Mapping[str, ParamInfo]] = None,
 ) -> Callable[[Request, Callable[..., Any]], Awaitable[Response]]:
-    binders = get_binders_for_middleware(method, services)
-
-    async def handler(request, next_handler):
-        values = []
-        for binder in binders:
-            if binder is _next_handler_binder:
-                values.append(next_handler)
-            else:
-                values.append(await binder.get_parameter(request))
+    binders = get_binders_for_middleware(method, services, params)
+
+    # the handler is generated with one argument per binder, like handlers of
+    # requests (see get_async_wrapper)
+    namespace: Dict[str, Any] = {"method": method}
+    values = []
+    for index, binder in enumerate(binders):
+        if binder is _next_handler_binder:
+            values.append("next_handler")
+        else:
+            values.append(_get_parameter_expression(binder, index, namespace))
 
-        if _next_handler_binder in binders:
-            # middleware that can continue the chain: control is left to it;
-            # for example an authorization middleware can decide to now call
-            # the next handler
-            return await method(*values)
+    call = f"method({', '.join(values)})"
 
+    if _next_handler_binder in binders:
+        # middleware that can continue the chain: control is left to it;
+        # for example an authorization middleware can decide to now call
+        # the next handler
+        body = f"    return await {call}\n"
+    else:
         # middleware that cannot continue the chain, so we continue it here
-        await method(*values)
-        return await next_handler(request)
+        body = f"    await {call}\n    return await next_handler(request)\n"
 
-    return handler
+    source = "async def handler(request, next_handler):\n" + body
+    return compile_function(source, "handler", namespace)
 
 
 def normalize_middleware(
     middleware: Callable[..., Awaitable[Response]], services: ContainerProtocol
 ) -> Callable[[Request, Callable[..., Any]], Awaitable[Response]]:
-    if not inspect.iscoroutinefunction(middleware) and not inspect.iscoroutinefunction(
+    if not _is_async_function(middleware) and not inspect.iscoroutinefunction(
         getattr(middleware, "__call__", None)
     ):
         raise ValueError("Middlewares must be asynchronous functions")
 
-    params = _get_method_annotations_base(middleware)
+    # the basic signature is recognized by parameter names only, so type hints are
+    # resolved only for middlewares that need binders
+    sig = _get_signature(middleware)
 
-    if _is_basic_middleware_signature(params):
+    if _is_basic_middleware_signature(sig.parameters):
         return middleware
 
-    return _get_middleware_async_binder(middleware, services)
+    params = _get_method_annotations_base(middleware, sig)
+    return _get_middleware_async_binder(middleware, services, params)
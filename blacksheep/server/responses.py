@@ -1,8 +1,7 @@
-import ntpath
 from enum import Enum
 from functools import lru_cache
 from io import BytesIO
-from typing import Any, AnyStr, AsyncIterable, Callable, Optional, Union
+from typing import Any, AnyStr, AsyncIterable, Callable, Optional, Tuple, Union
 
 from blacksheep import Content, Response, StreamedContent
 from blacksheep.common.files.asyncfs import FilesHandler
@@ -33,6 +32,9 @@ def _ensure_bytes(value: AnyStr) -> bytes:
 
 FileInput = Union[Callable[[], AsyncIterable[bytes]], str, bytes, bytearray, BytesIO]
 
+# BytesIO values up to this size are sent in a single body, bigger ones are streamed
+_BYTES_IO_STREAM_THRESHOLD = 1024 * 256
+
 
 @lru_cache(2000)
 def _get_file_provider(file_path: str) -> Callable[[], AsyncIterable[bytes]]:
@@ -43,25 +45,40 @@ def _get_file_provider(file_path: str) -> Callable[[], AsyncIterable[bytes]]:
     return data_provider
 
 
-def _file(
-    value: FileInput,
-    content_type: str,
-    content_disposition_type: ContentDispositionType,
-    file_name: Optional[str] = None,
-) -> Response:
+@lru_cache(1024)
+def _get_content_disposition_header(
+    content_disposition_type: ContentDispositionType, file_name: Optional[str]
+) -> Tuple[bytes, bytes]:
     if file_name:
-        exact_file_name = ntpath.basename(file_name)
+        if file_name[1:2] == ":":
+            # drive prefix, like in "C:report.pdf"
+            file_name = file_name[2:]
+
+        exact_file_name = file_name.rpartition("\\")[2].rpartition("/")[2]
         if not exact_file_name:
             raise ValueError(
                 "Invalid file name: it should be an exact "
                 'file name without path, for example: "foo.txt"'
             )
 
-        content_disposition_value = (
-            f'{content_disposition_type.value}; filename="{exact_file_name}"'
+        return (
+            b"Content-Disposition",
+            f'{content_disposition_type.value}; filename="{exact_file_name}"'.encode(),
         )
-    else:
-        content_disposition_value = content_disposition_type.value
+    return b"Content-Disposition", content_disposition_type.value.encode()
+
+
+def _file(
+    value: FileInput,
+    content_type: str,
+    content_disposition_type: ContentDispositionType,
+    file_name: Optional[str] = None,
+) -> Response:
+    # the header tuple is immutable and shared, the list is created per response
+    # since response headers can be modified
+    content_disposition_header = _get_content_disposition_header(
+        content_disposition_type, file_name
+    )
 
     content: Content
     content_type_value = _ensure_bytes(content_type)
@@ -69,6 +86,12 @@ def _file(
     if isinstance(value, str):
         # value is treated as a path
         content = StreamedContent(content_type_value, _get_file_provider(value))
+    elif (
+        isinstance(value, BytesIO)
+        and value.getbuffer().nbytes <= _BYTES_IO_STREAM_THRESHOLD
+    ):
+        content = Content(content_type_value, value.getvalue())
+        value.close()
     elif isinstance(value, BytesIO):
 
         async def data_provider():
@@ -106,9 +129,7 @@ def _file(
             "bytes, bytearray, io.BytesIO"
         )
 
-    return Response(
-        200, [(b"Content-Disposition", content_disposition_value.encode())], content
-    )
+    return Response(200, [content_disposition_header], content)
 
 
 def file(
@@ -4,7 +4,18 @@ import re
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from functools import lru_cache
-from typing import Any, AnyStr, Callable, Dict, List, Optional, Sequence, Set, Union
+from typing import (
+    Any,
+    AnyStr,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 from urllib.parse import unquote
 
 from blacksheep.common import extend
@@ -642,6 +653,9 @@ class RouterFiltersMixin:
 RouteConfig = Union[Dict[str, Any], "Router"]
 
 
+_MATCH_CACHE_SIZE = 1200
+
+
 class Router(RouterBase):
     __slots__ = (
         "routes",
@@ -649,6 +663,7 @@ class Router(RouterBase):
         "_fallback",
         "_sub_routers",
         "_filters",
+        "_match_cache",
     )
 
     def __init__(
@@ -671,6 +686,7 @@ class Router(RouterBase):
         self._fallback = None
         self.routes: Dict[bytes, List[Route]] = defaultdict(list)
         self._sub_routers = sub_routers
+        self._match_cache: Dict[Tuple[Any, Any], Route] = {}
 
         if self._filters:
             extend(self, RouterFiltersMixin)
@@ -683,6 +699,7 @@ class Router(RouterBase):
         self._map = {}
         self._fallback = None
         self.routes = defaultdict(list)
+        self._match_cache.clear()
         if self._sub_routers:
             for sub_router in self._sub_routers:
                 sub_router.reset()
@@ -693,6 +710,7 @@ class Router(RouterBase):
 
     @fallback.setter
     def fallback(self, value):
+        self._match_cache.clear()
         if not isinstance(value, Route):
             if callable(value):
                 self._fallback = Route(b"*", value)
@@ -774,6 +792,7 @@ class Router(RouterBase):
 
     def add_route(self, method: AnyStr, route: Route):
         self.routes[ensure_bytes(method)].append(route)
+        self._match_cache.clear()
 
     def sort_routes(self):
         """
@@ -796,6 +815,7 @@ class Router(RouterBase):
             )
 
         self.routes = current_routes
+        self._match_cache.clear()
 
         if self._sub_routers:
             for sub_router in self._sub_routers:
@@ -807,20 +827,38 @@ class Router(RouterBase):
         """
         return self.get_match_by_method_and_path(request.method, request._path)  # type: ignore ()
 
-    @lru_cache(maxsize=1200)
     def get_match_by_method_and_path(
         self, method: AnyStr, path: AnyStr
     ) -> Optional[RouteMatch]:
+        cache_key = (method, path)
+        cached_route = self._match_cache.get(cache_key)
+
+        if cached_route is not None:
+            return RouteMatch(cached_route, None)
+
         bytes_value = ensure_bytes(path)
         for route in self.routes[ensure_bytes(method)]:
             match = route.match_by_path(bytes_value)
             if match:
+                if not route.has_params:
+                    self._cache_match(cache_key, route)
                 return match
+
+        # misses are not cached: random paths (e.g. from scans) would fill the cache
+        # and evict the matches of static routes
         if self._fallback is None:
             return None
 
         return RouteMatch(self._fallback, None)
 
+    def _cache_match(self, cache_key: Tuple[Any, Any], route: Route) -> None:
+        # Only routes without parameters are cached, since their matches do not
+        # depend on the request path: matches of routes with parameters would fill
+        # the cache with one entry per distinct value.
+        if len(self._match_cache) >= _MATCH_CACHE_SIZE:
+            self._match_cache.clear()
+        self._match_cache[cache_key] = route
+
     @lru_cache(maxsize=1200)
     def get_matching_route(self, method: AnyStr, value: AnyStr) -> Optional[Route]:
         for route in self.routes[ensure_bytes(method)]:
@@ -930,15 +968,15 @@ def validate_default_router():
     This method ensures that the default router is associated to an application, if it
     defines any route.
     """
-    if set(router):
-        # The default router has routes defined, ensure that it is bound to an
+    if id(router) in _apps_by_router_id:
+        # The default router is bound to an application: since routers are never
+        # unbound, there is no need to inspect its routes
+        return
+
+    if next(iter(router), None) is not None:
+        # The default router has routes defined, but it is not bound to an
         # application
-        # verify that
-        try:
-            _apps_by_router_id[id(router)]
-        except KeyError:
-            # Not good
-            raise OrphanDefaultRouterError() from None
+        raise OrphanDefaultRouterError()
 
 
 # Singleton router used to store initial configuration,
@@ -2,6 +2,7 @@ import glob
 import inspect
 import os
 from pathlib import Path
+from typing import Any, Callable, Dict
 
 
 def get_parent_file():
@@ -28,3 +29,16 @@ def import_child_modules(root_path: Path):
     stripped_path = os.path.relpath(path).replace("/", ".").replace("\\", ".")
     for module in modules:
         __import__(stripped_path + "." + module)
+
+
+def compile_function(
+    source: str, name: str, namespace: Dict[str, Any]
+) -> Callable[..., Any]:
+    """
+    Compiles source code that defines a function, using the given namespace as its
+    globals, and returns the function with the given name. This is used to generate
+    functions specialized for a configuration known at application start, so that
+    the work of handling the configuration is not repeated at each call.
+    """
+    exec(compile(source, f"<blacksheep: {name}>", "exec"), namespace)
+    return namespace[name]
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 import sys
@@ -16,7 +17,11 @@ from rodi import Container, inject
 
 from blacksheep import HTTPException, JSONContent, Request, Response, TextContent
 from blacksheep.contents import FormPart
-from blacksheep.server.application import Application, ApplicationSyncEvent
+from blacksheep.server.application import (
+    Application,
+    ApplicationEvent,
+    ApplicationSyncEvent,
+)
 from blacksheep.server.bindings import (
     ClientInfo,
     FromBytes,
@@ -3704,6 +3709,336 @@ async def test_start_stop_multiple_events_using_decorators(app: Application):
     assert on_stop_count == 2
 
 
+@pytest.mark.asyncio
+async def test_handler_registered_for_more_methods_is_normalized_once(app):
+    @app.router.route("/:id", methods=["GET", "POST"])
+    async def example(id: int): ...
+
+    await app.start()
+
+    get_route = app.router.routes[b"GET"][0]
+    post_route = app.router.routes[b"POST"][0]
+
+    assert get_route.handler is not example
+    assert get_route.handler is post_route.handler
+
+
+@pytest.mark.asyncio
+async def test_application_event_fires_handlers_in_order_by_default():
+    event = ApplicationEvent(None)
+    calls = []
+
+    async def handler_1(_) -> None:
+        await asyncio.sleep(0.01)
+        calls.append(1)
+
+    async def handler_2(_) -> None:
+        calls.append(2)
+
+    event += handler_1
+    event += handler_2
+
+    await event.fire()
+
+    assert calls == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_application_event_fires_handlers_concurrently():
+    event = ApplicationEvent(None, concurrent=True)
+    calls = []
+
+    async def handler_1(_) -> None:
+        await asyncio.sleep(0.01)
+        calls.append(1)
+
+    async def handler_2(_) -> None:
+        calls.append(2)
+
+    event += handler_1
+    event += handler_2
+
+    await event.fire()
+
+    assert calls == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_application_event_awaits_all_handlers_on_failure():
+    event = ApplicationEvent(None, concurrent=True)
+    calls = []
+
+    async def handler_1(_) -> None:
+        raise RuntimeError("Crash 1!")
+
+    async def handler_2(_) -> None:
+        await asyncio.sleep(0.01)
+        calls.append(2)
+        raise RuntimeError("Crash 2!")
+
+    async def handler_3(_) -> None:
+        await asyncio.sleep(0.01)
+        calls.append(3)
+
+    event += handler_1
+    event += handler_2
+    event += handler_3
+
+    with pytest.raises(RuntimeError, match="Crash 1!"):
+        await event.fire()
+
+    assert calls == [2, 3]
+
+
+async def _event_handler_without_parameters() -> None: ...
+
+
+async def _event_handler_with_parameter(application) -> None: ...
+
+
+async def _event_handler_with_default(application=None) -> None: ...
+
+
+async def _event_handler_with_varargs(*args) -> None: ...
+
+
+@dataclass
+class _UnhashableEventHandler:
+    calls: int = 0
+
+    async def __call__(self, application) -> None:
+        self.calls += 1
+
+
+@dataclass
+class _UnhashableEventHandlerWithoutParameters:
+    calls: int = 0
+
+    async def __call__(self) -> None:
+        self.calls += 1
+
+
+class _EventHandlers:
+    async def without_parameters(self) -> None: ...
+
+    async def with_parameter(self, application) -> None: ...
+
+
+@pytest.mark.parametrize(
+    "handler,wrapped",
+    [
+        (_event_handler_without_parameters, True),
+        (_event_handler_with_parameter, False),
+        (_event_handler_with_default, False),
+        (_event_handler_with_varargs, False),
+        (_EventHandlers().without_parameters, True),
+        (_EventHandlers().with_parameter, False),
+    ],
+)
+def test_application_event_wraps_handlers_without_parameters(handler, wrapped):
+    event = ApplicationEvent(None)
+    event += handler
+
+    assert (event._handlers[0] is not handler) is wrapped
+
+
+def test_application_sync_event_fires_handlers_in_order():
+    calls = []
+    event = ApplicationSyncEvent("context")
+
+    def handler_1(context, value):
+        calls.append((1, context, value))
+
+    def handler_2(context, value):
+        calls.append((2, context, value))
+
+    event.fire_sync("nothing")
+
+    event += handler_1
+    event += handler_2
+    event.fire_sync("a")
+
+    event -= handler_1
+    event.fire_sync("b")
+
+    assert calls == [(1, "context", "a"), (2, "context", "a"), (2, "context", "b")]
+
+
+@pytest.mark.parametrize(
+    "handler",
+    [
+        _event_handler_without_parameters,
+        _event_handler_with_parameter,
+        _UnhashableEventHandler(),
+        _UnhashableEventHandlerWithoutParameters(),
+    ],
+)
+def test_application_event_removes_handlers(handler):
+    event = ApplicationEvent(None)
+    event += handler
+    event += _event_handler_with_varargs
+
+    event -= handler
+
+    assert len(event) == 1
+    assert event._handlers[0] is _event_handler_with_varargs
+
+
+@pytest.mark.asyncio
+async def test_application_event_fires_unhashable_handlers():
+    event = ApplicationEvent(None)
+    handler_1 = _UnhashableEventHandler()
+    handler_2 = _UnhashableEventHandlerWithoutParameters()
+    event += handler_1
+    event += handler_2
+
+    await event.fire()
+
+    assert handler_1.calls == 1
+    assert handler_2.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_application_reuses_http_handler_before_start(app: Application):
+    @app.router.get("/")
+    async def home():
+        return text("Hello, World")
+
+    app.normalize_handlers()
+
+    await app(get_example_scope("GET", "/", []), MockReceive(), MockSend())
+    http_handler = app._http_handler
+
+    await app(get_example_scope("GET", "/", []), MockReceive(), MockSend())
+
+    assert http_handler is not None
+    assert app._http_handler is http_handler
+
+
+@pytest.mark.asyncio
+async def test_application_keeps_overridden_handle_http_after_start():
+    calls = []
+
+    class CustomApplication(Application):
+        async def _handle_http(self, scope, receive, send) -> None:
+            calls.append(scope["path"])
+            await super()._handle_http(scope, receive, send)
+
+    app = CustomApplication(router=Router())
+
+    @app.router.get("/")
+    async def home():
+        return text("Hello, World")
+
+    await app.start()
+    await app(get_example_scope("GET", "/", []), MockReceive(), MockSend())
+
+    assert calls == ["/"]
+
+
+class _ChildApplication:
+    """Implements the parts of Application used by its parent application."""
+
+    def __init__(self, name, calls, fail_on_start=False):
+        self.name = name
+        self.calls = calls
+        self.fail_on_start = fail_on_start
+        self.started = False
+        self.after_start = ApplicationEvent(self)
+        self.on_middlewares_configuration = ApplicationSyncEvent(self)
+
+    async def start(self):
+        self.calls.append(f"{self.name} start")
+        await asyncio.sleep(0)
+        if self.fail_on_start:
+            raise RuntimeError("Crash!")
+        self.started = True
+        self.calls.append(f"{self.name} started")
+
+    async def stop(self):
+        self.calls.append(f"{self.name} stop")
+        await asyncio.sleep(0)
+        self.started = False
+        self.calls.append(f"{self.name} stopped")
+
+
+@pytest.mark.asyncio
+async def test_child_apps_are_started_and_stopped_concurrently(app: Application):
+    calls = []
+    child_apps = [_ChildApplication("a", calls), _ChildApplication("b", calls)]
+
+    for child_app in child_apps:
+        app._bind_child_app_events(child_app)  # type: ignore
+
+    await app._start_child_apps(app)
+
+    assert calls == ["a start", "b start", "a started", "b started"]
+    assert all(child_app.started for child_app in child_apps)
+
+    calls.clear()
+    await app._stop_child_apps(app)
+
+    assert calls == ["a stop", "b stop", "a stopped", "b stopped"]
+    assert not any(child_app.started for child_app in child_apps)
+
+
+@pytest.mark.asyncio
+async def test_child_apps_are_stopped_when_a_child_app_fails_to_start(app: Application):
+    calls = []
+    child_app_1 = _ChildApplication("a", calls)
+    child_app_2 = _ChildApplication("b", calls, fail_on_start=True)
+    app._bind_child_app_events(child_app_1)  # type: ignore
+    app._bind_child_app_events(child_app_2)  # type: ignore
+
+    with pytest.raises(RuntimeError, match="Crash!"):
+        await app._start_child_apps(app)
+
+    assert calls == ["a start", "b start", "a started", "a stop", "a stopped"]
+    assert child_app_1.started is False
+
+
+@pytest.mark.asyncio
+async def test_child_apps_are_stopped_when_a_child_app_after_start_fails(
+    app: Application,
+):
+    calls = []
+    child_app_1 = _ChildApplication("a", calls)
+    child_app_2 = _ChildApplication("b", calls)
+
+    async def after_start(_):
+        await asyncio.sleep(0.01)
+        calls.append("a after start")
+
+    async def fail(_):
+        raise RuntimeError("Crash!")
+
+    child_app_1.after_start += after_start
+    child_app_2.after_start += fail
+    app._bind_child_app_events(child_app_1)  # type: ignore
+    app._bind_child_app_events(child_app_2)  # type: ignore
+
+    await app._start_child_apps(app)
+
+    with pytest.raises(RuntimeError, match="Crash!"):
+        await app._fire_child_apps_after_start(app)
+
+    assert "a after start" in calls
+    assert calls[-4:] == ["a stop", "b stop", "a stopped", "b stopped"]
+    assert not child_app_1.started
+    assert not child_app_2.started
+
+
+def test_child_app_events_are_bound_once(app: Application):
+    calls = []
+    app._bind_child_app_events(_ChildApplication("a", calls))  # type: ignore
+    app._bind_child_app_events(_ChildApplication("b", calls))  # type: ignore
+
+    assert len(app.on_start) == 1
+    assert len(app.after_start) == 1
+    assert len(app.on_middlewares_configuration) == 1
+    assert len(app.on_stop) == 1
+
+
 @pytest.mark.asyncio
 async def test_on_middlewares_configured_event(app: Application):
     on_middlewares_configuration_count = 0
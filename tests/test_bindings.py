@@ -295,6 +295,29 @@ async def test_from_query_raises_for_invalid_parameter(
         await parameter.get_value(request)
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query,expected_value", [[b"foo=10", 10], [b"", 5]])
+async def test_sync_binder_get_parameter_sync(query, expected_value):
+    request = Request("GET", b"/?" + query, None)
+
+    parameter = QueryBinder(int, "foo", implicit=True)
+    parameter.default = 5
+
+    value = parameter.get_parameter_sync(request)
+
+    assert value == expected_value
+    assert value == await parameter.get_parameter(request)
+
+
+def test_sync_binder_get_parameter_sync_raises_for_invalid_parameter():
+    request = Request("GET", b"/?foo=x", None)
+
+    parameter = QueryBinder(int, "foo", required=True)
+
+    with raises(BadRequest):
+        parameter.get_parameter_sync(request)
+
+
 @pytest.mark.asyncio
 async def test_from_services():
     request = Request("GET", b"/", [])
@@ -1,7 +1,16 @@
 import sys
 from dataclasses import dataclass
 from inspect import Parameter, _ParameterKind
-from typing import AsyncIterable, List, Optional, Sequence, Union
+from typing import (
+    AsyncIterable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    get_type_hints,
+)
 
 import pytest
 from guardpost import Identity, User
@@ -32,7 +41,10 @@ from blacksheep.server.normalization import (
     RouteBinderMismatch,
     UnsupportedSignatureError,
     _check_union,
+    _get_method_annotations_or_throw,
     _get_raw_bound_value_type,
+    _get_signature,
+    _is_bound_value_annotation,
     get_asyncgen_yield_type,
     get_binders,
     normalize_handler,
@@ -211,6 +223,19 @@ def test_throw_for_ambiguous_binder_multiple_from_body():
         get_binders(Route(b"/", handler), Container())
 
 
+def test_throw_for_parameter_without_matching_binder():
+    def handler(a: Cat): ...
+
+    with pytest.raises(
+        ValueError,
+        match=(
+            r"^No matching binder for parameter a: .*Cat of "
+            r"test_throw_for_parameter_without_matching_binder\.<locals>\.handler\.$"
+        ),
+    ):
+        get_binders(Route(b"/", handler), Container())
+
+
 def test_does_not_throw_for_forward_ref():
     def handler(a: "Cat"): ...
 
@@ -333,6 +358,16 @@ def test_check_union():
     assert value is str
 
 
+@pytest.mark.parametrize("annotation", [Union[str, int], Union[str, int, None]])
+def test_check_union_raises_for_unsupported_union(annotation):
+    with raises(NormalizationError):
+        _check_union(
+            Parameter("foo", kind=_ParameterKind.POSITIONAL_ONLY),
+            annotation,
+            len,
+        )
+
+
 @pytest.mark.skipif(sys.version_info < (3, 10), reason="requires python3.10 or higher")
 def test_check_union_or_none():
     optional, value = _check_union(
@@ -585,6 +620,20 @@ def test_get_raw_bound_value_type_fallsback_to_str():
     assert _get_raw_bound_value_type(Foo) is str  # type: ignore
 
 
+@pytest.mark.parametrize(
+    "annotation,expected_result",
+    [
+        [FromQuery[int], True],
+        [FromQuery, True],
+        [int, False],
+        [List[int], False],
+        [[int], False],  # unhashable annotations are not cached
+    ],
+)
+def test_is_bound_value_annotation(annotation, expected_result):
+    assert _is_bound_value_annotation(annotation) is expected_result
+
+
 def test_normalization_with_service_json_route_param():
     def handler(
         foo_id: str,
@@ -681,3 +730,50 @@ def test_get_asyncgen_yield_type():
 
     assert get_asyncgen_yield_type(example_1) is int
     assert get_asyncgen_yield_type(example_2) is str
+
+
+def test_method_annotations_are_resolved_once():
+    def handler(pet: "Pet") -> Pet: ...
+
+    annotations = _get_method_annotations_or_throw(handler)
+
+    assert annotations == {"pet": Pet, "return": Pet}
+    assert _get_method_annotations_or_throw(handler) is annotations
+
+
+def test_method_annotations_are_resolved_with_method_namespaces():
+    def handler(value: "Example"): ...  # noqa: F821
+
+    handler._locals = {"Example": Cat}  # type: ignore
+    assert _get_method_annotations_or_throw(handler) == {"value": Cat}
+
+    handler._locals = {"Example": Dog}  # type: ignore
+    assert _get_method_annotations_or_throw(handler) == {"value": Dog}
+
+    handler._locals["Example"] = Pet  # type: ignore
+    assert _get_method_annotations_or_throw(handler) == {"value": Pet}
+
+
+def test_method_annotations_match_type_hints():
+    def handler_1(a: int, b: FromQuery[List[int]], c: Optional[Cat]) -> Pet: ...
+
+    def handler_2(a: "Cat", b: List["Dog"]) -> None: ...
+
+    def handler_3(a: Optional[int] = None, *, b: int = None): ...  # type: ignore
+
+    def handler_4(a: List, b: Sequence, c: Callable) -> Dict: ...
+
+    for handler in (handler_1, handler_2, handler_3, handler_4):
+        annotations = _get_method_annotations_or_throw(handler)
+
+        assert annotations == get_type_hints(handler)
+        assert annotations is not handler.__annotations__
+
+
+def test_method_signature_is_inspected_once():
+    async def handler(pet: Pet): ...
+
+    signature = _get_signature(handler)
+
+    assert list(signature.parameters) == ["pet"]
+    assert _get_signature(handler) is signature
@@ -1,7 +1,12 @@
 import pytest
 
 from blacksheep import Content, Request, scribe
-from blacksheep.contents import FormPart, MultiPartFormData, StreamedContent
+from blacksheep.contents import (
+    ASGIContent,
+    FormPart,
+    MultiPartFormData,
+    StreamedContent,
+)
 from blacksheep.exceptions import BadRequestFormat
 from blacksheep.messages import get_absolute_url_to_path, get_request_absolute_url
 from blacksheep.scribe import write_request, write_small_request
@@ -25,6 +30,34 @@ def test_request_supports_dynamic_attributes():
     assert request.foo is foo  # type: ignore
 
 
+@pytest.mark.parametrize(
+    "headers",
+    [
+        [(b"x-foo", b"foo"), (b"x-ufo", b"ufo")],
+        ((b"x-foo", b"foo"), (b"x-ufo", b"ufo")),
+    ],
+)
+def test_incoming_request_headers(headers):
+    request = Request.incoming("GET", b"/", b"", headers)
+
+    assert request.headers.get_first(b"x-foo") == b"foo"
+    assert request.headers.get_first(b"x-ufo") == b"ufo"
+
+
+def test_request_release():
+    async def receive(): ...
+
+    request = Request.incoming("GET", b"/", b"", [])
+    content = ASGIContent(receive)
+    request.scope = get_example_scope("GET", "/")
+    request.content = content
+
+    request.release()
+
+    assert request.scope is None
+    assert content.receive is None
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "url,method,headers,content,expected_result",
@@ -7,7 +7,7 @@ from uuid import UUID, uuid4
 
 import pytest
 
-from blacksheep import Content, Cookie, Response, scribe
+from blacksheep import Content, Cookie, Response, StreamedContent, scribe
 from blacksheep.server.controllers import (
     CannotDetermineDefaultViewNameError,
     Controller,
@@ -736,6 +736,35 @@ async def test_file_response_from_bytes_io(app):
     assert bytes_io.closed  # type: ignore
 
 
+@pytest.mark.asyncio
+async def test_file_response_from_big_bytes_io(app):
+    bytes_io: Optional[BytesIO] = None
+    expected_result = b"Hello, World!" * 1024 * 30
+
+    @app.router.get("/")
+    async def home():
+        nonlocal bytes_io
+        bytes_io = BytesIO()
+        bytes_io.write(expected_result)
+        return file(bytes_io, "text/plain", file_name="foo.txt")
+
+    app.normalize_handlers()
+
+    await app(
+        get_example_scope("GET", "/", []),
+        MockReceive(),
+        MockSend(),
+    )
+
+    response = app.response
+    assert response.status == 200
+    assert isinstance(response.content, StreamedContent)
+    assert await response.read() == expected_result
+
+    assert bytes_io is not None
+    assert bytes_io.closed  # type: ignore
+
+
 @pytest.mark.asyncio
 async def test_file_response_from_generator_inline(app):
     @app.router.get("/")
@@ -878,6 +907,41 @@ def test_files_raises_for_invalid_name_with_folder_path():
         file(b"Hello, There!", "text/plain", file_name="not_good/")
 
 
+def test_files_raises_for_invalid_name_with_drive_only():
+    with pytest.raises(ValueError):
+        file(b"Hello, There!", "text/plain", file_name="C:")
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    [
+        "foo.txt",
+        "folder/foo.txt",
+        "folder\\foo.txt",
+        "a\\b/foo.txt",
+        "C:foo.txt",
+        "C:\\folder\\foo.txt",
+    ],
+)
+def test_files_uses_exact_file_name(file_name):
+    response = file(b"Hello, There!", "text/plain", file_name=file_name)
+
+    assert (
+        response.headers.get_single(b"content-disposition")
+        == b'attachment; filename="foo.txt"'
+    )
+
+
+def test_file_responses_do_not_share_headers():
+    response_1 = file(b"Hello, There!", "text/plain")
+    response_2 = file(b"Hello, There!", "text/plain")
+
+    response_1.add_header(b"X-Foo", b"Foo")
+
+    assert response_2.headers.get_single(b"content-disposition") == b"attachment"
+    assert response_2.headers.get(b"x-foo") == ()
+
+
 def test_json_response_raises_for_not_json_serializable():
     class NotSerializable:
         def __init__(self) -> None:
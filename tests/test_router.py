@@ -336,6 +336,93 @@ def test_router_match_any_by_extension():
     assert m.values.get("tail") == "anything/really"
 
 
+def test_router_match_reflects_routes_added_after_lookup():
+    router = Router()
+
+    def a(): ...
+
+    assert router.get_match_by_method_and_path(RouteMethod.GET, b"/a") is None
+
+    router.add_get("/a", a)
+
+    m = router.get_match_by_method_and_path(RouteMethod.GET, b"/a")
+    assert m is not None
+    assert m.handler is a
+
+
+def test_router_match_reflects_replaced_handlers():
+    router = Router()
+
+    def a(): ...
+
+    def b(): ...
+
+    router.add_get("/a", a)
+
+    m = router.get_match_by_method_and_path(RouteMethod.GET, b"/a")
+    assert m is not None
+    assert m.handler is a
+
+    for route in router:
+        route.handler = b
+
+    m = router.get_match_by_method_and_path(RouteMethod.GET, b"/a")
+    assert m is not None
+    assert m.handler is b
+
+
+def test_router_match_cache_is_not_filled_by_misses():
+    router = Router()
+
+    def a(): ...
+
+    router.add_get("/a", a)
+
+    m = router.get_match_by_method_and_path(RouteMethod.GET, b"/a")
+    assert m is not None
+    cached_routes = dict(router._match_cache)
+
+    for index in range(2000):
+        path = f"/not-found/{index}".encode()
+        assert router.get_match_by_method_and_path(RouteMethod.GET, path) is None
+
+    assert router._match_cache == cached_routes
+
+    m = router.get_match_by_method_and_path(RouteMethod.GET, b"/a")
+    assert m is not None
+    assert m.handler is a
+
+
+def test_router_match_misses_use_fallback():
+    router = Router()
+
+    def a(): ...
+
+    def fallback(): ...
+
+    router.add_get("/a", a)
+    router.fallback = fallback
+
+    for _ in range(2):
+        m = router.get_match_by_method_and_path(RouteMethod.GET, b"/b")
+        assert m is not None
+        assert m.handler is fallback
+
+
+def test_router_match_route_with_parameters_by_path():
+    router = Router()
+
+    def a(): ...
+
+    router.add_get("/a/:id", a)
+
+    for value in ("1", "2", "1"):
+        m = router.get_match_by_method_and_path(RouteMethod.GET, f"/a/{value}")
+        assert m is not None
+        assert m.handler is a
+        assert m.values == {"id": value}
+
+
 def test_router_match_any_below():
     router = Router()
 
@@ -3,6 +3,7 @@ from typing import AnyStr, Sequence
 import pytest
 
 from blacksheep.utils import ensure_bytes, ensure_str, join_fragments
+from blacksheep.utils.meta import compile_function
 
 
 @pytest.mark.parametrize(
@@ -45,3 +46,14 @@ def test_ensure_bytes_throws_for_invalid_value():
 def test_ensure_str_throws_for_invalid_value():
     with pytest.raises(ValueError):
         ensure_str(True)  # type: ignore
+
+
+def test_compile_function():
+    fn = compile_function(
+        "def add_offset(value):\n    return value + offset\n",
+        "add_offset",
+        {"offset": 10},
+    )
+
+    assert fn.__name__ == "add_offset"
+    assert fn(5) == 15
@@ -365,6 +365,72 @@ async def test_application_handling_proper_websocket_request():
     )
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "path,raw_path,expected_value",
+    [
+        ["/ws/a/b@c", b"/ws/a%2Fb%40c", "a/b@c"],
+        ["/ws/%40", b"/ws/%2540", "%40"],
+    ],
+)
+async def test_application_websocket_route_is_matched_by_raw_path(
+    path, raw_path, expected_value
+):
+    app = FakeApplication()
+    route_values = []
+
+    @app.router.ws("/ws/{foo}")
+    async def websocket_handler(websocket: WebSocket):
+        route_values.append(websocket.route_values)
+        await websocket.accept()
+
+    await app.start()
+    await app(
+        {
+            "type": "websocket",
+            "path": path,
+            "raw_path": raw_path,
+            "query_string": b"",
+            "headers": [],
+        },
+        MockReceive([{"type": "websocket.connect"}]),
+        MockSend(),
+    )
+
+    assert route_values == [{"foo": expected_value}]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "scope",
+    [
+        {"type": "websocket", "path": "/ws/a@b", "query_string": b"", "headers": []},
+        {
+            "type": "websocket",
+            "path": "/ws/a@b",
+            "raw_path": None,
+            "query_string": b"",
+            "headers": [],
+        },
+    ],
+)
+async def test_application_websocket_route_is_matched_by_path_without_raw_path(
+    scope,
+):
+    app = FakeApplication()
+    route_values = []
+
+    @app.router.ws("/ws/{foo}")
+    async def websocket_handler(websocket: WebSocket):
+        route_values.append(websocket.route_values)
+        await websocket.accept()
+
+    await app.start()
+    await app(scope, MockReceive([{"type": "websocket.connect"}]), MockSend())
+
+    assert route_values == [{"foo": "a@b"}]
+
+
 @pytest.mark.asyncio
 async def test_application_handling_proper_websocket_request_with_query():
     app = FakeApplication()